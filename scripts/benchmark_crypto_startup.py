@@ -0,0 +1,65 @@
+"""Benchmark of the startup cost of the encryption key derivation.
+
+Each sample runs in a fresh interpreter and compares importing the crypto module (what the
+application does at startup) with the work the import used to include: deriving the Fernet key
+with PBKDF2. Also reports the cost of the first encryption once the key was derived in the
+background, which is what a user action pays after warm_up_in_background() has finished.
+
+Usage:
+    python scripts/benchmark_crypto_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Runs in a child interpreter, so every sample starts with a cold import cache
+CHILD_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+started = time.perf_counter()
+from Shared.infrastructure.security.crypto import crypto_manager
+imported = time.perf_counter()
+crypto_manager.warm_up()
+derived = time.perf_counter()
+crypto_manager.encrypt_api_key("sk-or-benchmark")
+encrypted = time.perf_counter()
+print(json.dumps({{
+    "lazy import": imported - started,
+    "eager import (import + key derivation)": derived - started,
+    "first encryption after warm-up": encrypted - derived,
+}}))
+"""
+
+
+def run_sample() -> dict:
+    """Run one measurement in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT.format(src=str(SRC_DIR))],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [run_sample() for _ in range(args.runs)]
+
+    print(f"{args.runs} cold starts, median")
+    for name in samples[0]:
+        median = statistics.median(sample[name] for sample in samples)
+        print(f"  {name:<40} {median * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Throughput benchmark of the streaming flashcard importer.
+
+Writes a generated file of the given size and format to a temporary directory, imports it
+into a fresh database with FlashcardImporter and reports rows per second. With --trace-memory
+it also reports the peak traced memory, which stays flat as the row count grows, as rows are
+streamed in batches (tracing slows the import down several times).
+
+Usage:
+    python scripts/benchmark_import.py [--rows 1000000] [--format csv|tsv|anki] [--batch-size 5000] [--trace-memory]
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from CardManagement.application.card_service import CardService  # noqa: E402
+from CardManagement.application.services.flashcard_importer import FlashcardImporter  # noqa: E402
+from CardManagement.infrastructure.persistence.sqlite.repositories.FlashcardRepositoryImpl import (  # noqa: E402
+    FlashcardRepositoryImpl,
+)
+from DeckManagement.application.deck_service import DeckService  # noqa: E402
+from DeckManagement.infrastructure.persistence.sqlite.repositories.DeckRepositoryImpl import (  # noqa: E402
+    DeckRepositoryImpl,
+)
+from Shared.infrastructure.config import IMPORT_BATCH_SIZE  # noqa: E402
+from Shared.infrastructure.persistence.sqlite.connection import SqliteConnectionProvider  # noqa: E402
+from Shared.infrastructure.persistence.sqlite.migrations import run_migrations  # noqa: E402
+from UserProfile.domain.models.user import User  # noqa: E402
+from UserProfile.infrastructure.persistence.sqlite.repositories.UserRepositoryImpl import (  # noqa: E402
+    UserRepositoryImpl,
+)
+
+
+def write_file(path: Path, rows: int, file_format: str) -> None:
+    """Write a file of generated flashcards."""
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if file_format == "anki":
+            file.write("#separator:tab\n#html:true\n")
+        delimiter = "," if file_format == "csv" else "\t"
+        writer = csv.writer(file, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
+        for index in range(rows):
+            writer.writerow([f"Pytanie numer {index}, o czymś", f"Odpowiedź numer {index}: to i owo"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "tsv", "anki"], default="csv")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--trace-memory", action="store_true", help="report peak memory (slows the import down)")
+    args = parser.parse_args()
+
+    suffix = {"csv": ".csv", "tsv": ".tsv", "anki": ".txt"}[args.format]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = Path(tmp_dir) / f"flashcards{suffix}"
+        write_file(source, args.rows, args.format)
+        file_size = source.stat().st_size
+        db_path = str(Path(tmp_dir) / "benchmark.db")
+        run_migrations(db_path)
+        provider = SqliteConnectionProvider(db_path)
+        user_id = UserRepositoryImpl(provider).add(User(id=None, username="benchmark")).id
+        deck_service = DeckService(DeckRepositoryImpl(provider))
+        deck_id = deck_service.create_deck("Import", user_id).id
+        importer = FlashcardImporter(CardService(FlashcardRepositoryImpl(provider)), deck_service, args.batch_size)
+
+        if args.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        result = importer.import_file(source, deck_id, user_id)
+        elapsed = time.perf_counter() - started
+
+    print(f"{args.rows} rows ({args.format}, {file_size / 1e6:.1f} MB), batches of {args.batch_size}")
+    print(
+        f"  imported {result.imported}, rejected {result.failed} in {elapsed:.2f}s: {result.imported / elapsed:,.0f} rows/s"
+    )
+    if args.trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  peak traced memory {peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
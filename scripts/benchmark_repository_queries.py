@@ -0,0 +1,72 @@
+"""Micro-benchmark of per-query repository overhead.
+
+Compares the old query path (PRAGMA foreign_keys and row_factory reassigned before every query)
+with the current one (connection configured once by SqliteConnectionProvider, fixed SQL text
+served from the prepared statement cache).
+
+Usage:
+    python scripts/benchmark_repository_queries.py [--iterations 20000]
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from Shared.infrastructure.persistence.sqlite.connection import SqliteConnectionProvider  # noqa: E402
+from Shared.infrastructure.persistence.sqlite.migrations import run_migrations  # noqa: E402
+from UserProfile.domain.models.user import User  # noqa: E402
+from UserProfile.infrastructure.persistence.sqlite.repositories.UserRepositoryImpl import (  # noqa: E402
+    UserRepositoryImpl,
+)
+
+SELECT_USER_BY_ID = """
+    SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
+    FROM Users
+    WHERE id = ?
+"""
+
+
+def legacy_query(conn: sqlite3.Connection, user_id: int) -> sqlite3.Row:
+    """The per-query setup the repositories used to do."""
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.row_factory = sqlite3.Row
+    return conn.execute(SELECT_USER_BY_ID, (user_id,)).fetchone()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / "benchmark.db")
+        run_migrations(db_path)
+        provider = SqliteConnectionProvider(db_path)
+        repository = UserRepositoryImpl(provider)
+        user_id = repository.add(User(id=None, username="benchmark")).id
+        conn = provider.get_connection()
+
+        timings = {
+            "legacy (PRAGMA + row_factory per query)": timeit.timeit(
+                lambda: legacy_query(conn, user_id), number=args.iterations
+            ),
+            "current (connection configured once)": timeit.timeit(
+                lambda: conn.execute(SELECT_USER_BY_ID, (user_id,)).fetchone(), number=args.iterations
+            ),
+            "UserRepositoryImpl.get_by_id": timeit.timeit(
+                lambda: repository.get_by_id(user_id), number=args.iterations
+            ),
+        }
+
+    print(f"{args.iterations} queries per variant")
+    for name, seconds in timings.items():
+        print(f"  {name:<42} {seconds / args.iterations * 1e6:8.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
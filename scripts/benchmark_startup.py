@@ -0,0 +1,106 @@
+"""Startup benchmark: time from launching the app to its first idle, over several runs.
+
+Each run starts src/main.py with STARTUP_EXIT_AFTER_IDLE=1, so the app quits as soon as the
+first view has been painted, and STARTUP_TIMING_PATH pointing at a temporary file, where it
+writes its phase timings (see Shared.infrastructure.startup_timing). The script reports
+percentiles of the launch-to-first-idle time and of every recorded phase.
+
+Runs headless under Xvfb when there is no display: by default 'xvfb-run' is used if DISPLAY
+is unset and xvfb-run is installed. The app uses its normal data directory (database,
+migrations, log), so close it before benchmarking.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 10] [--warmup 1] [--xvfb auto|always|never] [--json results.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MAIN = REPO_ROOT / "src" / "main.py"
+
+LAUNCH_TO_FIRST_IDLE = "launch_to_first_idle"
+PERCENTILES = (50, 90, 95)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def use_xvfb(mode: str) -> bool:
+    """Whether to wrap the app in xvfb-run."""
+    if mode == "always":
+        if shutil.which("xvfb-run") is None:
+            sys.exit("xvfb-run not found; install Xvfb or use --xvfb never")
+        return True
+    if mode == "never":
+        return False
+    return sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and shutil.which("xvfb-run") is not None
+
+
+def run_once(xvfb: bool, timeout: float) -> Dict[str, float]:
+    """Launch the app once and return its timings in milliseconds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        timing_path = Path(tmp_dir) / "startup_timing.json"
+        env = dict(os.environ, STARTUP_TIMING_PATH=str(timing_path), STARTUP_EXIT_AFTER_IDLE="1")
+        command = [sys.executable, str(MAIN)]
+        if xvfb:
+            command = ["xvfb-run", "-a"] + command
+
+        launched = time.monotonic()
+        result = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=timeout)
+        exited = time.monotonic()
+        if result.returncode != 0 or not timing_path.exists():
+            sys.exit(f"The app did not start (exit code {result.returncode}):\n{result.stderr[-2000:]}")
+        timings = json.loads(timing_path.read_text(encoding="utf-8"))
+
+    # time.monotonic is system-wide, so the app's origin can be compared with our launch time
+    origin_offset_ms = (timings["origin_monotonic"] - launched) * 1000
+    measured = {phase["name"]: phase["duration_ms"] for phase in timings["phases"]}
+    measured["interpreter_start"] = origin_offset_ms
+    measured[LAUNCH_TO_FIRST_IDLE] = origin_offset_ms + timings["marks"]["first_idle"]
+    measured["launch_to_exit"] = (exited - launched) * 1000
+    return measured
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1, help="runs discarded before measuring (bytecode caches)")
+    parser.add_argument("--xvfb", choices=["auto", "always", "never"], default="auto")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds to wait for one run")
+    parser.add_argument("--json", type=Path, help="also write the raw samples to this file")
+    args = parser.parse_args()
+
+    xvfb = use_xvfb(args.xvfb)
+    for _ in range(args.warmup):
+        run_once(xvfb, args.timeout)
+    samples = [run_once(xvfb, args.timeout) for _ in range(args.runs)]
+
+    names = list(samples[0])
+    header = "".join(f"{f'p{pct}':>10}" for pct in PERCENTILES)
+    print(f"{args.runs} runs{' under Xvfb' if xvfb else ''}, milliseconds")
+    print(f"  {'phase':<24}{header}{'max':>10}")
+    for name in names:
+        values = [sample[name] for sample in samples if name in sample]
+        row = "".join(f"{percentile(values, pct):10.1f}" for pct in PERCENTILES)
+        print(f"  {name:<24}{row}{max(values):10.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(samples, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Import-time budget check for the application's cold start.
+
+Imports the entry point module in fresh interpreters with 'python -X importtime' and fails
+(exit code 1) when the median import time exceeds the budget, or when a module that is meant
+to be imported lazily (litellm by default) is loaded during startup. Everything main.py
+imports runs before the first window can be painted, so this bounds the cold start up to
+the creation of ProfileListView.
+
+Usage:
+    python scripts/check_import_time.py [--budget 1.0] [--runs 3] [--module main] [--forbid litellm] [--top 15]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# e.g. "import time:       576 |       1308 |   encodings.aliases"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure(module: str) -> List[ImportRecord]:
+    """Import the module in a fresh interpreter and return its -X importtime records."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error_lines = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(error_lines[-10:]))
+    records = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            records.append(
+                ImportRecord(match[4], int(match[1]), int(match[2]), len(match[3]) // 2),
+            )
+    return records
+
+
+def total_seconds(records: List[ImportRecord], module: str) -> float:
+    """Cumulative import time of the module, in seconds."""
+    return next(record.cumulative_us for record in records if record.module == module) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="main", help="entry point module, relative to src/")
+    parser.add_argument("--budget", type=float, default=1.0, help="maximum median import time in seconds")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--forbid", nargs="*", default=["litellm"], help="modules that must not be imported")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    try:
+        samples = [measure(args.module) for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+    median = statistics.median(total_seconds(records, args.module) for records in samples)
+
+    # Slowest direct imports of the entry point, from the last sample
+    slowest: Dict[str, int] = {}
+    for record in samples[-1]:
+        if record.depth == 1:
+            slowest[record.module] = record.cumulative_us
+    print(f"Slowest imports of {args.module} (cumulative):")
+    for name, cumulative_us in sorted(slowest.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1e3:8.1f} ms  {name}")
+
+    failures = []
+    loaded = {record.module for record in samples[-1]}
+    for forbidden in args.forbid:
+        if forbidden in loaded:
+            failures.append(f"{forbidden} is imported at startup but should be imported lazily")
+    if median > args.budget:
+        failures.append(f"import time {median:.3f}s exceeds the budget of {args.budget:.3f}s")
+
+    print(f"\nMedian import time of {args.module} over {args.runs} runs: {median:.3f}s (budget {args.budget:.3f}s)")
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}", file=sys.stderr)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,26 @@
+import json
 import logging
-from datetime import datetime
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence, Tuple
+
+from fsrs import Card as FSRSCard
 
 from CardManagement.domain.models.Flashcard import Flashcard
+from CardManagement.domain.models.FlashcardPage import FlashcardPage
 from CardManagement.domain.repositories.IFlashcardRepository import IFlashcardRepository
 
 
+@dataclass
+class CreateFlashcardDTO:
+    """DTO for one flashcard created with CardService.create_flashcards_bulk."""
+
+    front_text: str
+    back_text: str
+    source: str = "manual"
+    ai_model_name: Optional[str] = None
+
+
 class CardService:
     """Application service for flashcard management operations"""
 
@@ -32,18 +47,7 @@ class CardService:
         Raises:
             ValueError: If texts are empty or too long
         """
-        # Validate texts
-        front_text = front_text.strip()
-        back_text = back_text.strip()
-
-        if not front_text:
-            raise ValueError("Tekst na przedniej stronie nie może być pusty")
-        if not back_text:
-            raise ValueError("Tekst na tylnej stronie nie może być pusty")
-        if len(front_text) > 200:
-            raise ValueError("Tekst na przedniej stronie nie może być dłuższy niż 200 znaków")
-        if len(back_text) > 500:
-            raise ValueError("Tekst na tylnej stronie nie może być dłuższy niż 500 znaków")
+        front_text, back_text = self.validate_texts(front_text, back_text)
 
         # Create and persist the flashcard
         flashcard = Flashcard(
@@ -51,7 +55,7 @@ class CardService:
             deck_id=deck_id,
             front_text=front_text,
             back_text=back_text,
-            fsrs_state=None,  # Initial state, will be set when first reviewed
+            fsrs_state=json.dumps(FSRSCard().to_dict()),  # New FSRS card, due immediately
             source=source,
             ai_model_name=ai_model_name,
             created_at=datetime.now(),
@@ -66,6 +70,117 @@ class CardService:
             self.logger.error(f"Failed to create flashcard in deck {deck_id}: {str(e)}")
             raise
 
+    def create_flashcards_bulk(self, deck_id: int, flashcards: Sequence[CreateFlashcardDTO]) -> List[Flashcard]:
+        """
+        Creates many flashcards in the specified deck in a single transaction.
+
+        All flashcards are validated before anything is saved; either all are created or none.
+
+        Args:
+            deck_id: The ID of the deck to add the flashcards to
+            flashcards: Texts, sources and AI model names of the flashcards
+
+        Returns:
+            The created Flashcards with IDs and timestamps, in the given order
+
+        Raises:
+            ValueError: If a text is empty or too long; the message names the flashcard
+        """
+        new_flashcards = self._new_flashcards(deck_id, flashcards)
+        try:
+            created_flashcards: List[Flashcard] = self.flashcard_repository.add_many(new_flashcards)
+            self.logger.info(f"Created {len(created_flashcards)} flashcards in deck {deck_id}")
+            return created_flashcards
+        except Exception as e:
+            self.logger.error(f"Failed to create {len(new_flashcards)} flashcards in deck {deck_id}: {str(e)}")
+            raise
+
+    def import_flashcards(self, deck_id: int, flashcards: Sequence[CreateFlashcardDTO]) -> int:
+        """
+        Creates many flashcards in the specified deck in a single transaction, without reading them back.
+
+        Like create_flashcards_bulk, but for imports of large files, where the created flashcards are not needed.
+
+        Args:
+            deck_id: The ID of the deck to add the flashcards to
+            flashcards: Texts, sources and AI model names of the flashcards
+
+        Returns:
+            The number of created flashcards
+
+        Raises:
+            ValueError: If a text is empty or too long; the message names the flashcard
+        """
+        new_flashcards = self._new_flashcards(deck_id, flashcards)
+        try:
+            count: int = self.flashcard_repository.insert_many(new_flashcards)
+            self.logger.debug(f"Imported {count} flashcards into deck {deck_id}")
+            return count
+        except Exception as e:
+            self.logger.error(f"Failed to import {len(new_flashcards)} flashcards into deck {deck_id}: {str(e)}")
+            raise
+
+    def _new_flashcards(self, deck_id: int, flashcards: Sequence[CreateFlashcardDTO]) -> List[Flashcard]:
+        """Validates the DTOs and builds new, unsaved flashcards with fresh FSRS state."""
+        now = datetime.now()
+        # FSRSCard() waits 1 ms per card to get a unique card_id, so one new card is built and
+        # copied with consecutive ids; all cards of the batch are due at the same moment
+        first_card_id = int(datetime.now(timezone.utc).timestamp() * 1000)
+        new_card_state = FSRSCard(card_id=first_card_id).to_dict()
+        new_flashcards = []
+        for index, dto in enumerate(flashcards):
+            try:
+                front_text, back_text = self.validate_texts(dto.front_text, dto.back_text)
+            except ValueError as e:
+                raise ValueError(f"Fiszka {index + 1}: {e}") from e
+            new_flashcards.append(
+                Flashcard(
+                    id=None,
+                    deck_id=deck_id,
+                    front_text=front_text,
+                    back_text=back_text,
+                    fsrs_state=json.dumps({**new_card_state, "card_id": first_card_id + index}),
+                    source=dto.source,
+                    ai_model_name=dto.ai_model_name,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        return new_flashcards
+
+    @staticmethod
+    def validate_texts(front_text: str, back_text: str) -> Tuple[str, str]:
+        """
+        Validates flashcard texts the way every write path stores them.
+        Shared by create, update, bulk creation and the file importer, so all of them accept the same texts.
+
+        Both texts are stripped of surrounding whitespace first; the limits apply to the stripped texts:
+        the front must be 1-200 characters long and the back 1-500 characters long.
+
+        Args:
+            front_text: Text for the front of the flashcard
+            back_text: Text for the back of the flashcard
+
+        Returns:
+            The stripped front and back texts, to be saved instead of the originals
+
+        Raises:
+            ValueError: With a user-facing (Polish) message naming the side, if a text is empty or
+                whitespace-only, or longer than its limit. Only the first failed check is reported.
+        """
+        front_text = front_text.strip()
+        back_text = back_text.strip()
+
+        if not front_text:
+            raise ValueError("Tekst na przedniej stronie nie może być pusty")
+        if not back_text:
+            raise ValueError("Tekst na tylnej stronie nie może być pusty")
+        if len(front_text) > 200:
+            raise ValueError("Tekst na przedniej stronie nie może być dłuższy niż 200 znaków")
+        if len(back_text) > 500:
+            raise ValueError("Tekst na tylnej stronie nie może być dłuższy niż 500 znaków")
+        return front_text, back_text
+
     def update_flashcard(
         self,
         flashcard_id: int,
@@ -87,18 +202,7 @@ class CardService:
         Raises:
             ValueError: If texts are empty or too long, or if flashcard doesn't exist
         """
-        # Validate texts
-        front_text = front_text.strip()
-        back_text = back_text.strip()
-
-        if not front_text:
-            raise ValueError("Tekst na przedniej stronie nie może być pusty")
-        if not back_text:
-            raise ValueError("Tekst na tylnej stronie nie może być pusty")
-        if len(front_text) > 200:
-            raise ValueError("Tekst na przedniej stronie nie może być dłuższy niż 200 znaków")
-        if len(back_text) > 500:
-            raise ValueError("Tekst na tylnej stronie nie może być dłuższy niż 500 znaków")
+        front_text, back_text = self.validate_texts(front_text, back_text)
 
         # Get existing flashcard
         flashcard = self.flashcard_repository.get_by_id(flashcard_id)
@@ -139,6 +243,66 @@ class CardService:
             self.logger.error(f"Failed to list flashcards for deck {deck_id}: {str(e)}")
             raise
 
+    def list_page(
+        self,
+        deck_id: int,
+        sort_key: str = "created_at",
+        after_cursor: Optional[str] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> FlashcardPage:
+        """
+        Lists one page of the flashcards in a deck.
+
+        Args:
+            deck_id: The ID of the deck to list flashcards from
+            sort_key: One of FLASHCARD_SORT_KEYS; ties are ordered by flashcard ID
+            after_cursor: next_cursor of the previous page, or None for the first page
+            limit: Maximum number of flashcards on the page
+            descending: Whether to list from the highest sort value
+
+        Returns:
+            FlashcardPage with the flashcards and the cursor of the next page (None on the last page)
+
+        Raises:
+            ValueError: If the sort key is unknown or the cursor is invalid
+        """
+        try:
+            page: FlashcardPage = self.flashcard_repository.list_page(
+                deck_id, sort_key, after_cursor=after_cursor, limit=limit, descending=descending
+            )
+            self.logger.debug(f"Listed a page of {len(page.items)} flashcards for deck {deck_id} by {sort_key}")
+            return page
+        except Exception as e:
+            self.logger.error(f"Failed to list flashcards for deck {deck_id}: {str(e)}")
+            raise
+
+    def search_flashcards(
+        self, user_id: int, query: str, deck_id: Optional[int] = None, limit: int = 50, offset: int = 0
+    ) -> List[Flashcard]:
+        """
+        Searches the fronts and backs of the user's flashcards.
+
+        Args:
+            user_id: The ID of the user whose decks are searched
+            query: Text typed by the user; every word is matched as a prefix
+            deck_id: Restrict the search to this deck (all user's decks if None)
+            limit: Maximum number of results
+            offset: Number of results to skip (for paging)
+
+        Returns:
+            Matching flashcards, most relevant first
+        """
+        try:
+            flashcards: List[Flashcard] = self.flashcard_repository.search(
+                user_id, query, deck_id=deck_id, limit=limit, offset=offset
+            )
+            self.logger.debug(f"Search for '{query}' returned {len(flashcards)} flashcards")
+            return flashcards
+        except Exception as e:
+            self.logger.error(f"Failed to search flashcards for user {user_id}: {str(e)}")
+            raise
+
     def delete_flashcard(self, flashcard_id: int) -> None:
         """
         Deletes a flashcard.
@@ -1,19 +1,22 @@
 """Presenter for the AI flashcard generation view."""
 
 import logging
-import threading
-from typing import Protocol, List, Optional
+from concurrent.futures import CancelledError, Future
+from typing import Callable, Protocol, List, Optional, Sequence
 
 from CardManagement.application.services.ai_service import AIService
+from CardManagement.application.services.generated_flashcards import GeneratedFlashcards
 from CardManagement.application.card_service import CardService
 from CardManagement.infrastructure.api_clients.openrouter.exceptions import (
     AIAPIAuthError,
     FlashcardGenerationError,
 )
+from CardManagement.infrastructure.api_clients.openrouter.retry import RetryAttempt
 from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
 from Shared.application.navigation import NavigationControllerProtocol
 from UserProfile.application.user_profile_service import UserProfileService
 from Shared.application.session_service import SessionService
+from Shared.infrastructure.config import AI_MAX_SOURCE_TEXT_LENGTH
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +31,14 @@ class IAIGenerateView(Protocol):
     def update_generate_button_state(self, is_enabled: bool) -> None: ...
     def get_input_text(self) -> str: ...
     def get_selected_model(self) -> str: ...
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None: ...
 
 
 class AIGeneratePresenter:
     """Presenter for the AI flashcard generation view."""
 
     # Constants
-    MAX_TEXT_LENGTH = 10000
+    MAX_TEXT_LENGTH = AI_MAX_SOURCE_TEXT_LENGTH
 
     def __init__(
         self,
@@ -60,7 +64,7 @@ class AIGeneratePresenter:
 
         # State
         self._is_generating = False
-        self._generation_thread: Optional[threading.Thread] = None
+        self._generation_future: Optional["Future[int]"] = None
         self._cancellation_requested = False
 
     def initialize(self) -> None:
@@ -91,17 +95,28 @@ class AIGeneratePresenter:
         # Update UI state
         self._set_generating_state(True)
 
-        # Start generation in a background thread
-        self._generation_thread = threading.Thread(target=self._generate_flashcards_thread, args=(raw_text, model))
-        self._generation_thread.daemon = True
-        self._generation_thread.start()
+        # Start generation on the application's event loop
+        flashcards = GeneratedFlashcards()
+        future = self._ai_service.start_flashcard_generation(
+            raw_text,
+            self._deck_id,
+            lambda flashcard: self._on_flashcard(flashcards, flashcard, raw_text),
+            model=model,
+            on_retry=lambda retry: self._on_retry(flashcards, retry),
+        )
+        self._generation_future = future
+        # Leaving the review screen early cancels the generation
+        flashcards.add_cancel_callback(future.cancel)
+        future.add_done_callback(lambda done: self._on_generation_done(flashcards, done))
 
     def handle_cancel_generation(self) -> None:
-        """Handle cancellation request."""
+        """Handle cancellation request, aborting the request in flight."""
         self._cancellation_requested = True
         self._view.update_progress_label("Anulowanie generowania...")
         self._view.update_cancel_button_state(False)
         logger.info(f"User requested cancellation of flashcard generation for deck {self._deck_id}")
+        if self._generation_future is not None:
+            self._generation_future.cancel()
 
     def _set_generating_state(self, is_generating: bool) -> None:
         """Update UI state for generation process."""
@@ -114,51 +129,74 @@ class AIGeneratePresenter:
         else:
             self._view.update_progress_label("")
 
-    def _generate_flashcards_thread(self, raw_text: str, model: str) -> None:
-        """Background thread for flashcard generation."""
-        try:
-            # Check for cancellation
-            if self._cancellation_requested:
-                self._after_generation(cancelled=True)
-                return
-
-            # Log the generation attempt
-            logger.info(
-                f"Generating flashcards for deck {self._deck_id} with model {model}, text length: {len(raw_text)}"
-            )
-
-            flashcards = self._ai_service.generate_flashcards(raw_text=raw_text, deck_id=self._deck_id, model=model)
-
-            # Check for cancellation again after generation
-            if self._cancellation_requested:
-                self._after_generation(cancelled=True)
-                return
-
-            # Check if we got any flashcards
-            if not flashcards:
-                self._after_generation(error="Nie udało się wygenerować żadnych fiszek")
-                return
+    def _on_flashcard(self, flashcards: GeneratedFlashcards, flashcard: FlashcardDTO, raw_text: str) -> None:
+        """Add a generated flashcard (called on the event loop thread), opening the review screen on the first one."""
+        if self._cancellation_requested or flashcards.is_cancelled:
+            return
+        flashcards.append(flashcard)
+        if len(flashcards) == 1:
+            logger.info(f"First flashcard generated for deck {self._deck_id}, opening review")
+            self._view.schedule(0, lambda: self._navigate_to_review(flashcards, raw_text))
+
+    def _on_retry(self, flashcards: GeneratedFlashcards, retry: RetryAttempt) -> None:
+        """Report that a failed request will be retried (called on the event loop thread)."""
+        logger.info(
+            f"Flashcard generation for deck {self._deck_id}: attempt {retry.attempt}/{retry.max_attempts} failed, "
+            f"retrying in {retry.delay:.1f}s ({retry.total_wait:.1f}s waited in total)"
+        )
+        self._view.schedule(0, lambda: self._show_retry(flashcards, retry))
+
+    def _show_retry(self, flashcards: GeneratedFlashcards, retry: RetryAttempt) -> None:
+        """Show that a failed request will be retried."""
+        if len(flashcards) > 0 or self._cancellation_requested:
+            # The review screen is already open, or the generation is being cancelled
+            return
+        self._view.update_progress_label(
+            f"Próba {retry.attempt}/{retry.max_attempts} nieudana, ponawianie za {retry.delay:.0f} s "
+            f"(łącznie {retry.total_wait:.0f} s oczekiwania)..."
+        )
 
-            logger.info(f"Successfully generated {len(flashcards)} flashcards for deck {self._deck_id}")
+    def _on_generation_done(self, flashcards: GeneratedFlashcards, future: "Future[int]") -> None:
+        """Finish the generation once its future is done (called on the event loop thread).
 
-            # Navigate to the single flashcard review view
-            self._navigate_to_review(flashcards, raw_text)
+        Errors after the first flashcard are recorded on the sequence and shown by the review screen.
+        """
+        error: Optional[str] = None
+        try:
+            future.result()
+        except CancelledError:
+            logger.info(f"Flashcard generation for deck {self._deck_id} stopped after {len(flashcards)} cards")
 
         except AIAPIAuthError:
             logger.error(f"Authentication error during flashcard generation for deck {self._deck_id}")
-            self._after_generation(error="Sprawdź swój klucz API w ustawieniach profilu")
+            error = "Sprawdź swój klucz API w ustawieniach profilu"
 
         except FlashcardGenerationError as e:
-            error_message = str(e)
-            logger.error(f"Flashcard generation error for deck {self._deck_id}: {error_message}")
-            self._after_generation(error=error_message)
+            error = str(e)
+            logger.error(f"Flashcard generation error for deck {self._deck_id}: {error}")
 
         except Exception as e:
-            error_message = self._ai_service.explain_error(e)
+            error = self._ai_service.explain_error(e)
             logger.error(
                 f"Unexpected error during flashcard generation for deck {self._deck_id}: {str(e)}", exc_info=True
             )
-            self._after_generation(error=error_message)
+
+        finally:
+            flashcards.finish(error)
+
+        self._view.schedule(0, lambda: self._finish_generation(flashcards, error))
+
+    def _finish_generation(self, flashcards: GeneratedFlashcards, error: Optional[str]) -> None:
+        """Reset the view once the generation is done, unless the review screen has taken over."""
+        if len(flashcards) > 0:
+            # The review screen is already open and reports the outcome
+            logger.info(f"Generated {len(flashcards)} flashcards for deck {self._deck_id}")
+        elif self._cancellation_requested:
+            self._after_generation(cancelled=True)
+        elif error:
+            self._after_generation(error=error)
+        else:
+            self._after_generation(error="Nie udało się wygenerować żadnych fiszek")
 
     def _after_generation(self, error: Optional[str] = None, cancelled: bool = False) -> None:
         """Handle post-generation cleanup and notifications."""
@@ -168,7 +206,7 @@ class AIGeneratePresenter:
         elif error:
             self._view.show_toast("Błąd", error)
 
-    def _navigate_to_review(self, flashcards: List[FlashcardDTO], original_source_text: str) -> None:
+    def _navigate_to_review(self, flashcards: Sequence[FlashcardDTO], original_source_text: str) -> None:
         """Navigate to the flashcard review view."""
         try:
             # Add debug logging
@@ -1,10 +1,11 @@
 """Presenter for the AI-generated flashcard review view."""
 
 import logging
-from typing import Protocol, List, Optional
+from typing import Callable, Protocol, List, Optional, Sequence
 
 from CardManagement.application.services.ai_service import AIService
-from CardManagement.application.card_service import CardService
+from CardManagement.application.card_service import CardService, CreateFlashcardDTO
+from CardManagement.application.services.generated_flashcards import GeneratedFlashcards
 from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
 from Shared.application.navigation import NavigationControllerProtocol
 
@@ -23,6 +24,7 @@ class IAIReviewSingleFlashcardView(Protocol):
     def get_back_text(self) -> str: ...
     def display_flashcard(self, front_text: str, back_text: str, tags: Optional[List[str]] = None) -> None: ...
     def update_char_counts(self) -> None: ...
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None: ...
 
 
 class AIReviewSingleFlashcardPresenter:
@@ -31,6 +33,8 @@ class AIReviewSingleFlashcardPresenter:
     # Constants
     FRONT_TEXT_MAX_LENGTH = 200
     BACK_TEXT_MAX_LENGTH = 500
+    # How often to check for the next flashcard while generation is still running
+    WAIT_FOR_FLASHCARD_POLL_MS = 200
 
     def __init__(
         self,
@@ -40,7 +44,7 @@ class AIReviewSingleFlashcardPresenter:
         navigation: NavigationControllerProtocol,
         deck_id: int,
         deck_name: str,
-        generated_flashcards_dtos: List[FlashcardDTO],
+        generated_flashcards_dtos: Sequence[FlashcardDTO],
         current_flashcard_index: int,
         available_llm_models: List[str],
         original_source_text: str,
@@ -59,6 +63,8 @@ class AIReviewSingleFlashcardPresenter:
         # State
         self._has_unsaved_changes = False
         self._is_saving = False
+        self._is_waiting_for_flashcard = False
+        self._has_left = False
 
     def initialize(self) -> None:
         """Initialize the presenter and display the current flashcard."""
@@ -87,31 +93,20 @@ class AIReviewSingleFlashcardPresenter:
 
     def save_and_continue(self) -> None:
         """Save the current flashcard and move to the next one."""
-        if self._is_saving:
+        if self._is_saving or self._is_waiting_for_flashcard:
             return
 
-        front_text = self._view.get_front_text().strip()
-        back_text = self._view.get_back_text().strip()
-
-        original_front = self._flashcards[self._current_index].front.strip()
-        original_back = self._flashcards[self._current_index].back.strip()
-
-        source = "ai-edited" if front_text != original_front or back_text != original_back else "ai-generated"
-        ai_model_name = (
-            self._flashcards[self._current_index].metadata.get("model")
-            if self._flashcards[self._current_index].metadata
-            else None
-        )
+        current = self._current_as_create_dto()
 
         self._is_saving = True
         self._view.show_saving(True)
         try:
             self._card_service.create_flashcard(
                 deck_id=self._deck_id,
-                front_text=front_text,
-                back_text=back_text,
-                source=source,
-                ai_model_name=ai_model_name,
+                front_text=current.front_text,
+                back_text=current.back_text,
+                source=current.source,
+                ai_model_name=current.ai_model_name,
             )
             self._view.show_toast("Sukces", "Fiszka została zapisana")
             self._has_unsaved_changes = False
@@ -127,15 +122,91 @@ class AIReviewSingleFlashcardPresenter:
             self._is_saving = False
             self._view.show_saving(False)
 
+    def accept_all(self) -> None:
+        """Save the current flashcard (with its edits) and all the following ones as generated, then go back.
+
+        All flashcards are saved in one transaction. If generation is still running, saving waits for it to finish.
+        """
+        if self._is_saving or self._is_waiting_for_flashcard:
+            return
+        current = self._current_as_create_dto()
+
+        self._is_saving = True
+        self._view.show_saving(True)
+        if self._is_still_generating():
+            self._view.show_toast("Informacja", "Fiszki zostaną zapisane po zakończeniu generowania...")
+        self._save_all(current)
+
+    def _save_all(self, current: CreateFlashcardDTO) -> None:
+        """Save 'current' and the flashcards after it in bulk, once generation has finished."""
+        if self._has_left:
+            return
+        if self._is_still_generating():
+            self._view.schedule(self.WAIT_FOR_FLASHCARD_POLL_MS, lambda: self._save_all(current))
+            return
+
+        remaining = [
+            self._to_create_dto(dto, dto.front.strip(), dto.back.strip())
+            for dto in list(self._flashcards)[self._current_index + 1 :]
+        ]
+        try:
+            created = self._card_service.create_flashcards_bulk(self._deck_id, [current] + remaining)
+            if isinstance(self._flashcards, GeneratedFlashcards) and self._flashcards.error:
+                self._view.show_toast("Błąd", f"Generowanie przerwane: {self._flashcards.error}")
+            self._view.show_toast("Sukces", f"Zapisano {len(created)} fiszek")
+            self._has_unsaved_changes = False
+            self.navigate_back()
+        except ValueError as e:
+            self._view.show_toast("Błąd", str(e))
+            logger.warning(f"Validation error saving flashcards for deck {self._deck_id}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error saving flashcards for deck {self._deck_id}: {str(e)}", exc_info=True)
+            self._view.show_toast("Błąd", f"Wystąpił błąd podczas zapisywania: {str(e)}")
+        finally:
+            self._is_saving = False
+            self._view.show_saving(False)
+
+    def _current_as_create_dto(self) -> CreateFlashcardDTO:
+        """The current flashcard as shown in the view, marked 'ai-edited' if its text was changed."""
+        return self._to_create_dto(
+            self._flashcards[self._current_index],
+            self._view.get_front_text().strip(),
+            self._view.get_back_text().strip(),
+        )
+
+    @staticmethod
+    def _to_create_dto(dto: FlashcardDTO, front_text: str, back_text: str) -> CreateFlashcardDTO:
+        """A flashcard to save from a generated one with the given (possibly edited) texts."""
+        source = "ai-edited" if front_text != dto.front.strip() or back_text != dto.back.strip() else "ai-generated"
+        ai_model_name = dto.metadata.get("model") if dto.metadata else None
+        return CreateFlashcardDTO(
+            front_text=front_text, back_text=back_text, source=source, ai_model_name=ai_model_name
+        )
+
     def discard_and_continue(self) -> None:
         """Discard the current flashcard and move to the next one."""
-        if not self._view.show_discard_confirmation():
+        if self._is_waiting_for_flashcard or not self._view.show_discard_confirmation():
             return
         self._proceed_to_next_flashcard()
 
     def _proceed_to_next_flashcard(self) -> None:
         """Proceed to the next flashcard or finish if all are reviewed."""
         self._current_index += 1
+        self._show_current_or_finish()
+
+    def _show_current_or_finish(self) -> None:
+        """Open the view of the current flashcard, wait for it if it is still being generated, or finish."""
+        if self._has_left:
+            return
+        if self._is_still_generating() and self._current_index >= len(self._flashcards):
+            if not self._is_waiting_for_flashcard:
+                self._is_waiting_for_flashcard = True
+                self._view.update_save_button_state(False)
+                self._view.show_toast("Informacja", "Trwa generowanie kolejnych fiszek...")
+            self._view.schedule(self.WAIT_FOR_FLASHCARD_POLL_MS, self._show_current_or_finish)
+            return
+        self._is_waiting_for_flashcard = False
+
         if self._current_index < len(self._flashcards):
             try:
                 self._navigation.navigate(
@@ -154,12 +225,21 @@ class AIReviewSingleFlashcardPresenter:
                 logger.error(error_msg, exc_info=True)
                 self._view.show_toast("Błąd", "Wystąpił błąd podczas przechodzenia do następnej fiszki.")
         else:
+            if isinstance(self._flashcards, GeneratedFlashcards) and self._flashcards.error:
+                self._view.show_toast("Błąd", f"Generowanie przerwane: {self._flashcards.error}")
             total_count = len(self._flashcards)
             self._view.show_toast("Zakończono", f"Zakończono przeglądanie {total_count} wygenerowanych fiszek.")
             self.navigate_back()
 
+    def _is_still_generating(self) -> bool:
+        """Whether more flashcards may still arrive from a running generation."""
+        return isinstance(self._flashcards, GeneratedFlashcards) and not self._flashcards.is_done
+
     def navigate_back(self) -> None:
-        """Navigate back to the card list."""
+        """Navigate back to the card list, stopping a generation that is still running."""
         if self._has_unsaved_changes and not self._view.show_unsaved_changes_confirmation():
             return
+        self._has_left = True
+        if isinstance(self._flashcards, GeneratedFlashcards) and not self._flashcards.is_done:
+            self._flashcards.cancel()
         self._navigation.navigate(f"/decks/{self._deck_id}/cards")
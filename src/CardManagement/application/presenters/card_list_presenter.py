@@ -1,10 +1,12 @@
 """Presenter for the card list view."""
 
 import logging
-from typing import Protocol, List, Optional
+import threading
+from typing import Callable, Dict, Protocol, List, Optional
 
 from CardManagement.domain.models.Flashcard import Flashcard
 from CardManagement.application.card_service import CardService
+from CardManagement.application.services.flashcard_importer import FlashcardImporter, ImportProgress, ImportResult
 from DeckManagement.application.deck_service import DeckService
 from Shared.application.session_service import SessionService
 from Shared.application.navigation import NavigationControllerProtocol
@@ -35,15 +37,22 @@ class ICardListView(Protocol):
     """Protocol defining the interface for CardListView"""
 
     def display_cards(self, cards: List[FlashcardViewModel]) -> None: ...
+    def append_cards(self, cards: List[FlashcardViewModel]) -> None: ...
     def show_loading(self, is_loading: bool) -> None: ...
     def show_error(self, message: str) -> None: ...
     def show_toast(self, title: str, message: str) -> None: ...
     def clear_card_selection(self) -> None: ...
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None: ...
+    def show_import_progress(self, fraction: Optional[float]) -> None: ...
 
 
 class CardListPresenter:
     """Presenter for the card list view."""
 
+    SEARCH_RESULTS_LIMIT = 200
+    # Cards fetched and handed to the view at a time while the deck is loaded
+    LOAD_PAGE_SIZE = 500
+
     def __init__(
         self,
         view: ICardListView,
@@ -53,6 +62,7 @@ class CardListPresenter:
         navigation_controller: NavigationControllerProtocol,
         deck_id: int,
         deck_name: str,
+        importer: Optional[FlashcardImporter] = None,
     ):
         """Initialize the card list presenter.
 
@@ -64,6 +74,7 @@ class CardListPresenter:
             navigation_controller: Controller for navigation
             deck_id: ID of the deck to manage cards for
             deck_name: Name of the deck
+            importer: Importer of flashcard files; built from the services when omitted
         """
         self.view = view
         self.card_service = card_service
@@ -74,26 +85,171 @@ class CardListPresenter:
         self.deck_name = deck_name
         self.dialog_open: bool = False
         self.deleting_id: Optional[int] = None
+        # Active search; an empty query shows the whole deck
+        self.search_query: str = ""
+        self.search_all_decks: bool = False
+        # Order of the deck's cards, one of FLASHCARD_SORT_KEYS
+        self.sort_key: str = "created_at"
+        self.sort_descending: bool = False
+        # Deck of each displayed card, so cards found in other decks open in the right one
+        self._card_deck_ids: Dict[int, int] = {}
+        # Incremented by every load and cancel_loading(); results of older loads are dropped
+        self._load_generation = 0
+        self._load_thread: Optional[threading.Thread] = None
+        self._is_loading = False
+        self.importer = importer or FlashcardImporter(card_service, deck_service)
+        self._import_thread: Optional[threading.Thread] = None
 
     def load_cards(self) -> None:
-        """Load cards for the current deck."""
+        """Load cards for the current deck, or the results of the active search.
+
+        The deck is fetched page by page on worker threads, each page after the previous one is shown,
+        so the first cards appear after a single page query however large the deck is. A new load
+        supersedes any load in progress.
+        """
         # Check if user is authenticated
         if not self.session_service.is_authenticated():
             self.view.show_toast("Błąd", "Musisz być zalogowany aby przeglądać fiszki.")
             self.navigation.navigate("/profiles")
             return
 
+        self._load_generation += 1
+        self._is_loading = True
         self.view.show_loading(True)
+        self._start_page_load(self._load_generation, self.search_query, self.search_all_decks, None)
+
+    def _start_page_load(
+        self, generation: int, search_query: str, search_all_decks: bool, after_cursor: Optional[str]
+    ) -> None:
+        """Fetch the next page of the load on a worker thread."""
+        self._load_thread = threading.Thread(
+            target=self._load_page_thread,
+            args=(generation, search_query, search_all_decks, after_cursor),
+            name="CardListLoader",
+            daemon=True,
+        )
+        self._load_thread.start()
+
+    def cancel_loading(self) -> None:
+        """Drop the results of the load in progress, e.g. when the view is hidden."""
+        if self._is_loading:
+            self._load_generation += 1
+            self._finish_loading()
+
+    def _finish_loading(self) -> None:
+        """Leave the loading state."""
+        self._is_loading = False
+        self.view.show_loading(False)
+
+    def _is_stale(self, generation: int) -> bool:
+        """Whether a newer load or a cancellation superseded the given load."""
+        return generation != self._load_generation
+
+    def _load_page_thread(
+        self, generation: int, search_query: str, search_all_decks: bool, after_cursor: Optional[str]
+    ) -> None:
+        """Background thread fetching one page of the deck, or the search results, as view models."""
         try:
-            cards = self.card_service.list_by_deck_id(self.deck_id)
+            next_cursor: Optional[str] = None
+            if search_query:
+                cards = self._search(search_query, search_all_decks)
+            else:
+                page = self.card_service.list_page(
+                    self.deck_id,
+                    self.sort_key,
+                    after_cursor=after_cursor,
+                    limit=self.LOAD_PAGE_SIZE,
+                    descending=self.sort_descending,
+                )
+                cards, next_cursor = page.items, page.next_cursor
+            if self._is_stale(generation):
+                logger.debug(f"Dropping stale card list load {generation}")
+                return
+            card_deck_ids = {card.id: card.deck_id for card in cards if card.id is not None}
             card_viewmodels = [FlashcardViewModel.from_flashcard(card) for card in cards]
-            self.view.display_cards(card_viewmodels)
         except Exception as e:
             error_msg = f"Wystąpił błąd podczas ładowania fiszek: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.view.show_error(error_msg)
-        finally:
-            self.view.show_loading(False)
+            self.view.schedule(0, lambda: self._load_failed(generation, error_msg))
+            return
+
+        first_page = after_cursor is None
+        self.view.schedule(
+            0, lambda: self._deliver_page(generation, card_viewmodels, card_deck_ids, first_page, next_cursor)
+        )
+
+    def _deliver_page(
+        self,
+        generation: int,
+        card_viewmodels: List[FlashcardViewModel],
+        card_deck_ids: Dict[int, int],
+        first_page: bool,
+        next_cursor: Optional[str],
+    ) -> None:
+        """Hand a loaded page to the view and request the next one (UI thread)."""
+        if self._is_stale(generation):
+            return
+        try:
+            if first_page:
+                self._card_deck_ids = card_deck_ids
+                self.view.display_cards(card_viewmodels)
+            else:
+                self._card_deck_ids.update(card_deck_ids)
+                self.view.append_cards(card_viewmodels)
+        except Exception as e:
+            error_msg = f"Wystąpił błąd podczas ładowania fiszek: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self._load_failed(generation, error_msg)
+            return
+
+        if next_cursor is not None:
+            self._start_page_load(generation, "", False, next_cursor)
+        else:
+            self._finish_loading()
+
+    def _load_failed(self, generation: int, error_msg: str) -> None:
+        """Report a failed load (UI thread)."""
+        if self._is_stale(generation):
+            return
+        self.view.show_error(error_msg)
+        self._finish_loading()
+
+    def search_cards(self, query: str, all_decks: bool = False) -> None:
+        """Search flashcards by front and back text.
+
+        Args:
+            query: Text typed by the user; an empty query shows the whole deck again
+            all_decks: Search all of the user's decks instead of the current one
+        """
+        self.search_query = query.strip()
+        self.search_all_decks = all_decks
+        self.load_cards()
+
+    def sort_cards(self, sort_key: str) -> None:
+        """Order the deck's cards by a column; choosing the current column again reverses the order.
+
+        Args:
+            sort_key: One of FLASHCARD_SORT_KEYS
+        """
+        if sort_key == self.sort_key:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_key = sort_key
+            self.sort_descending = False
+        self.load_cards()
+
+    def _search(self, query: str, all_decks: bool) -> List[Flashcard]:
+        """Search the current deck, or all decks, of the current user."""
+        user = self.session_service.get_current_user()
+        if not user or user.id is None:
+            return []
+        results: List[Flashcard] = self.card_service.search_flashcards(
+            user.id,
+            query,
+            deck_id=None if all_decks else self.deck_id,
+            limit=self.SEARCH_RESULTS_LIMIT,
+        )
+        return results
 
     def navigate_back(self) -> None:
         """Navigate back to deck list."""
@@ -107,6 +263,67 @@ class CardListPresenter:
         """Navigate to AI generation view."""
         self.navigation.navigate(f"/decks/{self.deck_id}/cards/generate")
 
+    def import_cards(self, path: str) -> None:
+        """Import flashcards from a CSV/TSV file or an Anki text export into the deck.
+
+        The import runs on a worker thread; progress and the outcome reach the view through view.schedule().
+        """
+        if self._import_thread is not None:
+            self.view.show_toast("Import", "Import jest już w toku.")
+            return
+        user = self.session_service.get_current_user()
+        if not user or user.id is None:
+            self.view.show_toast("Błąd", "Musisz być zalogowany aby importować fiszki.")
+            self.navigation.navigate("/profiles")
+            return
+
+        self.view.show_import_progress(0.0)
+        self._import_thread = threading.Thread(
+            target=self._import_cards_thread, args=(path, user.id), name="FlashcardImport", daemon=True
+        )
+        self._import_thread.start()
+
+    def _import_cards_thread(self, path: str, user_id: int) -> None:
+        """Background thread running the import."""
+
+        def report_progress(progress: ImportProgress) -> None:
+            self.view.schedule(0, lambda: self.view.show_import_progress(progress.fraction))
+
+        try:
+            result = self.importer.import_file(path, self.deck_id, user_id, on_progress=report_progress)
+        except (ValueError, OSError) as e:
+            error_msg = f"Nie udało się zaimportować fiszek: {str(e)}"
+            logger.warning(error_msg)
+            self.view.schedule(0, lambda: self._import_failed(error_msg))
+            return
+        except Exception as e:
+            error_msg = f"Wystąpił błąd podczas importu fiszek: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self.view.schedule(0, lambda: self._import_failed(error_msg))
+            return
+        self.view.schedule(0, lambda: self._import_finished(result))
+
+    def _import_finished(self, result: ImportResult) -> None:
+        """Report the outcome of an import and show the new cards (UI thread)."""
+        self._import_thread = None
+        self.view.show_import_progress(None)
+        message = f"Zaimportowano fiszek: {result.imported}."
+        if result.failed:
+            first_error = result.errors[0]
+            message += (
+                f" Pominięto wierszy: {result.failed}"
+                f" (pierwszy w wierszu {first_error.line}: {first_error.message})."
+            )
+        self.view.show_toast("Import", message)
+        self.load_cards()
+
+    def _import_failed(self, error_msg: str) -> None:
+        """Report a failed import (UI thread); cards committed before the failure are shown."""
+        self._import_thread = None
+        self.view.show_import_progress(None)
+        self.view.show_error(error_msg)
+        self.load_cards()
+
     def start_study_session(self) -> None:
         """Start a study session."""
         try:
@@ -121,7 +338,8 @@ class CardListPresenter:
         if self.dialog_open:
             return
 
-        self.navigation.navigate(f"/decks/{self.deck_id}/cards/{flashcard_id}/edit")
+        deck_id = self._card_deck_ids.get(flashcard_id, self.deck_id)
+        self.navigation.navigate(f"/decks/{deck_id}/cards/{flashcard_id}/edit")
 
     def delete_flashcard(self, flashcard_id: int) -> None:
         """Handle flashcard deletion request."""
@@ -1,12 +1,15 @@
 """AI service for flashcard generation."""
 
+import asyncio
 import logging
 import traceback
-from typing import List, Optional
+from concurrent.futures import Future
+from typing import AsyncGenerator, Callable, List, Optional, Set
 
 from cryptography.fernet import InvalidToken
 
-from CardManagement.infrastructure.api_clients.openrouter.client import OpenRouterAPIClient
+from CardManagement.application.services.text_chunking import split_into_chunks
+from CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
 from CardManagement.infrastructure.api_clients.openrouter.exceptions import (
     AIAPIAuthError,
     AIAPIConnectionError,
@@ -15,35 +18,50 @@ from CardManagement.infrastructure.api_clients.openrouter.exceptions import (
     AIRateLimitError,
     FlashcardGenerationError,
 )
+from CardManagement.infrastructure.api_clients.openrouter.retry import RetryListener
 from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
 from Shared.application.session_service import SessionService
-from Shared.infrastructure.config import DEFAULT_AI_MODEL
+from Shared.infrastructure.config import (
+    AI_CHUNK_OVERLAP,
+    AI_CHUNK_SIZE,
+    AI_GENERATION_CONCURRENCY,
+    AI_MAX_SOURCE_TEXT_LENGTH,
+    DEFAULT_AI_MODEL,
+)
 from Shared.infrastructure.security.crypto import crypto_manager
 
 
 class AIService:
     """Application service for AI-powered features."""
 
+    # Session secret holding the decrypted OpenRouter API key of the current user, shared with UserProfileService
+    API_KEY_SECRET = SessionService.API_KEY_SECRET
+
     def __init__(
         self,
-        api_client: OpenRouterAPIClient,
+        api_client: AsyncOpenRouterAPIClient,
         session_service: SessionService,
         logger: logging.Logger,
+        max_concurrency: int = AI_GENERATION_CONCURRENCY,
     ) -> None:
         """Initialize the AI service.
 
         Args:
-            api_client: Low-level OpenRouter API client.
+            api_client: OpenRouter API client whose event loop runs the generations.
             session_service: Service for accessing current user data.
             logger: Pre-configured application logger.
+            max_concurrency: Maximum number of chunks of a long text generated in parallel.
         """
         self.api_client = api_client
         self.session_service = session_service
         self.logger = logger
+        self.max_concurrency = max(1, max_concurrency)
 
     def _get_user_api_key(self) -> str:
         """Get the API key for the current user.
 
+        The key is decrypted once per session and then served from the session's secret cache.
+
         Returns:
             str: The decrypted API key.
 
@@ -56,6 +74,10 @@ class AIService:
         if not user.encrypted_api_key:
             raise AIAPIAuthError("API key not set. Please set your OpenRouter API key in profile settings.")
 
+        cached_key: Optional[str] = self.session_service.get_secret(self.API_KEY_SECRET)
+        if cached_key is not None:
+            return cached_key
+
         # Decrypt the API key if it's bytes
         if isinstance(user.encrypted_api_key, bytes):
             try:
@@ -106,7 +128,11 @@ class AIService:
         self.logger.debug(f"Returning API key (masked): {masked_key}")
 
         # Jawne castowanie typu przed zwróceniem
-        return str(api_key)
+        user_api_key = str(api_key)
+        # Don't cache the key into a session that was switched while decrypting
+        if self.session_service.get_current_user() is user:
+            self.session_service.set_secret(self.API_KEY_SECRET, user_api_key)
+        return user_api_key
 
     def explain_error(self, error: Exception) -> str:
         """Convert an API error to a user-friendly message.
@@ -142,19 +168,22 @@ class AIService:
         deck_id: int,
         *,
         model: Optional[str] = None,
+        bypass_cache: bool = False,
     ) -> List[FlashcardDTO]:
-        """Generate flashcards from the given text.
+        """Generate flashcards from the given text, blocking until all of them are available.
 
-        This is a high-level method that:
-        1. Gets the current user's API key
-        2. Validates the input
-        3. Calls the API client with appropriate parameters
-        4. Returns the generated flashcards
+        Runs start_flashcard_generation and waits for it, so long texts are split into chunks and
+        generated concurrently in the same way, and duplicate questions are dropped. Cards are returned
+        in the order they were generated. Must not be called from the event loop thread.
+
+        Results are cached by the API client; bypass_cache forces a fresh generation (whose result
+        replaces the cached one).
 
         Args:
             raw_text: The text to generate flashcards from.
             deck_id: The ID of the deck to associate flashcards with.
             model: Optional model override. If not provided, uses the default.
+            bypass_cache: Whether to ignore cached results.
 
         Returns:
             List[FlashcardDTO]: The generated flashcards.
@@ -167,51 +196,191 @@ class AIService:
             AIRateLimitError: When hitting rate limits.
             FlashcardGenerationError: If flashcard generation fails.
             ValueError: If the input text is empty or too long.
+            RuntimeError: If the API client's event loop is not running.
+        """
+        self._validate_source_text(raw_text)
+        flashcards: List[FlashcardDTO] = []
+        self.start_flashcard_generation(
+            raw_text, deck_id, flashcards.append, model=model, bypass_cache=bypass_cache
+        ).result()
+        return flashcards
+
+    @staticmethod
+    def _validate_source_text(raw_text: str) -> None:
+        """Reject empty texts and texts over AI_MAX_SOURCE_TEXT_LENGTH.
+
+        Raises:
+            ValueError: If the input text is empty or too long.
         """
-        # Input validation
         if not raw_text.strip():
             raise ValueError("Tekst nie może być pusty")
-        if len(raw_text) > 10000:  # Arbitrary limit to prevent token overflow
-            raise ValueError("Tekst jest zbyt długi (max 10000 znaków)")
+        if len(raw_text) > AI_MAX_SOURCE_TEXT_LENGTH:
+            raise ValueError(f"Tekst jest zbyt długi (max {AI_MAX_SOURCE_TEXT_LENGTH} znaków)")
+
+    def start_flashcard_generation(
+        self,
+        raw_text: str,
+        deck_id: int,
+        on_flashcard: Callable[[FlashcardDTO], None],
+        *,
+        model: Optional[str] = None,
+        bypass_cache: bool = False,
+        on_retry: Optional[RetryListener] = None,
+    ) -> "Future[int]":
+        """Start generating flashcards on the application's event loop.
 
-        # Get API key
-        api_key = self._get_user_api_key()
+        Requires an AsyncOpenRouterAPIClient. on_flashcard is called on the event loop thread for every
+        flashcard as soon as it is available (see astream_flashcards). Any number of generations can
+        run at the same time.
 
-        # Add more diagnostic information about the API key (be careful not to log the actual key)
-        self.logger.debug(
-            f"API key in generate_flashcards - type: {type(api_key)}, length: {len(api_key) if api_key else 0}"
-        )
+        Args:
+            raw_text: The text to generate flashcards from.
+            deck_id: The ID of the deck to associate flashcards with.
+            on_flashcard: Called with each generated flashcard.
+            model: Optional model override. If not provided, uses the default.
+            bypass_cache: Whether to ignore cached results.
+            on_retry: Called on the event loop thread before waiting to retry a failed request.
+
+        Returns:
+            Future[int]: Completes with the number of flashcards, or with the exceptions listed for
+            generate_flashcards. Cancelling it aborts the requests in flight.
+
+        Raises:
+            RuntimeError: If the API client's event loop is not running.
+        """
+        client = self.api_client
 
-        # Log request information (without sensitive data)
+        async def generate() -> int:
+            count = 0
+            flashcards = self.astream_flashcards(
+                raw_text, deck_id, model=model, bypass_cache=bypass_cache, on_retry=on_retry
+            )
+            async for flashcard in flashcards:
+                count += 1
+                on_flashcard(flashcard)
+            return count
+
+        future: "Future[int]" = client.submit(generate())
+        return future
+
+    async def astream_flashcards(
+        self,
+        raw_text: str,
+        deck_id: int,
+        *,
+        model: Optional[str] = None,
+        bypass_cache: bool = False,
+        on_retry: Optional[RetryListener] = None,
+    ) -> AsyncGenerator[FlashcardDTO, None]:
+        """Generate flashcards from the given text on the event loop of an AsyncOpenRouterAPIClient.
+
+        Short texts are streamed from the model card by card. Longer texts are split into overlapping
+        chunks along paragraph and heading boundaries, and the cards of each chunk are yielded as soon
+        as that chunk is done, so the order follows completion rather than the document. Questions
+        already yielded (ignoring case and whitespace) are skipped.
+
+        At most max_concurrency chunks are generated at a time; cancelling the consuming task cancels
+        all of their requests, including waits for a retry. on_retry is called before each such wait.
+        """
+        client = self.api_client
+        self._validate_source_text(raw_text)
+        # Decrypting the key may derive the encryption key, which must not block the loop
+        api_key = await asyncio.to_thread(self._get_user_api_key)
         self.logger.info(
-            "Generating flashcards",
-            extra={
-                "deck_id": deck_id,
-                "text_length": len(raw_text),
-                "model": model or DEFAULT_AI_MODEL,
-            },
+            "Streaming flashcards",
+            extra={"deck_id": deck_id, "text_length": len(raw_text), "model": model or DEFAULT_AI_MODEL},
         )
 
-        try:
-            # Call the API client
-            flashcards: List[FlashcardDTO] = self.api_client.generate_flashcards(
+        if len(raw_text) > AI_CHUNK_SIZE:
+            chunks = split_into_chunks(raw_text, AI_CHUNK_SIZE, AI_CHUNK_OVERLAP)
+            flashcards = self._astream_from_chunks(
+                client,
+                api_key,
+                chunks,
+                deck_id,
+                model or DEFAULT_AI_MODEL,
+                use_cache=not bypass_cache,
+                on_retry=on_retry,
+            )
+        else:
+            flashcards = client.astream_flashcards(
                 api_key=api_key,
                 raw_text=raw_text,
                 deck_id=deck_id,
                 model=model or DEFAULT_AI_MODEL,
-                temperature=0.3,  # Lower temperature for more focused output
+                temperature=0.3,
+                use_cache=not bypass_cache,
+                on_retry=on_retry,
             )
-            return flashcards
 
+        seen: Set[str] = set()
+        try:
+            async for flashcard in flashcards:
+                key = self._question_key(flashcard)
+                if key not in seen:
+                    seen.add(key)
+                    yield flashcard
+        except asyncio.CancelledError:
+            self.logger.info("Flashcard streaming cancelled", extra={"deck_id": deck_id})
+            raise
         except Exception as e:
-            # Log the error
             self.logger.error(
-                "Flashcard generation failed",
-                extra={
-                    "deck_id": deck_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                "Flashcard streaming failed",
+                extra={"deck_id": deck_id, "error": str(e), "error_type": type(e).__name__},
                 exc_info=True,
             )
-            raise  # Re-raise to be handled by the UI
+            raise
+        finally:
+            await flashcards.aclose()
+
+    async def _astream_from_chunks(
+        self,
+        client: AsyncOpenRouterAPIClient,
+        api_key: str,
+        chunks: List[str],
+        deck_id: int,
+        model: str,
+        use_cache: bool = True,
+        on_retry: Optional[RetryListener] = None,
+    ) -> AsyncGenerator[FlashcardDTO, None]:
+        """Generate chunks concurrently, yielding the cards of each chunk as soon as it is done."""
+        self.logger.info(f"Streaming flashcards from {len(chunks)} chunks, up to {self.max_concurrency} at a time")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate_chunk(index: int, chunk: str) -> List[FlashcardDTO]:
+            async with semaphore:
+                try:
+                    flashcards: List[FlashcardDTO] = await client.agenerate_flashcards(
+                        api_key=api_key,
+                        raw_text=chunk,
+                        deck_id=deck_id,
+                        model=model,
+                        temperature=0.3,
+                        use_cache=use_cache,
+                        on_retry=on_retry,
+                    )
+                except FlashcardGenerationError as e:
+                    self.logger.warning(f"Chunk {index + 1}/{len(chunks)} produced no flashcards: {e}")
+                    return []
+            self.logger.debug(f"Chunk {index + 1}/{len(chunks)} produced {len(flashcards)} flashcards")
+            return flashcards
+
+        tasks = [asyncio.ensure_future(generate_chunk(index, chunk)) for index, chunk in enumerate(chunks)]
+        count = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for flashcard in await next_done:
+                    count += 1
+                    yield flashcard
+        finally:
+            # Also runs on cancellation or an error: requests still in flight are aborted
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if count == 0:
+            raise FlashcardGenerationError("No valid flashcards generated")
+
+    @staticmethod
+    def _question_key(flashcard: FlashcardDTO) -> str:
+        """Question of a flashcard normalized for duplicate detection (case and whitespace ignored)."""
+        return " ".join(flashcard.front.casefold().split())
@@ -0,0 +1,307 @@
+"""Streaming import of flashcards from CSV, TSV and Anki plain-text exports."""
+
+import csv
+import html
+import io
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from CardManagement.application.card_service import CardService, CreateFlashcardDTO
+from DeckManagement.application.deck_service import DeckService
+from Shared.infrastructure.config import IMPORT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_TSV = "tsv"
+FORMAT_ANKI = "anki"
+SUPPORTED_FORMATS = (FORMAT_CSV, FORMAT_TSV, FORMAT_ANKI)
+
+_FORMATS_BY_SUFFIX = {".csv": FORMAT_CSV, ".tsv": FORMAT_TSV, ".tab": FORMAT_TSV, ".txt": FORMAT_ANKI}
+
+# First-row cells recognised as a header of a CSV/TSV file, which is then skipped
+_HEADER_NAMES = {"front", "back", "question", "answer", "przód", "przod", "tył", "tyl", "pytanie", "odpowiedź"}
+
+# Values of the '#separator:' header of Anki exports
+_ANKI_SEPARATORS = {"tab": "\t", "comma": ",", "semicolon": ";", "space": " ", "pipe": "|", "colon": ":"}
+# Anki header naming a column that holds metadata rather than a field, e.g. '#tags column:3'
+_ANKI_METADATA_COLUMN = re.compile(r"^(guid|notetype|deck|tags) column$")
+
+_HTML_LINE_BREAK = re.compile(r"<br\s*/?>|</div>|</p>", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Rows whose errors are kept in ImportResult.errors; later ones are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass
+class ImportRowError:
+    """A row that was not imported."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class ImportProgress:
+    """Progress of an import, reported after every committed batch."""
+
+    rows_read: int
+    imported: int
+    failed: int
+    bytes_read: int
+    total_bytes: int
+
+    @property
+    def fraction(self) -> float:
+        """Part of the file read so far, between 0 and 1."""
+        if self.total_bytes <= 0:
+            return 1.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import.
+
+    Only the first MAX_REPORTED_ERRORS row errors are kept in 'errors'; 'failed' counts all of them.
+    """
+
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    cancelled: bool = False
+
+
+@dataclass
+class _Dialect:
+    """How rows of a file are read."""
+
+    delimiter: str
+    quoting: int = csv.QUOTE_MINIMAL
+    html: bool = False
+    # 0-based columns of Anki metadata (guid, note type, deck, tags), skipped when picking the fields
+    skipped_columns: Set[int] = field(default_factory=set)
+    detect_header: bool = True
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Guess the format of a file from its extension.
+
+    Returns:
+        str: One of SUPPORTED_FORMATS; Anki exports usually have the .txt extension.
+
+    Raises:
+        ValueError: If the extension is not recognised.
+    """
+    file_format = _FORMATS_BY_SUFFIX.get(Path(path).suffix.lower())
+    if file_format is None:
+        raise ValueError("Nieobsługiwany format pliku (obsługiwane: .csv, .tsv, .txt z eksportu Anki)")
+    return file_format
+
+
+class FlashcardImporter:
+    """Imports flashcards into a deck from a CSV/TSV file or an Anki "notes in plain text" export.
+
+    The file is streamed row by row, so memory use does not depend on its size. The first two
+    fields of a row are the front and back of a flashcard; further fields are ignored. Valid rows
+    are created through CardService.import_flashcards in batches, each in its own transaction,
+    so a cancelled or failed import keeps the batches committed before it.
+    """
+
+    def __init__(self, card_service: CardService, deck_service: DeckService, batch_size: int = IMPORT_BATCH_SIZE):
+        """Initialize the importer.
+
+        Args:
+            card_service: Service the flashcards are created with
+            deck_service: Service used to check the target deck belongs to the user
+            batch_size: Flashcards committed per transaction
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.card_service = card_service
+        self.deck_service = deck_service
+        self.batch_size = batch_size
+
+    def import_file(
+        self,
+        path: Union[str, Path],
+        deck_id: int,
+        user_id: int,
+        *,
+        file_format: Optional[str] = None,
+        on_progress: Optional[Callable[[ImportProgress], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> ImportResult:
+        """Import the flashcards of a file into a deck.
+
+        Args:
+            path: The file; UTF-8, with or without a byte order mark
+            deck_id: The deck the flashcards are added to
+            user_id: The user owning the deck
+            file_format: One of SUPPORTED_FORMATS; detected from the extension when omitted
+            on_progress: Called (on the calling thread) after every committed batch
+            cancel_event: When set, the import stops after the current batch
+
+        Returns:
+            ImportResult: Counts of imported and rejected rows, with the reasons of the rejections
+
+        Raises:
+            ValueError: If the deck does not exist, the format is not supported, or the file
+                cannot be decoded or parsed; batches committed before the error are kept
+            OSError: If the file cannot be read
+        """
+        if self.deck_service.get_deck(deck_id, user_id) is None:
+            raise ValueError("Talia nie istnieje")
+        file_format = file_format or detect_format(path)
+        if file_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Nieobsługiwany format pliku: {file_format}")
+
+        total_bytes = os.path.getsize(path)
+        result = ImportResult()
+        batch: List[CreateFlashcardDTO] = []
+        rows_read = 0
+
+        def report_progress() -> None:
+            if on_progress is not None:
+                on_progress(ImportProgress(rows_read, result.imported, result.failed, raw.tell(), total_bytes))
+
+        def commit_batch() -> None:
+            result.imported += self.card_service.import_flashcards(deck_id, batch)
+            batch.clear()
+            report_progress()
+
+        with open(path, "rb") as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            line = 0
+            try:
+                for line, fields in self._read_rows(text, file_format):
+                    rows_read += 1
+                    try:
+                        front_text, back_text = self._to_texts(fields)
+                    except ValueError as e:
+                        self._reject(result, line, str(e))
+                        continue
+                    batch.append(CreateFlashcardDTO(front_text=front_text, back_text=back_text))
+                    if len(batch) >= self.batch_size:
+                        commit_batch()
+                        if cancel_event is not None and cancel_event.is_set():
+                            result.cancelled = True
+                            break
+            except (UnicodeDecodeError, csv.Error) as e:
+                logger.error(f"Import of {path} stopped after line {line}: {e}")
+                raise ValueError(
+                    f"Nie udało się odczytać pliku za wierszem {line} (zaimportowano {result.imported} fiszek): {e}"
+                ) from e
+            if batch:
+                commit_batch()
+            elif not result.cancelled:
+                report_progress()
+
+        logger.info(
+            f"Imported {result.imported} flashcards into deck {deck_id} from {path} "
+            f"({result.failed} rows rejected{', cancelled' if result.cancelled else ''})"
+        )
+        return result
+
+    def _read_rows(self, text: io.TextIOWrapper, file_format: str) -> Iterator[Tuple[int, List[str]]]:
+        """Yield the 1-based starting line and the fields of every non-blank row."""
+        header_lines = 0
+        if file_format == FORMAT_ANKI:
+            directives, header_lines = self._read_anki_header(text)
+            dialect = self._anki_dialect(directives)
+        elif file_format == FORMAT_TSV:
+            # Plain TSV has no quoting; a quote character is part of the text
+            dialect = _Dialect(delimiter="\t", quoting=csv.QUOTE_NONE)
+        else:
+            dialect = _Dialect(delimiter=",")
+
+        reader = csv.reader(text, delimiter=dialect.delimiter, quoting=dialect.quoting, strict=True)
+        first_row = True
+        previous_line_num = 0
+        for fields in reader:
+            line = header_lines + previous_line_num + 1
+            previous_line_num = reader.line_num
+            if not any(field.strip() for field in fields):
+                continue
+            if first_row:
+                first_row = False
+                if dialect.detect_header and self._is_header(fields):
+                    continue
+            if dialect.skipped_columns:
+                fields = [value for index, value in enumerate(fields) if index not in dialect.skipped_columns]
+            if dialect.html:
+                fields = [self._html_to_text(value) for value in fields[:2]]
+            yield line, fields
+
+    @staticmethod
+    def _read_anki_header(text: io.TextIOWrapper) -> Tuple[Dict[str, str], int]:
+        """Read the '#key:value' lines at the top of an Anki export.
+
+        Returns:
+            The directives by lowercased key, and the number of lines consumed. The first line
+            that is not a directive is pushed back by seeking to its start.
+        """
+        directives: Dict[str, str] = {}
+        lines = 0
+        while True:
+            position = text.tell()
+            line = text.readline()
+            if not line.startswith("#") or ":" not in line:
+                text.seek(position)
+                return directives, lines
+            key, _, value = line[1:].partition(":")
+            directives[key.strip().lower()] = value.strip()
+            lines += 1
+
+    @staticmethod
+    def _anki_dialect(directives: Dict[str, str]) -> _Dialect:
+        """Build the dialect described by the header directives of an Anki export."""
+        separator = directives.get("separator", "tab")
+        delimiter = _ANKI_SEPARATORS.get(separator.lower(), separator)
+        if len(delimiter) != 1:
+            raise ValueError(f"Nieobsługiwany separator w pliku Anki: {separator}")
+        skipped_columns = set()
+        for key, value in directives.items():
+            if _ANKI_METADATA_COLUMN.match(key) and value.isdigit():
+                skipped_columns.add(int(value) - 1)
+        return _Dialect(
+            delimiter=delimiter,
+            html=directives.get("html", "false").lower() == "true",
+            skipped_columns=skipped_columns,
+            detect_header=False,
+        )
+
+    @staticmethod
+    def _is_header(fields: List[str]) -> bool:
+        """Whether the first row names the columns, e.g. 'front,back'."""
+        return len(fields) >= 2 and all(value.strip().lower() in _HEADER_NAMES for value in fields[:2])
+
+    @staticmethod
+    def _html_to_text(value: str) -> str:
+        """Convert an HTML field of an Anki export to plain text."""
+        value = _HTML_LINE_BREAK.sub("\n", value)
+        return html.unescape(_HTML_TAG.sub("", value))
+
+    @staticmethod
+    def _to_texts(fields: List[str]) -> Tuple[str, str]:
+        """The validated front and back texts of a row."""
+        if len(fields) < 2:
+            raise ValueError("Wiersz musi zawierać przód i tył fiszki")
+        texts: Tuple[str, str] = CardService.validate_texts(fields[0], fields[1])
+        return texts
+
+    @staticmethod
+    def _reject(result: ImportResult, line: int, message: str) -> None:
+        """Record a row that was not imported."""
+        result.failed += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(ImportRowError(line=line, message=message))
@@ -0,0 +1,80 @@
+"""Flashcards of a generation that is still running."""
+
+import threading
+from typing import Callable, List, Optional, Sequence, overload
+
+from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
+
+
+class GeneratedFlashcards(Sequence[FlashcardDTO]):
+    """Thread-safe, growing sequence of generated flashcards.
+
+    The generating thread appends flashcards as they are streamed and calls finish() at the end,
+    while the review screen reads the ones already available. The reviewer can cancel() the
+    generation, which runs the registered cancel callbacks (e.g. cancelling the request in flight)
+    and is also checked by the generating side between flashcards.
+    """
+
+    def __init__(self) -> None:
+        self._items: List[FlashcardDTO] = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+        self._error: Optional[str] = None
+        self._cancel_callbacks: List[Callable[[], object]] = []
+
+    @overload
+    def __getitem__(self, index: int) -> FlashcardDTO: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[FlashcardDTO]: ...
+
+    def __getitem__(self, index):  # type: ignore[no-untyped-def]
+        with self._lock:
+            return self._items[index]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def append(self, flashcard: FlashcardDTO) -> None:
+        """Add a flashcard received from the model."""
+        with self._lock:
+            self._items.append(flashcard)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """Mark the generation as finished.
+
+        Args:
+            error: User-facing message if the generation failed before producing all flashcards.
+        """
+        self._error = error
+        self._done.set()
+
+    def add_cancel_callback(self, callback: Callable[[], object]) -> None:
+        """Register a callback run by cancel(), e.g. one that aborts the request in flight."""
+        with self._lock:
+            self._cancel_callbacks.append(callback)
+
+    def cancel(self) -> None:
+        """Ask the generation to stop."""
+        self._cancelled.set()
+        with self._lock:
+            callbacks = list(self._cancel_callbacks)
+        for callback in callbacks:
+            callback()
+
+    @property
+    def is_done(self) -> bool:
+        """Whether no more flashcards will be added."""
+        return self._done.is_set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether the reviewer asked to stop the generation."""
+        return self._cancelled.is_set()
+
+    @property
+    def error(self) -> Optional[str]:
+        """User-facing message of the error that ended the generation, if any."""
+        return self._error
@@ -0,0 +1,104 @@
+"""Splitting long source texts into chunks for AI flashcard generation."""
+
+import re
+from typing import Iterator, List
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s")
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+_SEPARATOR = "\n\n"
+
+
+def split_into_chunks(text: str, max_chars: int, overlap: int = 0) -> List[str]:
+    """Split text into chunks of at most max_chars characters along paragraph and heading boundaries.
+
+    Paragraphs are packed greedily; a Markdown heading starts a new chunk once the current one is half
+    full. Paragraphs longer than a chunk are split at sentence ends, and sentences longer than a chunk
+    at whitespace. Each chunk that continues the previous one mid-section starts with up to 'overlap'
+    characters from its end, so a concept cut at the boundary is still seen whole by one request.
+
+    Args:
+        text: The source text.
+        max_chars: Maximum length of a chunk.
+        overlap: Characters repeated from the end of the previous chunk (capped at a quarter of max_chars).
+
+    Returns:
+        List[str]: The chunks in document order; empty for blank text.
+
+    Raises:
+        ValueError: If max_chars is not positive.
+    """
+    if max_chars <= 0:
+        raise ValueError("max_chars must be positive")
+    text = text.replace("\r\n", "\n").strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+    overlap = min(max(overlap, 0), max_chars // 4)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for block in _blocks(text, max_chars):
+        is_heading = bool(_HEADING.match(block))
+        if current and (size + len(_SEPARATOR) + len(block) > max_chars or (is_heading and size >= max_chars // 2)):
+            chunk = _SEPARATOR.join(current)
+            chunks.append(chunk)
+            # A new section needs no context from the previous one
+            tail = "" if is_heading else _tail(chunk, overlap)
+            current = [tail] if tail and len(tail) + len(_SEPARATOR) + len(block) <= max_chars else []
+            size = len(tail) if current else 0
+        size += len(block) + (len(_SEPARATOR) if current else 0)
+        current.append(block)
+    if current:
+        chunks.append(_SEPARATOR.join(current))
+    return chunks
+
+
+def _blocks(text: str, max_chars: int) -> Iterator[str]:
+    """Paragraphs and headings of the text, none longer than max_chars."""
+    for paragraph in _BLANK_LINES.split(text):
+        lines: List[str] = []
+        for line in paragraph.split("\n"):
+            if _HEADING.match(line) and lines:
+                yield from _split_long("\n".join(lines).strip(), max_chars)
+                lines = []
+            lines.append(line)
+        yield from _split_long("\n".join(lines).strip(), max_chars)
+
+
+def _split_long(block: str, max_chars: int) -> Iterator[str]:
+    """Split a block longer than max_chars at sentence ends, or at whitespace as a last resort."""
+    if not block:
+        return
+    if len(block) <= max_chars:
+        yield block
+        return
+    current = ""
+    for sentence in _SENTENCE_END.split(block):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                yield current
+                current = ""
+            yield sentence[:cut].rstrip()
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            yield current
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        yield current
+
+
+def _tail(chunk: str, overlap: int) -> str:
+    """The last 'overlap' characters of a chunk, starting at a paragraph or word boundary."""
+    if overlap <= 0 or len(chunk) <= overlap:
+        return ""
+    tail = chunk[-overlap:]
+    paragraph_start = tail.find(_SEPARATOR)
+    if paragraph_start != -1:
+        return tail[paragraph_start:].strip()
+    word_start = tail.find(" ")
+    return tail[word_start:].strip() if word_start != -1 else ""
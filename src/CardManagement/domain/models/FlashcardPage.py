@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from CardManagement.domain.models.Flashcard import Flashcard
+
+# Orders supported by paged flashcard listings; ties are broken by flashcard ID
+FLASHCARD_SORT_KEYS = ("front_text", "source", "created_at", "updated_at", "due")
+
+
+@dataclass(frozen=True)
+class FlashcardPage:
+    """
+    One page of flashcards returned by keyset-paginated repository queries.
+    'next_cursor' is an opaque token to pass back for the following page, or None when there are no more rows.
+    """
+
+    items: List[Flashcard]
+    next_cursor: Optional[str]
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from CardManagement.domain.models.Flashcard import Flashcard
+from CardManagement.domain.models.FlashcardPage import FlashcardPage
 
 
 class IFlashcardRepository(ABC):
@@ -14,6 +16,20 @@ class IFlashcardRepository(ABC):
         Adds a new flashcard and returns the instance with assigned 'id' and timestamps.
         """
 
+    @abstractmethod
+    def add_many(self, flashcards: Sequence[Flashcard]) -> List[Flashcard]:
+        """
+        Adds many new flashcards in a single transaction (all or none) and returns them,
+        in the given order, with assigned 'id' and timestamps.
+        """
+
+    @abstractmethod
+    def insert_many(self, flashcards: Sequence[Flashcard]) -> int:
+        """
+        Adds many new flashcards in a single transaction (all or none) without reading them back,
+        for imports where the created rows are not needed. Returns the number of added flashcards.
+        """
+
     @abstractmethod
     def get_by_id(self, flashcard_id: int) -> Optional[Flashcard]:
         """
@@ -26,12 +42,58 @@ class IFlashcardRepository(ABC):
         Returns a list of flashcards belonging to the given deck.
         """
 
+    @abstractmethod
+    def list_page(
+        self,
+        deck_id: int,
+        sort_key: str = "created_at",
+        after_cursor: Optional[str] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> FlashcardPage:
+        """
+        Returns the next page of the deck's flashcards ordered by (sort_key, id), using keyset pagination.
+        'sort_key' is one of FLASHCARD_SORT_KEYS; pass the previous page's next_cursor as 'after_cursor'
+        to continue. Raises ValueError for an unknown sort key or a cursor of another sort key.
+        """
+
+    @abstractmethod
+    def list_due_page(
+        self, deck_id: int, now: datetime, limit: int, after_cursor: Optional[str] = None
+    ) -> FlashcardPage:
+        """
+        Returns the next page of due flashcards using keyset pagination on (due, id).
+        Pass the previous page's next_cursor as 'after_cursor' to continue.
+        """
+
+    @abstractmethod
+    def count_due_by_deck_id(self, deck_id: int, now: datetime) -> int:
+        """
+        Returns the number of flashcards in the deck that are due at 'now'.
+        """
+
+    @abstractmethod
+    def search(
+        self, user_id: int, query: str, deck_id: Optional[int] = None, limit: int = 50, offset: int = 0
+    ) -> List[Flashcard]:
+        """
+        Full-text search over fronts and backs of all flashcards in the user's decks
+        (or only in 'deck_id'), ranked by relevance. Every word of 'query' is matched as a prefix.
+        """
+
     @abstractmethod
     def update(self, flashcard: Flashcard) -> None:
         """
         Updates an existing flashcard (content or FSRS state).
         """
 
+    @abstractmethod
+    def bulk_set_fsrs_state(self, states: List[Tuple[int, str]]) -> None:
+        """
+        Sets the FSRS state of many flashcards in a single transaction.
+        'states' holds (flashcard_id, fsrs_state) pairs.
+        """
+
     @abstractmethod
     def delete(self, flashcard_id: int) -> None:
         """
@@ -0,0 +1,289 @@
+"""Asynchronous OpenRouter API client running on the application's event loop."""
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+from typing import Any, AsyncGenerator, Coroutine, Dict, List, Optional, Tuple, TypeVar
+
+from Shared.infrastructure.async_loop import AsyncLoopThread
+
+from .cache import FlashcardCache
+from .client import OpenRouterAPIClient, litellm
+from .exceptions import FlashcardGenerationError, OpenRouterError
+from .retry import RetryListener, RetryPolicy, acall_with_retry
+from .streaming import FlashcardStreamParser
+from .types import ChatCompletionDTO, ChatMessage, FlashcardDTO
+
+T = TypeVar("T")
+
+
+class AsyncOpenRouterAPIClient(OpenRouterAPIClient):
+    """OpenRouter client whose requests are coroutines built on litellm.acompletion.
+
+    The coroutines run on the shared AsyncLoopThread; use submit() to start one from another thread.
+    Many generations and key verifications can be in flight at once, and cancelling the future
+    returned by submit() aborts the HTTP request. The blocking verify_key is inherited.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        event_loop: AsyncLoopThread,
+        default_model: Optional[str] = None,
+        cache: Optional[FlashcardCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            logger: Pre-configured application logger.
+            event_loop: The application's event loop thread the coroutines run on.
+            default_model: Optional default model to use for completions.
+            cache: Optional cache of generation results consulted before calling the API.
+            retry_policy: When to retry failed requests; defaults to RetryPolicy().
+        """
+        super().__init__(logger=logger, default_model=default_model, cache=cache, retry_policy=retry_policy)
+        self.event_loop = event_loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Run a coroutine (e.g. one of this client's a-methods) on the event loop.
+
+        Returns:
+            concurrent.futures.Future: Cancelling it cancels the coroutine and its HTTP request.
+        """
+        future: "concurrent.futures.Future[T]" = self.event_loop.submit(coro)
+        return future
+
+    async def averify_key(self, api_key: str) -> Tuple[bool, str]:
+        """Asynchronous verify_key.
+
+        Unlike verify_key, litellm debug logging is not switched on, as that is global and
+        other requests may be running on the loop at the same time.
+        """
+        self.logger.info("Verifying OpenRouter API key")
+        if not api_key.startswith("sk-or-"):
+            self.logger.warning("API key validation failed: Invalid key format")
+            return False, "Nieprawidłowy format klucza API (powinien zaczynać się od 'sk-or-')"
+
+        try:
+            self.logger.info("Sending test request to OpenRouter API")
+            response = await litellm.acompletion(
+                model=self.KEY_VERIFICATION_MODEL,
+                messages=[{"role": "user", "content": "test"}],
+                api_key=api_key,
+                max_tokens=1,
+                temperature=0.0,
+                custom_headers=self.default_headers,
+            )
+            self.logger.info("OpenRouter API test request successful")
+            self.logger.debug(f"Response model: {response.model}")
+            return True, "API key valid"
+        except asyncio.CancelledError:
+            self.logger.info("API key verification cancelled")
+            raise
+        except Exception as e:
+            return self._verification_result(e)
+
+    async def achat_completion(
+        self,
+        api_key: str,
+        messages: List[ChatMessage],
+        *,
+        model: Optional[str] = None,
+        response_format: Optional[dict] = None,
+        on_retry: Optional[RetryListener] = None,
+        **params: Any,
+    ) -> ChatCompletionDTO:
+        """Send a chat completion request to OpenRouter API.
+
+        Failed requests are retried according to the client's retry policy (see RetryPolicy);
+        cancelling the task also stops waiting for a retry.
+
+        Args:
+            api_key: OpenRouter API key for authentication.
+            messages: List of chat messages for the completion.
+            model: Model identifier to use for completion. If not provided,
+                  uses the default_model specified in constructor.
+            response_format: Optional response format specification.
+            on_retry: Called before waiting to retry a failed request.
+            **params: Additional parameters to pass to the API.
+
+        Returns:
+            ChatCompletionDTO containing the API response.
+
+        Raises:
+            AIAPIAuthError: If the API key is invalid or missing.
+            AIAPIConnectionError: If there are network connectivity issues.
+            AIAPIRequestError: For 4xx client errors.
+            AIAPIServerError: For 5xx server errors.
+            AIRateLimitError: When hitting rate limits.
+            ValueError: If no model is specified (neither in request nor default).
+        """
+        completion_params = self._completion_params(messages, model, response_format, params)
+
+        async def request() -> ChatCompletionDTO:
+            try:
+                response = await litellm.acompletion(
+                    **completion_params, api_key=api_key, custom_headers=self.default_headers
+                )
+                return self._to_chat_completion_dto(response)
+
+            except Exception as e:
+                self._handle_litellm_error(e)
+
+        return await acall_with_retry(request, self.retry_policy, on_retry=on_retry)
+
+    async def agenerate_flashcards(
+        self,
+        api_key: str,
+        raw_text: str,
+        deck_id: int,
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        use_cache: bool = True,
+        on_retry: Optional[RetryListener] = None,
+    ) -> List[FlashcardDTO]:
+        """Generate flashcards from the given text.
+
+        If a cache is configured, an earlier result for the same model, temperature, prompt and
+        (normalized) text is returned without calling the API. Fresh results are always stored.
+
+        Args:
+            api_key: OpenRouter API key for authentication.
+            raw_text: The text to generate flashcards from.
+            deck_id: The ID of the deck to associate flashcards with.
+            model: Optional model override for this specific generation.
+            temperature: Controls randomness in the generation (0.0 to 1.0).
+            use_cache: Whether a cached result may be returned instead of calling the API.
+            on_retry: Called before waiting to retry a failed request.
+
+        Returns:
+            List[FlashcardDTO]: The generated flashcards.
+
+        Raises:
+            FlashcardGenerationError: If flashcard generation fails.
+            AIAPIAuthError: If the API key is invalid.
+            AIAPIConnectionError: If there are network issues.
+            AIAPIRequestError: For 4xx client errors.
+            AIAPIServerError: For 5xx server errors.
+            AIRateLimitError: When hitting rate limits.
+        """
+        cache_key = self._cache_key(raw_text, model, temperature)
+        cached = self._cached_flashcards(cache_key, deck_id) if use_cache else None
+        if cached:
+            return cached
+
+        try:
+            response = await self.achat_completion(
+                api_key=api_key,
+                messages=self._format_flashcard_prompt(raw_text),
+                model=model,
+                response_format={"type": "json_object"},
+                on_retry=on_retry,
+                temperature=temperature,
+            )
+            flashcards = self._parse_flashcard_response(response, deck_id)
+            self._store_in_cache(cache_key, flashcards)
+            return flashcards
+
+        except OpenRouterError:
+            raise
+        except Exception as e:
+            raise FlashcardGenerationError(f"Unexpected error in flashcard generation: {str(e)}")
+
+    async def astream_flashcards(
+        self,
+        api_key: str,
+        raw_text: str,
+        deck_id: int,
+        *,
+        model: Optional[str] = None,
+        temperature: float = 0.3,
+        use_cache: bool = True,
+        on_retry: Optional[RetryListener] = None,
+    ) -> AsyncGenerator[FlashcardDTO, None]:
+        """Generate flashcards from the given text, yielding each one as soon as the model has written it.
+
+        The completion is requested with stream=True and parsed incrementally, so the first flashcard is
+        available after a fraction of the full generation time. Cancelling the consuming task (or closing
+        the generator) closes the stream and aborts the request. Opening the stream is retried according
+        to the retry policy; once flashcards have arrived the request is not repeated. A cached result, if
+        any, is yielded without calling the API, and a stream read to the end is stored in the cache.
+
+        Args:
+            api_key: OpenRouter API key for authentication.
+            raw_text: The text to generate flashcards from.
+            deck_id: The ID of the deck to associate flashcards with.
+            model: Optional model override for this specific generation.
+            temperature: Controls randomness in the generation (0.0 to 1.0).
+            use_cache: Whether a cached result may be returned instead of calling the API.
+            on_retry: Called before waiting to retry opening the stream.
+
+        Yields:
+            FlashcardDTO: The generated flashcards, in the order the model writes them.
+
+        Raises:
+            FlashcardGenerationError: If the response contains no valid flashcards.
+            AIAPIAuthError: If the API key is invalid.
+            AIAPIConnectionError: If there are network issues.
+            AIAPIRequestError: For 4xx client errors.
+            AIAPIServerError: For 5xx server errors.
+            AIRateLimitError: When hitting rate limits.
+            ValueError: If no model is specified (neither in request nor default).
+        """
+        stream_params = self._stream_params(raw_text, model, temperature)
+        cache_key = self._cache_key(raw_text, stream_params["model"], temperature)
+        cached = self._cached_flashcards(cache_key, deck_id) if use_cache else None
+        if cached:
+            for flashcard in cached:
+                yield flashcard
+            return
+
+        parser = FlashcardStreamParser()
+        received: List[FlashcardDTO] = []
+        stream = None
+        try:
+            stream = await acall_with_retry(
+                lambda: self._aopen_stream(stream_params, api_key), self.retry_policy, on_retry=on_retry
+            )
+            async for chunk in stream:
+                for flashcard in self._parse_stream_chunk(parser, chunk, deck_id):
+                    received.append(flashcard)
+                    yield flashcard
+        except OpenRouterError:
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            self.logger.info(f"Flashcard stream stopped after {len(received)} flashcards")
+            raise
+        except Exception as e:
+            self._handle_litellm_error(e)
+        finally:
+            await self._aclose_stream(stream)
+
+        if not received:
+            self.logger.error(f"Streamed AI response contained no valid flashcards: {parser.text[:500]}")
+            raise FlashcardGenerationError("No valid flashcards generated")
+        self.logger.info(f"Streamed {len(received)} flashcards")
+        self._store_in_cache(cache_key, received)
+
+    async def _aopen_stream(self, stream_params: Dict[str, Any], api_key: str) -> Any:
+        """Send a streamed completion request, converting litellm errors to our exceptions."""
+        try:
+            return await litellm.acompletion(**stream_params, api_key=api_key, custom_headers=self.default_headers)
+        except Exception as e:
+            self._handle_litellm_error(e)
+
+    async def _aclose_stream(self, stream: Any) -> None:
+        """Close an async litellm stream, releasing its HTTP connection."""
+        for target in (stream, getattr(stream, "completion_stream", None)):
+            close = getattr(target, "aclose", None) or getattr(target, "close", None)
+            if callable(close):
+                try:
+                    result = close()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    self.logger.debug(f"Error closing completion stream: {e}")
+                return
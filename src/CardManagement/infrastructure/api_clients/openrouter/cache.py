@@ -0,0 +1,158 @@
+"""On-disk cache of generated flashcards, keyed by the content of the generation request."""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .types import FlashcardDTO
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format or the key derivation changes, so old entries are never read
+CACHE_FORMAT_VERSION = 1
+
+_HORIZONTAL_WHITESPACE = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_source_text(text: str) -> str:
+    """Normalize a source text so that trivially different copies of it share a cache entry.
+
+    Unicode is NFC-normalized, line endings are unified, runs of spaces and tabs are collapsed,
+    lines are stripped and runs of blank lines are reduced to one.
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_HORIZONTAL_WHITESPACE.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+class FlashcardCache:
+    """Content-addressed SQLite cache of parsed flashcard generation results.
+
+    An entry is keyed by a SHA-256 hash of the model, temperature, prompt template and normalized
+    source text, and stores the parsed flashcards without their deck id. Entries older than 'ttl_seconds'
+    are dropped on read; when the stored flashcards exceed 'max_bytes', the least recently used
+    entries are evicted. The cache is safe to use from several threads.
+
+    The cache never breaks generation: database errors are logged and treated as a miss.
+    """
+
+    def __init__(self, db_path: Union[str, Path], ttl_seconds: float, max_bytes: int) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Path of the SQLite file, or ":memory:".
+            ttl_seconds: How long an entry stays valid after it was stored.
+            max_bytes: Upper bound for the total size of the stored flashcards.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS FlashcardCache (
+                    key TEXT PRIMARY KEY,
+                    flashcards TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_flashcard_cache_lru ON FlashcardCache(last_used_at)")
+
+    @staticmethod
+    def make_key(model: str, temperature: float, prompt_template: str, source_text: str) -> str:
+        """Hash the parts of a generation request that determine its result."""
+        payload = json.dumps(
+            [CACHE_FORMAT_VERSION, model, float(temperature), prompt_template, normalize_source_text(source_text)],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, deck_id: int) -> Optional[List[FlashcardDTO]]:
+        """Return the cached flashcards bound to 'deck_id', or None on a miss or an expired entry."""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT flashcards, created_at FROM FlashcardCache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM FlashcardCache WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE FlashcardCache SET last_used_at = ? WHERE key = ?", (now, key))
+            cards = json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Flashcard cache read failed, treating as a miss: {e}")
+            return None
+        return [
+            FlashcardDTO(
+                front=card["front"],
+                back=card["back"],
+                deck_id=deck_id,
+                tags=card.get("tags"),
+                metadata=card.get("metadata"),
+            )
+            for card in cards
+        ]
+
+    def put(self, key: str, flashcards: List[FlashcardDTO]) -> None:
+        """Store the flashcards under 'key', evicting the least recently used entries over max_bytes."""
+        payload = json.dumps(
+            [{"front": f.front, "back": f.back, "tags": f.tags, "metadata": f.metadata} for f in flashcards],
+            ensure_ascii=False,
+        )
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.debug(f"Not caching a {size} byte generation result (limit {self.max_bytes})")
+            return
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO FlashcardCache (key, flashcards, size, created_at, last_used_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (key, payload, size, now, now),
+                )
+                self._conn.execute("DELETE FROM FlashcardCache WHERE created_at < ?", (now - self.ttl_seconds,))
+                self._conn.execute(
+                    """
+                    DELETE FROM FlashcardCache WHERE key IN (
+                        SELECT key FROM (
+                            SELECT key, SUM(size) OVER (ORDER BY last_used_at DESC, key) AS running_size
+                            FROM FlashcardCache
+                        )
+                        WHERE running_size > ?
+                    )
+                    """,
+                    (self.max_bytes,),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Flashcard cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM FlashcardCache")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
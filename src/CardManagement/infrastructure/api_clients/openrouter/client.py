@@ -2,11 +2,15 @@
 
 import json
 import logging
-from typing import List, Optional, Any, NoReturn, Tuple, cast
+import math
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, NoReturn, Tuple, cast
 
-import litellm
-from tenacity import retry, stop_after_attempt, wait_exponential
+from Shared.infrastructure.lazy_import import LazyModule, warm_up_in_background
 
+from .cache import FlashcardCache
 from .exceptions import (
     AIAPIAuthError,
     AIAPIConnectionError,
@@ -14,19 +18,41 @@ from .exceptions import (
     AIAPIServerError,
     AIRateLimitError,
     FlashcardGenerationError,
-    OpenRouterError,
 )
 from .prompts import FLASHCARD_GENERATION_PROMPT, FLASHCARD_SCHEMA
+from .retry import RetryPolicy
+from .streaming import FlashcardStreamParser
 from .types import ChatMessage, ChatCompletionDTO, FlashcardDTO
 
 
+def _configure_litellm(module: Any) -> None:
+    """Configure litellm settings once it is imported."""
+    # Ensure HTTPS is enforced
+    module.api_base = "https://openrouter.ai/api/v1"
+    # Make sure we're using the right HTTP endpoint pattern
+    # litellm.force_openai_route = True
+
+
+# litellm takes seconds to import, so it is only imported when the first request is made
+litellm = LazyModule("litellm", on_import=_configure_litellm)
+
+
 class OpenRouterAPIClient:
-    """Client for interacting with OpenRouter API via litellm."""
+    """Client for interacting with OpenRouter API via litellm.
+
+    Only key verification is blocking; requests and flashcard generation are the coroutines of
+    AsyncOpenRouterAPIClient, which builds them from the prompt, parsing and cache helpers here.
+    """
+
+    # Small model used for the lightweight key verification request
+    KEY_VERIFICATION_MODEL = "openrouter/meta-llama/llama-3-8b-instruct"
 
     def __init__(
         self,
         logger: logging.Logger,
         default_model: Optional[str] = None,
+        cache: Optional[FlashcardCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
         """Initialize the OpenRouter API client.
 
@@ -34,17 +60,17 @@ class OpenRouterAPIClient:
             logger: Pre-configured application logger.
             default_model: Optional default model to use for completions.
                          If not provided, must be specified in each request.
+            cache: Optional cache of generation results consulted before calling the API.
+            retry_policy: When to retry failed requests; defaults to RetryPolicy().
         """
         self.logger = logger
         self.default_model = default_model
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
         self._configure_litellm()
 
     def _configure_litellm(self) -> None:
-        """Configure litellm settings."""
-        # Ensure HTTPS is enforced
-        litellm.api_base = "https://openrouter.ai/api/v1"
-        # Make sure we're using the right HTTP endpoint pattern
-        # litellm.force_openai_route = True
+        """Configure request settings; litellm itself is configured when it is imported."""
         # Przygotowujemy domyślne nagłówki dla OpenRouter, które będziemy przekazywać w wywołaniach
         self.default_headers = {
             "HTTP-Referer": "https://10xcards.app",  # Opcjonalny identyfikator aplikacji
@@ -63,18 +89,54 @@ class OpenRouterAPIClient:
         if isinstance(error, litellm.exceptions.AuthenticationError):
             raise AIAPIAuthError(str(error))
         elif isinstance(error, litellm.exceptions.RateLimitError):
-            retry_after = getattr(error, "retry_after", None)
-            raise AIRateLimitError(retry_after)
+            raise AIRateLimitError(self._retry_after(error))
         elif isinstance(error, litellm.exceptions.BadRequestError):
             raise AIAPIRequestError(400, str(error))
         elif isinstance(error, litellm.exceptions.ServiceUnavailableError):
             raise AIAPIServerError(503, str(error))
+        elif isinstance(error, litellm.exceptions.InternalServerError):
+            raise AIAPIServerError(500, str(error))
         elif isinstance(error, (litellm.exceptions.Timeout, litellm.exceptions.APIConnectionError)):
             raise AIAPIConnectionError(str(error))
+        elif isinstance(error, litellm.exceptions.APIError) and getattr(error, "status_code", 0) >= 500:
+            raise AIAPIServerError(error.status_code, str(error))
         else:
             self.logger.error(f"Unexpected error in OpenRouter API client: {error}", exc_info=True)
             raise
 
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[int]:
+        """Seconds to wait before retrying, from the error or its response's Retry-After header."""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            response = getattr(error, "response", None)
+            headers = getattr(response, "headers", None)
+            retry_after = headers.get("retry-after") if headers is not None else None
+        if retry_after is None:
+            return None
+        try:
+            return max(0, math.ceil(float(retry_after)))
+        except (TypeError, ValueError):
+            pass
+        try:
+            # Retry-After may also be an HTTP date
+            retry_at = parsedate_to_datetime(str(retry_after))
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0, math.ceil((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+    @staticmethod
+    def preload() -> threading.Thread:
+        """Import litellm on a background thread, so that the first request does not wait for it.
+
+        Returns:
+            The started thread.
+        """
+        thread: threading.Thread = warm_up_in_background([litellm], name="LitellmImport")
+        return thread
+
     def verify_key(self, api_key: str) -> Tuple[bool, str]:
         """Verify if the API key is valid by making a lightweight API call.
 
@@ -115,7 +177,7 @@ class OpenRouterAPIClient:
             self.logger.info("Sending test request to OpenRouter API")
 
             response = litellm.completion(
-                model="openrouter/meta-llama/llama-3-8b-instruct",  # Poprawny format modelu dla OpenRouter
+                model=self.KEY_VERIFICATION_MODEL,  # Poprawny format modelu dla OpenRouter
                 messages=test_message,
                 api_key=api_key,
                 max_tokens=1,  # Absolutne minimum tokenów
@@ -131,50 +193,54 @@ class OpenRouterAPIClient:
 
             return True, "API key valid"
 
-        except litellm.exceptions.AuthenticationError as e:
+        except Exception as e:
+            return self._verification_result(e)
+
+        finally:
+            # Przywróć poprzedni stan debug
+            if not debug_was_on and hasattr(litellm, "_turn_off_debug"):
+                self.logger.info("Restoring original litellm debug mode")
+                litellm._turn_off_debug()
+
+    def _verification_result(self, error: Exception) -> Tuple[bool, str]:
+        """Map an error raised by the key verification request to the verify_key result."""
+        if isinstance(error, litellm.exceptions.AuthenticationError):
             # Authentication error means invalid key
-            self.logger.warning(f"API key verification failed: Invalid authentication: {str(e)}")
+            self.logger.warning(f"API key verification failed: Invalid authentication: {str(error)}")
             return False, "Nieprawidłowy klucz API"
 
-        except litellm.exceptions.APIConnectionError as e:
+        if isinstance(error, litellm.exceptions.APIConnectionError):
             # Connection issues
-            error_msg = f"Could not connect to OpenRouter API: {str(e)}"
+            error_msg = f"Could not connect to OpenRouter API: {str(error)}"
             self.logger.error(error_msg)
-            return False, f"Błąd połączenia z API OpenRouter: {str(e)}"
+            return False, f"Błąd połączenia z API OpenRouter: {str(error)}"
 
-        except litellm.exceptions.BadRequestError as e:
+        if isinstance(error, litellm.exceptions.BadRequestError):
             # Bad request oznacza problem z zapytaniem - w kontekście weryfikacji klucza,
             # najczęściej wskazuje to na nieprawidłowy klucz lub autoryzację
-            error_msg = f"Bad request to OpenRouter API: {str(e)}"
+            error_msg = f"Bad request to OpenRouter API: {str(error)}"
             self.logger.error(error_msg)
 
             # Sprawdź komunikat błędu dla lepszej diagnostyki
-            error_str = str(e).lower()
+            error_str = str(error).lower()
 
             if "auth" in error_str or "key" in error_str or "credential" in error_str:
                 return False, "Nieprawidłowy klucz API lub brak uprawnień"
             elif "rate limit" in error_str:
-                return False, f"Przekroczono limit zapytań dla klucza API: {str(e)}"
+                return False, f"Przekroczono limit zapytań dla klucza API: {str(error)}"
             else:
                 # W przypadku innych błędów, zakładamy że klucz jest niepoprawny
-                return False, f"Błąd weryfikacji klucza API: {str(e)}"
+                return False, f"Błąd weryfikacji klucza API: {str(error)}"
 
-        except litellm.exceptions.RateLimitError as e:
+        if isinstance(error, litellm.exceptions.RateLimitError):
             # Rate limit error oznacza, że klucz jest prawidłowy, ale są limity
-            self.logger.warning(f"API key is valid but rate limited: {str(e)}")
+            self.logger.warning(f"API key is valid but rate limited: {str(error)}")
             return True, "API key poprawny, ale osiągnięto limit zapytań"
 
-        except Exception as e:
-            # Catch-all for other errors
-            error_msg = f"Unexpected error verifying API key: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            return False, f"Nieoczekiwany błąd: {str(e)}"
-
-        finally:
-            # Przywróć poprzedni stan debug
-            if not debug_was_on and hasattr(litellm, "_turn_off_debug"):
-                self.logger.info("Restoring original litellm debug mode")
-                litellm._turn_off_debug()
+        # Catch-all for other errors
+        error_msg = f"Unexpected error verifying API key: {str(error)}"
+        self.logger.error(error_msg, exc_info=error)
+        return False, f"Nieoczekiwany błąd: {str(error)}"
 
     def _format_flashcard_prompt(self, raw_text: str) -> List[ChatMessage]:
         """Format the flashcard generation prompt with the input text.
@@ -196,6 +262,30 @@ class OpenRouterAPIClient:
 
         return [system_message, user_message]
 
+    def _cached_flashcards(self, cache_key: Optional[str], deck_id: int) -> Optional[List[FlashcardDTO]]:
+        """Flashcards cached under cache_key, or None on a miss."""
+        if cache_key is None or self.cache is None:
+            return None
+        cached = self.cache.get(cache_key, deck_id)
+        if cached:
+            self.logger.info(f"Returning {len(cached)} flashcards from the generation cache")
+        return cached
+
+    def _store_in_cache(self, cache_key: Optional[str], flashcards: List[FlashcardDTO]) -> None:
+        """Store a fresh generation result, if there is a cache."""
+        if cache_key is not None and self.cache is not None:
+            self.cache.put(cache_key, flashcards)
+
+    def _cache_key(self, raw_text: str, model: Optional[str], temperature: float) -> Optional[str]:
+        """Key of the generation request in the cache, or None if there is no cache or no model."""
+        selected_model = model or self.default_model
+        if self.cache is None or not selected_model:
+            return None
+        if not selected_model.startswith("openrouter/"):
+            selected_model = f"openrouter/{selected_model}"
+        prompt_template = FLASHCARD_GENERATION_PROMPT + json.dumps(FLASHCARD_SCHEMA, sort_keys=True)
+        return FlashcardCache.make_key(selected_model, temperature, prompt_template, raw_text)
+
     def _parse_flashcard_response(self, response: ChatCompletionDTO, deck_id: int) -> List[FlashcardDTO]:
         """Parse the API response into flashcard DTOs.
 
@@ -226,20 +316,12 @@ class OpenRouterAPIClient:
             if "flashcards" not in data:
                 raise FlashcardGenerationError("Response missing 'flashcards' array")
 
-            # Convert to DTOs
-            flashcards = []
-            for card in data["flashcards"]:
-                if "front" not in card or "back" not in card:
-                    continue  # Skip invalid cards
-                flashcards.append(
-                    FlashcardDTO(
-                        front=card["front"],
-                        back=card["back"],
-                        deck_id=deck_id,
-                        tags=card.get("tags"),
-                        metadata=card.get("metadata"),
-                    )
-                )
+            # Convert to DTOs, skipping invalid cards
+            flashcards = [
+                flashcard
+                for flashcard in (self._to_flashcard_dto(card, deck_id) for card in data["flashcards"])
+                if flashcard is not None
+            ]
 
             if not flashcards:
                 raise FlashcardGenerationError("No valid flashcards generated")
@@ -258,39 +340,29 @@ class OpenRouterAPIClient:
             self.logger.error(f"Unexpected error parsing flashcards: {str(e)}", exc_info=True)
             raise FlashcardGenerationError(f"Error parsing flashcards: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry_error_callback=lambda retry_state: retry_state.outcome.result() if retry_state.outcome else None,
-    )
-    def chat_completion(
+    @staticmethod
+    def _to_flashcard_dto(card: Dict[str, Any], deck_id: int) -> Optional[FlashcardDTO]:
+        """Convert one flashcard object of the response to a DTO, or None if it lacks a front or back."""
+        if "front" not in card or "back" not in card:
+            return None
+        return FlashcardDTO(
+            front=card["front"],
+            back=card["back"],
+            deck_id=deck_id,
+            tags=card.get("tags"),
+            metadata=card.get("metadata"),
+        )
+
+    def _completion_params(
         self,
-        api_key: str,
         messages: List[ChatMessage],
-        *,
-        model: Optional[str] = None,
-        response_format: Optional[dict] = None,
-        **params: Any,
-    ) -> ChatCompletionDTO:
-        """Send a chat completion request to OpenRouter API.
-
-        Args:
-            api_key: OpenRouter API key for authentication.
-            messages: List of chat messages for the completion.
-            model: Model identifier to use for completion. If not provided,
-                  uses the default_model specified in constructor.
-            response_format: Optional response format specification.
-            **params: Additional parameters to pass to the API.
-
-        Returns:
-            ChatCompletionDTO containing the API response.
+        model: Optional[str],
+        response_format: Optional[dict],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the litellm completion parameters (without the API key) for a chat completion request.
 
         Raises:
-            AIAPIAuthError: If the API key is invalid or missing.
-            AIAPIConnectionError: If there are network connectivity issues.
-            AIAPIRequestError: For 4xx client errors.
-            AIAPIServerError: For 5xx server errors.
-            AIRateLimitError: When hitting rate limits.
             ValueError: If no model is specified (neither in request nor default).
         """
         # Validate model selection
@@ -298,157 +370,130 @@ class OpenRouterAPIClient:
         if not selected_model:
             raise ValueError("No model specified. Provide either in the request or set a default_model.")
 
-        try:
-            # Log request metadata (not content for privacy)
-            self.logger.info(
-                "Sending chat completion request",
-                extra={
-                    "model": selected_model,
-                    "message_count": len(messages),
-                    "has_response_format": response_format is not None,
-                },
-            )
+        # Log request metadata (not content for privacy)
+        self.logger.info(
+            "Sending chat completion request",
+            extra={
+                "model": selected_model,
+                "message_count": len(messages),
+                "has_response_format": response_format is not None,
+            },
+        )
 
-            # Upewnij się, że model ma poprawny prefix dla OpenRouter
-            if not selected_model.startswith("openrouter/"):
-                selected_model = f"openrouter/{selected_model}"
-                self.logger.debug(f"Added openrouter/ prefix to model: {selected_model}")
+        # Upewnij się, że model ma poprawny prefix dla OpenRouter
+        if not selected_model.startswith("openrouter/"):
+            selected_model = f"openrouter/{selected_model}"
+            self.logger.debug(f"Added openrouter/ prefix to model: {selected_model}")
+
+        # Convert ChatMessage objects to dictionaries
+        formatted_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
+
+        # Build completion params
+        completion_params = {
+            "model": selected_model,
+            "messages": formatted_messages,
+            "max_tokens": 3000,  # Increased from 1000
+            "temperature": 0.3,
+            **params,  # Include any additional params passed to the function
+        }
 
-            # Convert ChatMessage objects to dictionaries
-            formatted_messages = [{"role": msg.role, "content": msg.content} for msg in messages]
+        if response_format:
+            completion_params["response_format"] = response_format
 
-            # Build completion params
-            completion_params = {
-                "model": selected_model,
-                "messages": formatted_messages,
-                "max_tokens": 3000,  # Increased from 1000
-                "temperature": 0.3,
-                **params,  # Include any additional params passed to the function
-            }
+        # Log detailed request information, but remove the API key for security
+        safe_params = {**completion_params}
+        if "api_key" in safe_params:
+            safe_params["api_key"] = "sk-...redacted..."
 
-            if response_format:
-                completion_params["response_format"] = response_format
-
-            # Log detailed request information, but remove the API key for security
-            safe_params = {**completion_params}
-            if "api_key" in safe_params:
-                safe_params["api_key"] = "sk-...redacted..."
-
-            self.logger.debug(f"OpenRouter chat completion request params: {json.dumps(safe_params, default=str)}")
-            self.logger.debug(f"Custom headers for OpenRouter: {json.dumps(self.default_headers, default=str)}")
-
-            # Make API call
-            response = litellm.completion(**completion_params, api_key=api_key, custom_headers=self.default_headers)
-
-            # Extract and convert the necessary fields from ModelResponse
-            choices = (
-                [
-                    {
-                        "content": (
-                            choice.message.content
-                            if hasattr(choice, "message") and hasattr(choice.message, "content")
-                            else None
-                        ),
-                        "role": (
-                            choice.message.role
-                            if hasattr(choice, "message") and hasattr(choice.message, "role")
-                            else "assistant"
-                        ),
-                        "index": choice.index if hasattr(choice, "index") else 0,
-                        # Add any other fields that might be needed
-                    }
-                    for choice in response.choices
-                ]
-                if hasattr(response, "choices")
-                else []
-            )
+        self.logger.debug(f"OpenRouter chat completion request params: {json.dumps(safe_params, default=str)}")
+        self.logger.debug(f"Custom headers for OpenRouter: {json.dumps(self.default_headers, default=str)}")
+        return completion_params
 
-            usage = (
+    @staticmethod
+    def _to_chat_completion_dto(response: Any) -> ChatCompletionDTO:
+        """Extract and convert the necessary fields from a litellm ModelResponse."""
+        choices = (
+            [
                 {
-                    "prompt_tokens": (
-                        response.usage.prompt_tokens
-                        if hasattr(response, "usage") and hasattr(response.usage, "prompt_tokens")
-                        else 0
-                    ),
-                    "completion_tokens": (
-                        response.usage.completion_tokens
-                        if hasattr(response, "usage") and hasattr(response.usage, "completion_tokens")
-                        else 0
+                    "content": (
+                        choice.message.content
+                        if hasattr(choice, "message") and hasattr(choice.message, "content")
+                        else None
                     ),
-                    "total_tokens": (
-                        response.usage.total_tokens
-                        if hasattr(response, "usage") and hasattr(response.usage, "total_tokens")
-                        else 0
+                    "role": (
+                        choice.message.role
+                        if hasattr(choice, "message") and hasattr(choice.message, "role")
+                        else "assistant"
                     ),
+                    "index": choice.index if hasattr(choice, "index") else 0,
+                    # Add any other fields that might be needed
                 }
-                if hasattr(response, "usage")
-                else {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            )
-
-            # Convert to DTO
-            return ChatCompletionDTO(
-                model=cast(str, response.model),  # Cast to ensure str type
-                choices=choices,
-                usage=usage,
-                raw_response=response.__dict__,
-            )
-
-        except Exception as e:
-            self._handle_litellm_error(e)
+                for choice in response.choices
+            ]
+            if hasattr(response, "choices")
+            else []
+        )
 
-    def generate_flashcards(
-        self,
-        api_key: str,
-        raw_text: str,
-        deck_id: int,
-        *,
-        model: Optional[str] = None,
-        temperature: float = 0.3,
-    ) -> List[FlashcardDTO]:
-        """Generate flashcards from the given text.
+        usage = (
+            {
+                "prompt_tokens": (
+                    response.usage.prompt_tokens
+                    if hasattr(response, "usage") and hasattr(response.usage, "prompt_tokens")
+                    else 0
+                ),
+                "completion_tokens": (
+                    response.usage.completion_tokens
+                    if hasattr(response, "usage") and hasattr(response.usage, "completion_tokens")
+                    else 0
+                ),
+                "total_tokens": (
+                    response.usage.total_tokens
+                    if hasattr(response, "usage") and hasattr(response.usage, "total_tokens")
+                    else 0
+                ),
+            }
+            if hasattr(response, "usage")
+            else {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        )
 
-        Args:
-            api_key: OpenRouter API key for authentication.
-            raw_text: The text to generate flashcards from.
-            deck_id: The ID of the deck to associate flashcards with.
-            model: Optional model override for this specific generation.
-            temperature: Controls randomness in the generation (0.0 to 1.0).
+        # Convert to DTO
+        return ChatCompletionDTO(
+            model=cast(str, response.model),  # Cast to ensure str type
+            choices=choices,
+            usage=usage,
+            raw_response=response.__dict__,
+        )
 
-        Returns:
-            List[FlashcardDTO]: The generated flashcards.
+    def _stream_params(self, raw_text: str, model: Optional[str], temperature: float) -> Dict[str, Any]:
+        """Build the litellm parameters (without the API key) of a streamed flashcard generation request.
 
         Raises:
-            FlashcardGenerationError: If flashcard generation fails.
-            AIAPIAuthError: If the API key is invalid.
-            AIAPIConnectionError: If there are network issues.
-            AIAPIRequestError: For 4xx client errors.
-            AIAPIServerError: For 5xx server errors.
-            AIRateLimitError: When hitting rate limits.
+            ValueError: If no model is specified (neither in request nor default).
         """
-        # Format the prompt
-        messages = self._format_flashcard_prompt(raw_text)
+        selected_model = model or self.default_model
+        if not selected_model:
+            raise ValueError("No model specified. Provide either in the request or set a default_model.")
+        if not selected_model.startswith("openrouter/"):
+            selected_model = f"openrouter/{selected_model}"
 
-        # Set up response format for JSON - use a dictionary directly as expected by litellm
-        response_format_dict = {
-            "type": "json_object",
+        messages = self._format_flashcard_prompt(raw_text)
+        self.logger.info("Sending streaming flashcard generation request", extra={"model": selected_model})
+        return {
+            "model": selected_model,
+            "messages": [{"role": msg.role, "content": msg.content} for msg in messages],
+            "max_tokens": 3000,
+            "temperature": temperature,
+            "response_format": {"type": "json_object"},
+            "stream": True,
         }
 
-        try:
-            # Make the API request
-            response = self.chat_completion(
-                api_key=api_key,
-                messages=messages,
-                model=model,
-                response_format=response_format_dict,
-                temperature=temperature,
-            )
-
-            # Parse and return the flashcards
-            return self._parse_flashcard_response(response, deck_id)
-
-        except OpenRouterError:
-            # Re-raise API errors as is
-            raise
-        except Exception as e:
-            # Wrap any other errors
-            raise FlashcardGenerationError(f"Unexpected error in flashcard generation: {str(e)}")
+    def _parse_stream_chunk(self, parser: FlashcardStreamParser, chunk: Any, deck_id: int) -> List[FlashcardDTO]:
+        """Feed the text delta of one streamed chunk to the parser and return the flashcards it completed."""
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            return []
+        return [
+            flashcard
+            for flashcard in (self._to_flashcard_dto(card, deck_id) for card in parser.feed(delta))
+            if flashcard is not None
+        ]
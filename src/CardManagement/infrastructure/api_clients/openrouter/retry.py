@@ -0,0 +1,120 @@
+"""Retry policy for OpenRouter requests."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .exceptions import (
+    AIAPIConnectionError,
+    AIAPIServerError,
+    AIRateLimitError,
+    OpenRouterError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """A failed attempt that is about to be retried, as reported to a RetryListener."""
+
+    attempt: int  # Number of the attempt that failed (1-based)
+    max_attempts: int
+    delay: float  # Seconds until the next attempt
+    total_wait: float  # Seconds spent waiting so far, including 'delay'
+    error: OpenRouterError
+
+
+RetryListener = Callable[[RetryAttempt], None]
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Only failures that are safe to repeat are retried: server errors (5xx), timeouts and
+    connection errors, and rate limiting (429). A rate-limited request waits for the server's
+    Retry-After (plus up to 'jitter' seconds); other failures use exponential backoff with full
+    jitter. No wait may end after 'deadline' seconds from the first attempt; if it would, the
+    error is raised at once.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+    deadline: float = 60.0
+    jitter: float = 1.0
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether the error belongs to a failure class that is safe to retry."""
+        return isinstance(error, (AIAPIServerError, AIAPIConnectionError, AIRateLimitError))
+
+    def delay(self, attempt: int, error: Exception, rng: Callable[[float, float], float] = random.uniform) -> float:
+        """Seconds to wait after the given failed attempt (1-based)."""
+        if isinstance(error, AIRateLimitError) and error.retry_after is not None:
+            return max(0.0, float(error.retry_after)) + rng(0.0, self.jitter)
+        return rng(0.0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def next_delay(self, attempt: int, error: Exception, elapsed: float) -> Optional[float]:
+        """The wait before retrying, or None if the error must be raised.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based).
+            error: The error it failed with.
+            elapsed: Seconds since the first attempt started.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.delay(attempt, error)
+        if elapsed + delay > self.deadline:
+            logger.info(f"Not retrying: waiting {delay:.1f}s would exceed the {self.deadline:.0f}s deadline")
+            return None
+        return delay
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    *,
+    on_retry: Optional[RetryListener] = None,
+) -> T:
+    """Await func(), retrying it according to the policy; cancelling the task interrupts a wait.
+
+    Args:
+        func: Creates the awaitable request; called once per attempt.
+        policy: The retry policy.
+        on_retry: Called before each wait.
+
+    Raises:
+        The last error of func if it is not retried.
+    """
+    started = time.monotonic()
+    total_wait = 0.0
+    attempt = 1
+    while True:
+        try:
+            return await func()
+        except OpenRouterError as e:
+            delay = policy.next_delay(attempt, e, time.monotonic() - started)
+            if delay is None:
+                raise
+            total_wait += delay
+            _report(on_retry, RetryAttempt(attempt, policy.max_attempts, delay, total_wait, e))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _report(on_retry: Optional[RetryListener], retry: RetryAttempt) -> None:
+    logger.warning(
+        f"Request failed (attempt {retry.attempt}/{retry.max_attempts}): {retry.error}; retrying in {retry.delay:.1f}s"
+    )
+    if on_retry is not None:
+        try:
+            on_retry(retry)
+        except Exception as e:
+            logger.warning(f"Retry listener failed: {e}", exc_info=True)
@@ -0,0 +1,92 @@
+"""Incremental parsing of streamed flashcard JSON responses."""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FlashcardStreamParser:
+    """Extracts flashcard objects from a JSON response while it is still being streamed.
+
+    The response is expected to follow FLASHCARD_SCHEMA: {"flashcards": [{...}, {...}]}. Text
+    is fed in arbitrary pieces; every object of the "flashcards" array is returned by feed() as
+    soon as its closing brace arrives. Anything before the top-level object (e.g. a Markdown
+    code fence) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._position = 0  # Number of characters scanned so far
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None  # Last string closed directly inside the top-level object
+        self._array_depth: Optional[int] = None  # Depth inside the "flashcards" array
+        self._object_start: Optional[int] = None  # Start of the flashcard object being received
+        self._text = ""
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return self._text
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume the next piece of the response.
+
+        Args:
+            chunk: Text received from the stream.
+
+        Returns:
+            List[Dict[str, Any]]: Flashcard objects completed by this piece, in order.
+        """
+        self._text += chunk
+        completed: List[Dict[str, Any]] = []
+        text = self._text
+        for index in range(self._position, len(text)):
+            char = text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = text[self._string_start + 1 : index]
+                continue
+
+            if char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+                    self._string_start = index
+            elif char in "{[":
+                if self._depth == 0 and char == "[":
+                    continue  # Not a JSON object yet
+                if char == "{" and self._array_depth is not None and self._depth == self._array_depth:
+                    self._object_start = index
+                if char == "[" and self._depth == 1 and self._last_key == "flashcards":
+                    self._array_depth = 2
+                self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                self._depth -= 1
+                if char == "]" and self._depth == 1:
+                    self._array_depth = None
+                if char == "}" and self._object_start is not None and self._depth == self._array_depth:
+                    card = self._decode(text[self._object_start : index + 1])
+                    if card is not None:
+                        completed.append(card)
+                    self._object_start = None
+        self._position = len(text)
+        return completed
+
+    @staticmethod
+    def _decode(fragment: str) -> Optional[Dict[str, Any]]:
+        """Decode one flashcard object, skipping it if it is not valid JSON."""
+        try:
+            card = json.loads(fragment)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed flashcard in streamed response: {e}")
+            return None
+        return card if isinstance(card, dict) else None
@@ -1,5 +1,11 @@
+import json
+from functools import lru_cache
 from CardManagement.domain.models.Flashcard import Flashcard
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+# (due, state, stability, difficulty, last_review) as stored in the Flashcards columns
+FsrsColumns = Tuple[Optional[str], Optional[int], Optional[float], Optional[float], Optional[str]]
 
 
 class FlashcardMapper:
@@ -21,3 +27,50 @@ class FlashcardMapper:
             created_at=datetime.fromisoformat(created_at) if isinstance(created_at, str) else created_at,
             updated_at=datetime.fromisoformat(updated_at) if isinstance(updated_at, str) else updated_at,
         )
+
+    @staticmethod
+    def to_db_timestamp(value: datetime) -> str:
+        """
+        Formats a datetime the same way SQLite's strftime('%Y-%m-%dT%H:%M:%f', ...) does (UTC, millisecond precision),
+        so values written from Python and values computed in SQL compare correctly as text.
+        Naive datetimes are assumed to be UTC.
+        """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}"
+
+    @staticmethod
+    def to_fsrs_columns(fsrs_state: Optional[str]) -> FsrsColumns:
+        """
+        Extracts the indexed FSRS columns from the fsrs_state JSON blob.
+        Returns all None for missing or corrupt state; the repository then falls back to created_at for 'due'.
+        """
+        if not fsrs_state:
+            return (None, None, None, None, None)
+        try:
+            data = json.loads(fsrs_state)
+        except (TypeError, ValueError):
+            return (None, None, None, None, None)
+        if not isinstance(data, dict):
+            return (None, None, None, None, None)
+
+        return (
+            _fsrs_timestamp_column(data.get("due")),
+            data.get("state"),
+            data.get("stability"),
+            data.get("difficulty"),
+            _fsrs_timestamp_column(data.get("last_review")),
+        )
+
+
+# Cards created together share their 'due' timestamp, so bulk inserts mostly hit the cache
+@lru_cache(maxsize=1024)
+def _fsrs_timestamp_column(raw: Any) -> Optional[str]:
+    """Converts an ISO timestamp from fsrs_state to the Flashcards column format; None if it is not one."""
+    if not isinstance(raw, str):
+        return None
+    try:
+        return FlashcardMapper.to_db_timestamp(datetime.fromisoformat(raw))
+    except ValueError:
+        return None
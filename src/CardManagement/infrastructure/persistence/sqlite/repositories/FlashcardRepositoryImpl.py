@@ -1,12 +1,24 @@
+import json
 import sqlite3
 import logging
-from typing import List, Optional, Tuple, Protocol
+from datetime import datetime
+from typing import ContextManager, List, Optional, Sequence, Tuple, Protocol
 from CardManagement.domain.models.Flashcard import Flashcard
+from CardManagement.domain.models.FlashcardPage import FlashcardPage
 from CardManagement.domain.repositories.IFlashcardRepository import IFlashcardRepository
 from CardManagement.infrastructure.persistence.sqlite.mappers.FlashcardMapper import FlashcardMapper
 
 logger = logging.getLogger(__name__)
 
+# ORDER BY expression of each sort key of list_page; each matches a (deck_id, expression) index
+_SORT_EXPRESSIONS = {
+    "front_text": "front_text COLLATE NOCASE",
+    "source": "source",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "due": "due",
+}
+
 
 class DbConnectionProvider(Protocol):
     """Protocol defining the required interface for database connection providers."""
@@ -15,26 +27,36 @@ class DbConnectionProvider(Protocol):
         """Returns a SQLite connection object."""
         ...
 
+    def transaction(self) -> ContextManager[None]:
+        """Runs the enclosed writes in one transaction, joining the one already open on the thread."""
+        ...
+
 
 class FlashcardRepositoryImpl(IFlashcardRepository):
     """
     SQLite implementation of IFlashcardRepository.
     All SQL is parameterized. Propagates sqlite3.IntegrityError and other DB exceptions to the application layer.
+    Writes run inside the provider's transaction(), so they join a unit of work opened by the caller.
+    The due/state/stability/difficulty/last_review columns mirror fsrs_state and are rewritten on every add/update.
     """
 
+    # Rows per INSERT in add_many; 11 parameters each keeps a statement under SQLite's historical 999 limit
+    ADD_MANY_CHUNK_SIZE = 80
+
     def __init__(self, db_provider: DbConnectionProvider):
         self._db_provider = db_provider
         logger.debug("FlashcardRepositoryImpl initialized with database provider")
 
     def add(self, flashcard: Flashcard) -> Flashcard:
         """Adds a new flashcard and returns the instance with assigned 'id' and timestamps."""
-        conn = self._db_provider.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(
+        with self._db_provider.transaction():
+            cursor = self._db_provider.get_connection().execute(
                 """
-                INSERT INTO Flashcards (deck_id, front_text, back_text, fsrs_state, source, ai_model_name)
-                VALUES (?, ?, ?, ?, ?, ?)
+                INSERT INTO Flashcards (
+                    deck_id, front_text, back_text, fsrs_state, source, ai_model_name,
+                    due, state, stability, difficulty, last_review
+                )
+                VALUES (?, ?, ?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now')), ?, ?, ?, ?)
                 """,
                 (
                     flashcard.deck_id,
@@ -43,18 +65,96 @@ class FlashcardRepositoryImpl(IFlashcardRepository):
                     flashcard.fsrs_state,
                     flashcard.source,
                     flashcard.ai_model_name,
+                    *FlashcardMapper.to_fsrs_columns(flashcard.fsrs_state),
                 ),
             )
-            flashcard_id = cursor.lastrowid
-            assert flashcard_id is not None, "flashcard_id should never be None after insert!"
-            conn.commit()
-            result = self.get_by_id(flashcard_id)
-            if result is None:
-                raise RuntimeError(f"Failed to fetch Flashcard after insert (id={flashcard_id})")
-            return result
-        except sqlite3.IntegrityError:
-            conn.rollback()
-            raise
+        flashcard_id = cursor.lastrowid
+        assert flashcard_id is not None, "flashcard_id should never be None after insert!"
+        result = self.get_by_id(flashcard_id)
+        if result is None:
+            raise RuntimeError(f"Failed to fetch Flashcard after insert (id={flashcard_id})")
+        return result
+
+    def add_many(self, flashcards: Sequence[Flashcard]) -> List[Flashcard]:
+        """
+        Adds many new flashcards in a single transaction and returns them with assigned 'id' and timestamps.
+        Rows are inserted with multi-row INSERT ... RETURNING statements (sqlite3's executemany discards
+        RETURNING rows), so there is no per-row round-trip to read them back.
+        """
+        if not flashcards:
+            return []
+        created: List[Flashcard] = []
+        with self._db_provider.transaction():
+            conn = self._db_provider.get_connection()
+            for start in range(0, len(flashcards), self.ADD_MANY_CHUNK_SIZE):
+                chunk = flashcards[start : start + self.ADD_MANY_CHUNK_SIZE]
+                rows = self._insert_chunk(conn, chunk, returning="RETURNING id, created_at, updated_at")
+                # AUTOINCREMENT ids grow in VALUES order, while RETURNING rows come in no guaranteed order
+                for flashcard, (flashcard_id, created_at, updated_at) in zip(
+                    chunk, sorted(rows, key=lambda row: row[0])
+                ):
+                    created.append(
+                        FlashcardMapper.from_row(
+                            (
+                                flashcard_id,
+                                flashcard.deck_id,
+                                flashcard.front_text,
+                                flashcard.back_text,
+                                flashcard.fsrs_state,
+                                flashcard.source,
+                                flashcard.ai_model_name,
+                                created_at,
+                                updated_at,
+                            )
+                        )
+                    )
+        logger.debug(f"Added {len(created)} flashcards")
+        return created
+
+    def insert_many(self, flashcards: Sequence[Flashcard]) -> int:
+        """
+        Adds many new flashcards in a single transaction without reading them back.
+        Uses the same multi-row INSERTs as add_many: with the FTS trigger, one statement per row
+        (executemany) is several times slower than one statement per chunk.
+        """
+        if not flashcards:
+            return 0
+        with self._db_provider.transaction():
+            conn = self._db_provider.get_connection()
+            for start in range(0, len(flashcards), self.ADD_MANY_CHUNK_SIZE):
+                self._insert_chunk(conn, flashcards[start : start + self.ADD_MANY_CHUNK_SIZE])
+        logger.debug(f"Inserted {len(flashcards)} flashcards")
+        return len(flashcards)
+
+    @staticmethod
+    def _insert_chunk(conn: sqlite3.Connection, chunk: Sequence[Flashcard], returning: str = "") -> List:
+        """Inserts up to ADD_MANY_CHUNK_SIZE flashcards with one statement; returns the rows of the RETURNING clause."""
+        values = ", ".join(
+            ["(?, ?, ?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', 'now')), ?, ?, ?, ?)"] * len(chunk)
+        )
+        params: List = []
+        for flashcard in chunk:
+            params += [
+                flashcard.deck_id,
+                flashcard.front_text,
+                flashcard.back_text,
+                flashcard.fsrs_state,
+                flashcard.source,
+                flashcard.ai_model_name,
+                *FlashcardMapper.to_fsrs_columns(flashcard.fsrs_state),
+            ]
+        rows: List = conn.execute(
+            f"""
+            INSERT INTO Flashcards (
+                deck_id, front_text, back_text, fsrs_state, source, ai_model_name,
+                due, state, stability, difficulty, last_review
+            )
+            VALUES {values}
+            {returning}
+            """,
+            params,
+        ).fetchall()
+        return rows
 
     def get_by_id(self, flashcard_id: int) -> Optional[Flashcard]:
         """Retrieves a flashcard by its ID. Returns None if not found."""
@@ -74,14 +174,142 @@ class FlashcardRepositoryImpl(IFlashcardRepository):
         ).fetchall()
         return [FlashcardMapper.from_row(row) for row in rows]
 
-    def update(self, flashcard: Flashcard) -> None:
-        """Updates an existing flashcard (content or FSRS state)."""
+    def list_page(
+        self,
+        deck_id: int,
+        sort_key: str = "created_at",
+        after_cursor: Optional[str] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> FlashcardPage:
+        """
+        Returns the next page of the deck's flashcards using keyset pagination on (sort_key, id).
+        The keyset filter is written as a range on the sort column, so every page is a single seek
+        into the (deck_id, sort column) index rather than a scan past the pages before it.
+        """
+        expression = _SORT_EXPRESSIONS.get(sort_key)
+        if expression is None:
+            raise ValueError(f"Unknown flashcard sort key: {sort_key!r}")
+        direction, after, after_or_equal = ("DESC", "<", "<=") if descending else ("ASC", ">", ">=")
+        params: Tuple = (deck_id,)
+        keyset_filter = ""
+        if after_cursor is not None:
+            value, flashcard_id = self._decode_page_cursor(after_cursor, sort_key)
+            keyset_filter = f"AND {expression} {after_or_equal} ? AND ({expression} {after} ? OR id {after} ?)"
+            params += (value, value, flashcard_id)
+        conn = self._db_provider.get_connection()
+        rows = conn.execute(
+            f"""
+            SELECT id, deck_id, front_text, back_text, fsrs_state, source, ai_model_name, created_at, updated_at,
+                   {sort_key}
+            FROM Flashcards
+            WHERE deck_id = ? {keyset_filter}
+            ORDER BY {expression} {direction}, id {direction}
+            LIMIT ?
+            """,
+            params + (limit,),
+        ).fetchall()
+        items = [FlashcardMapper.from_row(row[:9]) for row in rows]
+        next_cursor = json.dumps([sort_key, rows[-1][9], rows[-1][0]]) if len(rows) == limit else None
+        return FlashcardPage(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _decode_page_cursor(cursor: str, sort_key: str) -> Tuple[str, int]:
+        """Decodes a cursor produced by list_page for the given sort key into its (value, id) keyset."""
+        try:
+            cursor_sort_key, value, flashcard_id = json.loads(cursor)
+            if cursor_sort_key != sort_key or not isinstance(value, str):
+                raise ValueError(cursor)
+            return value, int(flashcard_id)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid flashcard page cursor: {cursor!r}") from e
+
+    def list_due_page(
+        self, deck_id: int, now: datetime, limit: int, after_cursor: Optional[str] = None
+    ) -> FlashcardPage:
+        """Returns the next page of due flashcards using keyset pagination on (due, id)."""
+        conn = self._db_provider.get_connection()
+        params: Tuple = (deck_id, FlashcardMapper.to_db_timestamp(now))
+        keyset_filter = ""
+        if after_cursor is not None:
+            keyset_filter = "AND (due, id) > (?, ?)"
+            params += self._decode_due_cursor(after_cursor)
+        rows = conn.execute(
+            f"""
+            SELECT id, deck_id, front_text, back_text, fsrs_state, source, ai_model_name, created_at, updated_at, due
+            FROM Flashcards
+            WHERE deck_id = ? AND due <= ? {keyset_filter}
+            ORDER BY due ASC, id ASC
+            LIMIT ?
+            """,
+            params + (limit,),
+        ).fetchall()
+        items = [FlashcardMapper.from_row(row[:9]) for row in rows]
+        next_cursor = json.dumps([rows[-1][9], rows[-1][0]]) if len(rows) == limit else None
+        return FlashcardPage(items=items, next_cursor=next_cursor)
+
+    def count_due_by_deck_id(self, deck_id: int, now: datetime) -> int:
+        """Returns the number of flashcards in the deck that are due at 'now'."""
         conn = self._db_provider.get_connection()
+        row = conn.execute(
+            "SELECT COUNT(*) FROM Flashcards WHERE deck_id = ? AND due <= ?",
+            (deck_id, FlashcardMapper.to_db_timestamp(now)),
+        ).fetchone()
+        return int(row[0])
+
+    @staticmethod
+    def _decode_due_cursor(cursor: str) -> Tuple[str, int]:
+        """Decodes a cursor produced by list_due_page into its (due, id) keyset."""
         try:
-            conn.execute(
+            due, flashcard_id = json.loads(cursor)
+            return str(due), int(flashcard_id)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid flashcard page cursor: {cursor!r}") from e
+
+    def search(
+        self, user_id: int, query: str, deck_id: Optional[int] = None, limit: int = 50, offset: int = 0
+    ) -> List[Flashcard]:
+        """Full-text search over fronts and backs of the user's flashcards, best bm25 matches first."""
+        match = self._to_fts_query(query)
+        if not match:
+            return []
+        deck_filter = "AND f.deck_id = ?" if deck_id is not None else ""
+        params: Tuple = (match, user_id) + ((deck_id,) if deck_id is not None else ()) + (limit, offset)
+        conn = self._db_provider.get_connection()
+        rows = conn.execute(
+            f"""
+            SELECT f.id, f.deck_id, f.front_text, f.back_text, f.fsrs_state, f.source, f.ai_model_name,
+                   f.created_at, f.updated_at
+            FROM FlashcardsFts
+            JOIN Flashcards f ON f.id = FlashcardsFts.rowid
+            JOIN Decks d ON d.id = f.deck_id
+            WHERE FlashcardsFts MATCH ? AND d.user_id = ? {deck_filter}
+            ORDER BY bm25(FlashcardsFts, 2.0, 1.0), f.id
+            LIMIT ? OFFSET ?
+            """,
+            params,
+        ).fetchall()
+        return [FlashcardMapper.from_row(row) for row in rows]
+
+    @staticmethod
+    def _to_fts_query(query: str) -> str:
+        """
+        Turns free text typed by the user into an FTS5 query: every word must match as a prefix.
+        Words are quoted, so FTS5 operators and punctuation in the input are treated as plain text.
+        """
+        terms = [term.replace('"', '""') for term in query.split()]
+        return " ".join(f'"{term}"*' for term in terms if term.strip('"'))
+
+    def update(self, flashcard: Flashcard) -> None:
+        """Updates an existing flashcard (content or FSRS state)."""
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().execute(
                 """
                 UPDATE Flashcards
-                SET front_text = ?, back_text = ?, fsrs_state = ?, source = ?, ai_model_name = ?, updated_at = CURRENT_TIMESTAMP
+                SET front_text = ?, back_text = ?, fsrs_state = ?, source = ?, ai_model_name = ?,
+                    due = COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', created_at)),
+                    state = ?, stability = ?, difficulty = ?, last_review = ?,
+                    updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
                 """,
                 (
@@ -90,19 +318,35 @@ class FlashcardRepositoryImpl(IFlashcardRepository):
                     flashcard.fsrs_state,
                     flashcard.source,
                     flashcard.ai_model_name,
+                    *FlashcardMapper.to_fsrs_columns(flashcard.fsrs_state),
                     flashcard.id,
                 ),
             )
-            conn.commit()
-        except sqlite3.IntegrityError:
-            conn.rollback()
-            raise
+
+    def bulk_set_fsrs_state(self, states: List[Tuple[int, str]]) -> None:
+        """Sets the FSRS state of many flashcards with one executemany in a single transaction."""
+        if not states:
+            return
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().executemany(
+                """
+                UPDATE Flashcards
+                SET fsrs_state = ?,
+                    due = COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', created_at)),
+                    state = ?, stability = ?, difficulty = ?, last_review = ?
+                WHERE id = ?
+                """,
+                (
+                    (fsrs_state, *FlashcardMapper.to_fsrs_columns(fsrs_state), flashcard_id)
+                    for flashcard_id, fsrs_state in states
+                ),
+            )
+        logger.debug(f"Set FSRS state for {len(states)} flashcards")
 
     def delete(self, flashcard_id: int) -> None:
         """Deletes a flashcard by its ID."""
-        conn = self._db_provider.get_connection()
-        conn.execute("DELETE FROM Flashcards WHERE id = ?", (flashcard_id,))
-        conn.commit()
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().execute("DELETE FROM Flashcards WHERE id = ?", (flashcard_id,))
 
     def get_fsrs_card_data_for_deck(self, deck_id: int) -> List[Tuple[int, Optional[str]]]:
         """Retrieves tuples (flashcard_id, fsrs_state) for all flashcards in the deck."""
@@ -1,4 +1,5 @@
-from typing import Any, List
+from typing import Any, Callable, List
+import tkinter as tk
 
 import ttkbootstrap as ttk
 from ttkbootstrap.scrolled import ScrolledText
@@ -9,6 +10,7 @@ from Shared.application.session_service import SessionService
 from UserProfile.application.user_profile_service import UserProfileService
 from Shared.ui.widgets.header_bar import HeaderBar
 from Shared.application.navigation import NavigationControllerProtocol
+from Shared.infrastructure.config import AI_MAX_SOURCE_TEXT_LENGTH
 from CardManagement.application.presenters.ai_generate_presenter import AIGeneratePresenter, IAIGenerateView
 
 
@@ -16,7 +18,7 @@ class AIGenerateView(ttk.Frame, IAIGenerateView):
     """View for generating flashcards using AI"""
 
     # Constants
-    MAX_TEXT_LENGTH = 10000
+    MAX_TEXT_LENGTH = AI_MAX_SOURCE_TEXT_LENGTH
 
     def __init__(
         self,
@@ -118,7 +120,7 @@ class AIGenerateView(ttk.Frame, IAIGenerateView):
         self.char_count_frame = ttk.Frame(content)
         self.char_count_frame.grid(row=2, column=0, sticky="w", pady=(5, 0))
 
-        self.char_count_label = ttk.Label(self.char_count_frame, text="Liczba znaków: 0 / 10000")
+        self.char_count_label = ttk.Label(self.char_count_frame, text=f"Liczba znaków: 0 / {self.MAX_TEXT_LENGTH}")
         self.char_count_label.pack(side=ttk.LEFT, padx=5)
 
         # Generation status label - using more subtle color (secondary)
@@ -247,3 +249,11 @@ class AIGenerateView(ttk.Frame, IAIGenerateView):
     def get_selected_model(self) -> str:
         """Get the selected model."""
         return str(self.model_var.get())
+
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None:
+        """Run a callback on the UI thread after delay_ms; safe to call from the event loop thread"""
+        try:
+            self.after(delay_ms, callback)
+        except (RuntimeError, tk.TclError):
+            # The view was destroyed before the callback could be scheduled
+            pass
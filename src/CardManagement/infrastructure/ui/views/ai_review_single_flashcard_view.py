@@ -1,7 +1,8 @@
 """View for reviewing AI-generated flashcards one by one."""
 
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 from tkinter.scrolledtext import ScrolledText
+import tkinter as tk
 import logging
 
 import ttkbootstrap as ttk
@@ -130,6 +131,14 @@ class AIReviewSingleFlashcardView(ttk.Frame, IAIReviewSingleFlashcardView):
         )
         self.discard_btn.pack(side=RIGHT, padx=(0, 5))
 
+        self.accept_all_btn = ttk.Button(
+            button_bar,
+            text="Zapisz wszystkie",
+            style="success.TButton",
+            command=self.presenter.accept_all,
+        )
+        self.accept_all_btn.pack(side=RIGHT, padx=(0, 5))
+
         # Bind text change events
         self.front_text.bind("<<Modified>>", self._on_text_changed)
         self.back_text.bind("<<Modified>>", self._on_text_changed)
@@ -164,6 +173,7 @@ class AIReviewSingleFlashcardView(ttk.Frame, IAIReviewSingleFlashcardView):
         logger.debug(f"Showing saving state: {is_saving}")
         self.save_btn.configure(state="disabled" if is_saving else "normal")
         self.discard_btn.configure(state="disabled" if is_saving else "normal")
+        self.accept_all_btn.configure(state="disabled" if is_saving else "normal")
         self.front_text.configure(state="disabled" if is_saving else "normal")
         self.back_text.configure(state="disabled" if is_saving else "normal")
 
@@ -228,3 +238,11 @@ class AIReviewSingleFlashcardView(ttk.Frame, IAIReviewSingleFlashcardView):
             text=f"{back_count}/{self.presenter.BACK_TEXT_MAX_LENGTH}",
             style="danger.TLabel" if back_count > self.presenter.BACK_TEXT_MAX_LENGTH else "secondary.TLabel",
         )
+
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None:
+        """Run a callback on the UI thread after delay_ms."""
+        try:
+            self.after(delay_ms, callback)
+        except (RuntimeError, tk.TclError):
+            # The view was destroyed before the callback could be scheduled
+            pass
@@ -1,4 +1,6 @@
-from typing import Callable, List, Any
+from typing import Callable, List, Any, Optional
+import tkinter as tk
+from tkinter import filedialog
 
 import ttkbootstrap as ttk
 
@@ -20,6 +22,8 @@ from CardManagement.infrastructure.ui.widgets.button_panel import ButtonPanel
 class CardListView(ttk.Frame, ICardListView):
     """View for displaying and managing the list of flashcards in a deck"""
 
+    SEARCH_DEBOUNCE_MS = 250
+
     def __init__(
         self,
         parent: Any,
@@ -47,6 +51,7 @@ class CardListView(ttk.Frame, ICardListView):
         self._show_toast_callback = show_toast
         self.deck_id = deck_id
         self.deck_name = deck_name
+        self._search_job: Optional[str] = None
 
         # Create presenter
         self.presenter = CardListPresenter(
@@ -66,7 +71,7 @@ class CardListView(ttk.Frame, ICardListView):
     def _init_ui(self) -> None:
         """Initialize the UI components"""
         # Configure grid
-        self.grid_rowconfigure(1, weight=1)  # FlashcardTable row
+        self.grid_rowconfigure(2, weight=1)  # FlashcardTable row
         self.grid_columnconfigure(0, weight=1)
 
         # Header
@@ -74,17 +79,37 @@ class CardListView(ttk.Frame, ICardListView):
         self.header.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
         self.header.set_back_command(self.presenter.navigate_back)
 
+        # Search
+        search_frame = ttk.Frame(self)
+        search_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=(5, 0))
+        search_frame.grid_columnconfigure(1, weight=1)
+        ttk.Label(search_frame, text="Szukaj:").grid(row=0, column=0, padx=(0, 5))
+        self.search_var = ttk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.grid(row=0, column=1, sticky="ew")
+        self.search_all_decks_var = ttk.BooleanVar(value=False)
+        self.search_all_decks_check = ttk.Checkbutton(
+            search_frame,
+            text="We wszystkich taliach",
+            variable=self.search_all_decks_var,
+            command=self._run_search,
+        )
+        self.search_all_decks_check.grid(row=0, column=2, padx=(10, 0))
+
         # Flashcard Table
         self.flashcard_table = FlashcardTable(
-            self, on_edit=self.presenter.edit_flashcard, on_delete=self._show_delete_confirmation
+            self,
+            on_edit=self.presenter.edit_flashcard,
+            on_delete=self._show_delete_confirmation,
+            on_sort=self.presenter.sort_cards,
         )
-        self.flashcard_table.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.flashcard_table.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
 
         # Button Panel
         self.button_panel = ButtonPanel(
             self, on_add=self.presenter.add_flashcard, on_generate_ai=self.presenter.generate_with_ai, disabled=False
         )
-        self.button_panel.grid(row=2, column=0, sticky="ew", padx=5, pady=(0, 5))
+        self.button_panel.grid(row=3, column=0, sticky="ew", padx=5, pady=(0, 5))
 
         # Start Study Button
         self.start_study_btn = ttk.Button(
@@ -95,6 +120,17 @@ class CardListView(ttk.Frame, ICardListView):
         )
         self.start_study_btn.pack(side=ttk.LEFT, padx=5)
 
+        # Import Button
+        self.import_btn = ttk.Button(
+            self.button_panel,
+            text="Importuj z pliku",
+            style="secondary.TButton",
+            command=self._choose_import_file,
+        )
+        self.import_btn.pack(side=ttk.LEFT, padx=5)
+        self.import_progress_label = ttk.Label(self.button_panel, text="")
+        self.import_progress_label.pack(side=ttk.LEFT, padx=5)
+
         # Delete Deck Button
         self.delete_deck_btn = ttk.Button(
             self.button_panel,
@@ -111,12 +147,45 @@ class CardListView(ttk.Frame, ICardListView):
         """Bind keyboard shortcuts and events"""
         self.bind("<BackSpace>", lambda e: self.presenter.navigate_back())
         self.bind("<Visibility>", lambda e: self._on_visibility())
+        # Navigating away hides the view; a load still in progress is no longer needed
+        self.bind("<Unmap>", lambda e: self.presenter.cancel_loading() if e.widget is self else None)
+        self.bind("<Destroy>", lambda e: self.presenter.cancel_loading() if e.widget is self else None)
+        self.search_entry.bind("<KeyRelease>", lambda e: self._schedule_search())
+        self.search_entry.bind("<Return>", lambda e: self._run_search())
+
+    def _schedule_search(self) -> None:
+        """Search once typing pauses, instead of on every keystroke"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        """Pass the current search text to the presenter"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        self.presenter.search_cards(self.search_var.get(), all_decks=self.search_all_decks_var.get())
 
     def _on_visibility(self) -> None:
         """Handle visibility change event"""
         if self.winfo_viewable():
             self.presenter.load_cards()
 
+    def _choose_import_file(self) -> None:
+        """Ask for a file to import flashcards from"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Importuj fiszki",
+            filetypes=[
+                ("CSV / TSV / Anki", "*.csv *.tsv *.txt"),
+                ("CSV", "*.csv"),
+                ("TSV", "*.tsv"),
+                ("Eksport Anki (tekst)", "*.txt"),
+            ],
+        )
+        if path:
+            self.presenter.import_cards(path)
+
     def _show_delete_confirmation(self, flashcard_id: int) -> None:
         """Show confirmation dialog for flashcard deletion"""
         ConfirmationDialog(
@@ -148,6 +217,10 @@ class CardListView(ttk.Frame, ICardListView):
         """Display the list of cards"""
         self.flashcard_table.set_items(cards)
 
+    def append_cards(self, cards: List[FlashcardViewModel]) -> None:
+        """Add cards to the end of the displayed list"""
+        self.flashcard_table.append_items(cards)
+
     def show_loading(self, is_loading: bool) -> None:
         """Show or hide loading state"""
         self.button_panel.set_disabled(is_loading)
@@ -163,3 +236,20 @@ class CardListView(ttk.Frame, ICardListView):
     def clear_card_selection(self) -> None:
         """Clear the current card selection"""
         self.flashcard_table.clear_selection()
+
+    def show_import_progress(self, fraction: Optional[float]) -> None:
+        """Show the progress of an import; None when no import is running"""
+        if fraction is None:
+            self.import_progress_label.configure(text="")
+            self.import_btn.configure(state=ttk.NORMAL)
+        else:
+            self.import_progress_label.configure(text=f"Importowanie... {fraction:.0%}")
+            self.import_btn.configure(state=ttk.DISABLED)
+
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None:
+        """Run a callback on the UI thread after delay_ms; safe to call from worker threads"""
+        try:
+            self.after(delay_ms, callback)
+        except (RuntimeError, tk.TclError):
+            # The view was destroyed before the callback could be scheduled
+            pass
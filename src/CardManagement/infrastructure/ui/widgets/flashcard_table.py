@@ -1,6 +1,6 @@
-from typing import Callable, Protocol, Sequence, Any
+from typing import Callable, List, Optional, Protocol, Sequence, Any
 
-from Shared.ui.widgets.generic_table_widget import GenericTableWidget
+from Shared.ui.widgets.generic_table_widget import GenericTableWidget, TableRow
 
 
 class FlashcardTableItem(Protocol):
@@ -15,7 +15,16 @@ class FlashcardTableItem(Protocol):
 class FlashcardTable(GenericTableWidget):
     """A table widget for displaying flashcards with sorting and selection capabilities"""
 
-    def __init__(self, parent: Any, on_edit: Callable[[int], None], on_delete: Callable[[int], None]):
+    # Columns whose heading sorts the table, by the sort key passed to on_sort
+    SORTABLE_COLUMNS = ("front_text", "source")
+
+    def __init__(
+        self,
+        parent: Any,
+        on_edit: Callable[[int], None],
+        on_delete: Callable[[int], None],
+        on_sort: Optional[Callable[[str], None]] = None,
+    ):
         """
         Initialize the FlashcardTable widget.
 
@@ -23,6 +32,7 @@ class FlashcardTable(GenericTableWidget):
             parent: The parent widget
             on_edit: Callback for when edit is requested for a flashcard
             on_delete: Callback for when delete is requested for a flashcard
+            on_sort: Callback for when a column heading is clicked, with the column's sort key
         """
         # Configure columns
         columns = [("front_text", "Przód"), ("back_text", "Tył"), ("source", "Źródło")]
@@ -31,6 +41,8 @@ class FlashcardTable(GenericTableWidget):
 
         column_stretches = {"front_text": True, "back_text": True, "source": False}
 
+        self._items: List[FlashcardTableItem] = []
+
         super().__init__(
             parent,
             columns,
@@ -41,22 +53,42 @@ class FlashcardTable(GenericTableWidget):
             on_delete_key=lambda id: on_delete(int(id)),
         )
 
+        if on_sort is not None:
+            for column in self.SORTABLE_COLUMNS:
+                self.tree.heading(column, command=lambda column=column: on_sort(column))
+
     def set_items(self, items: Sequence[FlashcardTableItem]) -> None:
         """
         Update the table with new items.
 
+        Rows are formatted only when they scroll into view, so large decks open instantly.
+
         Args:
             items: Sequence of items implementing FlashcardTableItem protocol
         """
-        self.clear()
-
-        # Add new items
-        for item in items:
-            # Truncate text for display
-            front_preview = (item.front_text[:30] + "...") if len(item.front_text) > 30 else item.front_text
-            back_preview = (item.back_text[:30] + "...") if len(item.back_text) > 30 else item.back_text
-            source_display = {"manual": "Ręcznie", "ai-generated": "AI", "ai-edited": "AI (edyt.)"}.get(
-                item.source, item.source
-            )
-
-            self.add_item(str(item.id), [front_preview, back_preview, source_display])
+        self._items = list(items)
+        self.set_data_source(
+            count=lambda: len(self._items),
+            fetch_range=lambda start, stop: [self._format_row(item) for item in self._items[start:stop]],
+        )
+
+    def append_items(self, items: Sequence[FlashcardTableItem]) -> None:
+        """
+        Add items to the end of the table, keeping the scroll position and selection.
+
+        Args:
+            items: Sequence of items implementing FlashcardTableItem protocol
+        """
+        self._items.extend(items)
+        self.refresh()
+
+    @staticmethod
+    def _format_row(item: FlashcardTableItem) -> TableRow:
+        """Format an item as an (id, values) table row."""
+        # Truncate text for display
+        front_preview = (item.front_text[:30] + "...") if len(item.front_text) > 30 else item.front_text
+        back_preview = (item.back_text[:30] + "...") if len(item.back_text) > 30 else item.back_text
+        source_display = {"manual": "Ręcznie", "ai-generated": "AI", "ai-edited": "AI (edyt.)"}.get(
+            item.source, item.source
+        )
+        return str(item.id), [front_preview, back_preview, source_display]
@@ -0,0 +1,344 @@
+"""Export of a user's decks, flashcards and review history to CSV, JSON Lines or a compressed snapshot, and restore."""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from DeckManagement.domain.repositories.IDeckArchiveRepository import ArchiveRecord, IDeckArchiveRepository
+from Shared.application.unit_of_work import UnitOfWork
+from Shared.infrastructure.config import IMPORT_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+FORMAT_SNAPSHOT = "snapshot"
+ARCHIVE_FORMATS = (FORMAT_CSV, FORMAT_JSONL, FORMAT_SNAPSHOT)
+ARCHIVE_SUFFIXES = {FORMAT_CSV: ".csv", FORMAT_JSONL: ".jsonl", FORMAT_SNAPSHOT: ".jsonl.gz"}
+
+ARCHIVE_NAME = "10xcards-archive"
+ARCHIVE_VERSION = 1
+
+# Fields of each record type, in file order; "type" comes first in every record
+RECORD_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "header": ("format", "version", "exported_at"),
+    "deck": ("id", "name", "created_at", "updated_at"),
+    "flashcard": (
+        "id",
+        "deck_id",
+        "front_text",
+        "back_text",
+        "fsrs_state",
+        "source",
+        "ai_model_name",
+        "created_at",
+        "updated_at",
+    ),
+    "review_log": (
+        "flashcard_id",
+        "review_log_data",
+        "fsrs_rating",
+        "reviewed_at",
+        "scheduler_params_at_review",
+        "created_at",
+    ),
+}
+# CSV has one column per field name of any record type; a record leaves the others empty
+CSV_COLUMNS: Tuple[str, ...] = ("type",) + tuple(
+    dict.fromkeys(field for fields in RECORD_FIELDS.values() for field in fields)
+)
+_INT_FIELDS = {"id", "deck_id", "flashcard_id", "fsrs_rating", "version"}
+# Fields that may be NULL; in CSV an empty cell stands for NULL
+_NULLABLE_FIELDS = {"fsrs_state", "ai_model_name", "created_at"}
+
+_MAX_DECK_NAME_LENGTH = 50
+
+
+@dataclass
+class ArchiveSummary:
+    """Numbers of records written by an export or restored by an import."""
+
+    decks: int = 0
+    flashcards: int = 0
+    review_logs: int = 0
+
+    def count(self, record: ArchiveRecord) -> None:
+        """Count one deck, flashcard or review log record."""
+        if record["type"] == "deck":
+            self.decks += 1
+        elif record["type"] == "flashcard":
+            self.flashcards += 1
+        elif record["type"] == "review_log":
+            self.review_logs += 1
+
+
+def detect_archive_format(path: Union[str, Path]) -> str:
+    """Guess the archive format from the file name.
+
+    Raises:
+        ValueError: If the extension is not one of ARCHIVE_SUFFIXES.
+    """
+    name = Path(path).name.lower()
+    for archive_format, suffix in sorted(ARCHIVE_SUFFIXES.items(), key=lambda item: -len(item[1])):
+        if name.endswith(suffix):
+            return archive_format
+    raise ValueError("Nieobsługiwany format kopii (obsługiwane: .csv, .jsonl, .jsonl.gz)")
+
+
+def write_records(records: Iterable[ArchiveRecord], stream: IO[str], archive_format: str) -> ArchiveSummary:
+    """Write records to a text stream, one line (or CSV row) per record.
+
+    The snapshot format is JSON Lines; the caller wraps the stream in gzip compression.
+    """
+    summary = ArchiveSummary()
+    if archive_format == FORMAT_CSV:
+        writer = csv.DictWriter(stream, fieldnames=CSV_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            summary.count(record)
+    else:
+        for record in records:
+            stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            stream.write("\n")
+            summary.count(record)
+    return summary
+
+
+def read_records(stream: IO[str], archive_format: str) -> Iterator[ArchiveRecord]:
+    """Read the records written by write_records, one at a time.
+
+    Raises:
+        ValueError: If a line is not a valid record
+    """
+    if archive_format == FORMAT_CSV:
+        reader = csv.DictReader(stream)
+        if tuple(reader.fieldnames or ()) != CSV_COLUMNS:
+            raise ValueError("Nieprawidłowe kolumny pliku CSV kopii")
+        for row in reader:
+            yield _record_from_csv(row, reader.line_num)
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Nieprawidłowy wiersz {line_number} kopii: {e}") from e
+            if not isinstance(record, dict) or record.get("type") not in RECORD_FIELDS:
+                raise ValueError(f"Nieprawidłowy rekord w wierszu {line_number} kopii")
+            yield record
+
+
+def _record_from_csv(row: Dict[str, str], line_number: int) -> ArchiveRecord:
+    """Convert a CSV row to a record of its type, restoring integers and NULLs."""
+    record_type = row.get("type")
+    if record_type not in RECORD_FIELDS:
+        raise ValueError(f"Nieprawidłowy rekord w wierszu {line_number} kopii")
+    record: ArchiveRecord = {"type": record_type}
+    for field in RECORD_FIELDS[record_type]:
+        value: Any = row.get(field) or ""
+        if value == "" and field in _NULLABLE_FIELDS:
+            value = None
+        elif field in _INT_FIELDS:
+            try:
+                value = int(value)
+            except ValueError as e:
+                raise ValueError(f"Nieprawidłowa wartość '{field}' w wierszu {line_number} kopii") from e
+        record[field] = value
+    return record
+
+
+class DeckArchiveService:
+    """Application service for backing up and restoring a user's decks.
+
+    Exports stream the decks, flashcards (with their FSRS state) and review logs from the
+    repository straight into the file, so memory use stays flat however large the collection is.
+    A restore reads the file the same way and adds everything as new decks of the user in a
+    single transaction: either the whole archive is restored or nothing is.
+    """
+
+    def __init__(
+        self, archive_repository: IDeckArchiveRepository, unit_of_work: UnitOfWork, batch_size: int = IMPORT_BATCH_SIZE
+    ):
+        """Initialize the service.
+
+        Args:
+            archive_repository: Repository the records are read from and restored to
+            unit_of_work: Transaction context the restore runs in
+            batch_size: Flashcards inserted per statement group during a restore
+        """
+        self.archive_repository = archive_repository
+        self.unit_of_work = unit_of_work
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(__name__)
+
+    def iter_export(self, user_id: int, deck_id: Optional[int] = None) -> Iterator[ArchiveRecord]:
+        """Yield the header record, then the records of the user's decks (or of one deck)."""
+        yield {
+            "type": "header",
+            "format": ARCHIVE_NAME,
+            "version": ARCHIVE_VERSION,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+        }
+        yield from self.archive_repository.iter_records(user_id, deck_id)
+
+    def export_to_file(
+        self,
+        path: Union[str, Path],
+        user_id: int,
+        deck_id: Optional[int] = None,
+        archive_format: Optional[str] = None,
+    ) -> ArchiveSummary:
+        """Export the user's decks (or one deck) to a file.
+
+        The file is written next to its destination and renamed into place when complete,
+        so a failed export never leaves a truncated archive behind.
+
+        Args:
+            path: Destination file
+            user_id: The user whose decks are exported
+            deck_id: Export only this deck
+            archive_format: One of ARCHIVE_FORMATS; detected from the file name when omitted
+
+        Returns:
+            ArchiveSummary: Numbers of exported decks, flashcards and review logs
+
+        Raises:
+            ValueError: If the format is not supported
+            OSError: If the file cannot be written
+        """
+        archive_format = archive_format or detect_archive_format(path)
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Nieobsługiwany format kopii: {archive_format}")
+
+        partial_path = Path(f"{path}.part")
+        try:
+            with self._open(partial_path, archive_format, "w") as stream:
+                summary = write_records(self.iter_export(user_id, deck_id), stream, archive_format)
+            os.replace(partial_path, path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        self.logger.info(
+            f"Exported {summary.decks} decks, {summary.flashcards} flashcards and {summary.review_logs} "
+            f"review logs of user {user_id} to {path} ({archive_format})"
+        )
+        return summary
+
+    def restore_from_file(
+        self, path: Union[str, Path], user_id: int, archive_format: Optional[str] = None
+    ) -> ArchiveSummary:
+        """Restore an archive written by export_to_file as new decks of the user.
+
+        Args:
+            path: The archive
+            user_id: The user the decks are restored for
+            archive_format: One of ARCHIVE_FORMATS; detected from the file name when omitted
+
+        Returns:
+            ArchiveSummary: Numbers of restored decks, flashcards and review logs
+
+        Raises:
+            ValueError: If the format is not supported or the file is not a valid archive
+            OSError: If the file cannot be read
+        """
+        archive_format = archive_format or detect_archive_format(path)
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Nieobsługiwany format kopii: {archive_format}")
+        try:
+            with self._open(Path(path), archive_format, "r") as stream:
+                return self.restore_records(read_records(stream, archive_format), user_id)
+        except (UnicodeDecodeError, gzip.BadGzipFile, EOFError, csv.Error) as e:
+            raise ValueError(f"Nie udało się odczytać kopii: {e}") from e
+
+    def restore_records(self, records: Iterable[ArchiveRecord], user_id: int) -> ArchiveSummary:
+        """Restore archive records as new decks of the user, in a single transaction.
+
+        Decks whose names are taken get a numbered name, e.g. "Angielski (2)". Flashcards keep
+        their FSRS state, source and timestamps, and review logs their data and dates.
+
+        Raises:
+            ValueError: If the records are not a valid archive; nothing is restored then
+        """
+        records = iter(records)
+        header = next(records, None)
+        if header is None or header.get("type") != "header" or header.get("format") != ARCHIVE_NAME:
+            raise ValueError("Plik nie jest kopią talii 10xCards")
+        if not isinstance(header.get("version"), int) or header["version"] > ARCHIVE_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja kopii: {header.get('version')}")
+
+        summary = ArchiveSummary()
+        with self.unit_of_work.transaction():
+            deck_names = self.archive_repository.list_deck_names(user_id)
+            deck_ids: Dict[int, int] = {}
+            # Flashcards waiting to be inserted, with the review logs that follow each of them
+            flashcards: List[ArchiveRecord] = []
+            review_logs: List[ArchiveRecord] = []
+
+            for record in records:
+                record_type = record.get("type")
+                if record_type == "deck":
+                    name = self._unique_deck_name(record["name"], deck_names)
+                    deck_ids[record["id"]] = self.archive_repository.add_deck(user_id, {**record, "name": name})
+                    deck_names.add(name)
+                elif record_type == "flashcard":
+                    if record.get("deck_id") not in deck_ids:
+                        raise ValueError(f"Fiszka {record.get('id')} należy do talii spoza kopii")
+                    if len(flashcards) >= self.batch_size:
+                        self._flush(user_id, flashcards, review_logs)
+                    flashcards.append({**record, "deck_id": deck_ids[record["deck_id"]]})
+                elif record_type == "review_log":
+                    if not flashcards or flashcards[-1]["id"] != record.get("flashcard_id"):
+                        raise ValueError(f"Historia powtórek fiszki {record.get('flashcard_id')} jest poza kolejnością")
+                    review_logs.append(record)
+                else:
+                    raise ValueError(f"Nieprawidłowy rekord kopii: {record_type}")
+                summary.count(record)
+            self._flush(user_id, flashcards, review_logs)
+
+        self.logger.info(
+            f"Restored {summary.decks} decks, {summary.flashcards} flashcards and {summary.review_logs} "
+            f"review logs for user {user_id}"
+        )
+        return summary
+
+    def _flush(self, user_id: int, flashcards: List[ArchiveRecord], review_logs: List[ArchiveRecord]) -> None:
+        """Insert the pending flashcards, then their review logs with the new flashcard IDs."""
+        if flashcards:
+            new_ids = self.archive_repository.add_flashcards(flashcards)
+            id_map = {record["id"]: new_id for record, new_id in zip(flashcards, new_ids)}
+            if review_logs:
+                self.archive_repository.add_review_logs(
+                    user_id, [{**log, "flashcard_id": id_map[log["flashcard_id"]]} for log in review_logs]
+                )
+        flashcards.clear()
+        review_logs.clear()
+
+    @staticmethod
+    def _unique_deck_name(name: str, taken: Set[str]) -> str:
+        """The deck name, numbered if the user already has a deck with that name."""
+        if name not in taken:
+            return name
+        number = 2
+        while True:
+            suffix = f" ({number})"
+            candidate = name[: _MAX_DECK_NAME_LENGTH - len(suffix)] + suffix
+            if candidate not in taken:
+                return candidate
+            number += 1
+
+    @staticmethod
+    def _open(path: Path, archive_format: str, mode: str) -> IO[str]:
+        """Open an archive as a UTF-8 text stream, compressed for snapshots."""
+        if archive_format == FORMAT_SNAPSHOT:
+            return io.TextIOWrapper(gzip.GzipFile(path, mode + "b", compresslevel=6), encoding="utf-8", newline="")
+        return open(path, mode, encoding="utf-8", newline="")
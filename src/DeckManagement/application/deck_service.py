@@ -1,9 +1,10 @@
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, time, timedelta
+from typing import List, Optional, Tuple
 from sqlite3 import IntegrityError
 
 from DeckManagement.domain.models.Deck import Deck
+from DeckManagement.domain.models.DeckStats import DeckStats
 from DeckManagement.domain.repositories.IDeckRepository import IDeckRepository
 
 
@@ -98,6 +99,27 @@ class DeckService:
             self.logger.error(f"Failed to list decks for user {user_id}: {str(e)}")
             raise
 
+    def list_decks_with_stats(self, user_id: int, now: Optional[datetime] = None) -> List[Tuple[Deck, DeckStats]]:
+        """
+        Lists all decks for the given user with their card statistics, in a single query.
+
+        Args:
+            user_id: The ID of the user whose decks to list
+            now: Current time; cards due before the end of its day count as due today (defaults to local now)
+
+        Returns:
+            List of (Deck, DeckStats) pairs for the decks owned by the user, ordered by name
+        """
+        now = now or datetime.now().astimezone()
+        end_of_today = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=now.tzinfo)
+        try:
+            decks: List[Tuple[Deck, DeckStats]] = self.deck_repository.list_all_with_stats(user_id, end_of_today)
+            self.logger.debug(f"Listed {len(decks)} decks with statistics for user {user_id}")
+            return decks
+        except Exception as e:
+            self.logger.error(f"Failed to list decks with statistics for user {user_id}: {str(e)}")
+            raise
+
     def delete_deck(self, deck_id: int, user_id: int) -> None:
         """
         Deletes a deck and all its flashcards.
@@ -1,10 +1,13 @@
 """Presenter for the deck list view."""
 
 import logging
-from typing import Protocol, List, Optional
+import threading
+from typing import Callable, Protocol, List, Optional
 from datetime import datetime
 
 from DeckManagement.domain.models.Deck import Deck
+from DeckManagement.domain.models.DeckStats import DeckStats
+from DeckManagement.application.deck_archive_service import ArchiveSummary, DeckArchiveService
 from DeckManagement.application.deck_service import DeckService
 from Shared.application.session_service import SessionService
 from Shared.application.navigation import NavigationControllerProtocol
@@ -15,17 +18,39 @@ logger = logging.getLogger(__name__)
 class DeckViewModel:
     """Data transfer object for deck display"""
 
-    def __init__(self, id: int, name: str, created_at: datetime):
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        created_at: datetime,
+        total: int = 0,
+        new: int = 0,
+        due_today: int = 0,
+        last_studied_at: Optional[datetime] = None,
+    ):
         self.id = id
         self.name = name
         self.created_at = created_at
+        self.total = total
+        self.new = new
+        self.due_today = due_today
+        self.last_studied_at = last_studied_at
 
     @classmethod
-    def from_deck(cls, deck: Deck) -> "DeckViewModel":
-        """Creates a ViewModel from a domain Deck model"""
+    def from_deck(cls, deck: Deck, stats: Optional[DeckStats] = None) -> "DeckViewModel":
+        """Creates a ViewModel from a domain Deck model and, if given, its statistics"""
         if deck.id is None or deck.created_at is None:
             raise ValueError("Cannot create DeckViewModel from Deck with None id or created_at")
-        return cls(id=deck.id, name=deck.name, created_at=deck.created_at)
+        stats = stats or DeckStats()
+        return cls(
+            id=deck.id,
+            name=deck.name,
+            created_at=deck.created_at,
+            total=stats.total,
+            new=stats.new,
+            due_today=stats.due_today,
+            last_studied_at=stats.last_studied_at,
+        )
 
 
 class IDeckListView(Protocol):
@@ -37,6 +62,8 @@ class IDeckListView(Protocol):
     def show_toast(self, title: str, message: str) -> None: ...
     def clear_deck_selection(self) -> None: ...
     def enable_study_button(self, enabled: bool) -> None: ...
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None: ...
+    def show_archive_busy(self, busy: bool) -> None: ...
 
 
 class DeckListPresenter:
@@ -48,6 +75,7 @@ class DeckListPresenter:
         deck_service: DeckService,
         session_service: SessionService,
         navigation_controller: NavigationControllerProtocol,
+        archive_service: Optional[DeckArchiveService] = None,
     ):
         """Initialize the deck list presenter.
 
@@ -56,13 +84,16 @@ class DeckListPresenter:
             deck_service: Service for deck operations
             session_service: Service for session management
             navigation_controller: Controller for navigation
+            archive_service: Service for exporting and restoring decks; backups are unavailable without it
         """
         self.view = view
         self.deck_service = deck_service
         self.session_service = session_service
         self.navigation = navigation_controller
+        self.archive_service = archive_service
         self.dialog_open: bool = False
         self.deleting_deck_id: Optional[int] = None
+        self._archive_thread: Optional[threading.Thread] = None
 
     def load_decks(self) -> None:
         """Load decks for the current user."""
@@ -78,8 +109,8 @@ class DeckListPresenter:
                 self.view.show_error("Musisz być zalogowany aby przeglądać talie.")
                 return
 
-            decks = self.deck_service.list_decks(user.id)
-            deck_viewmodels = [DeckViewModel.from_deck(deck) for deck in decks]
+            decks = self.deck_service.list_decks_with_stats(user.id)
+            deck_viewmodels = [DeckViewModel.from_deck(deck, stats) for deck, stats in decks]
             self.view.display_decks(deck_viewmodels)
             self.view.clear_deck_selection()
             self.view.enable_study_button(False)
@@ -193,6 +224,87 @@ class DeckListPresenter:
         self.navigation.navigate("/profiles")
         self.view.show_toast("Informacja", "Wylogowano pomyślnie")
 
+    def export_decks(self, path: str) -> None:
+        """Export all decks of the current user, with their flashcards and review history, to a file.
+
+        The export runs on a worker thread; the outcome reaches the view through view.schedule().
+        """
+        archive_service = self.archive_service
+        user_id = self._start_archive_operation("wyeksportować talie")
+        if user_id is None or archive_service is None:
+            return
+        self._archive_thread = threading.Thread(
+            target=self._archive_thread_main,
+            args=(lambda: archive_service.export_to_file(path, user_id), "Wyeksportowano", "eksportu"),
+            name="DeckExport",
+            daemon=True,
+        )
+        self._archive_thread.start()
+
+    def restore_decks(self, path: str) -> None:
+        """Restore decks from an exported file as new decks of the current user.
+
+        The restore runs on a worker thread; the outcome reaches the view through view.schedule().
+        """
+        archive_service = self.archive_service
+        user_id = self._start_archive_operation("przywrócić talie")
+        if user_id is None or archive_service is None:
+            return
+        self._archive_thread = threading.Thread(
+            target=self._archive_thread_main,
+            args=(lambda: archive_service.restore_from_file(path, user_id), "Przywrócono", "przywracania"),
+            name="DeckRestore",
+            daemon=True,
+        )
+        self._archive_thread.start()
+
+    def _start_archive_operation(self, action: str) -> Optional[int]:
+        """Check an export or restore can start and mark the view busy; returns the user ID."""
+        if self.archive_service is None:
+            self.view.show_error("Kopia zapasowa talii jest niedostępna")
+            return None
+        if self._archive_thread is not None:
+            self.view.show_toast("Kopia zapasowa", "Eksport lub przywracanie jest już w toku.")
+            return None
+        user = self.session_service.get_current_user()
+        if not user or user.id is None:
+            self.view.show_toast("Błąd", f"Musisz być zalogowany aby {action}.")
+            self.navigation.navigate("/profiles")
+            return None
+        user_id: int = user.id
+        self.view.show_archive_busy(True)
+        return user_id
+
+    def _archive_thread_main(self, operation: Callable[[], ArchiveSummary], done: str, activity: str) -> None:
+        """Background thread running an export or restore."""
+        try:
+            summary = operation()
+        except (ValueError, OSError) as e:
+            error_msg = f"Błąd podczas {activity} talii: {str(e)}"
+            logger.warning(error_msg)
+            self.view.schedule(0, lambda: self._archive_finished(error_msg=error_msg))
+            return
+        except Exception as e:
+            error_msg = f"Wystąpił błąd podczas {activity} talii: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self.view.schedule(0, lambda: self._archive_finished(error_msg=error_msg))
+            return
+        message = (
+            f"{done} talii: {summary.decks}, fiszek: {summary.flashcards}, "
+            f"powtórek w historii: {summary.review_logs}."
+        )
+        self.view.schedule(0, lambda: self._archive_finished(message=message))
+
+    def _archive_finished(self, message: Optional[str] = None, error_msg: Optional[str] = None) -> None:
+        """Report the outcome of an export or restore and refresh the list (UI thread)."""
+        self._archive_thread = None
+        self.view.show_archive_busy(False)
+        if error_msg is not None:
+            self.view.show_error(error_msg)
+        else:
+            self.view.show_toast("Kopia zapasowa", message or "")
+        self.load_decks()
+
     def start_study_session(self, deck_id: int) -> None:
         """Start a study session for the selected deck."""
         if not self.session_service.is_authenticated():
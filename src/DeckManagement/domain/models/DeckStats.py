@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# Counting due cards stops past this many, so the deck list stays cheap for decks with huge backlogs
+DUE_TODAY_CAP = 999
+
+
+@dataclass(frozen=True)
+class DeckStats:
+    """
+    Aggregate statistics of a deck's flashcards.
+    A card is new until its first review; reviewed cards are in learning (or relearning) or in review.
+    'due_today' counts cards due by the end of the day the statistics were read for; a value above
+    DUE_TODAY_CAP means "more than DUE_TODAY_CAP".
+    """
+
+    total: int = 0
+    new: int = 0
+    learning: int = 0
+    review: int = 0
+    due_today: int = 0
+    last_studied_at: Optional[datetime] = None
@@ -0,0 +1,36 @@
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Set
+
+# One exported row: a deck, a flashcard or a review log, keyed by column name (see DeckArchiveService)
+ArchiveRecord = Dict[str, Any]
+
+
+class IDeckArchiveRepository(Protocol):
+    """
+    Repository interface for exporting a user's decks with their flashcards and review history,
+    and restoring them. Rows are passed as plain records with the stored values unchanged
+    (timestamps as stored, fsrs_state and review log JSON as text), so a restore is lossless.
+    """
+
+    def iter_records(self, user_id: int, deck_id: Optional[int] = None) -> Iterator[ArchiveRecord]:
+        """
+        Streams the user's decks (or one deck) from a single read snapshot: first all deck records,
+        then every flashcard followed by its review log records. Rows are read from the database
+        as the iterator advances, never all at once.
+        """
+        ...
+
+    def list_deck_names(self, user_id: int) -> Set[str]:
+        """Returns the names of the user's decks."""
+        ...
+
+    def add_deck(self, user_id: int, record: ArchiveRecord) -> int:
+        """Adds a deck record with its timestamps for the user and returns the new deck ID."""
+        ...
+
+    def add_flashcards(self, records: Sequence[ArchiveRecord]) -> List[int]:
+        """Adds flashcard records (deck_id already mapped) and returns their new IDs in the given order."""
+        ...
+
+    def add_review_logs(self, user_id: int, records: Sequence[ArchiveRecord]) -> None:
+        """Adds review log records (flashcard_id already mapped) for the user."""
+        ...
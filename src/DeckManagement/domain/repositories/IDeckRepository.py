@@ -1,5 +1,7 @@
-from typing import List, Optional, Protocol
+from datetime import datetime
+from typing import List, Optional, Protocol, Tuple
 from DeckManagement.domain.models.Deck import Deck
+from DeckManagement.domain.models.DeckStats import DeckStats
 
 
 class IDeckRepository(Protocol):
@@ -23,6 +25,13 @@ class IDeckRepository(Protocol):
         """Returns all decks for the given user, ordered by name."""
         ...
 
+    def list_all_with_stats(self, user_id: int, due_before: datetime) -> List[Tuple[Deck, DeckStats]]:
+        """
+        Returns all decks for the given user with their statistics, ordered by name.
+        Cards due at or before 'due_before' are counted as due today.
+        """
+        ...
+
     def update(self, deck: Deck) -> None:
         """Updates an existing deck's name. Requires user_id in the deck object."""
         ...
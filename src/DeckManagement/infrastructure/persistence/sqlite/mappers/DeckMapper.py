@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Tuple, Optional
 
 from DeckManagement.domain.models.Deck import Deck
+from DeckManagement.domain.models.DeckStats import DeckStats
 
 
 class DeckMapper:
@@ -32,3 +33,33 @@ class DeckMapper:
             raise ValueError(f"Failed to parse timestamps from database: {e}")
 
         return Deck(id=id, user_id=user_id, name=name, created_at=created_at, updated_at=updated_at)
+
+    @staticmethod
+    def stats_from_row(row: Tuple[int, int, int, int, int, Optional[str]]) -> DeckStats:
+        """
+        Maps a database row to DeckStats.
+
+        Args:
+            row: Tuple containing (total, new, learning, review, due_today, last_studied_at)
+                last_studied_at is an ISO format datetime string or None
+
+        Returns:
+            DeckStats
+
+        Raises:
+            ValueError: If parsing last_studied_at fails
+        """
+        total, new, learning, review, due_today, last_studied_at_str = row
+        try:
+            last_studied_at = datetime.fromisoformat(last_studied_at_str) if last_studied_at_str else None
+        except ValueError as e:
+            raise ValueError(f"Failed to parse timestamps from database: {e}")
+
+        return DeckStats(
+            total=total,
+            new=new,
+            learning=learning,
+            review=review,
+            due_today=due_today,
+            last_studied_at=last_studied_at,
+        )
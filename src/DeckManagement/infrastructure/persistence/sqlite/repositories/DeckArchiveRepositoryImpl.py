@@ -0,0 +1,204 @@
+import sqlite3
+import logging
+from typing import Any, ContextManager, Iterator, List, Optional, Protocol, Sequence, Set, Tuple
+
+from CardManagement.infrastructure.persistence.sqlite.mappers.FlashcardMapper import FlashcardMapper
+from DeckManagement.domain.repositories.IDeckArchiveRepository import ArchiveRecord, IDeckArchiveRepository
+
+logger = logging.getLogger(__name__)
+
+DECK_FIELDS = ("id", "name", "created_at", "updated_at")
+FLASHCARD_FIELDS = (
+    "id",
+    "deck_id",
+    "front_text",
+    "back_text",
+    "fsrs_state",
+    "source",
+    "ai_model_name",
+    "created_at",
+    "updated_at",
+)
+REVIEW_LOG_FIELDS = (
+    "flashcard_id",
+    "review_log_data",
+    "fsrs_rating",
+    "reviewed_at",
+    "scheduler_params_at_review",
+    "created_at",
+)
+
+# The optional deck filter is bound twice: (deck_id IS NULL OR d.id = deck_id)
+_SELECT_DECKS = """
+    SELECT d.id, d.name, d.created_at, d.updated_at
+    FROM Decks d
+    WHERE d.user_id = ? AND (? IS NULL OR d.id = ?)
+    ORDER BY d.id
+"""
+_SELECT_FLASHCARDS = """
+    SELECT f.id, f.deck_id, f.front_text, f.back_text, f.fsrs_state, f.source, f.ai_model_name,
+           f.created_at, f.updated_at
+    FROM Flashcards f
+    JOIN Decks d ON d.id = f.deck_id
+    WHERE d.user_id = ? AND (? IS NULL OR d.id = ?)
+    ORDER BY f.id
+"""
+_SELECT_REVIEW_LOGS = """
+    SELECT r.flashcard_id, r.review_log_data, r.fsrs_rating, r.reviewed_at, r.scheduler_params_at_review,
+           r.created_at
+    FROM ReviewLogs r
+    JOIN Flashcards f ON f.id = r.flashcard_id
+    JOIN Decks d ON d.id = f.deck_id
+    WHERE r.user_profile_id = ? AND d.user_id = ? AND (? IS NULL OR d.id = ?)
+    ORDER BY r.flashcard_id, r.id
+"""
+_INSERT_DECK = "INSERT INTO Decks (user_id, name, created_at, updated_at) VALUES (?, ?, ?, ?)"
+_INSERT_REVIEW_LOG = """
+    INSERT INTO ReviewLogs (
+        user_profile_id, flashcard_id, review_log_data,
+        fsrs_rating, reviewed_at, scheduler_params_at_review, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class DbConnectionProvider(Protocol):
+    """Protocol defining the required interface for database connection providers."""
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Returns a SQLite connection object."""
+        ...
+
+    def transaction(self) -> ContextManager[None]:
+        """Runs the enclosed writes in one transaction, joining the one already open on the thread."""
+        ...
+
+
+class DeckArchiveRepositoryImpl(IDeckArchiveRepository):
+    """
+    SQLite implementation of IDeckArchiveRepository.
+    Exports are read through cursors stepped as the caller iterates, inside one read transaction,
+    so memory use does not grow with the number of flashcards and the export is a consistent snapshot.
+    Writes run inside the provider's transaction(); open one around the calls to restore atomically.
+    """
+
+    # Rows per flashcard INSERT; 14 parameters each keeps a statement under SQLite's historical 999 limit
+    ADD_FLASHCARDS_CHUNK_SIZE = 70
+
+    def __init__(self, db_provider: DbConnectionProvider):
+        self._db_provider = db_provider
+        logger.debug("DeckArchiveRepositoryImpl initialized with database provider")
+
+    def iter_records(self, user_id: int, deck_id: Optional[int] = None) -> Iterator[ArchiveRecord]:
+        """
+        Streams deck records, then each flashcard record followed by its review logs.
+        Flashcards and review logs are read by two cursors ordered by flashcard ID and merged.
+        """
+        conn = self._db_provider.get_connection()
+        # A read transaction keeps the three queries on one snapshot while the caller writes the export
+        owns_transaction = not conn.in_transaction
+        if owns_transaction:
+            conn.execute("BEGIN")
+        try:
+            for row in conn.execute(_SELECT_DECKS, (user_id, deck_id, deck_id)):
+                yield {"type": "deck", **dict(zip(DECK_FIELDS, row))}
+
+            review_logs = conn.execute(_SELECT_REVIEW_LOGS, (user_id, user_id, deck_id, deck_id))
+            pending_log: Optional[Tuple[Any, ...]] = review_logs.fetchone()
+            for row in conn.execute(_SELECT_FLASHCARDS, (user_id, deck_id, deck_id)):
+                yield {"type": "flashcard", **dict(zip(FLASHCARD_FIELDS, row))}
+                flashcard_id = row[0]
+                # Logs are ordered by flashcard ID too; those of the current flashcard follow it
+                while pending_log is not None and pending_log[0] <= flashcard_id:
+                    if pending_log[0] == flashcard_id:
+                        yield {"type": "review_log", **dict(zip(REVIEW_LOG_FIELDS, pending_log))}
+                    pending_log = review_logs.fetchone()
+        finally:
+            if owns_transaction:
+                conn.rollback()
+
+    def list_deck_names(self, user_id: int) -> Set[str]:
+        """Returns the names of the user's decks."""
+        conn = self._db_provider.get_connection()
+        return {row[0] for row in conn.execute("SELECT name FROM Decks WHERE user_id = ?", (user_id,))}
+
+    def add_deck(self, user_id: int, record: ArchiveRecord) -> int:
+        """
+        Adds a deck with the record's name and timestamps.
+        Raises sqlite3.IntegrityError if the name is not unique for the user.
+        """
+        with self._db_provider.transaction():
+            cursor = self._db_provider.get_connection().execute(
+                _INSERT_DECK, (user_id, record["name"], record["created_at"], record["updated_at"])
+            )
+        deck_id = cursor.lastrowid
+        assert deck_id is not None, "deck_id should never be None after insert!"
+        return deck_id
+
+    def add_flashcards(self, records: Sequence[ArchiveRecord]) -> List[int]:
+        """
+        Adds flashcards with their stored FSRS state, source and timestamps, using multi-row
+        INSERT ... RETURNING statements. The FSRS columns are derived from fsrs_state as in
+        FlashcardRepositoryImpl; cards without a usable state are due from their creation.
+        """
+        new_ids: List[int] = []
+        with self._db_provider.transaction():
+            conn = self._db_provider.get_connection()
+            for start in range(0, len(records), self.ADD_FLASHCARDS_CHUNK_SIZE):
+                chunk = records[start : start + self.ADD_FLASHCARDS_CHUNK_SIZE]
+                values = ", ".join(
+                    ["(?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, strftime('%Y-%m-%dT%H:%M:%f', ?)), ?, ?, ?, ?)"] * len(chunk)
+                )
+                params: List = []
+                for record in chunk:
+                    due, state, stability, difficulty, last_review = FlashcardMapper.to_fsrs_columns(
+                        record["fsrs_state"]
+                    )
+                    params += [
+                        record["deck_id"],
+                        record["front_text"],
+                        record["back_text"],
+                        record["fsrs_state"],
+                        record["source"],
+                        record["ai_model_name"],
+                        record["created_at"],
+                        record["updated_at"],
+                        due,
+                        record["created_at"],
+                        state,
+                        stability,
+                        difficulty,
+                        last_review,
+                    ]
+                rows = conn.execute(
+                    f"""
+                    INSERT INTO Flashcards (
+                        deck_id, front_text, back_text, fsrs_state, source, ai_model_name,
+                        created_at, updated_at, due, state, stability, difficulty, last_review
+                    )
+                    VALUES {values}
+                    RETURNING id
+                    """,
+                    params,
+                ).fetchall()
+                # AUTOINCREMENT ids grow in VALUES order, while RETURNING rows come in no guaranteed order
+                new_ids += sorted(row[0] for row in rows)
+        return new_ids
+
+    def add_review_logs(self, user_id: int, records: Sequence[ArchiveRecord]) -> None:
+        """Adds review logs with their stored JSON, rating and timestamps."""
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().executemany(
+                _INSERT_REVIEW_LOG,
+                (
+                    (
+                        user_id,
+                        record["flashcard_id"],
+                        record["review_log_data"],
+                        record["fsrs_rating"],
+                        record["reviewed_at"],
+                        record["scheduler_params_at_review"],
+                        record["created_at"],
+                    )
+                    for record in records
+                ),
+            )
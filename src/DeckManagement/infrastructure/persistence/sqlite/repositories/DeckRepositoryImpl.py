@@ -1,7 +1,10 @@
 import sqlite3
 import logging
-from typing import List, Optional, Protocol
+from datetime import datetime
+from typing import ContextManager, List, Optional, Protocol, Tuple
+from CardManagement.infrastructure.persistence.sqlite.mappers.FlashcardMapper import FlashcardMapper
 from DeckManagement.domain.models.Deck import Deck
+from DeckManagement.domain.models.DeckStats import DUE_TODAY_CAP, DeckStats
 from DeckManagement.domain.repositories.IDeckRepository import IDeckRepository
 from DeckManagement.infrastructure.persistence.sqlite.mappers.DeckMapper import DeckMapper
 
@@ -15,12 +18,17 @@ class DbConnectionProvider(Protocol):
         """Returns a SQLite connection object."""
         ...
 
+    def transaction(self) -> ContextManager[None]:
+        """Runs the enclosed writes in one transaction, joining the one already open on the thread."""
+        ...
+
 
 class DeckRepositoryImpl(IDeckRepository):
     """
     SQLite implementation of IDeckRepository.
     All SQL is parameterized and filtered by user_id to ensure user data isolation.
     Propagates sqlite3.IntegrityError and other DB exceptions to the application layer.
+    Writes run inside the provider's transaction(), so they join a unit of work opened by the caller.
     """
 
     def __init__(self, db_provider: DbConnectionProvider):
@@ -32,18 +40,14 @@ class DeckRepositoryImpl(IDeckRepository):
         Adds a new deck for the given user. Returns the deck with assigned ID and timestamps.
         Raises sqlite3.IntegrityError if the name is not unique for the user.
         """
-        conn = self._db_provider.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("INSERT INTO Decks (user_id, name) VALUES (?, ?)", (deck.user_id, deck.name))
+        # sqlite3.IntegrityError propagates to the application layer for user feedback/logging
+        with self._db_provider.transaction():
+            cursor = self._db_provider.get_connection().execute(
+                "INSERT INTO Decks (user_id, name) VALUES (?, ?)", (deck.user_id, deck.name)
+            )
             deck.id = cursor.lastrowid
             deck.created_at, deck.updated_at = self._fetch_timestamps(deck.id)
-            conn.commit()
-            return deck
-        except sqlite3.IntegrityError:
-            conn.rollback()
-            # Propagate to application layer for user feedback/logging
-            raise
+        return deck
 
     def get_by_id(self, deck_id: int, user_id: int) -> Optional[Deck]:
         """
@@ -80,26 +84,48 @@ class DeckRepositoryImpl(IDeckRepository):
         ).fetchall()
         return [DeckMapper.from_row(r) for r in rows]
 
+    def list_all_with_stats(self, user_id: int, due_before: datetime) -> List[Tuple[Deck, DeckStats]]:
+        """
+        Returns all decks for the given user with their statistics, ordered by name.
+        Counts come from DeckStats, which triggers keep up to date; the due cards of each deck are
+        counted from the (deck_id, due) index, as due-ness changes with time rather than with writes.
+        That count stops at DUE_TODAY_CAP + 1, so its cost does not grow with a deck's backlog.
+        """
+        conn = self._db_provider.get_connection()
+        rows = conn.execute(
+            """
+            SELECT d.id, d.user_id, d.name, d.created_at, d.updated_at,
+                   COALESCE(s.total, 0), COALESCE(s.new_count, 0), COALESCE(s.learning_count, 0),
+                   COALESCE(s.review_count, 0),
+                   (SELECT COUNT(*) FROM (SELECT 1 FROM Flashcards f WHERE f.deck_id = d.id AND f.due <= ? LIMIT ?)),
+                   s.last_studied_at
+            FROM Decks d
+            LEFT JOIN DeckStats s ON s.deck_id = d.id
+            WHERE d.user_id = ?
+            ORDER BY d.name
+            """,
+            (FlashcardMapper.to_db_timestamp(due_before), DUE_TODAY_CAP + 1, user_id),
+        ).fetchall()
+        return [(DeckMapper.from_row(row[:5]), DeckMapper.stats_from_row(row[5:])) for row in rows]
+
     def update(self, deck: Deck) -> None:
         """
         Updates an existing deck's name for the given user.
         Raises sqlite3.IntegrityError if the new name is not unique for the user.
         """
-        conn = self._db_provider.get_connection()
-        try:
-            conn.execute("UPDATE Decks SET name = ? WHERE id = ? AND user_id = ?", (deck.name, deck.id, deck.user_id))
-            conn.commit()
-        except sqlite3.IntegrityError:
-            conn.rollback()
-            raise
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().execute(
+                "UPDATE Decks SET name = ? WHERE id = ? AND user_id = ?", (deck.name, deck.id, deck.user_id)
+            )
 
     def delete(self, deck_id: int, user_id: int) -> None:
         """
         Deletes a deck by ID for the given user.
         """
-        conn = self._db_provider.get_connection()
-        conn.execute("DELETE FROM Decks WHERE id = ? AND user_id = ?", (deck_id, user_id))
-        conn.commit()
+        with self._db_provider.transaction():
+            self._db_provider.get_connection().execute(
+                "DELETE FROM Decks WHERE id = ? AND user_id = ?", (deck_id, user_id)
+            )
 
     def _fetch_timestamps(self, deck_id: Optional[int]):
         # Helper to fetch created_at and updated_at after insert
@@ -1,8 +1,11 @@
-from typing import Callable, List, Any
+from typing import Callable, List, Any, Optional
+import tkinter as tk
+from tkinter import filedialog
 
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import RIGHT
+from ttkbootstrap.constants import LEFT, RIGHT
 
+from DeckManagement.application.deck_archive_service import DeckArchiveService
 from DeckManagement.application.deck_service import DeckService
 from DeckManagement.application.presenters.deck_list_presenter import DeckListPresenter, DeckViewModel, IDeckListView
 from Shared.application.session_service import SessionService
@@ -23,6 +26,7 @@ class DeckListView(ttk.Frame, IDeckListView):
         session_service: SessionService,
         navigation_controller: NavigationControllerProtocol,
         show_toast: Callable[[str, str], None],
+        archive_service: Optional[DeckArchiveService] = None,
     ):
         """Initialize the deck list view.
 
@@ -32,6 +36,7 @@ class DeckListView(ttk.Frame, IDeckListView):
             session_service: Service for session management
             navigation_controller: Controller for navigation
             show_toast: Callback for showing toast notifications
+            archive_service: Service for exporting and restoring decks; the backup buttons are hidden without it
         """
         super().__init__(parent)
         self._show_toast_callback = show_toast
@@ -43,6 +48,7 @@ class DeckListView(ttk.Frame, IDeckListView):
             deck_service=deck_service,
             session_service=session_service,
             navigation_controller=navigation_controller,
+            archive_service=archive_service,
         )
 
         # Initialize UI
@@ -70,6 +76,21 @@ class DeckListView(ttk.Frame, IDeckListView):
         )
         self.create_deck_btn.pack(side=RIGHT, padx=5)
 
+        # Backup buttons
+        self.export_btn: Optional[ttk.Button] = None
+        self.restore_btn: Optional[ttk.Button] = None
+        if self.presenter.archive_service is not None:
+            self.export_btn = ttk.Button(
+                self.button_bar, text="Eksportuj talie", style="secondary.TButton", command=self._choose_export_file
+            )
+            self.export_btn.pack(side=LEFT, padx=5)
+            self.restore_btn = ttk.Button(
+                self.button_bar, text="Przywróć z kopii", style="secondary.TButton", command=self._choose_restore_file
+            )
+            self.restore_btn.pack(side=LEFT, padx=5)
+        self.archive_status_label = ttk.Label(self.button_bar, text="")
+        self.archive_status_label.pack(side=LEFT, padx=5)
+
         # Deck Table
         self.deck_table = DeckTable(
             self, on_select=self.presenter.handle_deck_selected, on_delete=self._show_delete_confirmation
@@ -111,6 +132,37 @@ class DeckListView(ttk.Frame, IDeckListView):
             self._handle_dialog_cancelled,
         )
 
+    def _choose_export_file(self) -> None:
+        """Ask where to export the decks to"""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Eksportuj talie",
+            defaultextension=".jsonl.gz",
+            initialfile="talie.jsonl.gz",
+            filetypes=[
+                ("Kopia skompresowana", "*.jsonl.gz"),
+                ("JSON Lines", "*.jsonl"),
+                ("CSV", "*.csv"),
+            ],
+        )
+        if path:
+            self.presenter.export_decks(path)
+
+    def _choose_restore_file(self) -> None:
+        """Ask for an exported file to restore decks from"""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Przywróć talie z kopii",
+            filetypes=[
+                ("Kopia talii", "*.jsonl.gz *.jsonl *.csv"),
+                ("Kopia skompresowana", "*.jsonl.gz"),
+                ("JSON Lines", "*.jsonl"),
+                ("CSV", "*.csv"),
+            ],
+        )
+        if path:
+            self.presenter.restore_decks(path)
+
     def _handle_deck_creation(self, deck_name: str) -> None:
         """Handle deck creation from dialog"""
         self.dialog_open = False
@@ -147,3 +199,19 @@ class DeckListView(ttk.Frame, IDeckListView):
     def show_toast(self, title: str, message: str) -> None:
         """Show toast notification"""
         self._show_toast_callback(title, message)
+
+    def show_archive_busy(self, busy: bool) -> None:
+        """Show whether an export or restore is running"""
+        self.archive_status_label.configure(text="Trwa kopiowanie talii..." if busy else "")
+        state = ttk.DISABLED if busy else ttk.NORMAL
+        for button in (self.export_btn, self.restore_btn):
+            if button is not None:
+                button.configure(state=state)
+
+    def schedule(self, delay_ms: int, callback: Callable[[], None]) -> None:
+        """Run a callback on the UI thread after delay_ms; safe to call from worker threads"""
+        try:
+            self.after(delay_ms, callback)
+        except (RuntimeError, tk.TclError):
+            # The view was destroyed before the callback could be scheduled
+            pass
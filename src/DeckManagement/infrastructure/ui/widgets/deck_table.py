@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Callable, Optional, Protocol, Sequence, Any
 
+from DeckManagement.domain.models.DeckStats import DUE_TODAY_CAP
 from Shared.ui.widgets.generic_table_widget import GenericTableWidget
 
 
@@ -10,6 +11,10 @@ class DeckTableItem(Protocol):
     id: int
     name: str
     created_at: datetime
+    total: int
+    new: int
+    due_today: int
+    last_studied_at: Optional[datetime]
 
 
 class DeckTable(GenericTableWidget):
@@ -25,11 +30,32 @@ class DeckTable(GenericTableWidget):
             on_delete: Callback for when delete is requested on a deck
         """
         # Configure columns
-        columns = [("name", "Nazwa"), ("created_at", "Utworzono")]
+        columns = [
+            ("name", "Nazwa"),
+            ("total", "Fiszki"),
+            ("new", "Nowe"),
+            ("due_today", "Na dziś"),
+            ("last_studied_at", "Ostatnia nauka"),
+            ("created_at", "Utworzono"),
+        ]
 
-        column_widths = {"name": 300, "created_at": 150}
+        column_widths = {
+            "name": 300,
+            "total": 80,
+            "new": 80,
+            "due_today": 80,
+            "last_studied_at": 150,
+            "created_at": 150,
+        }
 
-        column_stretches = {"name": True, "created_at": False}
+        column_stretches = {
+            "name": True,
+            "total": False,
+            "new": False,
+            "due_today": False,
+            "last_studied_at": False,
+            "created_at": False,
+        }
 
         super().__init__(
             parent,
@@ -52,7 +78,13 @@ class DeckTable(GenericTableWidget):
 
         # Add new items
         for item in items:
-            self.add_item(str(item.id), [item.name, item.created_at.strftime("%d-%m-%Y")])
+            last_studied = item.last_studied_at.astimezone().strftime("%d-%m-%Y") if item.last_studied_at else "—"
+            # The repository stops counting past the cap
+            due_today = f"{DUE_TODAY_CAP}+" if item.due_today > DUE_TODAY_CAP else item.due_today
+            self.add_item(
+                str(item.id),
+                [item.name, item.total, item.new, due_today, last_studied, item.created_at.strftime("%d-%m-%Y")],
+            )
 
     def get_selected_id(self) -> Optional[int]:
         """Get the ID of the currently selected item, if any"""
@@ -1,4 +1,4 @@
-from typing import Optional, Protocol
+from typing import Dict, Optional, Protocol
 import logging
 
 from UserProfile.domain.models.user import User
@@ -14,6 +14,9 @@ class ProfileServiceProtocol(Protocol):
 class SessionService:
     """Service responsible for user session management and authentication."""
 
+    # Secret holding the decrypted OpenRouter API key of the current user
+    API_KEY_SECRET = "openrouter_api_key"
+
     def __init__(self, profile_service: ProfileServiceProtocol):
         """Initialize the session service.
 
@@ -22,6 +25,8 @@ class SessionService:
         """
         self._profile_service = profile_service
         self._current_user: Optional[User] = None
+        # Values derived from the current user's data (e.g. the decrypted API key), kept in memory only
+        self._secrets: Dict[str, str] = {}
         logging.info("Session service initialized")
 
     def login(self, username: str, password: Optional[str] = None) -> None:
@@ -43,6 +48,7 @@ class SessionService:
                     logging.error(f"Failed login attempt for user: {username} - incorrect password")
                     raise AuthenticationError("Niepoprawne hasło")
 
+            self._secrets.clear()
             self._current_user = user
             logging.info(f"User logged in: {username}")
         except Exception as e:
@@ -53,6 +59,7 @@ class SessionService:
 
     def logout(self) -> None:
         """Log out the current user."""
+        self._secrets.clear()
         if self._current_user:
             logging.info(f"User logged out: {self._current_user.username}")
             self._current_user = None
@@ -77,7 +84,9 @@ class SessionService:
         """Refresh the current user's data from the repository.
 
         This is useful when user data has been updated outside the session.
+        Session secrets are cleared, as they may have been derived from the old data.
         """
+        self._secrets.clear()
         if not self._current_user or not self._current_user.id:
             return
 
@@ -89,3 +98,30 @@ class SessionService:
         except Exception as e:
             logging.error(f"Failed to refresh user data: {str(e)}")
             # Keep current user data if refresh fails
+
+    def get_secret(self, name: str) -> Optional[str]:
+        """Get a secret cached for the current session.
+
+        Args:
+            name: Name of the secret
+
+        Returns:
+            The cached value, or None if it is not cached or no user is logged in
+        """
+        if self._current_user is None:
+            return None
+        return self._secrets.get(name)
+
+    def set_secret(self, name: str, value: str) -> None:
+        """Cache a secret for the current session.
+
+        The value is held in memory only and is dropped on login, logout and refresh_current_user.
+        Does nothing if no user is logged in.
+
+        Args:
+            name: Name of the secret
+            value: The secret value
+        """
+        if self._current_user is None:
+            return
+        self._secrets[name] = value
@@ -0,0 +1,15 @@
+"""Unit of work interface shared by application services."""
+
+from typing import ContextManager, Protocol
+
+
+class UnitOfWork(Protocol):
+    """Protocol for grouping repository writes into a single atomic transaction."""
+
+    def transaction(self) -> ContextManager[None]:
+        """Open a transaction for the calling thread.
+
+        Repository writes made inside the block are committed together when it exits
+        and rolled back together if it raises. Nested calls join the outer transaction.
+        """
+        ...
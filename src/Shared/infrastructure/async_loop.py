@@ -0,0 +1,92 @@
+"""A long-lived asyncio event loop running on a background thread."""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread:
+    """Runs one asyncio event loop on a daemon thread for the lifetime of the application.
+
+    Coroutines are submitted from any thread (typically the Tk main thread) and run concurrently
+    on the loop. Each submission returns a concurrent.futures.Future; cancelling it cancels the
+    coroutine, so an awaited HTTP request is aborted rather than left running in the background.
+    """
+
+    def __init__(self, name: str = "AsyncLoop") -> None:
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the loop thread; does nothing if it is already running."""
+        with self._lock:
+            if self.is_running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(loop, ready), name=self._name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+        logger.debug(f"Event loop thread {self._name} started")
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            concurrent.futures.Future: Completes with the coroutine's result; cancel() cancels the coroutine.
+
+        Raises:
+            RuntimeError: If the loop thread is not running.
+        """
+        loop = self._loop
+        if loop is None or not self.is_running:
+            coro.close()
+            raise RuntimeError("Event loop thread is not running")
+        future: "concurrent.futures.Future[T]" = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel the pending coroutines, stop the loop and wait for the thread to finish."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Event loop thread {self._name} did not stop within {timeout}s")
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Give the remaining coroutines a chance to clean up (close streams and connections)
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
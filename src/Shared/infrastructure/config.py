@@ -5,7 +5,7 @@ import secrets
 import logging
 import shutil
 from pathlib import Path
-from typing import Final, List, Tuple
+from typing import Dict, Final, List, Tuple, Union
 
 from dotenv import load_dotenv
 
@@ -21,6 +21,30 @@ MIGRATIONS_DIR: Final[Path] = Path(__file__).parent / "persistence" / "sqlite" /
 # Database
 DATABASE_PATH: Final[Path] = DATA_DIR / "10xcards.db"
 
+# SQLite PRAGMAs applied to every connection, grouped into named durability profiles.
+# Both use WAL; "durable" fsyncs on every commit, "fast" only at checkpoints
+# (a power loss may drop the last few commits, but never corrupts the database).
+SQLITE_PRAGMA_PROFILES: Final[Dict[str, Dict[str, Union[str, int]]]] = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,  # KiB (negative value), i.e. ~8 MB
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32000,  # KiB (negative value), i.e. ~32 MB
+        "mmap_size": 268435456,  # 256 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms
+    },
+}
+SQLITE_DURABILITY_PROFILE: Final[str] = os.getenv("SQLITE_DURABILITY_PROFILE", "fast")
+SQLITE_CACHED_STATEMENTS: Final[int] = 256  # Prepared statements kept per connection (sqlite3 default: 128)
+
 
 # Security
 def get_secret_key() -> str:
@@ -112,6 +136,17 @@ AVAILABLE_LLM_MODELS: Final[List[str]] = [
     "openrouter/google/gemini-2.5-flash-preview",
 ]
 
+# AI flashcard generation
+AI_MAX_SOURCE_TEXT_LENGTH: Final[int] = 200_000  # Longest text accepted for generation
+AI_CHUNK_SIZE: Final[int] = 8000  # Longer texts are split into chunks of at most this many characters
+AI_CHUNK_OVERLAP: Final[int] = 400  # Characters repeated from the end of the previous chunk
+AI_GENERATION_CONCURRENCY: Final[int] = int(os.getenv("AI_GENERATION_CONCURRENCY", "4"))  # Parallel chunk requests
+
+# Cache of generated flashcards, keyed by model, temperature, prompt and normalized source text
+AI_CACHE_PATH: Final[Path] = DATA_DIR / "ai_cache.db"
+AI_CACHE_TTL_DAYS: Final[int] = int(os.getenv("AI_CACHE_TTL_DAYS", "30"))
+AI_CACHE_MAX_BYTES: Final[int] = 20 * 1024 * 1024  # Least recently used entries are evicted above this size
+
 # Available UI themes
 AVAILABLE_APP_THEMES: Final[List[str]] = [
     "darkly",  # Default dark theme
@@ -151,6 +186,18 @@ FSRS_DEFAULT_RELEARNING_STEPS_MINUTES: Final[List[int]] = [10]
 FSRS_MAXIMUM_INTERVAL: Final[int] = 36500  # Default from py-fsrs
 FSRS_ENABLE_FUZZING: Final[bool] = True  # Default from py-fsrs
 
+# Study session
+STUDY_QUEUE_PAGE_SIZE: Final[int] = 50  # Due cards fetched per page while studying
+REVIEW_WRITE_BATCH_SIZE: Final[int] = 20  # Reviews committed together by the background writer
+REVIEW_WRITE_FLUSH_INTERVAL_MS: Final[int] = 500  # Max time a review waits before being committed
+REVIEW_WRITE_QUEUE_SIZE: Final[int] = 1000  # Pending reviews before rating blocks on the writer
+# Flashcard import (CSV/TSV/Anki text)
+IMPORT_BATCH_SIZE: Final[int] = int(os.getenv("IMPORT_BATCH_SIZE", "5000"))  # Flashcards committed per transaction
+
+# Startup timing (see scripts/benchmark_startup.py)
+STARTUP_TIMING_PATH: Final[Path] = Path(os.getenv("STARTUP_TIMING_PATH") or DATA_DIR / "startup_timing.json")
+STARTUP_EXIT_AFTER_IDLE: Final[bool] = os.getenv("STARTUP_EXIT_AFTER_IDLE", "0") == "1"  # Quit once started
+
 
 # Function to get all config as a dictionary
 def get_config() -> dict:
@@ -163,9 +210,19 @@ def get_config() -> dict:
         "APP_ROOT": str(APP_ROOT),
         "DATA_DIR": str(DATA_DIR),
         "DATABASE_PATH": str(DATABASE_PATH),
+        "SQLITE_PRAGMA_PROFILES": SQLITE_PRAGMA_PROFILES,
+        "SQLITE_DURABILITY_PROFILE": SQLITE_DURABILITY_PROFILE,
+        "SQLITE_CACHED_STATEMENTS": SQLITE_CACHED_STATEMENTS,
         "OPENROUTER_API_BASE": OPENROUTER_API_BASE,
         "DEFAULT_AI_MODEL": DEFAULT_AI_MODEL,
         "AVAILABLE_LLM_MODELS": AVAILABLE_LLM_MODELS,
+        "AI_MAX_SOURCE_TEXT_LENGTH": AI_MAX_SOURCE_TEXT_LENGTH,
+        "AI_CHUNK_SIZE": AI_CHUNK_SIZE,
+        "AI_CHUNK_OVERLAP": AI_CHUNK_OVERLAP,
+        "AI_GENERATION_CONCURRENCY": AI_GENERATION_CONCURRENCY,
+        "AI_CACHE_PATH": str(AI_CACHE_PATH),
+        "AI_CACHE_TTL_DAYS": AI_CACHE_TTL_DAYS,
+        "AI_CACHE_MAX_BYTES": AI_CACHE_MAX_BYTES,
         "AVAILABLE_APP_THEMES": AVAILABLE_APP_THEMES,
         "FSRS_DEFAULT_PARAMETERS": FSRS_DEFAULT_PARAMETERS,
         "FSRS_DEFAULT_DESIRED_RETENTION": FSRS_DEFAULT_DESIRED_RETENTION,
@@ -173,4 +230,11 @@ def get_config() -> dict:
         "FSRS_DEFAULT_RELEARNING_STEPS_MINUTES": FSRS_DEFAULT_RELEARNING_STEPS_MINUTES,
         "FSRS_MAXIMUM_INTERVAL": FSRS_MAXIMUM_INTERVAL,
         "FSRS_ENABLE_FUZZING": FSRS_ENABLE_FUZZING,
+        "STUDY_QUEUE_PAGE_SIZE": STUDY_QUEUE_PAGE_SIZE,
+        "REVIEW_WRITE_BATCH_SIZE": REVIEW_WRITE_BATCH_SIZE,
+        "REVIEW_WRITE_FLUSH_INTERVAL_MS": REVIEW_WRITE_FLUSH_INTERVAL_MS,
+        "REVIEW_WRITE_QUEUE_SIZE": REVIEW_WRITE_QUEUE_SIZE,
+        "IMPORT_BATCH_SIZE": IMPORT_BATCH_SIZE,
+        "STARTUP_TIMING_PATH": str(STARTUP_TIMING_PATH),
+        "STARTUP_EXIT_AFTER_IDLE": STARTUP_EXIT_AFTER_IDLE,
     }
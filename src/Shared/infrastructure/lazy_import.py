@@ -0,0 +1,91 @@
+"""Deferred imports of slow third-party modules."""
+
+import importlib
+import logging
+import threading
+from types import ModuleType
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Lets a module keep the usual 'module.attribute' style (and tests keep patching
+    'package.module.lazy_name.attribute') while the import itself is deferred until
+    the attribute is actually needed. The import is done at most once, even when the
+    first accesses race on several threads.
+    """
+
+    def __init__(self, name: str, on_import: Optional[Callable[[ModuleType], None]] = None) -> None:
+        """Create the stand-in; nothing is imported yet.
+
+        Args:
+            name: Fully qualified name of the module.
+            on_import: Called once with the module right after it is imported, e.g. to configure it.
+        """
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_on_import", on_import)
+        object.__setattr__(self, "_module", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the module has been imported."""
+        return object.__getattribute__(self, "_module") is not None
+
+    def load(self) -> ModuleType:
+        """Import the module now (if not done yet) and return it."""
+        module: Optional[ModuleType] = object.__getattribute__(self, "_module")
+        if module is not None:
+            return module
+        with object.__getattribute__(self, "_lock"):
+            module = object.__getattribute__(self, "_module")
+            if module is None:
+                name = object.__getattribute__(self, "_name")
+                logger.debug(f"Importing {name}")
+                module = importlib.import_module(name)
+                on_import = object.__getattribute__(self, "_on_import")
+                if on_import is not None:
+                    on_import(module)
+                object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.load(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self.load(), attribute, value)
+
+    def __delattr__(self, attribute: str) -> None:
+        delattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {object.__getattribute__(self, '_name')!r} ({state})>"
+
+
+def warm_up_in_background(modules: Iterable[LazyModule], name: str = "ImportWarmUp") -> threading.Thread:
+    """Import the given lazy modules on a daemon thread.
+
+    Meant to be started once the first window is on screen, so that the first use of
+    a slow subsystem does not pay for its imports. Failures are logged; the next access
+    to the module retries the import and raises to its caller.
+
+    Returns:
+        The started thread.
+    """
+    pending: List[LazyModule] = [module for module in modules if not module.is_loaded]
+
+    def run() -> None:
+        for module in pending:
+            try:
+                module.load()
+            except Exception as e:
+                logger.warning(f"Background import of {module!r} failed: {e}")
+        logger.debug(f"Background import warm-up finished ({len(pending)} modules)")
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
@@ -1,8 +1,12 @@
 import sqlite3
 import logging
 import atexit
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple, Union, cast
+
+from Shared.infrastructure.config import SQLITE_CACHED_STATEMENTS, SQLITE_DURABILITY_PROFILE, SQLITE_PRAGMA_PROFILES
 
 logger = logging.getLogger(__name__)
 
@@ -10,77 +14,199 @@ logger = logging.getLogger(__name__)
 class SqliteConnectionProvider:
     """
     Singleton provider for SQLite database connections.
-    Ensures single connection instance and proper cleanup on application exit.
+    Each thread gets its own connection, opened on first use, so reads from background threads run
+    concurrently under WAL. Outside transaction() the connections are query-only: every write goes through
+    transaction(), which serializes the writers of all threads with a process-wide lock.
+    All connections are tuned with the PRAGMAs of a named durability profile (see SQLITE_PRAGMA_PROFILES in config)
+    and closed on application exit.
     """
 
     _instance: Optional["SqliteConnectionProvider"] = None
-    _connection: Optional[sqlite3.Connection] = None
+    _db_path: str = ""
+    _profile: str = SQLITE_DURABILITY_PROFILE
+    _closed: bool = True
 
-    def __new__(cls, db_path: str) -> "SqliteConnectionProvider":
+    def __new__(cls, db_path: str, profile: Optional[str] = None) -> "SqliteConnectionProvider":
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._init_connection(db_path)
+            instance = super().__new__(cls)
+            instance._init_connection(db_path, profile or SQLITE_DURABILITY_PROFILE)
+            cls._instance = instance
         return cls._instance
 
-    def _init_connection(self, db_path: str) -> None:
+    @property
+    def profile(self) -> str:
+        """Name of the durability profile applied to the connections."""
+        return self._profile
+
+    def _init_connection(self, db_path: str, profile: str) -> None:
         """
-        Initialize the SQLite connection with proper settings.
+        Initialize the provider and open the connection of the calling thread.
 
         Args:
             db_path: Path to the SQLite database file
+            profile: Name of the durability profile from SQLITE_PRAGMA_PROFILES
+
+        Raises:
+            ValueError: If the profile is unknown
         """
+        if profile not in SQLITE_PRAGMA_PROFILES:
+            raise ValueError(
+                f"Unknown SQLite durability profile '{profile}', expected one of: {', '.join(SQLITE_PRAGMA_PROFILES)}"
+            )
+        self._db_path = db_path
+        self._profile = profile
+        self._local = threading.local()
+        # Thread ident -> (thread, connection); used to close connections of finished threads and on exit
+        self._connections: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
         try:
             # Ensure the directory exists
             db_file = Path(db_path)
             db_file.parent.mkdir(parents=True, exist_ok=True)
 
             logger.info(f"Initializing SQLite connection to {db_path}")
-            self._connection = sqlite3.connect(
-                db_path,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-                check_same_thread=False,  # SQLite is thread-safe for reads
-            )
-
-            # Enable foreign key support
-            self._connection.execute("PRAGMA foreign_keys = ON")
-
-            # Use Row factory for better column access
-            self._connection.row_factory = sqlite3.Row
+            self._closed = False
+            self._open_thread_connection()
 
             # Register cleanup on application exit
             atexit.register(self._cleanup)
 
-            logger.info("SQLite connection initialized successfully")
+            logger.info(f"SQLite connection initialized successfully (profile: {profile})")
 
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize SQLite connection: {e}", exc_info=True)
             raise RuntimeError(f"Database connection failed: {e}")
 
+    def _open_thread_connection(self) -> sqlite3.Connection:
+        """Open the connection of the calling thread, closing connections left by finished threads."""
+        connection = sqlite3.connect(
+            self._db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            # Closed from the main thread on exit or when the owning thread has finished
+            check_same_thread=False,
+            # Repositories use fixed SQL text, so prepared statements are reused from this cache
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+
+        # Connection-level setup happens only here; repositories must not repeat it per query
+        # Enable foreign key support
+        connection.execute("PRAGMA foreign_keys = ON")
+
+        # Journal mode, fsync policy and caches
+        self._apply_pragmas(connection, SQLITE_PRAGMA_PROFILES[self._profile])
+
+        # Use Row factory for better column access
+        connection.row_factory = sqlite3.Row
+
+        # Writes are only allowed inside transaction(), which holds the writer lock
+        connection.execute("PRAGMA query_only = ON")
+
+        current = threading.current_thread()
+        with self._connections_lock:
+            finished = [ident for ident, (thread, _) in self._connections.items() if not thread.is_alive()]
+            for ident in finished:
+                self._close_quietly(self._connections.pop(ident)[1])
+            self._connections[current.ident or 0] = (current, connection)
+        self._local.connection = connection
+        logger.debug(f"Opened SQLite connection for thread {current.name}")
+        return connection
+
+    @staticmethod
+    def _apply_pragmas(connection: sqlite3.Connection, pragmas: Dict[str, Union[str, int]]) -> None:
+        """
+        Apply PRAGMA settings to a connection.
+
+        Args:
+            connection: Connection to configure
+            pragmas: Mapping of PRAGMA name to value
+        """
+        for name, value in pragmas.items():
+            result = connection.execute(f"PRAGMA {name} = {value}").fetchone()
+            # journal_mode reports the mode actually in effect (e.g. 'memory' for in-memory databases)
+            if name == "journal_mode" and result is not None and str(result[0]).upper() != str(value).upper():
+                logger.warning(f"SQLite journal_mode {value} not available, using {result[0]}")
+
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get the SQLite connection instance.
+        Get the SQLite connection of the calling thread.
 
         Returns:
             SQLite connection object
 
         Raises:
-            RuntimeError: If connection is not initialized or was closed
+            RuntimeError: If the provider is not initialized or was closed
         """
-        if self._connection is None:
+        if self._closed:
             logger.error("Attempting to get connection but none is initialized")
             raise RuntimeError("Database connection is not initialized")
-        return self._connection
-
-    def _cleanup(self) -> None:
-        """Clean up database connection on application exit."""
-        if self._connection is not None:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
             try:
-                logger.info("Closing SQLite connection")
-                self._connection.close()
-                self._connection = None
+                connection = self._open_thread_connection()
             except sqlite3.Error as e:
-                logger.error(f"Error closing SQLite connection: {e}", exc_info=True)
+                logger.error(f"Failed to open SQLite connection: {e}", exc_info=True)
+                raise RuntimeError(f"Database connection failed: {e}")
+        return cast(sqlite3.Connection, connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run the enclosed repository calls in a single transaction.
+
+        Repositories make their writes inside transaction() and do not commit on their own, so a
+        repository call made while a transaction is open on the thread joins it: all writes are
+        committed once when the outermost block exits, or rolled back if it raises.
+        This is the only way to write: transactions of different threads run one at a time, and outside
+        of one the connection refuses writes.
+
+        Raises:
+            RuntimeError: If the provider is not initialized or was closed
+        """
+        if getattr(self._local, "in_transaction", False):
+            yield
+            return
+
+        conn = self.get_connection()
+        with self._write_lock:
+            if conn.in_transaction:
+                # A read transaction left open (e.g. by a refused write) cannot be upgraded by BEGIN
+                conn.rollback()
+            conn.execute("PRAGMA query_only = OFF")
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                self._local.in_transaction = True
+                try:
+                    yield
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                finally:
+                    self._local.in_transaction = False
+            finally:
+                conn.execute("PRAGMA query_only = ON")
+
+    @staticmethod
+    def _close_quietly(connection: sqlite3.Connection) -> None:
+        """Close a connection, logging instead of raising on failure."""
+        try:
+            connection.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error closing SQLite connection: {e}", exc_info=True)
+
+    def _cleanup(self) -> None:
+        """Close all connections on application exit."""
+        if self._closed:
+            return
+        self._closed = True
+        logger.info("Closing SQLite connections")
+        with self._connections_lock:
+            for _, connection in self._connections.values():
+                self._close_quietly(connection)
+            self._connections.clear()
 
     def __del__(self) -> None:
-        """Ensure connection is closed on object destruction."""
+        """Ensure connections are closed on object destruction."""
         self._cleanup()
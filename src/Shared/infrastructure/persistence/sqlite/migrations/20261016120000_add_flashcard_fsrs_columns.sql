@@ -0,0 +1,41 @@
+-- Migration: Promote FSRS scheduling fields to Flashcards columns
+-- Version: 3
+-- Description: Adds indexed due/state/stability/difficulty/last_review columns derived from fsrs_state JSON
+-- Date: 2026-10-16
+
+-- Timestamps are stored as UTC 'YYYY-MM-DDTHH:MM:SS.SSS' strings so they compare lexicographically.
+-- Cards that were never scheduled (or have corrupt fsrs_state) use created_at as their due date,
+-- which makes them due immediately, exactly like a fresh FSRS card.
+ALTER TABLE Flashcards ADD COLUMN due TEXT;
+ALTER TABLE Flashcards ADD COLUMN state INTEGER;
+ALTER TABLE Flashcards ADD COLUMN stability REAL;
+ALTER TABLE Flashcards ADD COLUMN difficulty REAL;
+ALTER TABLE Flashcards ADD COLUMN last_review TEXT;
+
+-- Backfill from existing JSON state without touching updated_at
+DROP TRIGGER IF EXISTS update_flashcards_updated_at;
+
+UPDATE Flashcards
+SET due = strftime('%Y-%m-%dT%H:%M:%f', json_extract(fsrs_state, '$.due')),
+    state = json_extract(fsrs_state, '$.state'),
+    stability = json_extract(fsrs_state, '$.stability'),
+    difficulty = json_extract(fsrs_state, '$.difficulty'),
+    last_review = strftime('%Y-%m-%dT%H:%M:%f', json_extract(fsrs_state, '$.last_review'))
+WHERE fsrs_state IS NOT NULL AND json_valid(fsrs_state);
+
+UPDATE Flashcards
+SET due = strftime('%Y-%m-%dT%H:%M:%f', created_at)
+WHERE due IS NULL;
+
+CREATE TRIGGER update_flashcards_updated_at
+AFTER UPDATE ON Flashcards
+FOR EACH ROW
+BEGIN
+    UPDATE Flashcards SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
+END;
+
+-- Due-card selection per deck: WHERE deck_id = ? AND due <= ? ORDER BY due, id
+CREATE INDEX IF NOT EXISTS idx_flashcards_deck_due ON Flashcards (deck_id, due);
+
+-- Set schema version
+PRAGMA user_version = 3;
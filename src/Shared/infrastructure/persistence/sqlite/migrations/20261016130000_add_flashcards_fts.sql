@@ -0,0 +1,45 @@
+-- Migration: Full-text search over flashcards
+-- Version: 4
+-- Description: Adds FTS5 index on front_text/back_text kept in sync with Flashcards by triggers
+-- Date: 2026-10-16
+
+-- External-content table: the text lives only in Flashcards, FTS5 stores just the index.
+-- remove_diacritics lets "zolw" match "żółw"; prefix indexes keep "search as you type" queries fast.
+CREATE VIRTUAL TABLE FlashcardsFts USING fts5(
+    front_text,
+    back_text,
+    content = 'Flashcards',
+    content_rowid = 'id',
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+CREATE TRIGGER flashcards_fts_after_insert
+AFTER INSERT ON Flashcards
+BEGIN
+    INSERT INTO FlashcardsFts (rowid, front_text, back_text) VALUES (NEW.id, NEW.front_text, NEW.back_text);
+END;
+
+CREATE TRIGGER flashcards_fts_after_delete
+AFTER DELETE ON Flashcards
+BEGIN
+    INSERT INTO FlashcardsFts (FlashcardsFts, rowid, front_text, back_text)
+    VALUES ('delete', OLD.id, OLD.front_text, OLD.back_text);
+END;
+
+-- Only text changes touch the index (FSRS state and updated_at updates do not). UPDATE OF alone is not
+-- enough: the repository's update() writes every column, so the WHEN clause compares the texts as well.
+CREATE TRIGGER flashcards_fts_after_update
+AFTER UPDATE OF front_text, back_text ON Flashcards
+WHEN OLD.front_text IS NOT NEW.front_text OR OLD.back_text IS NOT NEW.back_text
+BEGIN
+    INSERT INTO FlashcardsFts (FlashcardsFts, rowid, front_text, back_text)
+    VALUES ('delete', OLD.id, OLD.front_text, OLD.back_text);
+    INSERT INTO FlashcardsFts (rowid, front_text, back_text) VALUES (NEW.id, NEW.front_text, NEW.back_text);
+END;
+
+-- Index existing flashcards
+INSERT INTO FlashcardsFts (FlashcardsFts) VALUES ('rebuild');
+
+-- Set schema version
+PRAGMA user_version = 4;
@@ -0,0 +1,18 @@
+-- Migration: Composite indexes for paged flashcard listing
+-- Version: 5
+-- Description: Adds one (deck_id, sort column) index per sort key of FlashcardRepositoryImpl.list_page
+-- Date: 2026-10-17
+
+-- Keyset pages: WHERE deck_id = ? AND <sort column> >= ? AND (...) ORDER BY <sort column>, id LIMIT ?
+-- SQLite appends the rowid (id) to every index, so each of these also orders ties by id and a page
+-- is one index range scan whatever its depth in the deck. Sorting by due uses idx_flashcards_deck_due.
+CREATE INDEX IF NOT EXISTS idx_flashcards_deck_front_text ON Flashcards (deck_id, front_text COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_flashcards_deck_source ON Flashcards (deck_id, source);
+CREATE INDEX IF NOT EXISTS idx_flashcards_deck_created_at ON Flashcards (deck_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_flashcards_deck_updated_at ON Flashcards (deck_id, updated_at);
+
+-- Every index above starts with deck_id, so the single-column index only slows down writes
+DROP INDEX IF EXISTS idx_flashcards_deck_id;
+
+-- Set schema version
+PRAGMA user_version = 5;
@@ -0,0 +1,88 @@
+-- Migration: Per-deck statistics
+-- Version: 6
+-- Description: Adds DeckStats with card counts by learning stage and the last review time, kept up to date by triggers
+-- Date: 2026-10-17
+
+-- One row per deck. A card is new until its first review (last_review IS NULL); reviewed cards are in
+-- review when their FSRS state is Review (2), otherwise learning (Learning 1 or Relearning 3).
+-- The number of due cards is not stored: it changes with the clock, not with writes, and is counted
+-- from idx_flashcards_deck_due when the decks are listed.
+CREATE TABLE DeckStats (
+    deck_id INTEGER PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    learning_count INTEGER NOT NULL DEFAULT 0,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    last_studied_at TEXT,  -- reviewed_at of the latest review log, ISO8601
+    FOREIGN KEY (deck_id) REFERENCES Decks(id) ON DELETE CASCADE
+);
+
+CREATE TRIGGER deck_stats_after_deck_insert
+AFTER INSERT ON Decks
+BEGIN
+    INSERT INTO DeckStats (deck_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER deck_stats_after_flashcard_insert
+AFTER INSERT ON Flashcards
+BEGIN
+    UPDATE DeckStats
+    SET total = total + 1,
+        new_count = new_count + (NEW.last_review IS NULL),
+        learning_count = learning_count + (NEW.last_review IS NOT NULL AND NEW.state IS NOT 2),
+        review_count = review_count + (NEW.last_review IS NOT NULL AND NEW.state IS 2)
+    WHERE deck_id = NEW.deck_id;
+END;
+
+CREATE TRIGGER deck_stats_after_flashcard_delete
+AFTER DELETE ON Flashcards
+BEGIN
+    UPDATE DeckStats
+    SET total = total - 1,
+        new_count = new_count - (OLD.last_review IS NULL),
+        learning_count = learning_count - (OLD.last_review IS NOT NULL AND OLD.state IS NOT 2),
+        review_count = review_count - (OLD.last_review IS NOT NULL AND OLD.state IS 2)
+    WHERE deck_id = OLD.deck_id;
+END;
+
+-- Moves the card out of its old stage (and deck) and into the new one
+CREATE TRIGGER deck_stats_after_flashcard_update
+AFTER UPDATE OF deck_id, state, last_review ON Flashcards
+BEGIN
+    UPDATE DeckStats
+    SET total = total - 1,
+        new_count = new_count - (OLD.last_review IS NULL),
+        learning_count = learning_count - (OLD.last_review IS NOT NULL AND OLD.state IS NOT 2),
+        review_count = review_count - (OLD.last_review IS NOT NULL AND OLD.state IS 2)
+    WHERE deck_id = OLD.deck_id;
+    UPDATE DeckStats
+    SET total = total + 1,
+        new_count = new_count + (NEW.last_review IS NULL),
+        learning_count = learning_count + (NEW.last_review IS NOT NULL AND NEW.state IS NOT 2),
+        review_count = review_count + (NEW.last_review IS NOT NULL AND NEW.state IS 2)
+    WHERE deck_id = NEW.deck_id;
+END;
+
+CREATE TRIGGER deck_stats_after_review_log_insert
+AFTER INSERT ON ReviewLogs
+BEGIN
+    UPDATE DeckStats
+    SET last_studied_at = MAX(COALESCE(last_studied_at, ''), NEW.reviewed_at)
+    WHERE deck_id = (SELECT deck_id FROM Flashcards WHERE id = NEW.flashcard_id);
+END;
+
+-- Backfill existing decks
+INSERT INTO DeckStats (deck_id, total, new_count, learning_count, review_count, last_studied_at)
+SELECT d.id,
+       COUNT(f.id),
+       COALESCE(SUM(f.id IS NOT NULL AND f.last_review IS NULL), 0),
+       COALESCE(SUM(f.last_review IS NOT NULL AND f.state IS NOT 2), 0),
+       COALESCE(SUM(f.last_review IS NOT NULL AND f.state IS 2), 0),
+       (SELECT MAX(r.reviewed_at) FROM ReviewLogs r JOIN Flashcards rf ON rf.id = r.flashcard_id
+        WHERE rf.deck_id = d.id)
+FROM Decks d
+LEFT JOIN Flashcards f ON f.deck_id = d.id
+GROUP BY d.id;
+
+-- Set schema version
+PRAGMA user_version = 6;
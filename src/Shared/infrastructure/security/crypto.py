@@ -2,7 +2,9 @@
 
 import base64
 import logging
+import threading
 import traceback
+from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
@@ -12,11 +14,61 @@ from Shared.infrastructure.config import get_secret_key
 
 
 class CryptoManager:
-    """Manages encryption/decryption of sensitive data using Fernet."""
+    """Manages encryption/decryption of sensitive data using Fernet.
+
+    Deriving the Fernet key is deliberately slow (PBKDF2 with 480,000 iterations), so it is
+    not done when the manager is created but on the first encrypt/decrypt, or earlier on a
+    background thread via warm_up_in_background(). The key is then kept for the lifetime of
+    the process.
+    """
 
     def __init__(self) -> None:
-        """Initialize the crypto manager with a Fernet instance."""
-        self._fernet = self._setup_fernet()
+        """Initialize the crypto manager; the Fernet key is derived on first use."""
+        self._fernet_instance: Optional[Fernet] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _fernet(self) -> Fernet:
+        """The Fernet instance, derived on first access."""
+        return self._get_fernet()
+
+    def _get_fernet(self) -> Fernet:
+        fernet = self._fernet_instance
+        if fernet is None:
+            with self._lock:
+                if self._fernet_instance is None:
+                    self._fernet_instance = self._setup_fernet()
+                fernet = self._fernet_instance
+        return fernet
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the key has already been derived."""
+        return self._fernet_instance is not None
+
+    def warm_up(self) -> None:
+        """Derive the key now, so that the first encrypt/decrypt does not have to."""
+        self._get_fernet()
+
+    def warm_up_in_background(self) -> Optional[threading.Thread]:
+        """Derive the key on a daemon thread.
+
+        Returns:
+            The started thread, or None if the key is already derived.
+        """
+        if self.is_ready:
+            return None
+        thread = threading.Thread(target=self._warm_up_safely, name="CryptoWarmUp", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up_safely(self) -> None:
+        try:
+            self.warm_up()
+            logging.debug("Encryption key derived in the background")
+        except Exception as e:
+            # The next encrypt/decrypt retries the derivation and reports the error to its caller
+            logging.warning(f"Background key derivation failed: {str(e)}")
 
     def _setup_fernet(self) -> Fernet:
         """Set up Fernet with a key derived from the application secret.
@@ -142,5 +194,5 @@ class CryptoManager:
             raise ValueError(detailed_error)
 
 
-# Singleton instance for app-wide use
+# Singleton instance for app-wide use; cheap to create, as the key is derived lazily
 crypto_manager = CryptoManager()
@@ -0,0 +1,96 @@
+"""Timing of the application's startup phases."""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Taken when this module is first imported; main.py imports it before anything else
+PROCESS_START: float = time.monotonic()
+
+
+class StartupTimer:
+    """Records named startup phases and events on a monotonic clock.
+
+    All times are milliseconds since 'origin', which should be taken as early in the
+    process as possible (PROCESS_START, before main.py's other imports). The result can be
+    written to a JSON file, which is what scripts/benchmark_startup.py reads.
+    """
+
+    def __init__(self, origin: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """Start the timer.
+
+        Args:
+            origin: Clock reading the times are measured from; defaults to now.
+            clock: Monotonic clock returning seconds.
+        """
+        self._clock = clock
+        self._origin = clock() if origin is None else origin
+        self._started_at = datetime.now(timezone.utc)
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._last_checkpoint = 0.0
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the origin."""
+        return (self._clock() - self._origin) * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase; it is recorded even if the block raises."""
+        start = self.elapsed_ms()
+        try:
+            yield
+        finally:
+            self._record(name, start, self.elapsed_ms())
+
+    def checkpoint(self, name: str) -> None:
+        """Record a phase that started when the previous phase ended (or at the origin) and ends now.
+
+        Lets consecutive steps of a long function be timed without wrapping each in phase().
+        """
+        self._record(name, self._last_checkpoint, self.elapsed_ms())
+
+    def mark(self, name: str) -> float:
+        """Record that an event happened now.
+
+        Returns:
+            Milliseconds since the origin.
+        """
+        elapsed = self.elapsed_ms()
+        self._marks[name] = round(elapsed, 3)
+        logger.debug(f"Startup event '{name}' at {elapsed:.1f} ms")
+        return elapsed
+
+    def _record(self, name: str, start: float, end: float) -> None:
+        self._phases.append({"name": name, "start_ms": round(start, 3), "duration_ms": round(end - start, 3)})
+        self._last_checkpoint = end
+        logger.debug(f"Startup phase '{name}' took {end - start:.1f} ms")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The recorded phases and events as a JSON-serializable dictionary."""
+        return {
+            "started_at": self._started_at.isoformat(),
+            "origin_monotonic": self._origin,
+            "phases": list(self._phases),
+            "marks": dict(self._marks),
+        }
+
+    def write_json(self, path: Union[str, Path]) -> None:
+        """Write the recorded timings to a JSON file; failures are logged, never raised."""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write startup timings to {path}: {e}")
+
+    def summary(self) -> str:
+        """One line listing the phases and events, for the application log."""
+        parts = [f"{phase['name']}={phase['duration_ms']:.0f}ms" for phase in self._phases]
+        parts += [f"{name}@{elapsed:.0f}ms" for name, elapsed in self._marks.items()]
+        return "Startup timings: " + ", ".join(parts)
@@ -1,7 +1,10 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 import tkinter as tk
 import ttkbootstrap as ttk
 
+# A row fetched from a data source: (item_id, values for each column)
+TableRow = Tuple[str, List[Any]]
+
 
 class GenericTableWidget(ttk.Frame):
     """A generic table widget based on ttk.Treeview.
@@ -13,8 +16,12 @@ class GenericTableWidget(ttk.Frame):
     - Double-click handling
     - Delete key handling
     - Basic sorting
+    - Virtual mode for very large tables (see set_data_source)
     """
 
+    # Rows fetched beyond the viewport on each side, so scrolling by a few rows does not hit the data source
+    VIRTUAL_BUFFER_ROWS = 50
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -46,6 +53,16 @@ class GenericTableWidget(ttk.Frame):
         self._on_double_click = on_double_click
         self._on_delete_key = on_delete_key
 
+        # Virtual mode state
+        self._count: Optional[Callable[[], int]] = None
+        self._fetch_range: Optional[Callable[[int, int], Sequence[TableRow]]] = None
+        self._total = 0
+        self._first = 0  # Index of the row shown at the top of the viewport
+        self._slot_ids: List[str] = []  # Item id shown in each materialized Treeview row
+        self._cache: List[TableRow] = []
+        self._cache_start = 0
+        self._selected_id: Optional[str] = None
+
         # Create treeview with scrollbar
         self.tree = ttk.Treeview(
             self,
@@ -55,8 +72,8 @@ class GenericTableWidget(ttk.Frame):
         )
 
         # Configure scrollbar
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
 
         # Configure columns
         for col_id, display_name in columns:
@@ -70,7 +87,7 @@ class GenericTableWidget(ttk.Frame):
 
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
 
         # Configure grid weights
         self.columnconfigure(0, weight=1)
@@ -84,10 +101,65 @@ class GenericTableWidget(ttk.Frame):
         if on_delete_key:
             self.tree.bind("<Delete>", self._handle_delete_key)
 
+        # Virtual mode scrolling; the handlers do nothing until a data source is set
+        self.tree.bind("<Configure>", self._handle_configure, add="+")
+        self.tree.bind("<MouseWheel>", self._handle_mouse_wheel, add="+")
+        self.tree.bind("<Button-4>", self._handle_mouse_wheel, add="+")
+        self.tree.bind("<Button-5>", self._handle_mouse_wheel, add="+")
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._handle_navigation_key, add="+")
+        if not on_select:
+            # Virtual mode tracks the selected item id itself
+            self.tree.bind("<<TreeviewSelect>>", self._handle_select)
+
+    @property
+    def is_virtual(self) -> bool:
+        """Whether rows come from a data source (virtual mode)."""
+        return self._fetch_range is not None
+
+    def set_data_source(self, count: Callable[[], int], fetch_range: Callable[[int, int], Sequence[TableRow]]) -> None:
+        """Switch the table to virtual mode.
+
+        Only the rows visible in the viewport exist as Treeview items; they are filled from
+        'fetch_range' as the table scrolls, so showing tens of thousands of rows costs the same
+        as showing one screen. Selection, double-click and Delete work on item ids as usual.
+        The scroll position is kept and the selection is cleared, as when refilling the table.
+
+        Args:
+            count: Returns the total number of rows
+            fetch_range: Returns the rows [start, stop) as (item_id, values) tuples
+        """
+        if not self.is_virtual:
+            self.tree.delete(*self.tree.get_children())
+            self.tree.configure(yscrollcommand="")
+            self.scrollbar.configure(command=self._handle_scrollbar)
+        self._count = count
+        self._fetch_range = fetch_range
+        self._selected_id = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read the row count and redraw the visible rows (virtual mode)."""
+        if self._count is None:
+            return
+        self._total = self._count()
+        self._cache = []
+        self._cache_start = 0
+        self._render()
+
     def clear(self) -> None:
-        """Remove all items from the table."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Remove all items from the table, leaving virtual mode."""
+        if self.is_virtual:
+            self._count = None
+            self._fetch_range = None
+            self._total = 0
+            self._first = 0
+            self._slot_ids = []
+            self._cache = []
+            self._selected_id = None
+            self.scrollbar.configure(command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.tree.delete(*self.tree.get_children())
 
     def add_item(self, item_id: str, values: List[Any]) -> None:
         """Add a new item to the table.
@@ -110,9 +182,16 @@ class GenericTableWidget(ttk.Frame):
     def delete_item(self, item_id: str) -> None:
         """Delete an item from the table.
 
+        In virtual mode the row is expected to be gone from the data source already; the table is refreshed.
+
         Args:
             item_id: Identifier of the item to delete
         """
+        if self.is_virtual:
+            if self._selected_id == item_id:
+                self._selected_id = None
+            self.refresh()
+            return
         self.tree.delete(item_id)
 
     def get_selected_id(self) -> Optional[str]:
@@ -121,15 +200,140 @@ class GenericTableWidget(ttk.Frame):
         Returns:
             The selected item ID or None if nothing is selected.
         """
+        if self.is_virtual:
+            return self._selected_id
         selection = self.tree.selection()
         return selection[0] if selection else None
 
     def clear_selection(self) -> None:
         """Clear the current selection."""
+        self._selected_id = None
         self.tree.selection_remove(self.tree.selection())
 
+    def _visible_rows(self) -> int:
+        """Number of rows that fit in the Treeview viewport."""
+        children = self.tree.get_children()
+        if children and self.tree.winfo_ismapped():
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                _, top, _, row_height = bbox
+                visible_rows: int = max(1, (self.tree.winfo_height() - int(top)) // int(row_height))
+                return visible_rows
+        return int(self.tree.cget("height"))
+
+    def _rows(self, start: int, stop: int) -> List[TableRow]:
+        """Rows [start, stop), fetched with a buffer around them when not cached."""
+        assert self._fetch_range is not None
+        if start < self._cache_start or stop > self._cache_start + len(self._cache):
+            self._cache_start = max(0, start - self.VIRTUAL_BUFFER_ROWS)
+            self._cache = list(self._fetch_range(self._cache_start, min(self._total, stop + self.VIRTUAL_BUFFER_ROWS)))
+        offset = start - self._cache_start
+        return self._cache[offset : offset + stop - start]
+
+    def _render(self) -> None:
+        """Fill the Treeview rows with the window of data starting at self._first."""
+        visible = self._visible_rows()
+        self._first = max(0, min(self._first, self._total - visible))
+        rows = self._rows(self._first, min(self._total, self._first + visible))
+
+        # Reuse the existing Treeview rows; only add or remove the difference
+        slots = list(self.tree.get_children())
+        for index in range(len(slots), len(rows)):
+            slots.append(self.tree.insert("", "end", f"row{index}"))
+        if len(slots) > len(rows):
+            self.tree.delete(*slots[len(rows) :])
+            del slots[len(rows) :]
+        for slot, (_, values) in zip(slots, rows):
+            self.tree.item(slot, values=values)
+        self._slot_ids = [item_id for item_id, _ in rows]
+
+        # Show the selection only while the selected item is in the viewport
+        if self._selected_id in self._slot_ids:
+            slot = slots[self._slot_ids.index(self._selected_id)]
+            self.tree.selection_set(slot)
+            self.tree.focus(slot)
+        elif self.tree.selection():
+            self.tree.selection_remove(self.tree.selection())
+        self.tree.yview_moveto(0)
+
+        if self._total > 0:
+            self.scrollbar.set(self._first / self._total, min(1.0, (self._first + len(rows)) / self._total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, first: int) -> None:
+        """Scroll so that row 'first' is at the top of the viewport."""
+        first = max(0, min(first, self._total - self._visible_rows()))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _slot_item_id(self, slot: str) -> Optional[str]:
+        """Item id shown in a materialized Treeview row."""
+        children = self.tree.get_children()
+        if slot in children:
+            index = children.index(slot)
+            if index < len(self._slot_ids):
+                item_id: str = self._slot_ids[index]
+                return item_id
+        return None
+
+    def _handle_scrollbar(self, *args: str) -> None:
+        """Handle scrollbar drags and clicks in virtual mode."""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * self._total))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            self._scroll_to(self._first + int(args[1]) * step)
+
+    def _handle_configure(self, event: tk.Event) -> None:
+        """Fill or trim rows when the Treeview is resized."""
+        if self.is_virtual:
+            self._render()
+
+    def _handle_mouse_wheel(self, event: tk.Event) -> Optional[str]:
+        """Scroll the virtual window with the mouse wheel."""
+        if not self.is_virtual:
+            return None
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_to(self._first - 3)
+        else:
+            self._scroll_to(self._first + 3)
+        return "break"
+
+    def _handle_navigation_key(self, event: tk.Event) -> Optional[str]:
+        """Move the selection with the keyboard past the edges of the virtual window."""
+        if not self.is_virtual or self._total == 0:
+            return None
+        visible = self._visible_rows()
+        if self._selected_id in self._slot_ids:
+            current = self._first + self._slot_ids.index(self._selected_id)
+        else:
+            current = self._first - 1 if event.keysym in ("Down", "Next") else self._first
+        moves = {"Up": current - 1, "Down": current + 1, "Prior": current - visible, "Next": current + visible}
+        target = {"Home": 0, "End": self._total - 1}.get(event.keysym, moves.get(event.keysym, current))
+        target = max(0, min(target, self._total - 1))
+
+        if target < self._first:
+            self._first = target
+        elif target >= self._first + visible:
+            self._first = target - visible + 1
+        self._first = max(0, min(self._first, self._total - visible))
+        self._selected_id = self._rows(target, target + 1)[0][0]
+        self._render()
+        if self._on_select:
+            self._on_select(self._selected_id)
+        return "break"
+
     def _handle_select(self, event: tk.Event) -> None:
         """Handle selection change event."""
+        if self.is_virtual:
+            selection = self.tree.selection()
+            item_id = self._slot_item_id(selection[0]) if selection else None
+            # Re-selecting the row while rendering is not a change
+            if item_id is None or item_id == self._selected_id:
+                return
+            self._selected_id = item_id
         if self._on_select:
             selected_id = self.get_selected_id()
             if selected_id:
@@ -139,6 +343,8 @@ class GenericTableWidget(ttk.Frame):
         """Handle double-click event."""
         if self._on_double_click:
             selected_id = self.get_selected_id()
+            if self.is_virtual:
+                selected_id = self._slot_item_id(self.tree.identify_row(event.y)) or selected_id
             if selected_id:
                 self._on_double_click(selected_id)
 
@@ -122,7 +122,12 @@ class StudyPresenter:
 
     def handle_end_session(self) -> None:
         """Handle ending the study session."""
-        self.study_service.end_session()
+        try:
+            self.study_service.end_session()
+        except Exception as e:
+            error_msg = f"Failed to save study session: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            self.view.show_error_message(error_msg)
         # Navigate back to the deck view
         self.navigation.navigate(f"/decks/{self.deck_id}/cards")
         logger.info(f"Study session for deck {self.deck_id} ended")
@@ -0,0 +1,101 @@
+"""Lazily paged queue of due cards for a study session."""
+
+import logging
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+from CardManagement.domain.models.Flashcard import Flashcard
+from CardManagement.domain.repositories.IFlashcardRepository import IFlashcardRepository
+
+from fsrs import Card as FSRSCard
+
+logger = logging.getLogger(__name__)
+
+SessionCard = Tuple[Flashcard, FSRSCard]
+
+
+class DueCardQueue:
+    """Forward-only queue of due cards that fetches pages from the repository on demand.
+
+    Only the current page is kept in memory. The queue is a snapshot of the cards that were due
+    at 'now': pages are fetched with keyset pagination on (due, id), so cards rescheduled during the
+    session never reappear. The total is taken once with a COUNT(*) when the queue is created.
+
+    Supports len(), indexing and item assignment for the current page, so it can be used wherever
+    the session previously held a fully built list.
+    """
+
+    def __init__(
+        self,
+        flashcard_repository: IFlashcardRepository,
+        deck_id: int,
+        now: datetime,
+        page_size: int,
+        prepare_cards: Callable[[List[Flashcard]], List[SessionCard]],
+    ):
+        """Initialize the queue and count the due cards.
+
+        Args:
+            flashcard_repository: Repository for flashcard data access.
+            deck_id: ID of the deck being studied.
+            now: Point in time defining which cards are due for this session.
+            page_size: Number of cards fetched per page.
+            prepare_cards: Callback converting fetched flashcards into (Flashcard, FSRSCard) pairs.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        self._repo = flashcard_repository
+        self._deck_id = deck_id
+        self._now = now
+        self._page_size = page_size
+        self._prepare_cards = prepare_cards
+
+        self._total: int = self._repo.count_due_by_deck_id(deck_id, now)
+        self._page: List[SessionCard] = []
+        self._page_offset = 0
+        self._next_cursor: Optional[str] = None
+        self._exhausted = self._total == 0
+
+        if not self._exhausted:
+            self._fetch_page(after_cursor=None)
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index: int) -> SessionCard:
+        self._ensure_loaded(index)
+        return self._page[index - self._page_offset]
+
+    def __setitem__(self, index: int, item: SessionCard) -> None:
+        self._ensure_loaded(index)
+        self._page[index - self._page_offset] = item
+
+    def _ensure_loaded(self, index: int) -> None:
+        """Advance through pages until 'index' is in the current page.
+
+        Raises:
+            IndexError: If the index is out of range or belongs to an already discarded page.
+        """
+        if index < 0 or index >= self._total:
+            raise IndexError(f"Queue index out of range: {index}")
+        if index < self._page_offset:
+            raise IndexError(f"Card {index} belongs to a page that was already discarded")
+
+        while index >= self._page_offset + len(self._page):
+            if self._exhausted:
+                # Cards were removed while the session was running; shrink the queue to what exists.
+                self._total = self._page_offset + len(self._page)
+                raise IndexError(f"Queue index out of range: {index}")
+            self._page_offset += len(self._page)
+            self._fetch_page(after_cursor=self._next_cursor)
+
+    def _fetch_page(self, after_cursor: Optional[str]) -> None:
+        """Fetch and prepare the next page of due cards."""
+        page = self._repo.list_due_page(self._deck_id, self._now, self._page_size, after_cursor=after_cursor)
+        self._page = self._prepare_cards(page.items)
+        self._next_cursor = page.next_cursor
+        self._exhausted = page.next_cursor is None
+        logger.debug(
+            f"Fetched {len(self._page)} due cards for deck {self._deck_id} starting at position {self._page_offset}"
+        )
@@ -0,0 +1,204 @@
+"""Write-behind queue persisting study reviews on a background thread."""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from CardManagement.domain.repositories.IFlashcardRepository import IFlashcardRepository
+from Study.domain.repositories.IReviewLogRepository import IReviewLogRepository
+from Shared.application.unit_of_work import UnitOfWork
+from Shared.infrastructure.config import (
+    REVIEW_WRITE_BATCH_SIZE,
+    REVIEW_WRITE_FLUSH_INTERVAL_MS,
+    REVIEW_WRITE_QUEUE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReviewEvent:
+    """A rated card: its new FSRS state and the review log entry to persist."""
+
+    user_id: int
+    flashcard_id: int
+    fsrs_state: str
+    review_log_data: Dict[str, Any]
+    rating: int
+    reviewed_at: datetime
+    scheduler_params_json: str
+
+
+class ReviewWriteError(Exception):
+    """Raised when reviews submitted earlier could not be saved."""
+
+    pass
+
+
+class _FlushRequest:
+    """Marker put on the queue by flush(); set once everything before it is committed."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class ReviewWriteQueue:
+    """Persists review events on a background thread so rating a card never waits on disk.
+
+    Events are drained from a bounded queue and group-committed: a batch is written in one
+    transaction once it holds 'batch_size' events or its oldest event has waited 'flush_interval_ms'.
+    The writer thread gets its own connection from the repositories' per-thread connection provider.
+
+    A failed batch is rolled back and reported by raising ReviewWriteError from the next
+    submit() or flush() call, so the caller on the UI thread can show it.
+    """
+
+    def __init__(
+        self,
+        flashcard_repository: IFlashcardRepository,
+        review_log_repository: IReviewLogRepository,
+        unit_of_work: UnitOfWork,
+        batch_size: int = REVIEW_WRITE_BATCH_SIZE,
+        flush_interval_ms: int = REVIEW_WRITE_FLUSH_INTERVAL_MS,
+        max_pending: int = REVIEW_WRITE_QUEUE_SIZE,
+    ):
+        """Initialize the queue and start the writer thread.
+
+        Args:
+            flashcard_repository: Repository used to save the new FSRS states.
+            review_log_repository: Repository used to save the review logs.
+            unit_of_work: Transaction context of the connection both repositories use.
+            batch_size: Maximum number of events committed in one transaction.
+            flush_interval_ms: Maximum time an event waits before its batch is committed.
+            max_pending: Queue capacity; submit() blocks when it is full.
+        """
+        self._flashcard_repo = flashcard_repository
+        self._review_log_repo = review_log_repository
+        self._unit_of_work = unit_of_work
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Optional[ReviewWriteError] = None
+        self._error_lock = threading.Lock()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="ReviewWriteQueue", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, event: ReviewEvent) -> None:
+        """Queue a review to be saved.
+
+        Args:
+            event: The review to persist.
+
+        Raises:
+            ReviewWriteError: If a previously submitted batch failed to save.
+            RuntimeError: If the queue was closed.
+        """
+        self._raise_pending_error()
+        if self._closed:
+            raise RuntimeError("Review write queue is closed")
+        self._queue.put(event)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until all reviews submitted so far are committed.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+        Raises:
+            ReviewWriteError: If any pending review failed to save or the wait timed out.
+        """
+        if not self._closed:
+            request = _FlushRequest()
+            self._queue.put(request)
+            if not request.done.wait(timeout):
+                raise ReviewWriteError(f"Reviews were not saved within {timeout} s")
+        self._raise_pending_error()
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Commit pending reviews and stop the writer thread.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the writer thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error("Review writer did not finish in time, some reviews may not be saved")
+        with self._error_lock:
+            if self._error is not None:
+                logger.error(f"Review write queue closed with unsaved reviews: {self._error}")
+
+    def _run(self) -> None:
+        """Writer thread loop: collect a batch, commit it, repeat until stopped."""
+        while True:
+            item = self._queue.get()
+            batch: List[ReviewEvent] = []
+            flush_request: Optional[_FlushRequest] = None
+            stop = False
+            deadline = time.monotonic() + self._flush_interval
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _FlushRequest):
+                    flush_request = item
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self._batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+            if flush_request is not None:
+                flush_request.done.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[ReviewEvent]) -> None:
+        """Save a batch of reviews in a single transaction, recording the error if it fails."""
+        try:
+            with self._unit_of_work.transaction():
+                self._flashcard_repo.bulk_set_fsrs_state([(event.flashcard_id, event.fsrs_state) for event in batch])
+                for event in batch:
+                    self._review_log_repo.add(
+                        user_id=event.user_id,
+                        flashcard_id=event.flashcard_id,
+                        review_log_data=event.review_log_data,
+                        rating=event.rating,
+                        reviewed_at=event.reviewed_at,
+                        scheduler_params_json=event.scheduler_params_json,
+                    )
+            logger.debug(f"Committed {len(batch)} reviews")
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} reviews: {e}", exc_info=True)
+            with self._error_lock:
+                if self._error is None:
+                    self._error = ReviewWriteError(f"Failed to save {len(batch)} reviews: {e}")
+
+    def _raise_pending_error(self) -> None:
+        """Raise (once) the error of a batch that failed since the last call."""
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
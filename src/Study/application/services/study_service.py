@@ -2,13 +2,17 @@
 
 import json
 import logging
+from contextlib import nullcontext
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from CardManagement.domain.models.Flashcard import Flashcard
 from CardManagement.domain.repositories.IFlashcardRepository import IFlashcardRepository
 from Study.domain.repositories.IReviewLogRepository import IReviewLogRepository
+from Study.application.services.due_card_queue import DueCardQueue
+from Study.application.services.review_write_queue import ReviewEvent, ReviewWriteQueue
 from Shared.application.session_service import SessionService
+from Shared.application.unit_of_work import UnitOfWork
 from Shared.infrastructure.config import get_config
 
 # Standardowy import biblioteki fsrs
@@ -25,6 +29,8 @@ class StudyService:
         flashcard_repository: IFlashcardRepository,
         review_log_repository: IReviewLogRepository,
         session_service: SessionService,
+        unit_of_work: Optional[UnitOfWork] = None,
+        review_writer: Optional[ReviewWriteQueue] = None,
     ):
         """Initialize the study service.
 
@@ -32,10 +38,16 @@ class StudyService:
             flashcard_repository: Repository for flashcard data access.
             review_log_repository: Repository for review logs data access.
             session_service: Service for accessing current user data.
+            unit_of_work: Transaction context shared by both repositories. When given, the card update
+                and its review log are committed atomically.
+            review_writer: Background writer for reviews. When given, record_review only queues the
+                review and end_session waits until everything is saved.
         """
         self.flashcard_repo = flashcard_repository
         self.review_log_repo = review_log_repository
         self.session_service = session_service
+        self.unit_of_work = unit_of_work
+        self.review_writer = review_writer
 
         self._config = get_config()
         self._default_fsrs_parameters = tuple(self._config.get("FSRS_DEFAULT_PARAMETERS", []))
@@ -44,12 +56,13 @@ class StudyService:
         self._default_relearning_steps_minutes = self._config.get("FSRS_DEFAULT_RELEARNING_STEPS_MINUTES", [10])
         self._maximum_interval = self._config.get("FSRS_MAXIMUM_INTERVAL", 36500)
         self._enable_fuzzing = self._config.get("FSRS_ENABLE_FUZZING", True)
+        self._queue_page_size = self._config.get("STUDY_QUEUE_PAGE_SIZE", 50)
 
         # Scheduler will be initialized during start_session
         self.scheduler: Optional[Scheduler] = None
 
-        # Session state
-        self.current_study_session_queue: List[Tuple[Flashcard, FSRSCard]] = []
+        # Session state; a DueCardQueue while a session is active
+        self.current_study_session_queue: Union[List[Tuple[Flashcard, FSRSCard]], DueCardQueue] = []
         self.current_card_index: int = -1
         self.current_deck_id: Optional[int] = None
 
@@ -84,11 +97,8 @@ class StudyService:
         # Initialize FSRS scheduler
         self._initialize_scheduler(user_id)
 
-        # Load and prepare cards
-        all_cards = self._load_and_prepare_fsrs_cards(deck_id, user_id)
-
-        # Filter and sort due cards
-        due_cards = self._filter_and_sort_due_cards(all_cards)
+        # Due cards are counted up front and fetched page by page as the session advances
+        due_cards = self._create_due_card_queue(deck_id)
 
         # Update session state
         self.current_study_session_queue = due_cards
@@ -96,7 +106,8 @@ class StudyService:
         if due_cards:
             self.current_card_index = 0
             logger.info(f"Started study session for deck {deck_id} with {len(due_cards)} due cards")
-            return due_cards[0]
+            first_card: Tuple[Flashcard, FSRSCard] = due_cards[0]
+            return first_card
         else:
             logger.info(f"Started study session for deck {deck_id} but no cards are due")
             return None
@@ -156,6 +167,7 @@ class StudyService:
         if rating_value < 1 or rating_value > 4:
             raise ValueError(f"Invalid rating value: {rating_value}. Must be between 1 and 4.")
 
+        previous_fsrs_state = flashcard.fsrs_state
         try:
             # Convert rating to FSRS Rating object
             fsrs_rating = FSRSRating(rating_value)
@@ -165,20 +177,33 @@ class StudyService:
 
             # Update flashcard FSRS state in domain model
             flashcard.fsrs_state = json.dumps(updated_fsrs_card.to_dict())
-
-            # Save updated flashcard to repository
-            self.flashcard_repo.update(flashcard)
-
-            # Save review log
             scheduler_params_json = json.dumps(list(self.scheduler.parameters))
-            self.review_log_repo.add(
-                user_id=user_id,
-                flashcard_id=flashcard_id,
-                review_log_data=review_log.to_dict(),
-                rating=rating_value,
-                reviewed_at=review_log.review_datetime,
-                scheduler_params_json=scheduler_params_json,
-            )
+
+            if self.review_writer:
+                # Saved in the background; failures are raised by a later submit or end_session
+                self.review_writer.submit(
+                    ReviewEvent(
+                        user_id=user_id,
+                        flashcard_id=flashcard_id,
+                        fsrs_state=flashcard.fsrs_state,
+                        review_log_data=review_log.to_dict(),
+                        rating=rating_value,
+                        reviewed_at=review_log.review_datetime,
+                        scheduler_params_json=scheduler_params_json,
+                    )
+                )
+            else:
+                # Save updated flashcard and its review log in one transaction
+                with self.unit_of_work.transaction() if self.unit_of_work else nullcontext():
+                    self.flashcard_repo.update(flashcard)
+                    self.review_log_repo.add(
+                        user_id=user_id,
+                        flashcard_id=flashcard_id,
+                        review_log_data=review_log.to_dict(),
+                        rating=rating_value,
+                        reviewed_at=review_log.review_datetime,
+                        scheduler_params_json=scheduler_params_json,
+                    )
 
             # Update current card in session queue
             self.current_study_session_queue[self.current_card_index] = (flashcard, updated_fsrs_card)
@@ -187,6 +212,8 @@ class StudyService:
             return flashcard, updated_fsrs_card
 
         except Exception as e:
+            # The transaction was rolled back, keep the in-memory card in sync with the database
+            flashcard.fsrs_state = previous_fsrs_state
             logger.error(f"Error recording review: {e}", exc_info=True)
             raise RuntimeError(f"Failed to record review: {str(e)}") from e
 
@@ -202,7 +229,12 @@ class StudyService:
         self.current_card_index += 1
 
         if self.current_card_index < len(self.current_study_session_queue):
-            return self.current_study_session_queue[self.current_card_index]
+            try:
+                return self.current_study_session_queue[self.current_card_index]
+            except IndexError:
+                # Cards were deleted while the session was running
+                logger.warning(f"Study queue ended early at position {self.current_card_index}")
+                return None
         else:
             # End of queue reached
             return None
@@ -227,10 +259,18 @@ class StudyService:
             return (self.current_card_index + 1, total)
 
     def end_session(self) -> None:
-        """End the current study session and clear session state."""
-        self.current_study_session_queue = []
-        self.current_card_index = -1
-        self.current_deck_id = None
+        """End the current study session and clear session state.
+
+        Raises:
+            ReviewWriteError: If reviews queued during the session could not be saved.
+        """
+        try:
+            if self.review_writer:
+                self.review_writer.flush()
+        finally:
+            self.current_study_session_queue = []
+            self.current_card_index = -1
+            self.current_deck_id = None
         # Don't clear scheduler as it can be reused
 
     def _initialize_scheduler(self, user_id: int) -> None:
@@ -256,18 +296,38 @@ class StudyService:
 
         logger.debug(f"Initialized FSRS scheduler with default parameters for user {user_id}")
 
-    def _load_and_prepare_fsrs_cards(self, deck_id: int, user_id: int) -> List[Tuple[Flashcard, FSRSCard]]:
-        """Load flashcards from the repository and prepare FSRS card objects.
+    def _create_due_card_queue(self, deck_id: int) -> DueCardQueue:
+        """Create a lazily paged queue of the cards due now in the given deck.
 
         Args:
             deck_id: ID of the deck to load cards from.
-            user_id: ID of the current user.
+
+        Returns:
+            Queue of (Flashcard, FSRSCard) tuples ordered by due date.
+        """
+        return DueCardQueue(
+            flashcard_repository=self.flashcard_repo,
+            deck_id=deck_id,
+            now=datetime.now(timezone.utc),
+            page_size=self._queue_page_size,
+            prepare_cards=self._prepare_fsrs_cards,
+        )
+
+    def _prepare_fsrs_cards(self, flashcards: List[Flashcard]) -> List[Tuple[Flashcard, FSRSCard]]:
+        """Prepare FSRS card objects for a page of due flashcards.
+
+        Selection and ordering by due date happen in SQL on the indexed 'due' column,
+        so cards that are not due are never deserialized.
+
+        Args:
+            flashcards: Due flashcards fetched from the repository.
 
         Returns:
             List of tuples containing (Flashcard, FSRSCard).
         """
-        flashcards = self.flashcard_repo.list_by_deck_id(deck_id)
         result = []
+        # Cards created before FSRS state was assigned at insert time; persisted together below
+        initial_states: List[Tuple[int, str]] = []
 
         for flashcard in flashcards:
             try:
@@ -278,9 +338,8 @@ class StudyService:
                 else:
                     # New card for FSRS
                     fsrs_card = FSRSCard()
-                    # Save initial state
                     flashcard.fsrs_state = json.dumps(fsrs_card.to_dict())
-                    self.flashcard_repo.update(flashcard)
+                    initial_states.append((flashcard.id, flashcard.fsrs_state))
 
                 result.append((flashcard, fsrs_card))
 
@@ -289,32 +348,12 @@ class StudyService:
                 # Treat as new card
                 fsrs_card = FSRSCard()
                 flashcard.fsrs_state = json.dumps(fsrs_card.to_dict())
-                self.flashcard_repo.update(flashcard)
+                initial_states.append((flashcard.id, flashcard.fsrs_state))
                 result.append((flashcard, fsrs_card))
 
-        logger.debug(f"Loaded and prepared {len(result)} cards for deck {deck_id}")
-        return result
-
-    def _filter_and_sort_due_cards(
-        self, all_session_cards: List[Tuple[Flashcard, FSRSCard]]
-    ) -> List[Tuple[Flashcard, FSRSCard]]:
-        """Filter cards that are due for review and sort them.
+        # Save initial states in a single transaction
+        if initial_states:
+            self.flashcard_repo.bulk_set_fsrs_state(initial_states)
 
-        Args:
-            all_session_cards: List of all cards in the session.
-
-        Returns:
-            Filtered and sorted list of cards that are due for review.
-        """
-        now = datetime.now(timezone.utc)
-        due_cards = []
-
-        for flashcard, fsrs_card in all_session_cards:
-            # Check if card is due (due <= now)
-            if fsrs_card.due <= now:
-                due_cards.append((flashcard, fsrs_card))
-
-        # Sort by due date (ascending)
-        due_cards.sort(key=lambda item: item[1].due)
-
-        return due_cards
+        logger.debug(f"Prepared {len(result)} due cards")
+        return result
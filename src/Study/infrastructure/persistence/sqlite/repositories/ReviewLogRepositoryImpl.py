@@ -1,13 +1,44 @@
 import sqlite3
 import json
 import logging
-from typing import List, Dict, Any, Protocol, Optional
+from typing import ContextManager, List, Dict, Any, Protocol, Optional
 from datetime import datetime
 
 from Study.domain.repositories.IReviewLogRepository import IReviewLogRepository
 
 logger = logging.getLogger(__name__)
 
+# Fixed SQL text, so every call hits the connection's prepared statement cache
+_INSERT_REVIEW_LOG = """
+    INSERT INTO ReviewLogs (
+        user_profile_id, flashcard_id, review_log_data,
+        fsrs_rating, reviewed_at, scheduler_params_at_review
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SELECT_LOGS_FOR_USER = """
+    SELECT * FROM ReviewLogs
+    WHERE user_profile_id = ?
+    ORDER BY reviewed_at DESC
+"""
+_SELECT_LOGS_FOR_FLASHCARD = """
+    SELECT * FROM ReviewLogs
+    WHERE user_profile_id = ? AND flashcard_id = ?
+    ORDER BY reviewed_at DESC
+"""
+_SELECT_LAST_LOG_FOR_FLASHCARD = """
+    SELECT * FROM ReviewLogs
+    WHERE user_profile_id = ? AND flashcard_id = ?
+    ORDER BY reviewed_at DESC LIMIT 1
+"""
+_DELETE_LOGS_FOR_FLASHCARD = """
+    DELETE FROM ReviewLogs
+    WHERE user_profile_id = ? AND flashcard_id = ?
+"""
+_DELETE_LOGS_FOR_USER = """
+    DELETE FROM ReviewLogs
+    WHERE user_profile_id = ?
+"""
+
 
 class DbConnectionProvider(Protocol):
     """Protocol defining the required interface for database connection providers."""
@@ -16,9 +47,16 @@ class DbConnectionProvider(Protocol):
         """Returns a SQLite connection object."""
         ...
 
+    def transaction(self) -> ContextManager[None]:
+        """Runs the enclosed writes in one transaction, joining the one already open on the thread."""
+        ...
+
 
 class ReviewLogRepositoryImpl(IReviewLogRepository):
-    """Implementation of the IReviewLogRepository interface for SQLite."""
+    """Implementation of the IReviewLogRepository interface for SQLite.
+
+    Writes run inside the provider's transaction(), so they join a unit of work opened by the caller.
+    """
 
     def __init__(self, db_provider: DbConnectionProvider):
         """Initialize the repository with a database connection provider.
@@ -51,27 +89,18 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            conn = self._db_provider.get_connection()
             # Convert review_log_data to JSON string
             review_log_json = json.dumps(review_log_data)
             # Convert datetime to ISO format string
             reviewed_at_str = reviewed_at.isoformat()
 
-            query = """
-                INSERT INTO ReviewLogs (
-                    user_profile_id, flashcard_id, review_log_data,
-                    fsrs_rating, reviewed_at, scheduler_params_at_review
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """
             params = (user_id, flashcard_id, review_log_json, rating, reviewed_at_str, scheduler_params_json)
 
-            self._execute_query(query, params)
-            conn.commit()
+            with self._db_provider.transaction():
+                self._execute_query(_INSERT_REVIEW_LOG, params)
 
             logger.debug(f"Added review log for user {user_id}, flashcard {flashcard_id}, rating {rating}")
         except Exception as e:
-            conn = self._db_provider.get_connection()
-            conn.rollback()
             error_msg = f"Failed to add review log: {e}"
             logger.error(error_msg, exc_info=True)
             raise RepositoryError(error_msg) from e
@@ -89,12 +118,7 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            query = """
-                SELECT * FROM ReviewLogs
-                WHERE user_profile_id = ?
-                ORDER BY reviewed_at DESC
-            """
-            cursor = self._execute_query(query, (user_id,))
+            cursor = self._execute_query(_SELECT_LOGS_FOR_USER, (user_id,))
 
             result = []
             for row in cursor.fetchall():
@@ -121,12 +145,7 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            query = """
-                SELECT * FROM ReviewLogs
-                WHERE user_profile_id = ? AND flashcard_id = ?
-                ORDER BY reviewed_at DESC
-            """
-            cursor = self._execute_query(query, (user_id, flashcard_id))
+            cursor = self._execute_query(_SELECT_LOGS_FOR_FLASHCARD, (user_id, flashcard_id))
 
             result = []
             for row in cursor.fetchall():
@@ -153,12 +172,7 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            query = """
-                SELECT * FROM ReviewLogs
-                WHERE user_profile_id = ? AND flashcard_id = ?
-                ORDER BY reviewed_at DESC LIMIT 1
-            """
-            cursor = self._execute_query(query, (user_id, flashcard_id))
+            cursor = self._execute_query(_SELECT_LAST_LOG_FOR_FLASHCARD, (user_id, flashcard_id))
 
             row = cursor.fetchone()
             if row:
@@ -183,20 +197,13 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            conn = self._db_provider.get_connection()
-            query = """
-                DELETE FROM ReviewLogs
-                WHERE user_profile_id = ? AND flashcard_id = ?
-            """
-            cursor = self._execute_query(query, (user_id, flashcard_id))
-            conn.commit()
+            with self._db_provider.transaction():
+                cursor = self._execute_query(_DELETE_LOGS_FOR_FLASHCARD, (user_id, flashcard_id))
 
             deleted_count = cursor.rowcount
             logger.debug(f"Deleted {deleted_count} review logs for user {user_id}, flashcard {flashcard_id}")
             return deleted_count
         except Exception as e:
-            conn = self._db_provider.get_connection()
-            conn.rollback()
             error_msg = f"Failed to delete review logs for user {user_id}, flashcard {flashcard_id}: {e}"
             logger.error(error_msg, exc_info=True)
             raise RepositoryError(error_msg) from e
@@ -214,20 +221,13 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
             RepositoryError: If the operation fails.
         """
         try:
-            conn = self._db_provider.get_connection()
-            query = """
-                DELETE FROM ReviewLogs
-                WHERE user_profile_id = ?
-            """
-            cursor = self._execute_query(query, (user_id,))
-            conn.commit()
+            with self._db_provider.transaction():
+                cursor = self._execute_query(_DELETE_LOGS_FOR_USER, (user_id,))
 
             deleted_count = cursor.rowcount
             logger.debug(f"Deleted {deleted_count} review logs for user {user_id}")
             return deleted_count
         except Exception as e:
-            conn = self._db_provider.get_connection()
-            conn.rollback()
             error_msg = f"Failed to delete review logs for user {user_id}: {e}"
             logger.error(error_msg, exc_info=True)
             raise RepositoryError(error_msg) from e
@@ -264,13 +264,12 @@ class ReviewLogRepositoryImpl(IReviewLogRepository):
         """
         try:
             conn = self._db_provider.get_connection()
-            # Enable foreign key support for each connection
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Enable row factory to get column names
-            conn.row_factory = sqlite3.Row
+            # Rows as sqlite3.Row for this cursor only; connection-level settings belong to the provider
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # type: ignore[assignment]
 
             logger.debug(f"Executing query: {query} with params: {params}")
-            return conn.execute(query, params)
+            return cursor.execute(query, params)
         except (RuntimeError, sqlite3.OperationalError) as e:
             error_msg = f"Database connection error: {e}"
             logger.error(error_msg, exc_info=True)
@@ -6,6 +6,7 @@ import logging
 from UserProfile.domain.repositories.IUserRepository import IUserRepository
 from UserProfile.domain.models.user import User
 from UserProfile.domain.repositories.exceptions import UserNotFoundError
+from Shared.application.session_service import SessionService
 from Shared.infrastructure.security.crypto import crypto_manager
 from Shared.domain.errors import AuthenticationError
 
@@ -68,13 +69,16 @@ class UpdateUserPreferencesDTO:
 class UserProfileService:
     """Service for managing user profiles and authentication."""
 
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, session_service: Optional[SessionService] = None):
         """Initialize the service with required dependencies.
 
         Args:
             user_repository: Repository for user data persistence
+            session_service: Session whose secret cache holds the logged-in user's decrypted API key.
+                Without it, get_api_key decrypts the key on every call.
         """
         self._user_repository = user_repository
+        self._session_service = session_service
 
     def get_profile_by_username(self, username: str) -> User:
         """Get a user profile by username.
@@ -190,6 +194,9 @@ class UserProfileService:
         Args:
             user_id: The ID of the user
 
+        The key of the logged-in user is decrypted once per session and then served from the
+        session's secret cache, which is dropped on login, logout and refresh_current_user.
+
         Returns:
             The decrypted API key or None if not set
 
@@ -204,9 +211,24 @@ class UserProfileService:
         if not user.encrypted_api_key:
             return None
 
+        # Cache only the session's own key, and only while the session holds the stored ciphertext
+        session = self._session_service
+        session_user = session.get_current_user() if session else None
+        is_session_key = (
+            session_user is not None
+            and session_user.id == user_id
+            and session_user.encrypted_api_key == user.encrypted_api_key
+        )
+        if session is not None and is_session_key:
+            cached: Optional[str] = session.get_secret(SessionService.API_KEY_SECRET)
+            if cached is not None:
+                return cached
+
         try:
             # Decrypt the API key using the crypto manager
             decrypted_key: str = crypto_manager.decrypt_api_key(user.encrypted_api_key)
+            if session is not None and is_session_key:
+                session.set_secret(SessionService.API_KEY_SECRET, decrypted_key)
             return decrypted_key
         except Exception as e:
             # If decryption fails, log the error and return None
@@ -1,7 +1,7 @@
 import sqlite3
 import logging
 from datetime import datetime
-from typing import List, Optional, Protocol
+from typing import ContextManager, List, Optional, Protocol
 
 from UserProfile.domain.models.user import User
 from UserProfile.domain.repositories.IUserRepository import IUserRepository
@@ -16,6 +16,37 @@ from UserProfile.domain.repositories.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Fixed SQL text, so every call hits the connection's prepared statement cache
+_SELECT_USER_BY_ID = """
+    SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
+    FROM Users
+    WHERE id = ?
+"""
+_SELECT_USER_BY_USERNAME = """
+    SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
+    FROM Users
+    WHERE username = ?
+"""
+_SELECT_ALL_USERS = """
+    SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
+    FROM Users
+    ORDER BY username
+"""
+_INSERT_USER = """
+    INSERT INTO Users (username, hashed_password, encrypted_api_key, default_llm_model, app_theme)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_UPDATE_USER = """
+    UPDATE Users
+    SET username = ?,
+        hashed_password = ?,
+        encrypted_api_key = ?,
+        default_llm_model = ?,
+        app_theme = ?
+    WHERE id = ?
+"""
+_DELETE_USER = "DELETE FROM Users WHERE id = ?"
+
 
 class DbConnectionProvider(Protocol):
     """Protocol defining the required interface for database connection providers."""
@@ -24,11 +55,16 @@ class DbConnectionProvider(Protocol):
         """Returns a SQLite connection object."""
         ...
 
+    def transaction(self) -> ContextManager[None]:
+        """Runs the enclosed writes in one transaction, joining the one already open on the thread."""
+        ...
+
 
 class UserRepositoryImpl(IUserRepository):
     """
     SQLite implementation of the IUserRepository interface.
     Handles all database operations for User entities.
+    Writes run inside the provider's transaction(), so they join a unit of work opened by the caller.
     """
 
     def __init__(self, db_provider: DbConnectionProvider):
@@ -87,8 +123,6 @@ class UserRepositoryImpl(IUserRepository):
         """
         try:
             conn = self._db_provider.get_connection()
-            # Enable foreign key support for each connection
-            conn.execute("PRAGMA foreign_keys = ON")
             logger.debug(f"Executing query: {query} with params: {params}")
             return conn.execute(query, params)
         except (RuntimeError, sqlite3.OperationalError) as e:
@@ -119,19 +153,19 @@ class UserRepositoryImpl(IUserRepository):
         if not user.username:
             raise InvalidUserDataError("Username is required")
 
-        query = """
-            INSERT INTO Users (username, hashed_password, encrypted_api_key, default_llm_model, app_theme)
-            VALUES (?, ?, ?, ?, ?)
-        """
         try:
             logger.info(f"Adding new user with username: {user.username}")
-            conn = self._db_provider.get_connection()
-            conn.execute("PRAGMA foreign_keys = ON")
-            cursor = conn.execute(
-                query,
-                (user.username, user.hashed_password, user.encrypted_api_key, user.default_llm_model, user.app_theme),
-            )
-            conn.commit()
+            with self._db_provider.transaction():
+                cursor = self._db_provider.get_connection().execute(
+                    _INSERT_USER,
+                    (
+                        user.username,
+                        user.hashed_password,
+                        user.encrypted_api_key,
+                        user.default_llm_model,
+                        user.app_theme,
+                    ),
+                )
 
             # Get the newly created user with timestamps
             created_user = self.get_by_id(cursor.lastrowid)  # type: ignore[arg-type]
@@ -173,14 +207,9 @@ class UserRepositoryImpl(IUserRepository):
             RepositoryError: If query fails
             InvalidUserDataError: If retrieved data is invalid
         """
-        query = """
-            SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
-            FROM Users
-            WHERE id = ?
-        """
         try:
             logger.debug(f"Fetching user by id: {user_id}")
-            cursor = self._execute_query(query, (user_id,))
+            cursor = self._execute_query(_SELECT_USER_BY_ID, (user_id,))
             row = cursor.fetchone()
 
             if row is None:
@@ -213,14 +242,9 @@ class UserRepositoryImpl(IUserRepository):
             RepositoryError: If query fails
             InvalidUserDataError: If retrieved data is invalid
         """
-        query = """
-            SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
-            FROM Users
-            WHERE username = ?
-        """
         try:
             logger.debug(f"Fetching user by username: {username}")
-            cursor = self._execute_query(query, (username,))
+            cursor = self._execute_query(_SELECT_USER_BY_USERNAME, (username,))
             row = cursor.fetchone()
 
             if row is None:
@@ -250,14 +274,9 @@ class UserRepositoryImpl(IUserRepository):
             RepositoryError: If query fails
             InvalidUserDataError: If retrieved data is invalid
         """
-        query = """
-            SELECT id, username, hashed_password, encrypted_api_key, default_llm_model, app_theme, created_at, updated_at
-            FROM Users
-            ORDER BY username
-        """
         try:
             logger.debug("Fetching all users")
-            cursor = self._execute_query(query)
+            cursor = self._execute_query(_SELECT_ALL_USERS)
             users = [self._map_row_to_user(row) for row in cursor.fetchall()]
             logger.debug(f"Successfully fetched {len(users)} users")
             return users
@@ -293,15 +312,6 @@ class UserRepositoryImpl(IUserRepository):
         if self.get_by_id(user.id) is None:
             raise UserNotFoundError(user.id)
 
-        query = """
-            UPDATE Users
-            SET username = ?,
-                hashed_password = ?,
-                encrypted_api_key = ?,
-                default_llm_model = ?,
-                app_theme = ?
-            WHERE id = ?
-        """
         try:
             logger.info(f"Updating user {user.id} with username: {user.username}")
             logger.info(
@@ -312,9 +322,6 @@ class UserRepositoryImpl(IUserRepository):
                 f"app_theme={user.app_theme}"
             )
 
-            conn = self._db_provider.get_connection()
-            conn.execute("PRAGMA foreign_keys = ON")
-
             # Log detailed information about the values being saved
             logger.info(
                 f"User {user.id} preferences - default_llm_model: {user.default_llm_model}, app_theme: {user.app_theme}"
@@ -364,8 +371,8 @@ class UserRepositoryImpl(IUserRepository):
                 f"id={type(params[5])}"
             )
 
-            cursor = conn.execute(query, params)
-            conn.commit()
+            with self._db_provider.transaction():
+                cursor = self._db_provider.get_connection().execute(_UPDATE_USER, params)
 
             row_count = cursor.rowcount
             logger.info(f"Update affected {row_count} rows")
@@ -410,13 +417,10 @@ class UserRepositoryImpl(IUserRepository):
         if self.get_by_id(user_id) is None:
             raise UserNotFoundError(user_id)
 
-        query = "DELETE FROM Users WHERE id = ?"
         try:
             logger.info(f"Deleting user with id: {user_id}")
-            conn = self._db_provider.get_connection()
-            conn.execute("PRAGMA foreign_keys = ON")
-            cursor = conn.execute(query, (user_id,))
-            conn.commit()
+            with self._db_provider.transaction():
+                cursor = self._db_provider.get_connection().execute(_DELETE_USER, (user_id,))
 
             if cursor.rowcount == 0:  # Should never happen as we checked existence
                 error_msg = f"Failed to delete user {user_id}"
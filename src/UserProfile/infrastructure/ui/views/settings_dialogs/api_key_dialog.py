@@ -2,12 +2,14 @@
 
 import tkinter as tk
 import threading
-from typing import Callable, Optional, Union
+from concurrent.futures import Future
+from typing import Callable, Optional, Tuple, Union
 import logging
 import sys
 
 import ttkbootstrap as ttk
 
+from CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
 from CardManagement.infrastructure.api_clients.openrouter.client import OpenRouterAPIClient
 from Shared.infrastructure.security.crypto import crypto_manager
 
@@ -51,6 +53,7 @@ class APIKeyDialog(tk.Toplevel):
         self.on_save = on_save
         self.current_key = current_key
         self.validation_thread: Optional[threading.Thread] = None
+        self.validation_future: Optional["Future[Tuple[bool, str]]"] = None
 
         # Variables
         self.api_key_var = ttk.StringVar(value=self._mask_api_key() if current_key else "")
@@ -197,11 +200,39 @@ class APIKeyDialog(tk.Toplevel):
         self.validation_message.set("")
         self.validation_status.set("Weryfikacja klucza API...")
 
+        if isinstance(self.api_client, AsyncOpenRouterAPIClient):
+            # Run validation on the application's event loop; closing the dialog aborts the request
+            future = self.api_client.submit(self.api_client.averify_key(api_key))
+            self.validation_future = future
+            future.add_done_callback(lambda done: self._on_validation_done(done, api_key))
+            return
+
         # Start validation in a separate thread to avoid UI freeze
         self.validation_thread = threading.Thread(target=self._threaded_validation, args=(api_key,))
         self.validation_thread.daemon = True
         self.validation_thread.start()
 
+    def _on_validation_done(self, future: "Future[Tuple[bool, str]]", api_key: str) -> None:
+        """Handle the result of an asynchronous validation (called on the event loop thread).
+
+        Args:
+            future: The finished validation
+            api_key: The validated API key
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            # Schedule UI update on the main thread
+            if error is None:
+                is_valid, message = future.result()
+                self.after(0, lambda: self._handle_validation_result(is_valid, message, api_key))
+            else:
+                self.after(0, lambda: self._handle_validation_error(str(error)))
+        except (RuntimeError, tk.TclError):
+            # The dialog was closed in the meantime
+            pass
+
     def _threaded_validation(self, api_key: str) -> None:
         """Run validation in a separate thread.
 
@@ -289,5 +320,7 @@ class APIKeyDialog(tk.Toplevel):
             logging.info("Cancelling validation in progress")
             # We can't directly stop the thread, but we can close the dialog
             self._set_validating(False)
+        if self.validation_future is not None and self.validation_future.cancel():
+            logging.info("Cancelled validation in progress")
 
         self.destroy()
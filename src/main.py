@@ -1,37 +1,58 @@
+# Imported first, so that the startup timings include the other imports
+from Shared.infrastructure.startup_timing import PROCESS_START, StartupTimer
 import ttkbootstrap as ttk
 import logging
-from typing import Any, Dict, Optional, Protocol, Callable, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol, Callable, Type
 
 # --- Project Imports ---
+from Shared.infrastructure.async_loop import AsyncLoopThread
 from Shared.infrastructure.logging import setup_logging
 from Shared.infrastructure.persistence.sqlite.connection import SqliteConnectionProvider
 from Shared.infrastructure.persistence.sqlite.migrations import run_migrations
-from Shared.infrastructure.config import DATABASE_PATH, AVAILABLE_LLM_MODELS, AVAILABLE_APP_THEMES
+from Shared.infrastructure.security.crypto import crypto_manager
+from Shared.infrastructure.config import (
+    AI_CACHE_MAX_BYTES,
+    AI_CACHE_PATH,
+    AI_CACHE_TTL_DAYS,
+    AVAILABLE_APP_THEMES,
+    AVAILABLE_LLM_MODELS,
+    DATABASE_PATH,
+    STARTUP_EXIT_AFTER_IDLE,
+    STARTUP_TIMING_PATH,
+)
 from Shared.application.session_service import SessionService
 from UserProfile.infrastructure.persistence.sqlite.repositories.UserRepositoryImpl import UserRepositoryImpl
 from UserProfile.application.user_profile_service import UserProfileService, UserProfileSummaryViewModel
 from UserProfile.infrastructure.ui.views.profile_list_view import ProfileListView
-from UserProfile.infrastructure.ui.views.settings_view import SettingsView
 from DeckManagement.infrastructure.persistence.sqlite.repositories.DeckRepositoryImpl import DeckRepositoryImpl
+from DeckManagement.infrastructure.persistence.sqlite.repositories.DeckArchiveRepositoryImpl import (
+    DeckArchiveRepositoryImpl,
+)
 from DeckManagement.application.deck_service import DeckService
+from DeckManagement.application.deck_archive_service import DeckArchiveService
 from DeckManagement.infrastructure.ui.views.deck_list_view import DeckListView
 from CardManagement.infrastructure.persistence.sqlite.repositories.FlashcardRepositoryImpl import (
     FlashcardRepositoryImpl,
 )
 from CardManagement.application.card_service import CardService
 from CardManagement.application.services.ai_service import AIService
-from CardManagement.infrastructure.api_clients.openrouter.client import OpenRouterAPIClient
+from CardManagement.infrastructure.api_clients.openrouter.cache import FlashcardCache
+from CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
 from CardManagement.infrastructure.ui.views.card_list_view import CardListView
 from CardManagement.infrastructure.ui.views.flashcard_edit_view import FlashcardEditView
-from CardManagement.infrastructure.ui.views.ai_generate_view import AIGenerateView
-from CardManagement.infrastructure.ui.views.ai_review_single_flashcard_view import AIReviewSingleFlashcardView
 from Study.application.services.study_service import StudyService
-from Study.application.presenters.study_presenter import StudyPresenter
-from Study.infrastructure.ui.views.study_session_view import StudySessionView
+from Study.application.services.review_write_queue import ReviewWriteQueue
 from Study.infrastructure.persistence.sqlite.repositories.ReviewLogRepositoryImpl import ReviewLogRepositoryImpl
 from Shared.ui.widgets.toast_container import ToastContainer
 from Shared.application.navigation import NavigationControllerProtocol
 
+# The AI, study and settings views are imported when they are first shown, to keep them out of the cold start
+if TYPE_CHECKING:
+    from UserProfile.infrastructure.ui.views.settings_view import SettingsView
+    from CardManagement.infrastructure.ui.views.ai_generate_view import AIGenerateView
+    from CardManagement.infrastructure.ui.views.ai_review_single_flashcard_view import AIReviewSingleFlashcardView
+    from Study.infrastructure.ui.views.study_session_view import StudySessionView
+
 
 class NavigationProtocol(Protocol):
     """Protocol defining the navigation interface required by views"""
@@ -121,6 +142,7 @@ class NavigationController(NavigationControllerProtocol):
         self.app_view = app_view
         self.views: Dict[str, ttk.Frame] = {}
         self.dynamic_view_factories: Dict[str, Callable] = {}
+        self.lazy_view_factories: Dict[str, Callable[[], ttk.Frame]] = {}
         self.current_view: Optional[ttk.Frame] = None
         # Storage for the last navigate kwargs
         self._last_navigate_kwargs: Dict[str, Any] = {}
@@ -142,6 +164,15 @@ class NavigationController(NavigationControllerProtocol):
         """
         self.views[path] = view
 
+    def register_lazy_view(self, path: str, view_factory: Callable[[], ttk.Frame]) -> None:
+        """Register a static view that is created on first navigation.
+
+        Args:
+            path: The path to register the view at
+            view_factory: A function that creates the view
+        """
+        self.lazy_view_factories[path] = view_factory
+
     def register_dynamic_view(self, path_pattern: str, view_factory: Callable) -> None:
         """Register a dynamic view factory.
 
@@ -184,6 +215,11 @@ class NavigationController(NavigationControllerProtocol):
         self._last_navigate_kwargs = kwargs
         logger.debug(f"Navigate called with path: {path}, kwargs keys: {list(kwargs.keys())}")
 
+        # Create a lazily registered static view on first navigation
+        if path not in self.views and path in self.lazy_view_factories:
+            logger.debug(f"Creating lazy view for path: {path}")
+            self.views[path] = self.lazy_view_factories.pop(path)()
+
         # If the path exists in static views, show it
         if path in self.views:
             logger.debug(f"Found static view for path: {path}")
@@ -416,6 +452,8 @@ class TenXCardsApp(ttk.Window):
             logging.error("Session service not provided to TenXCardsApp")
             raise ValueError("Session service not provided")
 
+        startup_timer: StartupTimer = dependencies.get("startup_timer") or StartupTimer()
+
         # Check if user is already logged in and has theme preference
         default_theme = "darkly"
         user = session_service.get_current_user()
@@ -444,6 +482,7 @@ class TenXCardsApp(ttk.Window):
             "AppHeader.TLabel", background=header_bg, foreground=header_fg, font=("TkDefaultFont", 10, "bold")
         )
         style.configure("AppHeader.TButton", background=header_bg)
+        startup_timer.checkpoint("create_window")
 
         # Get OpenRouter API client
         openrouter_api_client = dependencies.get("openrouter_api_client")
@@ -459,10 +498,15 @@ class TenXCardsApp(ttk.Window):
         review_log_repo = ReviewLogRepositoryImpl(db_provider)
 
         # Services
-        profile_service = UserProfileService(user_repo)
+        profile_service = UserProfileService(user_repo, session_service)
         deck_service = DeckService(deck_repo)
+        deck_archive_service = DeckArchiveService(DeckArchiveRepositoryImpl(db_provider), unit_of_work=db_provider)
         card_service = CardService(card_repo)
-        study_service = StudyService(card_repo, review_log_repo, session_service)
+        # Reviews are saved by a background writer thread (with its own connection from the provider)
+        review_writer = ReviewWriteQueue(card_repo, review_log_repo, db_provider)
+        study_service = StudyService(
+            card_repo, review_log_repo, session_service, unit_of_work=db_provider, review_writer=review_writer
+        )
 
         # AI Service setup
         ai_service = dependencies.get("ai_service")
@@ -471,6 +515,8 @@ class TenXCardsApp(ttk.Window):
             self.destroy()
             return
 
+        startup_timer.checkpoint("app_services")
+
         # --- AppView and NavigationController setup ---
         app_view = AppView(self, session_service)
         app_view.grid(row=0, column=0, sticky="nsew")
@@ -497,13 +543,15 @@ class TenXCardsApp(ttk.Window):
             session_service,
             navigation_controller,
             app_view.show_toast,
+            archive_service=deck_archive_service,
         )
         navigation_controller.register_view("/decks", deck_list_view)
 
-        # Settings view
-        navigation_controller.register_view(
-            "/settings",
-            SettingsView(
+        # Settings view, created when first opened
+        def create_settings_view() -> "SettingsView":
+            from UserProfile.infrastructure.ui.views.settings_view import SettingsView
+
+            return SettingsView(
                 app_view.main_content,
                 profile_service,
                 session_service,
@@ -512,8 +560,9 @@ class TenXCardsApp(ttk.Window):
                 app_view.show_toast,
                 AVAILABLE_LLM_MODELS,
                 AVAILABLE_APP_THEMES,
-            ),
-        )
+            )
+
+        navigation_controller.register_lazy_view("/settings", create_settings_view)
 
         # Dynamic views (card management)
         def create_card_list_view(deck_id: int) -> CardListView:
@@ -565,7 +614,9 @@ class TenXCardsApp(ttk.Window):
                 flashcard_id=flashcard_id,
             )
 
-        def create_ai_generate_view(deck_id: int) -> AIGenerateView:
+        def create_ai_generate_view(deck_id: int) -> "AIGenerateView":
+            from CardManagement.infrastructure.ui.views.ai_generate_view import AIGenerateView
+
             user = session_service.get_current_user()
             if not user or not user.id:
                 raise ValueError("Musisz być zalogowany aby generować karty")
@@ -584,7 +635,10 @@ class TenXCardsApp(ttk.Window):
                 available_llm_models=AVAILABLE_LLM_MODELS,
             )
 
-        def create_study_session_view(deck_id: int) -> StudySessionView:
+        def create_study_session_view(deck_id: int) -> "StudySessionView":
+            from Study.application.presenters.study_presenter import StudyPresenter
+            from Study.infrastructure.ui.views.study_session_view import StudySessionView
+
             user = session_service.get_current_user()
             if not user or not user.id:
                 raise ValueError("Musisz być zalogowany aby rozpocząć naukę")
@@ -610,10 +664,14 @@ class TenXCardsApp(ttk.Window):
 
             return view
 
-        def create_ai_review_flashcard_view(**kwargs) -> AIReviewSingleFlashcardView:
+        def create_ai_review_flashcard_view(**kwargs) -> "AIReviewSingleFlashcardView":
             """Create view for reviewing AI-generated flashcards."""
             import logging
 
+            from CardManagement.infrastructure.ui.views.ai_review_single_flashcard_view import (
+                AIReviewSingleFlashcardView,
+            )
+
             logger = logging.getLogger(__name__)
 
             logger.debug(f"create_ai_review_flashcard_view called with kwargs: {list(kwargs.keys())}")
@@ -663,6 +721,7 @@ class TenXCardsApp(ttk.Window):
         navigation_controller.register_dynamic_view("/decks/:id/cards/generate", create_ai_generate_view)
         navigation_controller.register_dynamic_view("/decks/:id/cards/review", create_ai_review_flashcard_view)
         navigation_controller.register_dynamic_view("/study/session/:id", create_study_session_view)
+        startup_timer.checkpoint("register_views")
 
         # --- Bind Events ---
         self.bind("<<NavigateToDeckList>>", lambda e: navigation_controller.navigate("/decks"))
@@ -694,11 +753,15 @@ class TenXCardsApp(ttk.Window):
 
         # Start with profiles view
         navigation_controller.navigate("/profiles")
+        startup_timer.checkpoint("first_navigation")
 
 
 # --- Main Entrypoint ---
 def main() -> None:
     """Main application entry point."""
+    startup_timer = StartupTimer(origin=PROCESS_START)
+    startup_timer.checkpoint("imports")
+
     # Setup logging early
     setup_logging(log_file="./data/app.log", log_level=logging.DEBUG)  # Ensure DEBUG level
 
@@ -727,8 +790,11 @@ def main() -> None:
     # Sprawdź czy SECRET_KEY istnieje, a jeśli nie to wygeneruj nowy
     logging.info("Starting 10xCards application")
 
+    startup_timer.checkpoint("setup_logging")
+
     # Initialize DB and run migrations
     run_migrations(str(DATABASE_PATH))
+    startup_timer.checkpoint("run_migrations")
 
     # Initialize dependencies
     db_provider = SqliteConnectionProvider(str(DATABASE_PATH))
@@ -740,24 +806,52 @@ def main() -> None:
     app_logger = logging.getLogger("app")
 
     # Setup OpenRouter API client and AI service
-    openrouter_api_client = OpenRouterAPIClient(
-        logger=app_logger.getChild("openrouter"), default_model="openrouter/openai/gpt-4o-mini"
+    flashcard_cache = FlashcardCache(
+        AI_CACHE_PATH, ttl_seconds=AI_CACHE_TTL_DAYS * 24 * 3600, max_bytes=AI_CACHE_MAX_BYTES
+    )
+    # AI requests run concurrently on one event loop thread for the lifetime of the app
+    event_loop = AsyncLoopThread(name="AIEventLoop")
+    event_loop.start()
+    openrouter_api_client = AsyncOpenRouterAPIClient(
+        logger=app_logger.getChild("openrouter"),
+        event_loop=event_loop,
+        default_model="openrouter/openai/gpt-4o-mini",
+        cache=flashcard_cache,
     )
     ai_service = AIService(
         api_client=openrouter_api_client, session_service=session_service, logger=app_logger.getChild("ai_service")
     )
 
+    startup_timer.checkpoint("services")
+
     # Create dependencies dict
     dependencies = {
         "db_provider": db_provider,
         "session_service": session_service,
         "openrouter_api_client": openrouter_api_client,
         "ai_service": ai_service,
+        "startup_timer": startup_timer,
     }
 
     # Start application
     app = TenXCardsApp(dependencies)
-    app.mainloop()
+
+    # The first idle callback runs once the first view has been laid out and painted
+    def on_first_idle() -> None:
+        startup_timer.mark("first_idle")
+        logging.info(startup_timer.summary())
+        startup_timer.write_json(STARTUP_TIMING_PATH)
+        if STARTUP_EXIT_AFTER_IDLE:
+            app.quit()
+
+    app.after_idle(on_first_idle)
+    # Derive the API key encryption key and import litellm once the window is up, not before it can appear
+    app.after_idle(crypto_manager.warm_up_in_background)
+    app.after_idle(openrouter_api_client.preload)
+    try:
+        app.mainloop()
+    finally:
+        event_loop.stop()
 
 
 if __name__ == "__main__":
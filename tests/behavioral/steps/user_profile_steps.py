@@ -1,4 +1,7 @@
 import sqlite3
+from contextlib import contextmanager
+from typing import Iterator
+
 from behave import given, when, then
 from hamcrest import assert_that, is_, is_not, none, instance_of
 
@@ -42,6 +45,19 @@ class TestDbProvider:
     def get_connection(self) -> sqlite3.Connection:
         return self._conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        if self._conn.in_transaction:
+            yield
+            return
+        self._conn.execute("BEGIN")
+        try:
+            yield
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
+
 
 @given("the database is empty")
 def setup_empty_database(context):
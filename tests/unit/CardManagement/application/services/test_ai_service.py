@@ -1,3 +1,7 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+
 import pytest
 from unittest.mock import Mock, patch
 import logging
@@ -5,15 +9,20 @@ from cryptography.fernet import InvalidToken
 
 from src.CardManagement.application.services.ai_service import AIService
 from src.CardManagement.infrastructure.api_clients.openrouter.exceptions import AIAPIConnectionError
+
+# The service module resolves its imports from the src path root, so its exception classes come from there
+from CardManagement.infrastructure.api_clients.openrouter.exceptions import FlashcardGenerationError
+from CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
+from src.Shared.infrastructure.async_loop import AsyncLoopThread
 from src.CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
 from src.UserProfile.domain.models.user import User
-from src.Shared.infrastructure.config import DEFAULT_AI_MODEL
+from src.Shared.infrastructure.config import AI_CHUNK_SIZE, AI_MAX_SOURCE_TEXT_LENGTH, DEFAULT_AI_MODEL
 
 
 @pytest.fixture
 def mock_api_client(mocker):
     """Mock dla klienta OpenRouter API."""
-    return mocker.Mock()
+    return mocker.Mock(spec=AsyncOpenRouterAPIClient)
 
 
 @pytest.fixture
@@ -24,6 +33,7 @@ def mock_session_service(mocker):
     mock_user = User(id=1, username="testuser", hashed_password=None, default_llm_model=None, app_theme=None)
     mock_user.encrypted_api_key = b"encrypted_api_key"
     mock.get_current_user.return_value = mock_user
+    mock.get_secret.return_value = None
     return mock
 
 
@@ -135,6 +145,44 @@ class TestGetUserApiKey:
                 assert e.__class__.__name__ == "AIAPIAuthError"
                 assert "Unexpected error with API key" in str(e)
 
+    def test_get_user_api_key_cached_in_session(self, ai_service, mock_session_service):
+        # Arrange
+        with patch("src.CardManagement.application.services.ai_service.crypto_manager") as mock_crypto:
+            mock_crypto.decrypt_api_key.return_value = "decrypted_api_key"
+
+            # Act
+            result = ai_service._get_user_api_key()
+
+            # Assert
+            assert result == "decrypted_api_key"
+            mock_session_service.set_secret.assert_called_once_with(AIService.API_KEY_SECRET, "decrypted_api_key")
+
+    def test_get_user_api_key_uses_session_cache(self, ai_service, mock_session_service):
+        # Arrange
+        mock_session_service.get_secret.return_value = "cached_api_key"
+        with patch("src.CardManagement.application.services.ai_service.crypto_manager") as mock_crypto:
+            # Act
+            result = ai_service._get_user_api_key()
+
+            # Assert
+            assert result == "cached_api_key"
+            mock_crypto.decrypt_api_key.assert_not_called()
+            mock_session_service.get_secret.assert_called_once_with(AIService.API_KEY_SECRET)
+
+    def test_get_user_api_key_not_cached_when_session_changed(self, ai_service, mock_session_service):
+        # Arrange
+        user = mock_session_service.get_current_user.return_value
+        other_user = User(id=2, username="other", hashed_password=None, default_llm_model=None, app_theme=None)
+        mock_session_service.get_current_user.side_effect = [user, other_user]
+        with patch("src.CardManagement.application.services.ai_service.crypto_manager") as mock_crypto:
+            mock_crypto.decrypt_api_key.return_value = "decrypted_api_key"
+
+            # Act
+            ai_service._get_user_api_key()
+
+            # Assert
+            mock_session_service.set_secret.assert_not_called()
+
 
 class TestExplainError:
     """Testy dla metody explain_error."""
@@ -262,28 +310,55 @@ class TestExplainError:
         assert "Nieoczekiwany błąd" in result
 
 
+@pytest.fixture
+def event_loop_thread():
+    loop_thread = AsyncLoopThread()
+    loop_thread.start()
+    yield loop_thread
+    loop_thread.stop()
+
+
+@pytest.fixture
+def async_api_client(mocker, event_loop_thread):
+    """Mock asynchronicznego klienta API uruchamiającego korutyny na prawdziwej pętli zdarzeń."""
+    client = mocker.Mock(spec=AsyncOpenRouterAPIClient)
+    client.submit.side_effect = event_loop_thread.submit
+    return client
+
+
+@pytest.fixture
+def async_ai_service(async_api_client, mock_session_service, mock_logger):
+    service = AIService(api_client=async_api_client, session_service=mock_session_service, logger=mock_logger)
+    with patch.object(service, "_get_user_api_key", return_value="api_key"):
+        yield service
+
+
 class TestGenerateFlashcards:
     """Testy dla metody generate_flashcards."""
 
-    def test_generate_flashcards_success(self, ai_service, mock_api_client, sample_flashcard_dto):
+    def test_generate_flashcards_success(self, async_ai_service, async_api_client, sample_flashcard_dto):
         # Arrange
-        with patch.object(ai_service, "_get_user_api_key", return_value="api_key"):
-            mock_api_client.generate_flashcards.return_value = [sample_flashcard_dto]
+        async def stream(**kwargs):
+            yield sample_flashcard_dto
 
-            # Act
-            result = ai_service.generate_flashcards("Sample text", 10)
+        async_api_client.astream_flashcards.side_effect = stream
 
-            # Assert
-            assert len(result) == 1
-            assert result[0].front == "Co to jest Python?"
-            assert result[0].back == "Język programowania wysokiego poziomu."
-            mock_api_client.generate_flashcards.assert_called_once_with(
-                api_key="api_key",
-                raw_text="Sample text",
-                deck_id=10,
-                model=DEFAULT_AI_MODEL,
-                temperature=0.3,
-            )
+        # Act
+        result = async_ai_service.generate_flashcards("Sample text", 10)
+
+        # Assert
+        assert len(result) == 1
+        assert result[0].front == "Co to jest Python?"
+        assert result[0].back == "Język programowania wysokiego poziomu."
+        async_api_client.astream_flashcards.assert_called_once_with(
+            api_key="api_key",
+            raw_text="Sample text",
+            deck_id=10,
+            model=DEFAULT_AI_MODEL,
+            temperature=0.3,
+            use_cache=True,
+            on_retry=None,
+        )
 
     def test_generate_flashcards_empty_text(self, ai_service):
         # Arrange & Act & Assert
@@ -292,30 +367,176 @@ class TestGenerateFlashcards:
 
     def test_generate_flashcards_text_too_long(self, ai_service):
         # Arrange
-        long_text = "x" * 10001  # Przekraczamy limit 10000 znaków
+        long_text = "x" * (AI_MAX_SOURCE_TEXT_LENGTH + 1)
 
         # Act & Assert
         with pytest.raises(ValueError, match="Tekst jest zbyt długi"):
             ai_service.generate_flashcards(long_text, 10)
 
-    def test_generate_flashcards_api_error(self, ai_service, mock_api_client):
+    def test_generate_flashcards_api_error(self, async_ai_service, async_api_client):
         # Arrange
-        with patch.object(ai_service, "_get_user_api_key", return_value="api_key"):
-            mock_api_client.generate_flashcards.side_effect = AIAPIConnectionError("Connection failed")
+        async def stream(**kwargs):
+            raise AIAPIConnectionError("Connection failed")
+            yield  # pragma: no cover
 
-            # Act & Assert
-            with pytest.raises(AIAPIConnectionError):
-                ai_service.generate_flashcards("Sample text", 10)
+        async_api_client.astream_flashcards.side_effect = stream
 
-    def test_generate_flashcards_with_custom_model(self, ai_service, mock_api_client, sample_flashcard_dto):
+        # Act & Assert
+        with pytest.raises(AIAPIConnectionError):
+            async_ai_service.generate_flashcards("Sample text", 10)
+
+    def test_generate_flashcards_with_custom_model_and_bypass_cache(
+        self, async_ai_service, async_api_client, sample_flashcard_dto
+    ):
         # Arrange
-        with patch.object(ai_service, "_get_user_api_key", return_value="api_key"):
-            mock_api_client.generate_flashcards.return_value = [sample_flashcard_dto]
+        async def stream(**kwargs):
+            yield sample_flashcard_dto
 
-            # Act
-            ai_service.generate_flashcards("Sample text", 10, model="custom_model")
+        async_api_client.astream_flashcards.side_effect = stream
 
-            # Assert
-            mock_api_client.generate_flashcards.assert_called_once_with(
-                api_key="api_key", raw_text="Sample text", deck_id=10, model="custom_model", temperature=0.3
-            )
+        # Act
+        async_ai_service.generate_flashcards("Sample text", 10, model="custom_model", bypass_cache=True)
+
+        # Assert
+        kwargs = async_api_client.astream_flashcards.call_args.kwargs
+        assert kwargs["model"] == "custom_model"
+        assert kwargs["use_cache"] is False
+
+    def test_generate_flashcards_long_text_is_chunked_and_deduplicated(self, async_ai_service, async_api_client):
+        # Arrange
+        paragraphs = [f"Akapit {i}. " + "tekst " * 400 for i in range(12)]
+        long_text = "\n\n".join(paragraphs)
+        assert len(long_text) > AI_CHUNK_SIZE
+
+        async def generate(*, raw_text, deck_id, **kwargs):
+            first = raw_text.split(".")[0]
+            return [
+                FlashcardDTO(front=f"Pytanie o {first}", back="Odpowiedź", deck_id=deck_id),
+                FlashcardDTO(front="  Wspólne   PYTANIE ", back="Odpowiedź", deck_id=deck_id),
+            ]
+
+        async_api_client.agenerate_flashcards.side_effect = generate
+
+        # Act
+        result = async_ai_service.generate_flashcards(long_text, 10)
+
+        # Assert
+        calls = async_api_client.agenerate_flashcards.call_args_list
+        assert len(calls) > 1
+        assert all(len(c.kwargs["raw_text"]) <= AI_CHUNK_SIZE for c in calls)
+        fronts = [card.front for card in result]
+        assert len(fronts) == len(calls) + 1
+        assert len(set(fronts)) == len(fronts)
+        async_api_client.astream_flashcards.assert_not_called()
+
+    def test_generate_flashcards_long_text_skips_chunks_without_flashcards(
+        self, async_ai_service, async_api_client, sample_flashcard_dto
+    ):
+        # Arrange
+        long_text = "\n\n".join("zdanie " * 400 for _ in range(8))
+        async_api_client.agenerate_flashcards.side_effect = [
+            FlashcardGenerationError("No valid flashcards generated")
+        ] + [[sample_flashcard_dto]] * 10
+
+        # Act
+        result = async_ai_service.generate_flashcards(long_text, 10)
+
+        # Assert
+        assert result == [sample_flashcard_dto]
+
+
+class TestStartFlashcardGeneration:
+    """Testy dla generowania fiszek na pętli zdarzeń."""
+
+    def test_start_flashcard_generation_reports_each_flashcard(self, async_ai_service, async_api_client):
+        # Arrange
+        async def stream(**kwargs):
+            for front in ("Pytanie 1", "pytanie 1", "Pytanie 2"):
+                yield FlashcardDTO(front=front, back="Odpowiedź", deck_id=kwargs["deck_id"])
+
+        async_api_client.astream_flashcards.side_effect = stream
+        received = []
+
+        # Act
+        future = async_ai_service.start_flashcard_generation("Sample text", 10, received.append)
+
+        # Assert
+        assert future.result(timeout=2) == 2
+        assert [card.front for card in received] == ["Pytanie 1", "Pytanie 2"]
+        assert async_api_client.astream_flashcards.call_args.kwargs["use_cache"] is True
+
+    def test_start_flashcard_generation_cancel_aborts_request(self, async_ai_service, async_api_client):
+        # Arrange
+        started = threading.Event()
+        aborted = threading.Event()
+
+        async def stream(**kwargs):
+            yield FlashcardDTO(front="Pytanie 1", back="Odpowiedź", deck_id=10)
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+            yield FlashcardDTO(front="Pytanie 2", back="Odpowiedź", deck_id=10)
+
+        async_api_client.astream_flashcards.side_effect = stream
+        received = []
+        future = async_ai_service.start_flashcard_generation("Sample text", 10, received.append)
+        assert started.wait(2)
+
+        # Act
+        future.cancel()
+
+        # Assert
+        assert aborted.wait(2)
+        with pytest.raises(CancelledError):
+            future.result()
+        assert [card.front for card in received] == ["Pytanie 1"]
+
+    def test_start_flashcard_generation_long_text_runs_chunks_concurrently(self, async_ai_service, async_api_client):
+        # Arrange
+        long_text = "\n\n".join(f"Akapit {i}. " + "tekst " * 400 for i in range(8))
+        running = []
+        peak = []
+
+        async def generate(*, raw_text, deck_id, **kwargs):
+            running.append(raw_text)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(raw_text)
+            return [FlashcardDTO(front=raw_text.split(".")[0], back="Odpowiedź", deck_id=deck_id)]
+
+        async_api_client.agenerate_flashcards.side_effect = generate
+        received = []
+
+        # Act
+        count = async_ai_service.start_flashcard_generation(long_text, 10, received.append).result(timeout=5)
+
+        # Assert
+        calls = async_api_client.agenerate_flashcards.call_count
+        assert calls > 1
+        assert count == len(received) == len({card.front for card in received})
+        assert 1 < max(peak) <= async_ai_service.max_concurrency
+        async_api_client.astream_flashcards.assert_not_called()
+
+    def test_start_flashcard_generation_propagates_errors(self, async_ai_service, async_api_client):
+        # Arrange
+        async def stream(**kwargs):
+            raise AIAPIConnectionError("Connection failed")
+            yield  # pragma: no cover
+
+        async_api_client.astream_flashcards.side_effect = stream
+
+        # Act
+        future = async_ai_service.start_flashcard_generation("Sample text", 10, Mock())
+
+        # Assert
+        with pytest.raises(AIAPIConnectionError):
+            future.result(timeout=2)
+
+    def test_start_flashcard_generation_requires_a_running_event_loop(self, async_ai_service, async_api_client):
+        async_api_client.submit.side_effect = AsyncLoopThread().submit
+
+        with pytest.raises(RuntimeError):
+            async_ai_service.start_flashcard_generation("Sample text", 10, Mock())
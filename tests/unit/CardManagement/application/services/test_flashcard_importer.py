@@ -0,0 +1,188 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from CardManagement.application.services import flashcard_importer
+from CardManagement.application.services.flashcard_importer import FlashcardImporter, ImportRowError, detect_format
+
+
+@pytest.fixture
+def imported():
+    """Batches passed to CardService.import_flashcards, as (front, back) pairs."""
+    return []
+
+
+@pytest.fixture
+def card_service(imported):
+    service = Mock()
+
+    def import_flashcards(deck_id, batch):
+        imported.append([(dto.front_text, dto.back_text) for dto in batch])
+        return len(batch)
+
+    service.import_flashcards.side_effect = import_flashcards
+    return service
+
+
+@pytest.fixture
+def deck_service():
+    service = Mock()
+    service.get_deck.return_value = Mock(id=7)
+    return service
+
+
+@pytest.fixture
+def importer(card_service, deck_service):
+    return FlashcardImporter(card_service, deck_service, batch_size=2)
+
+
+def write(tmp_path, name, content, encoding="utf-8"):
+    path = tmp_path / name
+    path.write_bytes(content.encode(encoding))
+    return path
+
+
+def cards(imported):
+    return [card for batch in imported for card in batch]
+
+
+def test_detect_format_from_extension():
+    assert detect_format("talia.CSV") == "csv"
+    assert detect_format("talia.tsv") == "tsv"
+    assert detect_format("eksport.txt") == "anki"
+    with pytest.raises(ValueError, match="Nieobsługiwany format"):
+        detect_format("talia.xlsx")
+
+
+def test_csv_import_skips_bom_and_header_and_handles_quoting(importer, tmp_path, imported):
+    path = write(
+        tmp_path,
+        "talia.csv",
+        '\ufeffPrzód,Tył\nStolica Polski,Warszawa\n"Pierwiastek, symbol O","Tlen\nO2",dodatkowa kolumna\n\n2+2,4\n',
+    )
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert (result.imported, result.failed, result.cancelled) == (3, 0, False)
+    assert cards(imported) == [("Stolica Polski", "Warszawa"), ("Pierwiastek, symbol O", "Tlen\nO2"), ("2+2", "4")]
+    assert [len(batch) for batch in imported] == [2, 1]
+
+
+def test_invalid_rows_are_reported_with_line_numbers(importer, tmp_path, imported):
+    path = write(
+        tmp_path,
+        "talia.csv",
+        "Kot,Cat\ntylko przód\n" + "A" * 201 + ",za długi przód\n ,pusty przód\nPytanie 2," + "B" * 501 + "\n",
+    )
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert (result.imported, result.failed) == (1, 4)
+    assert cards(imported) == [("Kot", "Cat")]
+    assert [error.line for error in result.errors] == [2, 3, 4, 5]
+    assert "przód i tył" in result.errors[0].message
+    assert "200 znaków" in result.errors[1].message
+    assert "pusty" in result.errors[2].message
+    assert "500 znaków" in result.errors[3].message
+
+
+def test_line_numbers_account_for_multiline_fields(importer, tmp_path):
+    path = write(tmp_path, "talia.csv", 'a,"b\nc"\nbez tyłu\n')
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert result.errors == [ImportRowError(line=3, message="Wiersz musi zawierać przód i tył fiszki")]
+
+
+def test_reported_errors_are_capped(importer, tmp_path, monkeypatch):
+    monkeypatch.setattr(flashcard_importer, "MAX_REPORTED_ERRORS", 2)
+    path = write(tmp_path, "talia.csv", "a\nb\nc\n")
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert result.failed == 3
+    assert len(result.errors) == 2
+
+
+def test_tsv_import_keeps_quotes_as_text(importer, tmp_path, imported):
+    path = write(tmp_path, "talia.tsv", 'Słowo "cytat"\tQuote\nkot\tcat\n')
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert result.imported == 2
+    assert cards(imported) == [('Słowo "cytat"', "Quote"), ("kot", "cat")]
+
+
+def test_anki_export_with_headers(importer, tmp_path, imported):
+    path = write(
+        tmp_path,
+        "eksport.txt",
+        "#separator:Semicolon\n#html:true\n#guid column:1\n#tags column:4\n"
+        "abc123;Stolica <b>Francji</b>;Paryż<br>nad Sekwaną;geografia\n"
+        'def456;"A &amp; B";<div>pierwsza</div><div>druga</div>;\n'
+        "ghi789;tylko przód\n",
+    )
+
+    result = importer.import_file(path, deck_id=7, user_id=1)
+
+    assert cards(imported) == [("Stolica Francji", "Paryż\nnad Sekwaną"), ("A & B", "pierwsza\ndruga")]
+    assert result.errors == [ImportRowError(line=7, message="Wiersz musi zawierać przód i tył fiszki")]
+
+
+def test_anki_export_without_headers_is_tab_separated(importer, tmp_path, imported):
+    path = write(tmp_path, "eksport.txt", 'front\tback\n"dwie\nlinie"\t<b>bez html</b>\n')
+
+    importer.import_file(path, deck_id=7, user_id=1)
+
+    # Without '#html:true' the fields are plain text, and the first row is not treated as a header
+    assert cards(imported) == [("front", "back"), ("dwie\nlinie", "<b>bez html</b>")]
+
+
+def test_progress_is_reported_after_each_batch(importer, tmp_path):
+    path = write(tmp_path, "talia.csv", "".join(f"p{i},o{i}\n" for i in range(5)))
+    progress = []
+
+    importer.import_file(path, deck_id=7, user_id=1, on_progress=progress.append)
+
+    assert [(p.rows_read, p.imported) for p in progress] == [(2, 2), (4, 4), (5, 5)]
+    assert progress[-1].fraction == 1.0
+    assert all(p.total_bytes == path.stat().st_size for p in progress)
+
+
+def test_cancel_stops_after_the_current_batch(importer, tmp_path, imported):
+    path = write(tmp_path, "talia.csv", "".join(f"p{i},o{i}\n" for i in range(6)))
+    cancel = threading.Event()
+    cancel.set()
+
+    result = importer.import_file(path, deck_id=7, user_id=1, cancel_event=cancel)
+
+    assert result.cancelled
+    assert result.imported == 2
+    assert len(imported) == 1
+
+
+def test_decoding_error_keeps_committed_batches(card_service, deck_service, tmp_path, imported):
+    importer = FlashcardImporter(card_service, deck_service, batch_size=1000)
+    path = tmp_path / "talia.csv"
+    # The file is decoded in blocks, so the invalid bytes come after more than one block of valid rows
+    path.write_bytes("".join(f"kot {i},cat\n" for i in range(3000)).encode("utf-8") + b"\xff\xfe,zly\n")
+
+    with pytest.raises(ValueError, match="zaimportowano 2000 fiszek"):
+        importer.import_file(path, deck_id=7, user_id=1)
+    assert len(cards(imported)) == 2000
+
+
+def test_missing_deck_is_rejected(importer, deck_service, card_service, tmp_path):
+    deck_service.get_deck.return_value = None
+    path = write(tmp_path, "talia.csv", "a,b\n")
+
+    with pytest.raises(ValueError, match="Talia nie istnieje"):
+        importer.import_file(path, deck_id=7, user_id=2)
+    deck_service.get_deck.assert_called_once_with(7, 2)
+    card_service.import_flashcards.assert_not_called()
+
+
+def test_batch_size_must_be_positive(card_service, deck_service):
+    with pytest.raises(ValueError):
+        FlashcardImporter(card_service, deck_service, batch_size=0)
@@ -0,0 +1,52 @@
+import pytest
+
+from src.CardManagement.application.services.text_chunking import split_into_chunks
+
+
+def test_short_text_is_a_single_chunk():
+    assert split_into_chunks("  Krótki tekst.  ", max_chars=100) == ["Krótki tekst."]
+
+
+def test_blank_text_has_no_chunks():
+    assert split_into_chunks(" \n\n ", max_chars=100) == []
+
+
+def test_paragraphs_are_packed_without_splitting():
+    paragraphs = [f"Akapit {i} " + "a" * 30 for i in range(10)]
+
+    chunks = split_into_chunks("\n\n".join(paragraphs), max_chars=100)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert [p for chunk in chunks for p in chunk.split("\n\n")] == paragraphs
+
+
+def test_heading_starts_a_new_chunk_when_current_is_half_full():
+    text = "Wstęp " + "a" * 110 + "\n# Rozdział 2\nTreść rozdziału\n\n" + "b" * 150
+
+    chunks = split_into_chunks(text, max_chars=200)
+
+    assert chunks == ["Wstęp " + "a" * 110, "# Rozdział 2\nTreść rozdziału\n\n" + "b" * 150]
+
+
+def test_chunks_overlap_at_paragraph_boundaries():
+    paragraphs = ["Pierwszy " + "a" * 50, "Drugi " + "b" * 15, "Trzeci " + "c" * 50]
+
+    chunks = split_into_chunks("\n\n".join(paragraphs), max_chars=100, overlap=25)
+
+    assert chunks == [paragraphs[0] + "\n\n" + paragraphs[1], paragraphs[1] + "\n\n" + paragraphs[2]]
+
+
+def test_long_paragraph_is_split_at_sentences_and_words():
+    sentence = "To jest zdanie testowe numer jeden."
+    text = " ".join([sentence] * 10) + " " + "słowo " * 40
+
+    chunks = split_into_chunks(text, max_chars=80)
+
+    assert all(len(chunk) <= 80 for chunk in chunks)
+    assert chunks[0] == f"{sentence} {sentence}"
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_rejects_non_positive_chunk_size():
+    with pytest.raises(ValueError):
+        split_into_chunks("tekst", max_chars=0)
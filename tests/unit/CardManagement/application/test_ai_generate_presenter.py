@@ -0,0 +1,175 @@
+"""Unit tests for AIGeneratePresenter."""
+
+import pytest
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+from CardManagement.application.presenters.ai_generate_presenter import AIGeneratePresenter
+from CardManagement.infrastructure.api_clients.openrouter.exceptions import AIAPIAuthError, OpenRouterError
+from CardManagement.infrastructure.api_clients.openrouter.retry import RetryAttempt
+from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
+
+
+@pytest.fixture
+def mock_view():
+    """Create a mock view implementing IAIGenerateView."""
+    view = Mock()
+    view.get_input_text = Mock(return_value="Tekst źródłowy")
+    view.get_selected_model = Mock(return_value="test-model")
+    # Callbacks the presenter schedules on the UI thread; run them with run_scheduled()
+    view.scheduled = []
+    view.schedule = Mock(side_effect=lambda delay_ms, callback: view.scheduled.append(callback))
+    return view
+
+
+def run_scheduled(view):
+    """Run the callbacks the presenter scheduled on the UI thread."""
+    while view.scheduled:
+        view.scheduled.pop(0)()
+
+
+@pytest.fixture
+def generation():
+    """Capture the callbacks passed to AIService.start_flashcard_generation and the future it returns."""
+    return {"future": Future()}
+
+
+@pytest.fixture
+def mock_ai_service(generation):
+    """Create a mock AIService recording the generation callbacks."""
+
+    def start_flashcard_generation(raw_text, deck_id, on_flashcard, model=None, on_retry=None):
+        generation["on_flashcard"] = on_flashcard
+        generation["on_retry"] = on_retry
+        return generation["future"]
+
+    service = Mock()
+    service.start_flashcard_generation = Mock(side_effect=start_flashcard_generation)
+    return service
+
+
+@pytest.fixture
+def mock_navigation():
+    """Create a mock navigation controller."""
+    return Mock()
+
+
+@pytest.fixture
+def presenter(mock_view, mock_ai_service, mock_navigation):
+    """Create an AIGeneratePresenter with mock dependencies."""
+    return AIGeneratePresenter(
+        view=mock_view,
+        ai_service=mock_ai_service,
+        card_service=Mock(),
+        user_profile_service=Mock(),
+        session_service=Mock(),
+        navigation=mock_navigation,
+        deck_id=1,
+        deck_name="Test Deck",
+        available_llm_models=["test-model"],
+    )
+
+
+def flashcard(front="Przód"):
+    """A generated flashcard for deck 1."""
+    return FlashcardDTO(front=front, back="Tył", deck_id=1)
+
+
+def test_first_flashcard_opens_review_on_ui_thread(presenter, mock_view, mock_navigation, generation):
+    """Test that the review screen is opened from a callback scheduled on the UI thread."""
+    presenter.handle_generate()
+
+    generation["on_flashcard"](flashcard())
+    mock_navigation.navigate.assert_not_called()
+
+    run_scheduled(mock_view)
+    mock_navigation.navigate.assert_called_once()
+    assert mock_navigation.navigate.call_args.kwargs["generated_flashcards_dtos"][0].front == "Przód"
+
+
+def test_later_flashcards_do_not_schedule_navigation(presenter, mock_view, mock_navigation, generation):
+    """Test that only the first flashcard opens the review screen."""
+    presenter.handle_generate()
+
+    generation["on_flashcard"](flashcard("1"))
+    generation["on_flashcard"](flashcard("2"))
+    run_scheduled(mock_view)
+
+    mock_navigation.navigate.assert_called_once()
+    assert len(mock_navigation.navigate.call_args.kwargs["generated_flashcards_dtos"]) == 2
+
+
+def test_retry_is_shown_on_ui_thread(presenter, mock_view, generation):
+    """Test that the retry notice updates the progress label from a callback scheduled on the UI thread."""
+    presenter.handle_generate()
+    mock_view.update_progress_label.reset_mock()
+
+    retry = RetryAttempt(attempt=1, max_attempts=3, delay=2.0, total_wait=2.0, error=OpenRouterError("timeout"))
+    generation["on_retry"](retry)
+    mock_view.update_progress_label.assert_not_called()
+
+    run_scheduled(mock_view)
+    mock_view.update_progress_label.assert_called_once()
+    assert "Próba 1/3" in mock_view.update_progress_label.call_args.args[0]
+
+
+def test_retry_is_not_shown_after_cancellation(presenter, mock_view, generation):
+    """Test that a retry reported before the cancellation is not shown once it has been requested."""
+    presenter.handle_generate()
+
+    retry = RetryAttempt(attempt=1, max_attempts=3, delay=2.0, total_wait=2.0, error=OpenRouterError("timeout"))
+    generation["on_retry"](retry)
+    presenter.handle_cancel_generation()
+    mock_view.update_progress_label.reset_mock()
+
+    run_scheduled(mock_view)
+    assert not any("Próba" in c.args[0] for c in mock_view.update_progress_label.call_args_list)
+
+
+def test_generation_error_is_shown_on_ui_thread(presenter, mock_view, generation):
+    """Test that a failed generation resets the view from a callback scheduled on the UI thread."""
+    presenter.handle_generate()
+    mock_view.show_generating_state.reset_mock()
+
+    generation["future"].set_exception(AIAPIAuthError("401"))
+    mock_view.show_toast.assert_not_called()
+    mock_view.show_generating_state.assert_not_called()
+
+    run_scheduled(mock_view)
+    mock_view.show_generating_state.assert_called_once_with(False)
+    mock_view.show_toast.assert_called_once_with("Błąd", "Sprawdź swój klucz API w ustawieniach profilu")
+
+
+def test_cancelled_generation_is_reported_on_ui_thread(presenter, mock_view, generation):
+    """Test that a cancelled generation is reported from a callback scheduled on the UI thread."""
+    presenter.handle_generate()
+
+    presenter.handle_cancel_generation()
+    mock_view.show_toast.assert_not_called()
+
+    run_scheduled(mock_view)
+    mock_view.show_toast.assert_called_once_with("Informacja", "Generowanie fiszek zostało anulowane")
+
+
+def test_generation_without_flashcards_is_reported_as_error(presenter, mock_view, generation):
+    """Test that a generation finishing without any flashcard is reported as an error."""
+    presenter.handle_generate()
+
+    generation["future"].set_result(0)
+    run_scheduled(mock_view)
+
+    mock_view.show_toast.assert_called_once_with("Błąd", "Nie udało się wygenerować żadnych fiszek")
+
+
+def test_finished_generation_leaves_review_screen_alone(presenter, mock_view, mock_navigation, generation):
+    """Test that a generation finishing after the review screen opened does not reset the view."""
+    presenter.handle_generate()
+    mock_view.show_generating_state.reset_mock()
+
+    generation["on_flashcard"](flashcard())
+    generation["future"].set_result(1)
+    run_scheduled(mock_view)
+
+    mock_navigation.navigate.assert_called_once()
+    mock_view.show_generating_state.assert_not_called()
+    mock_view.show_toast.assert_not_called()
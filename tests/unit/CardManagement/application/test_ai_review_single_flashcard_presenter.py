@@ -0,0 +1,97 @@
+from unittest.mock import Mock
+
+import pytest
+
+from CardManagement.application.card_service import CreateFlashcardDTO
+from CardManagement.application.presenters.ai_review_single_flashcard_presenter import (
+    AIReviewSingleFlashcardPresenter,
+)
+from CardManagement.application.services.generated_flashcards import GeneratedFlashcards
+from CardManagement.infrastructure.api_clients.openrouter.types import FlashcardDTO
+
+
+@pytest.fixture
+def mock_view():
+    view = Mock()
+    view.get_front_text.return_value = "Pytanie 1"
+    view.get_back_text.return_value = "Odpowiedź 1"
+    return view
+
+
+@pytest.fixture
+def mock_card_service():
+    return Mock()
+
+
+@pytest.fixture
+def mock_navigation():
+    return Mock()
+
+
+def _dto(index):
+    return FlashcardDTO(front=f"Pytanie {index}", back=f"Odpowiedź {index}", deck_id=1, metadata={"model": "m"})
+
+
+def _presenter(view, card_service, navigation, flashcards, index=0):
+    return AIReviewSingleFlashcardPresenter(
+        view=view,
+        ai_service=Mock(),
+        card_service=card_service,
+        navigation=navigation,
+        deck_id=1,
+        deck_name="Talia",
+        generated_flashcards_dtos=flashcards,
+        current_flashcard_index=index,
+        available_llm_models=[],
+        original_source_text="tekst",
+    )
+
+
+class TestAcceptAll:
+    def test_saves_current_and_remaining_in_one_call(self, mock_view, mock_card_service, mock_navigation):
+        mock_view.get_front_text.return_value = "Pytanie 1 (poprawione)"
+        mock_card_service.create_flashcards_bulk.return_value = [Mock(), Mock(), Mock()]
+        presenter = _presenter(mock_view, mock_card_service, mock_navigation, [_dto(0), _dto(1), _dto(2), _dto(3)], 1)
+
+        presenter.accept_all()
+
+        mock_card_service.create_flashcards_bulk.assert_called_once_with(
+            1,
+            [
+                CreateFlashcardDTO("Pytanie 1 (poprawione)", "Odpowiedź 1", "ai-edited", "m"),
+                CreateFlashcardDTO("Pytanie 2", "Odpowiedź 2", "ai-generated", "m"),
+                CreateFlashcardDTO("Pytanie 3", "Odpowiedź 3", "ai-generated", "m"),
+            ],
+        )
+        mock_card_service.create_flashcard.assert_not_called()
+        mock_view.show_toast.assert_any_call("Sukces", "Zapisano 3 fiszek")
+        mock_navigation.navigate.assert_called_once_with("/decks/1/cards")
+
+    def test_validation_error_keeps_review_open(self, mock_view, mock_card_service, mock_navigation):
+        mock_card_service.create_flashcards_bulk.side_effect = ValueError("Fiszka 2: za długi tekst")
+        presenter = _presenter(mock_view, mock_card_service, mock_navigation, [_dto(1), _dto(2)])
+
+        presenter.accept_all()
+
+        mock_view.show_toast.assert_called_once_with("Błąd", "Fiszka 2: za długi tekst")
+        mock_navigation.navigate.assert_not_called()
+        mock_view.show_saving.assert_called_with(False)
+
+    def test_waits_for_generation_to_finish(self, mock_view, mock_card_service, mock_navigation):
+        flashcards = GeneratedFlashcards()
+        flashcards.append(_dto(1))
+        scheduled = []
+        mock_view.schedule.side_effect = lambda delay_ms, callback: scheduled.append(callback)
+        mock_card_service.create_flashcards_bulk.return_value = [Mock(), Mock()]
+        presenter = _presenter(mock_view, mock_card_service, mock_navigation, flashcards)
+
+        presenter.accept_all()
+        mock_card_service.create_flashcards_bulk.assert_not_called()
+
+        flashcards.append(_dto(2))
+        flashcards.finish()
+        scheduled.pop()()
+
+        saved = mock_card_service.create_flashcards_bulk.call_args[0][1]
+        assert [dto.front_text for dto in saved] == ["Pytanie 1", "Pytanie 2"]
+        mock_navigation.navigate.assert_called_once_with("/decks/1/cards")
@@ -5,6 +5,8 @@ from unittest.mock import Mock, call
 from datetime import datetime
 
 from CardManagement.application.presenters.card_list_presenter import CardListPresenter, FlashcardViewModel
+from CardManagement.domain.models.FlashcardPage import FlashcardPage
+from CardManagement.application.services.flashcard_importer import ImportProgress, ImportResult, ImportRowError
 
 
 @pytest.fixture
@@ -16,14 +18,41 @@ def mock_view():
     view.show_error = Mock()
     view.show_toast = Mock()
     view.clear_card_selection = Mock()
+    view.append_cards = Mock()
+    # Callbacks the presenter schedules on the UI thread; run them with finish_loading()
+    view.scheduled = []
+    view.schedule = Mock(side_effect=lambda delay_ms, callback: view.scheduled.append(callback))
     return view
 
 
+def finish_loading(presenter, view):
+    """Wait for the background load and run the callbacks it scheduled on the UI thread.
+
+    Delivering a page starts the thread fetching the next one, so this repeats until no callbacks are left.
+    """
+    while True:
+        presenter._load_thread.join(timeout=5)
+        if not view.scheduled:
+            return
+        while view.scheduled:
+            view.scheduled.pop(0)()
+
+
+def deck_page(cards, next_cursor=None):
+    """A page of the deck returned by CardService.list_page."""
+    return FlashcardPage(items=cards, next_cursor=next_cursor)
+
+
+def first_page_call(sort_key="created_at", descending=False):
+    """The CardService.list_page call fetching the first page of deck 1."""
+    return call(1, sort_key, after_cursor=None, limit=CardListPresenter.LOAD_PAGE_SIZE, descending=descending)
+
+
 @pytest.fixture
 def mock_card_service():
     """Create a mock CardService."""
     service = Mock()
-    service.list_by_deck_id = Mock()
+    service.list_page = Mock()
     service.delete_flashcard = Mock()
     return service
 
@@ -91,14 +120,15 @@ def test_load_cards_success(presenter, mock_view, mock_card_service, flashcard_f
     """Test loading cards successfully."""
     # Arrange
     mock_cards = [flashcard_factory(1, "Front 1", "Back 1"), flashcard_factory(2, "Front 2", "Back 2")]
-    mock_card_service.list_by_deck_id.return_value = mock_cards
+    mock_card_service.list_page.return_value = deck_page(mock_cards)
 
     # Act
     presenter.load_cards()
+    finish_loading(presenter, mock_view)
 
     # Assert
     mock_view.show_loading.assert_has_calls([call(True), call(False)])
-    mock_card_service.list_by_deck_id.assert_called_once_with(1)
+    assert mock_card_service.list_page.call_args_list == [first_page_call()]
     mock_view.display_cards.assert_called_once()
     displayed_cards = mock_view.display_cards.call_args[0][0]
     assert len(displayed_cards) == 2
@@ -124,10 +154,11 @@ def test_load_cards_not_authenticated(presenter, mock_view, mock_session_service
 def test_load_cards_error(presenter, mock_view, mock_card_service):
     """Test loading cards with error."""
     # Arrange
-    mock_card_service.list_by_deck_id.side_effect = Exception("Test error")
+    mock_card_service.list_page.side_effect = Exception("Test error")
 
     # Act
     presenter.load_cards()
+    finish_loading(presenter, mock_view)
 
     # Assert
     mock_view.show_loading.assert_has_calls([call(True), call(False)])
@@ -135,6 +166,134 @@ def test_load_cards_error(presenter, mock_view, mock_card_service):
     assert "Test error" in mock_view.show_error.call_args[0][0]
 
 
+def test_search_cards_in_current_deck(presenter, mock_view, mock_card_service, flashcard_factory):
+    """Test searching the current deck."""
+    # Arrange
+    mock_card_service.search_flashcards.return_value = [flashcard_factory(2, "Front 2", "Back 2")]
+
+    # Act
+    presenter.search_cards("  front  ")
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    mock_card_service.search_flashcards.assert_called_once_with(
+        1, "front", deck_id=1, limit=CardListPresenter.SEARCH_RESULTS_LIMIT
+    )
+    mock_card_service.list_page.assert_not_called()
+    assert [card.id for card in mock_view.display_cards.call_args[0][0]] == [2]
+
+
+def test_search_cards_in_all_decks_edits_card_in_its_own_deck(
+    presenter, mock_view, mock_card_service, mock_navigation, flashcard_factory
+):
+    """Test that a card found in another deck is edited in that deck."""
+    # Arrange
+    other_deck_card = flashcard_factory(7, "Front", "Back")
+    other_deck_card.deck_id = 3
+    mock_card_service.search_flashcards.return_value = [other_deck_card]
+
+    # Act
+    presenter.search_cards("front", all_decks=True)
+    finish_loading(presenter, mock_view)
+    presenter.edit_flashcard(7)
+
+    # Assert
+    assert mock_card_service.search_flashcards.call_args.kwargs["deck_id"] is None
+    mock_navigation.navigate.assert_called_once_with("/decks/3/cards/7/edit")
+
+
+def test_search_cards_empty_query_lists_deck(presenter, mock_view, mock_card_service):
+    """Test that clearing the search shows the whole deck again."""
+    # Arrange
+    mock_card_service.list_page.return_value = deck_page([])
+    presenter.search_cards("front")
+    finish_loading(presenter, mock_view)
+
+    # Act
+    presenter.search_cards("   ")
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    mock_card_service.search_flashcards.assert_called_once()
+    assert mock_card_service.list_page.call_args_list == [first_page_call()]
+
+
+def test_load_cards_delivers_the_deck_page_by_page(presenter, mock_view, mock_card_service, flashcard_factory):
+    """Test that the next page is fetched after the previous one reached the view."""
+    # Arrange
+    presenter.LOAD_PAGE_SIZE = 2
+    mock_card_service.list_page.side_effect = [
+        deck_page([flashcard_factory(1, "F", "B"), flashcard_factory(2, "F", "B")], next_cursor="c1"),
+        deck_page([flashcard_factory(3, "F", "B"), flashcard_factory(4, "F", "B")], next_cursor="c2"),
+        deck_page([flashcard_factory(5, "F", "B")]),
+    ]
+
+    # Act
+    presenter.load_cards()
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    assert [c.kwargs["after_cursor"] for c in mock_card_service.list_page.call_args_list] == [None, "c1", "c2"]
+    assert [card.id for card in mock_view.display_cards.call_args[0][0]] == [1, 2]
+    assert [[card.id for card in c.args[0]] for c in mock_view.append_cards.call_args_list] == [[3, 4], [5]]
+    assert mock_view.show_loading.call_args_list == [call(True), call(False)]
+
+
+def test_sort_cards_reloads_and_toggles_direction(presenter, mock_view, mock_card_service):
+    """Test that choosing a column sorts by it, and choosing it again reverses the order."""
+    # Arrange
+    mock_card_service.list_page.return_value = deck_page([])
+
+    # Act
+    presenter.sort_cards("front_text")
+    finish_loading(presenter, mock_view)
+    presenter.sort_cards("front_text")
+    finish_loading(presenter, mock_view)
+    presenter.sort_cards("source")
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    assert mock_card_service.list_page.call_args_list == [
+        first_page_call("front_text"),
+        first_page_call("front_text", descending=True),
+        first_page_call("source"),
+    ]
+
+
+def test_load_cards_drops_stale_results(presenter, mock_view, mock_card_service, flashcard_factory):
+    """Test that a reload supersedes a load still in progress."""
+    # Arrange
+    mock_card_service.list_page.side_effect = [
+        deck_page([flashcard_factory(1, "Old", "Old")]),
+        deck_page([flashcard_factory(2, "New", "New")]),
+    ]
+    presenter.load_cards()
+    presenter._load_thread.join(timeout=5)
+
+    # Act
+    presenter.load_cards()
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    mock_view.display_cards.assert_called_once()
+    assert [card.id for card in mock_view.display_cards.call_args[0][0]] == [2]
+
+
+def test_cancel_loading_discards_results(presenter, mock_view, mock_card_service, flashcard_factory):
+    """Test that hiding the view cancels the load in progress."""
+    # Arrange
+    mock_card_service.list_page.return_value = deck_page([flashcard_factory(1, "Front", "Back")])
+    presenter.load_cards()
+
+    # Act
+    presenter.cancel_loading()
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    mock_view.display_cards.assert_not_called()
+    mock_view.show_loading.assert_has_calls([call(True), call(False)])
+
+
 def test_add_flashcard(presenter, mock_navigation):
     """Test navigating to add flashcard view."""
     # Act
@@ -288,3 +447,69 @@ def test_handle_deck_deletion_cancelled(presenter):
 
     # Assert
     assert not presenter.dialog_open
+
+
+def finish_import(presenter, view):
+    """Wait for the background import and run the callbacks it scheduled on the UI thread."""
+    presenter._import_thread.join(timeout=5)
+    while view.scheduled:
+        view.scheduled.pop(0)()
+
+
+def test_import_cards_reports_progress_and_result(presenter, mock_view, mock_card_service):
+    """Test a successful import running on a worker thread."""
+    # Arrange
+    presenter.importer = Mock()
+
+    def import_file(path, deck_id, user_id, on_progress):
+        on_progress(ImportProgress(rows_read=3, imported=2, failed=1, bytes_read=50, total_bytes=100))
+        return ImportResult(imported=2, failed=1, errors=[ImportRowError(line=3, message="Za długi tekst")])
+
+    presenter.importer.import_file.side_effect = import_file
+    mock_card_service.list_page.return_value = deck_page([])
+
+    # Act
+    presenter.import_cards("/tmp/talia.csv")
+    finish_import(presenter, mock_view)
+    finish_loading(presenter, mock_view)
+
+    # Assert
+    presenter.importer.import_file.assert_called_once()
+    assert presenter.importer.import_file.call_args[0] == ("/tmp/talia.csv", 1, 1)
+    assert mock_view.show_import_progress.call_args_list == [call(0.0), call(0.5), call(None)]
+    mock_view.show_toast.assert_called_once_with(
+        "Import", "Zaimportowano fiszek: 2. Pominięto wierszy: 1 (pierwszy w wierszu 3: Za długi tekst)."
+    )
+    assert mock_card_service.list_page.call_args_list == [first_page_call()]
+    assert presenter._import_thread is None
+
+
+def test_import_cards_failure(presenter, mock_view, mock_card_service):
+    """Test an import whose file cannot be read."""
+    # Arrange
+    presenter.importer = Mock()
+    presenter.importer.import_file.side_effect = ValueError("Nieobsługiwany format pliku")
+    mock_card_service.list_page.return_value = deck_page([])
+
+    # Act
+    presenter.import_cards("/tmp/talia.xlsx")
+    finish_import(presenter, mock_view)
+
+    # Assert
+    mock_view.show_error.assert_called_once_with("Nie udało się zaimportować fiszek: Nieobsługiwany format pliku")
+    mock_view.show_import_progress.assert_called_with(None)
+    assert presenter._import_thread is None
+
+
+def test_import_cards_not_authenticated(presenter, mock_view, mock_session_service, mock_navigation):
+    """Test that importing requires a logged-in user."""
+    # Arrange
+    presenter.importer = Mock()
+    mock_session_service.get_current_user.return_value = None
+
+    # Act
+    presenter.import_cards("/tmp/talia.csv")
+
+    # Assert
+    presenter.importer.import_file.assert_not_called()
+    mock_navigation.navigate.assert_called_once_with("/profiles")
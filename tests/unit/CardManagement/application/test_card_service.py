@@ -1,8 +1,10 @@
+import json
 import pytest
 from datetime import datetime
 
-from CardManagement.application.card_service import CardService
+from CardManagement.application.card_service import CardService, CreateFlashcardDTO
 from CardManagement.domain.models.Flashcard import Flashcard
+from CardManagement.domain.models.FlashcardPage import FlashcardPage
 
 
 @pytest.fixture
@@ -58,6 +60,8 @@ class TestCreateFlashcard:
         assert created_flashcard.back_text == back_text
         assert created_flashcard.source == "manual"
         assert created_flashcard.ai_model_name is None
+        # Nowa fiszka dostaje stan FSRS od razu, więc pierwsza sesja nauki niczego nie zapisuje
+        assert json.loads(created_flashcard.fsrs_state)["state"] == 1
 
     def test_create_flashcard_with_ai_source(self, card_service, flashcard_repository_mock, sample_flashcard):
         # Arrange
@@ -225,6 +229,51 @@ class TestListByDeckId:
         with pytest.raises(Exception):
             card_service.list_by_deck_id(10)
 
+    def test_list_page_delegates_to_repository(self, card_service, flashcard_repository_mock, sample_flashcard):
+        # Arrange
+        page = FlashcardPage(items=[sample_flashcard], next_cursor='["front_text", "a", 1]')
+        flashcard_repository_mock.list_page.return_value = page
+
+        # Act
+        result = card_service.list_page(10, "front_text", after_cursor=None, limit=50, descending=True)
+
+        # Assert
+        assert result == page
+        flashcard_repository_mock.list_page.assert_called_once_with(
+            10, "front_text", after_cursor=None, limit=50, descending=True
+        )
+
+    def test_list_page_invalid_sort_key(self, card_service, flashcard_repository_mock):
+        # Arrange
+        flashcard_repository_mock.list_page.side_effect = ValueError("Unknown flashcard sort key: 'x'")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            card_service.list_page(10, "x")
+
+
+class TestSearchFlashcards:
+    """Testy dla metody search_flashcards."""
+
+    def test_search_flashcards_delegates_to_repository(self, card_service, flashcard_repository_mock, sample_flashcard):
+        # Arrange
+        flashcard_repository_mock.search.return_value = [sample_flashcard]
+
+        # Act
+        result = card_service.search_flashcards(1, "stolica", deck_id=10, limit=20)
+
+        # Assert
+        assert result == [sample_flashcard]
+        flashcard_repository_mock.search.assert_called_once_with(1, "stolica", deck_id=10, limit=20, offset=0)
+
+    def test_search_flashcards_repository_error(self, card_service, flashcard_repository_mock):
+        # Arrange
+        flashcard_repository_mock.search.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with pytest.raises(Exception):
+            card_service.search_flashcards(1, "stolica")
+
 
 class TestDeleteFlashcard:
     """Testy dla metody delete_flashcard."""
@@ -297,3 +346,69 @@ class TestGetFlashcard:
         # Act & Assert
         with pytest.raises(Exception):
             card_service.get_flashcard(1)
+
+
+class TestCreateFlashcardsBulk:
+    """Testy dla metody create_flashcards_bulk."""
+
+    def test_create_flashcards_bulk_success(self, card_service, flashcard_repository_mock, sample_flashcard):
+        # Arrange
+        flashcard_repository_mock.add_many.return_value = [sample_flashcard, sample_flashcard]
+        dtos = [
+            CreateFlashcardDTO("  Pytanie 1 ", "Odpowiedź 1", source="ai-generated", ai_model_name="model"),
+            CreateFlashcardDTO("Pytanie 2", "Odpowiedź 2", source="ai-edited", ai_model_name="model"),
+        ]
+
+        # Act
+        result = card_service.create_flashcards_bulk(10, dtos)
+
+        # Assert
+        assert result == [sample_flashcard, sample_flashcard]
+        flashcard_repository_mock.add_many.assert_called_once()
+        created = flashcard_repository_mock.add_many.call_args[0][0]
+        assert [(c.deck_id, c.front_text, c.source) for c in created] == [
+            (10, "Pytanie 1", "ai-generated"),
+            (10, "Pytanie 2", "ai-edited"),
+        ]
+        card_ids = [json.loads(c.fsrs_state)["card_id"] for c in created]
+        assert len(set(card_ids)) == 2
+        flashcard_repository_mock.add.assert_not_called()
+
+    def test_create_flashcards_bulk_validates_all_before_saving(self, card_service, flashcard_repository_mock):
+        # Arrange
+        dtos = [CreateFlashcardDTO("Pytanie", "Odpowiedź"), CreateFlashcardDTO("A" * 201, "Odpowiedź")]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Fiszka 2: .*200 znaków"):
+            card_service.create_flashcards_bulk(10, dtos)
+        flashcard_repository_mock.add_many.assert_not_called()
+
+
+class TestImportFlashcards:
+    """Testy dla metody import_flashcards."""
+
+    def test_import_flashcards_inserts_without_reading_back(self, card_service, flashcard_repository_mock):
+        # Arrange
+        flashcard_repository_mock.insert_many.return_value = 2
+        dtos = [CreateFlashcardDTO(" Pytanie 1 ", "Odpowiedź 1"), CreateFlashcardDTO("Pytanie 2", "Odpowiedź 2")]
+
+        # Act
+        result = card_service.import_flashcards(10, dtos)
+
+        # Assert
+        assert result == 2
+        created = flashcard_repository_mock.insert_many.call_args[0][0]
+        assert [(c.deck_id, c.front_text, c.source) for c in created] == [
+            (10, "Pytanie 1", "manual"),
+            (10, "Pytanie 2", "manual"),
+        ]
+        states = [json.loads(c.fsrs_state) for c in created]
+        assert len({state["card_id"] for state in states}) == 2
+        assert states[0]["due"] == states[1]["due"]
+        flashcard_repository_mock.add_many.assert_not_called()
+
+    def test_import_flashcards_validates_all_before_saving(self, card_service, flashcard_repository_mock):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Fiszka 1: .*500 znaków"):
+            card_service.import_flashcards(10, [CreateFlashcardDTO("Pytanie", "B" * 501)])
+        flashcard_repository_mock.insert_many.assert_not_called()
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import litellm
+import pytest
+
+from src.CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
+from src.CardManagement.infrastructure.api_clients.openrouter.exceptions import FlashcardGenerationError
+from src.Shared.infrastructure.async_loop import AsyncLoopThread
+
+ACOMPLETION = "src.CardManagement.infrastructure.api_clients.openrouter.async_client.litellm.acompletion"
+
+
+@pytest.fixture
+def event_loop_thread():
+    loop_thread = AsyncLoopThread()
+    loop_thread.start()
+    yield loop_thread
+    loop_thread.stop()
+
+
+@pytest.fixture
+def client(event_loop_thread):
+    return AsyncOpenRouterAPIClient(logger=Mock(), event_loop=event_loop_thread, default_model="openai/gpt-4o-mini")
+
+
+def delta(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class FakeStream:
+    """Async litellm stream yielding the given text deltas, optionally blocking after them."""
+
+    def __init__(self, deltas, block=False):
+        self._deltas = list(deltas)
+        self._block = block
+        self.blocked = threading.Event()
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._deltas:
+            return delta(self._deltas.pop(0))
+        if self._block:
+            self.blocked.set()
+            await asyncio.sleep(60)
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_averify_key_valid(client):
+    response = SimpleNamespace(model="m")
+    with patch(ACOMPLETION, new=AsyncMock(return_value=response)):
+        assert client.submit(client.averify_key("sk-or-valid")).result(timeout=2) == (True, "API key valid")
+
+
+def test_averify_key_invalid_format_makes_no_request(client):
+    with patch(ACOMPLETION, new=AsyncMock()) as acompletion:
+        is_valid, _ = client.submit(client.averify_key("invalid")).result(timeout=2)
+
+    assert not is_valid
+    acompletion.assert_not_called()
+
+
+def test_averify_key_authentication_error(client):
+    error = litellm.exceptions.AuthenticationError("bad key", llm_provider="openrouter", model="m")
+    with patch(ACOMPLETION, new=AsyncMock(side_effect=error)):
+        assert client.submit(client.averify_key("sk-or-bad")).result(timeout=2) == (False, "Nieprawidłowy klucz API")
+
+
+def completion_response(content):
+    message = SimpleNamespace(content=content, role="assistant")
+    usage = SimpleNamespace(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+    return SimpleNamespace(model="m", choices=[SimpleNamespace(message=message, index=0)], usage=usage)
+
+
+def test_agenerate_flashcards_parses_response(client):
+    content = json.dumps({"flashcards": [{"front": "P1", "back": "O1", "tags": ["t"]}]})
+    with patch(ACOMPLETION, new=AsyncMock(return_value=completion_response(content))):
+        cards = client.submit(client.agenerate_flashcards("sk-or-key", "Tekst", 3)).result(timeout=2)
+
+    assert [(card.front, card.back, card.deck_id, card.tags) for card in cards] == [("P1", "O1", 3, ["t"])]
+
+
+def test_agenerate_flashcards_invalid_response(client):
+    with patch(ACOMPLETION, new=AsyncMock(return_value=completion_response("not json"))):
+        future = client.submit(client.agenerate_flashcards("sk-or-key", "Tekst", 3))
+        with pytest.raises(FlashcardGenerationError):
+            future.result(timeout=2)
+
+
+def test_astream_flashcards_yields_parsed_flashcards(client):
+    text = json.dumps({"flashcards": [{"front": "P1", "back": "O1"}, {"front": "P2", "back": "O2"}]})
+    stream = FakeStream([text[:20], text[20:45], text[45:]])
+
+    async def collect():
+        return [card async for card in client.astream_flashcards("sk-or-key", "Tekst", 5)]
+
+    with patch(ACOMPLETION, new=AsyncMock(return_value=stream)) as acompletion:
+        cards = client.submit(collect()).result(timeout=2)
+
+    assert [(card.front, card.back, card.deck_id) for card in cards] == [("P1", "O1", 5), ("P2", "O2", 5)]
+    assert acompletion.call_args.kwargs["stream"] is True
+    assert stream.closed
+
+
+def test_cancelling_stream_closes_it(client):
+    stream = FakeStream(['{"flashcards": [{"front": "P1", "back": "O1"}'], block=True)
+    received = []
+
+    async def collect():
+        async for card in client.astream_flashcards("sk-or-key", "Tekst", 5):
+            received.append(card)
+
+    with patch(ACOMPLETION, new=AsyncMock(return_value=stream)):
+        future = client.submit(collect())
+        assert stream.blocked.wait(2)
+        future.cancel()
+        client.submit(asyncio.sleep(0.05)).result(timeout=2)
+
+    assert [card.front for card in received] == ["P1"]
+    assert stream.closed
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.CardManagement.infrastructure.api_clients.openrouter import cache as cache_module
+from src.CardManagement.infrastructure.api_clients.openrouter.cache import FlashcardCache, normalize_source_text
+from src.CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
+from src.CardManagement.infrastructure.api_clients.openrouter.types import ChatCompletionDTO, FlashcardDTO
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def cache(clock):
+    flashcard_cache = FlashcardCache(":memory:", ttl_seconds=3600, max_bytes=10_000)
+    yield flashcard_cache
+    flashcard_cache.close()
+
+
+def cards(*fronts, deck_id=1):
+    return [FlashcardDTO(front=front, back="Odpowiedź", deck_id=deck_id, tags=["t"]) for front in fronts]
+
+
+def test_normalize_source_text_ignores_whitespace_and_line_endings():
+    assert normalize_source_text("  Ala\tma   kota \r\n\r\n\r\n\r\nKot  ma Alę\n") == "Ala ma kota\n\nKot ma Alę"
+
+
+def test_make_key_depends_on_every_part_of_the_request():
+    key = FlashcardCache.make_key("model", 0.3, "prompt", "Tekst  źródłowy")
+
+    assert key == FlashcardCache.make_key("model", 0.3, "prompt", "Tekst źródłowy\r\n")
+    assert key != FlashcardCache.make_key("other", 0.3, "prompt", "Tekst źródłowy")
+    assert key != FlashcardCache.make_key("model", 0.7, "prompt", "Tekst źródłowy")
+    assert key != FlashcardCache.make_key("model", 0.3, "prompt v2", "Tekst źródłowy")
+    assert key != FlashcardCache.make_key("model", 0.3, "prompt", "Inny tekst")
+
+
+def test_get_returns_stored_flashcards_bound_to_requested_deck(cache):
+    cache.put("key", cards("P1", "P2", deck_id=1))
+
+    result = cache.get("key", deck_id=7)
+
+    assert result == cards("P1", "P2", deck_id=7)
+    assert cache.get("missing", deck_id=7) is None
+
+
+def test_get_drops_expired_entry(cache, clock):
+    cache.put("key", cards("P1"))
+    clock[0] += 3601
+
+    assert cache.get("key", deck_id=1) is None
+
+
+def test_put_evicts_least_recently_used_entries_over_size_limit(clock):
+    entry_size = len(json.dumps([{"front": "P0", "back": "Odpowiedź", "tags": ["t"], "metadata": None}]).encode())
+    cache = FlashcardCache(":memory:", ttl_seconds=3600, max_bytes=entry_size * 2 + 5)
+    cache.put("a", cards("P0"))
+    clock[0] += 1
+    cache.put("b", cards("P1"))
+    clock[0] += 1
+    cache.get("a", deck_id=1)  # "b" is now the least recently used
+    clock[0] += 1
+
+    cache.put("c", cards("P2"))
+
+    assert cache.get("a", deck_id=1) is not None
+    assert cache.get("b", deck_id=1) is None
+    assert cache.get("c", deck_id=1) is not None
+    cache.close()
+
+
+class TestClientCache:
+    @pytest.fixture
+    def client(self, cache):
+        return AsyncOpenRouterAPIClient(
+            logger=Mock(), event_loop=Mock(), default_model="openai/gpt-4o-mini", cache=cache
+        )
+
+    @pytest.fixture
+    def response(self):
+        content = json.dumps({"flashcards": [{"front": "P1", "back": "O1"}, {"front": "P2", "back": "O2"}]})
+        return ChatCompletionDTO(model="m", choices=[{"content": content}], usage={}, raw_response={})
+
+    @staticmethod
+    def generate(client, *args, **kwargs):
+        return asyncio.run(client.agenerate_flashcards("sk-or-key", *args, **kwargs))
+
+    def test_agenerate_flashcards_returns_cached_result_for_same_text(self, client, response):
+        with patch.object(client, "achat_completion", new=AsyncMock(return_value=response)) as chat_completion:
+            first = self.generate(client, "Tekst źródłowy", 1)
+            second = self.generate(client, "  Tekst   źródłowy ", 2)
+
+        assert chat_completion.call_count == 1
+        assert [card.front for card in second] == [card.front for card in first] == ["P1", "P2"]
+        assert all(card.deck_id == 2 for card in second)
+
+    def test_agenerate_flashcards_without_cache_calls_api_and_refreshes_entry(self, client, response):
+        with patch.object(client, "achat_completion", new=AsyncMock(return_value=response)) as chat_completion:
+            self.generate(client, "Tekst źródłowy", 1)
+            self.generate(client, "Tekst źródłowy", 1, use_cache=False)
+
+        assert chat_completion.call_count == 2
+
+    def test_agenerate_flashcards_with_other_model_is_not_cached(self, client, response):
+        with patch.object(client, "achat_completion", new=AsyncMock(return_value=response)) as chat_completion:
+            self.generate(client, "Tekst źródłowy", 1)
+            self.generate(client, "Tekst źródłowy", 1, model="openai/gpt-4.1")
+
+        assert chat_completion.call_count == 2
+
+    def test_astream_flashcards_yields_cached_result(self, client, response):
+        with patch.object(client, "achat_completion", new=AsyncMock(return_value=response)):
+            self.generate(client, "Tekst źródłowy", 1)
+
+        async def stream():
+            return [card async for card in client.astream_flashcards("sk-or-key", "Tekst źródłowy", 3)]
+
+        acompletion = "src.CardManagement.infrastructure.api_clients.openrouter.async_client.litellm.acompletion"
+        with patch(acompletion, new=AsyncMock()) as completion:
+            result = asyncio.run(stream())
+
+        completion.assert_not_called()
+        assert [(card.front, card.deck_id) for card in result] == [("P1", 3), ("P2", 3)]
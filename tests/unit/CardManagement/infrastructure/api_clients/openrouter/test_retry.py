@@ -0,0 +1,144 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import litellm
+import pytest
+
+from src.CardManagement.infrastructure.api_clients.openrouter.async_client import AsyncOpenRouterAPIClient
+from src.CardManagement.infrastructure.api_clients.openrouter.exceptions import (
+    AIAPIAuthError,
+    AIAPIConnectionError,
+    AIAPIServerError,
+    AIRateLimitError,
+)
+from src.CardManagement.infrastructure.api_clients.openrouter.retry import RetryPolicy, acall_with_retry
+from src.CardManagement.infrastructure.api_clients.openrouter.types import ChatMessage
+
+SLEEP = "src.CardManagement.infrastructure.api_clients.openrouter.retry.asyncio.sleep"
+ACOMPLETION = "src.CardManagement.infrastructure.api_clients.openrouter.async_client.litellm.acompletion"
+
+
+class TestRetryPolicy:
+    def test_only_transient_errors_are_retryable(self):
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(AIAPIServerError(502))
+        assert policy.is_retryable(AIAPIConnectionError("timeout"))
+        assert policy.is_retryable(AIRateLimitError(5))
+        assert not policy.is_retryable(AIAPIAuthError())
+
+    def test_delay_honors_retry_after_with_jitter(self):
+        policy = RetryPolicy(jitter=1.0)
+
+        assert policy.delay(1, AIRateLimitError(7), rng=lambda low, high: high) == 8.0
+        assert policy.delay(1, AIRateLimitError(7), rng=lambda low, high: low) == 7.0
+
+    def test_delay_uses_capped_exponential_backoff_with_full_jitter(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        upper = lambda low, high: high  # noqa: E731
+
+        assert [policy.delay(attempt, AIAPIServerError(500), rng=upper) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+        assert policy.delay(3, AIAPIServerError(500), rng=lambda low, high: low) == 0
+
+    def test_next_delay_stops_at_max_attempts_and_deadline(self):
+        policy = RetryPolicy(max_attempts=3, deadline=10.0, jitter=0.0)
+
+        assert policy.next_delay(1, AIRateLimitError(5), elapsed=0.0) == 5.0
+        assert policy.next_delay(3, AIRateLimitError(5), elapsed=0.0) is None
+        assert policy.next_delay(1, AIRateLimitError(5), elapsed=6.0) is None
+        assert policy.next_delay(1, AIAPIAuthError(), elapsed=0.0) is None
+
+
+class TestAcallWithRetry:
+    def test_retries_transient_errors_and_reports_attempts(self):
+        func = AsyncMock(side_effect=[AIAPIServerError(503), AIRateLimitError(2), "result"])
+        reported = []
+
+        with patch(SLEEP, new=AsyncMock()) as sleep:
+            result = asyncio.run(
+                acall_with_retry(func, RetryPolicy(jitter=0.0, base_delay=0.0), on_retry=reported.append)
+            )
+
+        assert result == "result"
+        assert [(r.attempt, r.max_attempts, r.delay, r.total_wait) for r in reported] == [(1, 3, 0, 0), (2, 3, 2, 2)]
+        assert [c.args[0] for c in sleep.call_args_list] == [0, 2]
+
+    def test_raises_non_retryable_error_at_once(self):
+        func = AsyncMock(side_effect=AIAPIAuthError())
+
+        with pytest.raises(AIAPIAuthError):
+            asyncio.run(acall_with_retry(func, RetryPolicy()))
+        assert func.call_count == 1
+
+    def test_raises_last_error_when_attempts_run_out(self):
+        func = AsyncMock(side_effect=AIAPIServerError(500))
+
+        with patch(SLEEP, new=AsyncMock()), pytest.raises(AIAPIServerError):
+            asyncio.run(acall_with_retry(func, RetryPolicy(max_attempts=2)))
+        assert func.call_count == 2
+
+    def test_wait_does_not_block_and_is_cancellable(self):
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            raise AIRateLimitError(30)
+
+        async def scenario():
+            task = asyncio.ensure_future(acall_with_retry(request, RetryPolicy(deadline=60)))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+        assert len(attempts) == 1
+
+
+class TestClientRetry:
+    @pytest.fixture
+    def client(self):
+        return AsyncOpenRouterAPIClient(
+            logger=Mock(),
+            event_loop=Mock(),
+            default_model="openai/gpt-4o-mini",
+            retry_policy=RetryPolicy(base_delay=0.0, jitter=0.0),
+        )
+
+    @staticmethod
+    def response():
+        message = SimpleNamespace(content="{}", role="assistant")
+        usage = SimpleNamespace(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        return SimpleNamespace(model="m", choices=[SimpleNamespace(message=message, index=0)], usage=usage)
+
+    def test_achat_completion_retries_server_errors(self, client):
+        error = litellm.exceptions.InternalServerError("boom", llm_provider="openrouter", model="m")
+        reported = []
+
+        with patch(ACOMPLETION, new=AsyncMock(side_effect=[error, self.response()])) as completion:
+            result = asyncio.run(
+                client.achat_completion("sk-or-key", [ChatMessage(role="user", content="x")], on_retry=reported.append)
+            )
+
+        assert completion.call_count == 2
+        assert result.choices[0]["content"] == "{}"
+        assert isinstance(reported[0].error, AIAPIServerError)
+
+    def test_achat_completion_does_not_retry_auth_errors(self, client):
+        error = litellm.exceptions.AuthenticationError("bad key", llm_provider="openrouter", model="m")
+
+        with patch(ACOMPLETION, new=AsyncMock(side_effect=error)) as completion, pytest.raises(AIAPIAuthError):
+            asyncio.run(client.achat_completion("sk-or-key", [ChatMessage(role="user", content="x")]))
+
+        assert completion.call_count == 1
+
+    def test_rate_limit_error_carries_retry_after_header(self, client):
+        response = httpx.Response(429, headers={"retry-after": "12"}, request=httpx.Request("POST", "https://x"))
+        error = litellm.exceptions.RateLimitError("slow down", llm_provider="openrouter", model="m", response=response)
+
+        with pytest.raises(AIRateLimitError) as exc_info:
+            client._handle_litellm_error(error)
+
+        assert exc_info.value.retry_after == 12
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from src.CardManagement.infrastructure.api_clients.openrouter.streaming import FlashcardStreamParser
+
+RESPONSE = json.dumps(
+    {
+        "flashcards": [
+            {"front": "Co to jest {JSON}?", "back": 'Format z "cudzysłowami" i \\ ukośnikiem', "tags": ["a", "b"]},
+            {"front": "Drugie pytanie", "back": "Druga odpowiedź", "tags": []},
+        ]
+    },
+    ensure_ascii=False,
+)
+
+
+def feed_in_pieces(parser, text, size):
+    cards = []
+    for start in range(0, len(text), size):
+        cards.extend(parser.feed(text[start : start + size]))
+    return cards
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(RESPONSE)])
+def test_feed_returns_each_flashcard_once_regardless_of_chunking(size):
+    parser = FlashcardStreamParser()
+
+    cards = feed_in_pieces(parser, RESPONSE, size)
+
+    assert cards == json.loads(RESPONSE)["flashcards"]
+    assert parser.text == RESPONSE
+
+
+def test_feed_returns_flashcard_as_soon_as_it_is_closed():
+    parser = FlashcardStreamParser()
+    first_end = RESPONSE.index("}, {") + 1
+
+    assert parser.feed(RESPONSE[:first_end]) == [json.loads(RESPONSE)["flashcards"][0]]
+    assert parser.feed(RESPONSE[first_end:-3]) == []
+
+
+def test_feed_ignores_text_before_the_object_and_nested_arrays_outside_flashcards():
+    parser = FlashcardStreamParser()
+    text = '```json\n{"meta": [{"front": "nie fiszka"}], "flashcards": [{"front": "P", "back": "O"}]}\n```'
+
+    assert feed_in_pieces(parser, text, 5) == [{"front": "P", "back": "O"}]
+
+
+def test_feed_skips_malformed_flashcard():
+    parser = FlashcardStreamParser()
+    text = '{"flashcards": [{"front": "P", "back": }, {"front": "P2", "back": "O2"}]}'
+
+    assert parser.feed(text) == [{"front": "P2", "back": "O2"}]
@@ -1,7 +1,12 @@
+import json
+from pathlib import Path
 import sqlite3
+from contextlib import contextmanager
 import pytest
+from datetime import datetime, timedelta, timezone
 
 from src.CardManagement.domain.models.Flashcard import Flashcard
+from src.CardManagement.domain.models.FlashcardPage import FLASHCARD_SORT_KEYS
 from src.CardManagement.infrastructure.persistence.sqlite.repositories.FlashcardRepositoryImpl import (
     FlashcardRepositoryImpl,
 )
@@ -16,6 +21,20 @@ class MockDbProvider:
     def get_connection(self) -> sqlite3.Connection:
         return self.connection
 
+    @contextmanager
+    def transaction(self):
+        """Commits the enclosed writes, or joins the transaction already open, like SqliteConnectionProvider."""
+        if self.connection.in_transaction:
+            yield
+            return
+        self.connection.execute("BEGIN")
+        try:
+            yield
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+
 
 @pytest.fixture
 def db_connection():
@@ -32,10 +51,16 @@ def db_connection():
             source TEXT NOT NULL,
             ai_model_name TEXT,
             created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            due TEXT,
+            state INTEGER,
+            stability REAL,
+            difficulty REAL,
+            last_review TEXT
         );
         """
     )
+    conn.execute("CREATE INDEX idx_flashcards_deck_due ON Flashcards (deck_id, due);")
     yield conn
     conn.close()
 
@@ -155,3 +180,298 @@ def test_get_fsrs_card_data_for_deck(repository, sample_flashcard):
     assert len(data) == 1
     assert data[0][0] == added.id
     assert data[0][1] == added.fsrs_state
+
+
+def _fsrs_state(due: datetime, state: int = 2) -> str:
+    return json.dumps(
+        {
+            "card_id": 1,
+            "state": state,
+            "step": None,
+            "stability": 3.5,
+            "difficulty": 5.25,
+            "due": due.isoformat(),
+            "last_review": (due - timedelta(days=1)).isoformat(),
+        }
+    )
+
+
+def _card(deck_id: int, front: str, fsrs_state=None) -> Flashcard:
+    return Flashcard(
+        id=None,
+        deck_id=deck_id,
+        front_text=front,
+        back_text="Back",
+        fsrs_state=fsrs_state,
+        source="manual",
+        ai_model_name=None,
+        created_at=datetime(2026, 1, 1, 10, 0, 0),
+        updated_at=datetime(2026, 1, 1, 10, 0, 0),
+    )
+
+
+def test_update_keeps_fsrs_columns_in_sync(repository, db_connection, sample_flashcard):
+    added = repository.add(sample_flashcard)
+    due = datetime(2025, 5, 20, 10, 30, 15, 123456, tzinfo=timezone.utc)
+    added.fsrs_state = _fsrs_state(due)
+
+    repository.update(added)
+
+    row = db_connection.execute(
+        "SELECT due, state, stability, difficulty, last_review FROM Flashcards WHERE id = ?", (added.id,)
+    ).fetchone()
+    assert row == ("2025-05-20T10:30:15.123", 2, 3.5, 5.25, "2025-05-19T10:30:15.123")
+
+
+def test_add_without_fsrs_state_is_due_immediately(repository, db_connection, sample_flashcard):
+    added = repository.add(sample_flashcard)
+
+    row = db_connection.execute("SELECT due, state FROM Flashcards WHERE id = ?", (added.id,)).fetchone()
+    assert row[0] is not None
+    assert row[1] is None
+    page = repository.list_due_page(1, datetime.now(timezone.utc) + timedelta(seconds=1), limit=10)
+    assert [c.id for c in page.items] == [added.id]
+
+
+def test_update_with_corrupt_fsrs_state_falls_back_to_created_at(repository, db_connection, sample_flashcard):
+    added = repository.add(sample_flashcard)
+    added.fsrs_state = "{not json"
+
+    repository.update(added)
+
+    due, created_at = db_connection.execute(
+        "SELECT due, created_at FROM Flashcards WHERE id = ?", (added.id,)
+    ).fetchone()
+    assert due.startswith(created_at.replace(" ", "T"))
+
+
+def test_list_due_page_walks_pages_with_cursor(repository):
+    now = datetime.now(timezone.utc)
+    due_ids = [repository.add(_card(1, f"card {i}", _fsrs_state(now - timedelta(hours=5 - i)))).id for i in range(5)]
+    repository.add(_card(1, "future", _fsrs_state(now + timedelta(days=1))))
+    repository.add(_card(2, "other deck", _fsrs_state(now - timedelta(days=5))))
+
+    assert repository.count_due_by_deck_id(1, now) == 5
+
+    seen = []
+    cursor = None
+    while True:
+        page = repository.list_due_page(1, now, limit=2, after_cursor=cursor)
+        seen.extend(c.id for c in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == due_ids
+
+
+def test_list_due_page_rejects_invalid_cursor(repository):
+    with pytest.raises(ValueError):
+        repository.list_due_page(1, datetime.now(timezone.utc), limit=10, after_cursor="not a cursor")
+
+
+def _walk_pages(repository, deck_id, sort_key, descending=False, limit=2):
+    seen = []
+    cursor = None
+    while True:
+        page = repository.list_page(deck_id, sort_key, after_cursor=cursor, limit=limit, descending=descending)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            return seen
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("sort_key", FLASHCARD_SORT_KEYS)
+@pytest.mark.parametrize("descending", [False, True])
+def test_list_page_walks_the_deck_in_sort_order(repository, sort_key, descending):
+    now = datetime.now(timezone.utc)
+    fronts = ["banan", "Ananas", "cytryna", "banan", "ananas"]
+    for i, front in enumerate(fronts):
+        card = _card(1, front, _fsrs_state(now + timedelta(days=i % 3)))
+        card.source = "ai-generated" if i % 2 else "manual"
+        repository.add(card)
+    repository.add(_card(2, "other deck"))
+
+    seen = _walk_pages(repository, 1, sort_key, descending)
+
+    def key(card):
+        value = getattr(card, sort_key) if sort_key != "due" else json.loads(card.fsrs_state)["due"]
+        return (str(value).lower() if sort_key == "front_text" else str(value), card.id)
+
+    assert len(seen) == 5
+    assert [c.id for c in seen] == [c.id for c in sorted(seen, key=key, reverse=descending)]
+
+
+def test_list_page_orders_front_text_case_insensitively(repository):
+    for front in ["b", "A", "a", "C"]:
+        repository.add(_card(1, front))
+
+    assert [c.front_text for c in _walk_pages(repository, 1, "front_text", limit=3)] == ["A", "a", "b", "C"]
+
+
+def test_list_page_rejects_unknown_sort_key_and_foreign_cursor(repository):
+    repository.add(_card(1, "a"))
+    repository.add(_card(1, "b"))
+    cursor = repository.list_page(1, "front_text", limit=1).next_cursor
+
+    with pytest.raises(ValueError):
+        repository.list_page(1, "back_text")
+    with pytest.raises(ValueError):
+        repository.list_page(1, "created_at", after_cursor=cursor)
+    with pytest.raises(ValueError):
+        repository.list_page(1, "front_text", after_cursor="not a cursor")
+
+
+LIST_INDEXES_MIGRATION = (
+    Path(__file__).parents[7]
+    / "src/Shared/infrastructure/persistence/sqlite/migrations/20261017090000_add_flashcard_list_indexes.sql"
+)
+
+
+@pytest.mark.parametrize("sort_key", FLASHCARD_SORT_KEYS)
+def test_list_page_seeks_a_composite_index(repository, db_connection, sort_key, monkeypatch):
+    db_connection.executescript(LIST_INDEXES_MIGRATION.read_text(encoding="utf-8"))
+    plans = []
+    real_connection = db_connection
+
+    class PlanningConnection:
+        def execute(self, sql, params=()):
+            plans.extend(row[3] for row in real_connection.execute("EXPLAIN QUERY PLAN " + sql, params))
+            return real_connection.execute(sql, params)
+
+    monkeypatch.setattr(repository._db_provider, "get_connection", lambda: PlanningConnection())
+    cursor = json.dumps([sort_key, "2026-01-01", 10])
+
+    repository.list_page(1, sort_key, after_cursor=cursor, limit=10)
+    repository.list_page(1, sort_key, after_cursor=cursor, limit=10, descending=True)
+
+    assert len(plans) == 2
+    for plan in plans:
+        assert "INDEX idx_flashcards_deck_" in plan
+        assert "deck_id=? AND" in plan, plan
+
+
+def test_bulk_set_fsrs_state_updates_state_and_columns(repository, db_connection):
+    now = datetime.now(timezone.utc)
+    first = repository.add(_card(1, "first"))
+    second = repository.add(_card(1, "second"))
+
+    repository.bulk_set_fsrs_state(
+        [(first.id, _fsrs_state(now - timedelta(days=1))), (second.id, _fsrs_state(now + timedelta(days=1)))]
+    )
+
+    assert json.loads(repository.get_by_id(first.id).fsrs_state)["state"] == 2
+    rows = db_connection.execute("SELECT id, state FROM Flashcards ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [(first.id, 2), (second.id, 2)]
+    assert [c.id for c in repository.list_due_page(1, now, limit=10).items] == [first.id]
+
+
+def test_add_many_returns_cards_in_order_with_ids(repository, db_connection, monkeypatch):
+    monkeypatch.setattr(FlashcardRepositoryImpl, "ADD_MANY_CHUNK_SIZE", 2)
+    db_connection.row_factory = sqlite3.Row  # As configured by SqliteConnectionProvider
+    now = datetime.now(timezone.utc)
+    cards = [_card(1, f"card {i}", _fsrs_state(now - timedelta(hours=i))) for i in range(5)]
+
+    added = repository.add_many(cards)
+
+    assert [c.front_text for c in added] == [f"card {i}" for i in range(5)]
+    assert [c.id for c in added] == sorted(c.id for c in added)
+    assert all(c.created_at is not None and c.updated_at is not None for c in added)
+    assert [repository.get_by_id(c.id).front_text for c in added] == [c.front_text for c in added]
+    assert db_connection.execute("SELECT COUNT(*) FROM Flashcards WHERE state = 2").fetchone()[0] == 5
+
+
+def test_add_many_is_all_or_nothing(repository, db_connection):
+    cards = [_card(1, "valid"), _card(1, None)]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.add_many(cards)
+
+    assert db_connection.execute("SELECT COUNT(*) FROM Flashcards").fetchone()[0] == 0
+
+
+def test_add_many_with_no_cards(repository):
+    assert repository.add_many([]) == []
+
+
+def test_insert_many_adds_cards_in_chunks(repository, db_connection, monkeypatch):
+    monkeypatch.setattr(FlashcardRepositoryImpl, "ADD_MANY_CHUNK_SIZE", 2)
+    now = datetime.now(timezone.utc)
+    cards = [_card(1, f"card {i}", _fsrs_state(now)) for i in range(5)]
+
+    assert repository.insert_many(cards) == 5
+
+    rows = db_connection.execute("SELECT front_text, state FROM Flashcards ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [(f"card {i}", 2) for i in range(5)]
+
+
+def test_insert_many_is_all_or_nothing(repository, db_connection):
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.insert_many([_card(1, "valid"), _card(1, None)])
+
+    assert db_connection.execute("SELECT COUNT(*) FROM Flashcards").fetchone()[0] == 0
+    assert repository.insert_many([]) == 0
+
+
+FTS_MIGRATION = (
+    Path(__file__).parents[7]
+    / "src/Shared/infrastructure/persistence/sqlite/migrations/20261016130000_add_flashcards_fts.sql"
+)
+
+
+@pytest.fixture
+def search_repository(db_connection, repository):
+    db_connection.execute("CREATE TABLE Decks (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, name TEXT NOT NULL);")
+    db_connection.executemany(
+        "INSERT INTO Decks (id, user_id, name) VALUES (?, ?, ?)", [(1, 1, "A"), (2, 1, "B"), (3, 2, "Other user")]
+    )
+    db_connection.executescript(FTS_MIGRATION.read_text(encoding="utf-8"))
+    return repository
+
+
+def _text_card(deck_id, front, back):
+    return Flashcard(None, deck_id, front, back, None, "manual", None, None, None)
+
+
+def test_search_ranks_front_matches_first_and_scopes_to_user(search_repository):
+    back_hit = search_repository.add(_text_card(1, "Stolica Francji", "Paryż, nad Sekwaną"))
+    front_hit = search_repository.add(_text_card(2, "Paryż", "Stolica Francji"))
+    search_repository.add(_text_card(3, "Paryż", "Karta innego użytkownika"))
+
+    results = search_repository.search(1, "paryż")
+
+    assert [c.id for c in results] == [front_hit.id, back_hit.id]
+    assert [c.id for c in search_repository.search(1, "paryż", deck_id=1)] == [back_hit.id]
+
+
+def test_search_matches_word_prefixes_and_follows_updates_and_deletes(search_repository):
+    card = search_repository.add(_text_card(1, "Mitochondrium", "Centrum energetyczne komórki"))
+
+    assert [c.id for c in search_repository.search(1, "mito kom")] == [card.id]
+
+    card.front_text = "Rybosom"
+    search_repository.update(card)
+    assert search_repository.search(1, "mito") == []
+    assert [c.id for c in search_repository.search(1, "rybo")] == [card.id]
+
+    search_repository.delete(card.id)
+    assert search_repository.search(1, "rybo") == []
+
+
+def test_fsrs_only_update_leaves_the_search_index_untouched(search_repository, db_connection):
+    card = search_repository.add(_text_card(1, "Mitochondrium", "Centrum energetyczne komórki"))
+    index_before = db_connection.execute("SELECT * FROM FlashcardsFts_data ORDER BY id").fetchall()
+
+    # update() rewrites every column, but the texts are unchanged
+    card.fsrs_state = _fsrs_state(datetime(2026, 2, 1, 9, 0, 0, tzinfo=timezone.utc))
+    search_repository.update(card)
+
+    assert db_connection.execute("SELECT * FROM FlashcardsFts_data ORDER BY id").fetchall() == index_before
+    assert [c.id for c in search_repository.search(1, "mito")] == [card.id]
+
+
+@pytest.mark.parametrize("query", ["", "   ", '"', 'AND OR NOT "( * :'])
+def test_search_treats_operators_as_plain_text(search_repository, query):
+    search_repository.add(_text_card(1, "Front", "Back"))
+
+    assert search_repository.search(1, query) == []
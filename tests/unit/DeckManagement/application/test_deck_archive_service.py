@@ -0,0 +1,225 @@
+"""Unit tests for DeckArchiveService."""
+
+import gzip
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from DeckManagement.application.deck_archive_service import ArchiveSummary, DeckArchiveService, detect_archive_format
+from DeckManagement.infrastructure.persistence.sqlite.repositories.DeckArchiveRepositoryImpl import (
+    DeckArchiveRepositoryImpl,
+)
+
+MIGRATIONS = Path(__file__).parents[4] / "src/Shared/infrastructure/persistence/sqlite/migrations"
+
+
+class MockDbProvider:
+    """In-memory database provider that counts the transactions it commits or rolls back."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.transactions = 0
+
+    def get_connection(self) -> sqlite3.Connection:
+        return self.connection
+
+    @contextmanager
+    def transaction(self):
+        if self.connection.in_transaction:
+            yield
+            return
+        self.transactions += 1
+        self.connection.execute("BEGIN")
+        try:
+            yield
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+
+
+@pytest.fixture
+def db_connection():
+    conn = sqlite3.connect(":memory:")
+    for migration in sorted(MIGRATIONS.glob("*.sql")):
+        conn.executescript(migration.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO Users (id, username) VALUES (1, 'ala'), (2, 'ola')")
+    conn.execute(
+        "INSERT INTO Decks (id, user_id, name, created_at, updated_at) VALUES "
+        "(1, 1, 'Angielski', '2026-01-01 10:00:00', '2026-01-02 10:00:00'), "
+        "(2, 1, 'Chemia, \"organiczna\"', '2026-01-05 10:00:00', '2026-01-05 10:00:00')"
+    )
+    state = json.dumps({"card_id": 1, "state": 2, "stability": 3.5, "difficulty": 5.1, "due": "2026-10-20T08:00:00"})
+    cards = [
+        (1, 1, "kot", "cat", state, "manual", None),
+        (2, 1, "pies\nwielolinijkowy", "dog", None, "ai-generated", "model/x"),
+        (3, 2, "H₂O", 'woda; "tlen"', None, "ai-edited", "model/y"),
+    ]
+    conn.executemany(
+        "INSERT INTO Flashcards (id, deck_id, front_text, back_text, fsrs_state, source, ai_model_name, created_at, "
+        "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, '2026-01-03 10:00:00', '2026-01-04 10:00:00')",
+        cards,
+    )
+    conn.executemany(
+        "INSERT INTO ReviewLogs (user_profile_id, flashcard_id, review_log_data, fsrs_rating, reviewed_at, "
+        "scheduler_params_at_review, created_at) VALUES (1, ?, ?, ?, ?, '{\"w\": [0.4]}', ?)",
+        [
+            (1, '{"rating": 3}', 3, "2026-10-10T08:00:00+00:00", "2026-10-10 08:00:00"),
+            (1, '{"rating": 1}', 1, "2026-10-11T08:00:00+00:00", None),
+            (3, '{"rating": 4}', 4, "2026-10-12T08:00:00+00:00", "2026-10-12 08:00:00"),
+        ],
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def unit_of_work(db_connection):
+    return MockDbProvider(db_connection)
+
+
+@pytest.fixture
+def service(unit_of_work):
+    return DeckArchiveService(DeckArchiveRepositoryImpl(unit_of_work), unit_of_work, batch_size=1)
+
+
+def contents(service, user_id):
+    """The exported records of a user without their IDs, for comparing restored copies."""
+    records = list(service.archive_repository.iter_records(user_id))
+    return [
+        {key: value for key, value in record.items() if key not in ("id", "deck_id", "flashcard_id")}
+        for record in records
+    ]
+
+
+def test_detect_archive_format():
+    assert detect_archive_format("kopia.CSV") == "csv"
+    assert detect_archive_format("kopia.jsonl") == "jsonl"
+    assert detect_archive_format("kopia.jsonl.gz") == "snapshot"
+    with pytest.raises(ValueError, match="Nieobsługiwany format"):
+        detect_archive_format("kopia.zip")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".jsonl.gz"])
+def test_export_and_restore_round_trip(service, unit_of_work, tmp_path, suffix):
+    path = tmp_path / f"kopia{suffix}"
+
+    exported = service.export_to_file(path, user_id=1)
+    restored = service.restore_from_file(path, user_id=2)
+
+    assert exported == restored == ArchiveSummary(decks=2, flashcards=3, review_logs=3)
+    assert contents(service, 2) == contents(service, 1)
+    assert unit_of_work.transactions == 1
+    assert not Path(f"{path}.part").exists()
+
+
+def test_restored_review_logs_point_at_the_new_flashcards(service, db_connection, tmp_path):
+    path = tmp_path / "kopia.jsonl"
+    service.export_to_file(path, user_id=1)
+
+    service.restore_from_file(path, user_id=2)
+
+    rows = db_connection.execute(
+        "SELECT f.front_text, r.fsrs_rating FROM ReviewLogs r JOIN Flashcards f ON f.id = r.flashcard_id "
+        "WHERE r.user_profile_id = 2 ORDER BY r.id"
+    ).fetchall()
+    assert rows == [("kot", 3), ("kot", 1), ("H₂O", 4)]
+
+
+def test_export_of_one_deck(service, tmp_path):
+    path = tmp_path / "kopia.jsonl"
+
+    summary = service.export_to_file(path, user_id=1, deck_id=2)
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert summary == ArchiveSummary(decks=1, flashcards=1, review_logs=1)
+    assert [record["type"] for record in records] == ["header", "deck", "flashcard", "review_log"]
+    assert records[0]["format"] == "10xcards-archive"
+
+
+def test_snapshot_is_gzip_compressed_json_lines(service, tmp_path):
+    path = tmp_path / "kopia.jsonl.gz"
+
+    service.export_to_file(path, user_id=1)
+
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        assert json.loads(stream.readline())["type"] == "header"
+
+
+def test_restore_renames_decks_whose_names_are_taken(service, tmp_path):
+    path = tmp_path / "kopia.csv"
+    service.export_to_file(path, user_id=1, deck_id=1)
+
+    service.restore_from_file(path, user_id=1)
+    service.restore_from_file(path, user_id=1)
+
+    assert service.archive_repository.list_deck_names(1) == {
+        "Angielski",
+        "Angielski (2)",
+        "Angielski (3)",
+        'Chemia, "organiczna"',
+    }
+
+
+def test_numbered_deck_names_fit_the_name_limit():
+    name = "x" * 50
+
+    assert DeckArchiveService._unique_deck_name(name, {name}) == "x" * 46 + " (2)"
+
+
+def test_failed_export_leaves_no_file(unit_of_work, tmp_path):
+    repository = Mock()
+    repository.iter_records.side_effect = OSError("dysk pełny")
+    service = DeckArchiveService(repository, unit_of_work)
+    path = tmp_path / "kopia.jsonl"
+
+    with pytest.raises(OSError):
+        service.export_to_file(path, user_id=1)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("", "nie jest kopią"),
+        ('{"type": "deck", "id": 1, "name": "A"}\n', "nie jest kopią"),
+        ('{"type": "header", "format": "10xcards-archive", "version": 99}\n', "wersja"),
+        ('{"type": "header", "format": "10xcards-archive", "version": 1}\n{niepoprawny\n', "wiersz 2"),
+    ],
+)
+def test_restore_rejects_invalid_archives(service, tmp_path, content, message):
+    path = tmp_path / "kopia.jsonl"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=message):
+        service.restore_from_file(path, user_id=2)
+    assert service.archive_repository.list_deck_names(2) == set()
+
+
+def test_restore_rejects_records_out_of_order(unit_of_work):
+    repository = Mock()
+    repository.list_deck_names.return_value = set()
+    repository.add_deck.return_value = 5
+    service = DeckArchiveService(repository, unit_of_work)
+    header = {"type": "header", "format": "10xcards-archive", "version": 1}
+    deck = {"type": "deck", "id": 1, "name": "A"}
+
+    with pytest.raises(ValueError, match="spoza kopii"):
+        service.restore_records([header, deck, {"type": "flashcard", "id": 7, "deck_id": 2}], user_id=1)
+    with pytest.raises(ValueError, match="poza kolejnością"):
+        service.restore_records([header, deck, {"type": "review_log", "flashcard_id": 7}], user_id=1)
+    repository.add_flashcards.assert_not_called()
+
+
+def test_restore_of_a_corrupt_snapshot(service, tmp_path):
+    path = tmp_path / "kopia.jsonl.gz"
+    path.write_bytes(b"to nie jest gzip")
+
+    with pytest.raises(ValueError, match="Nie udało się odczytać kopii"):
+        service.restore_from_file(path, user_id=2)
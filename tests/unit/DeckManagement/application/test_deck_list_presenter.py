@@ -4,7 +4,9 @@ import pytest
 from unittest.mock import Mock, call
 from datetime import datetime
 
+from DeckManagement.application.deck_archive_service import ArchiveSummary
 from DeckManagement.application.presenters.deck_list_presenter import DeckListPresenter, DeckViewModel
+from DeckManagement.domain.models.DeckStats import DeckStats
 
 
 @pytest.fixture
@@ -17,6 +19,9 @@ def mock_view():
     view.show_toast = Mock()
     view.clear_deck_selection = Mock()
     view.enable_study_button = Mock()
+    # Callbacks the presenter schedules on the UI thread; run them with finish_archive()
+    view.scheduled = []
+    view.schedule = Mock(side_effect=lambda delay_ms, callback: view.scheduled.append(callback))
     return view
 
 
@@ -24,7 +29,7 @@ def mock_view():
 def mock_deck_service():
     """Create a mock DeckService."""
     service = Mock()
-    service.list_decks = Mock()
+    service.list_decks_with_stats = Mock()
     service.create_deck = Mock()
     service.delete_deck = Mock()
     return service
@@ -81,20 +86,27 @@ def test_load_decks_success(presenter, mock_view, mock_deck_service, deck_factor
         deck_factory(1, "Test Deck 1", datetime(2024, 1, 1)),
         deck_factory(2, "Test Deck 2", datetime(2024, 1, 2)),
     ]
-    mock_deck_service.list_decks.return_value = mock_decks
+    studied_at = datetime(2024, 2, 1, 12, 0)
+    mock_deck_service.list_decks_with_stats.return_value = [
+        (mock_decks[0], DeckStats(total=10, new=4, learning=1, review=5, due_today=3, last_studied_at=studied_at)),
+        (mock_decks[1], DeckStats()),
+    ]
 
     # Act
     presenter.load_decks()
 
     # Assert
     mock_view.show_loading.assert_has_calls([call(True), call(False)])
-    mock_deck_service.list_decks.assert_called_once_with(1)
+    mock_deck_service.list_decks_with_stats.assert_called_once_with(1)
     mock_view.display_decks.assert_called_once()
     displayed_decks = mock_view.display_decks.call_args[0][0]
     assert len(displayed_decks) == 2
     assert all(isinstance(deck, DeckViewModel) for deck in displayed_decks)
     assert displayed_decks[0].id == 1
     assert displayed_decks[1].id == 2
+    assert (displayed_decks[0].total, displayed_decks[0].new, displayed_decks[0].due_today) == (10, 4, 3)
+    assert displayed_decks[0].last_studied_at == studied_at
+    assert displayed_decks[1].last_studied_at is None
     mock_view.clear_deck_selection.assert_called_once()
     mock_view.enable_study_button.assert_called_once_with(False)
 
@@ -116,7 +128,7 @@ def test_load_decks_not_authenticated(presenter, mock_view, mock_session_service
 def test_load_decks_error(presenter, mock_view, mock_deck_service):
     """Test loading decks with error."""
     # Arrange
-    mock_deck_service.list_decks.side_effect = Exception("Test error")
+    mock_deck_service.list_decks_with_stats.side_effect = Exception("Test error")
 
     # Act
     presenter.load_decks()
@@ -177,3 +189,57 @@ def test_start_study_session(presenter, mock_view, mock_navigation):
 
     # Assert
     mock_navigation.navigate.assert_called_once_with("/study/session/1")
+
+
+def finish_archive(presenter, view):
+    """Wait for the background export or restore and run the callbacks it scheduled on the UI thread."""
+    presenter._archive_thread.join(timeout=5)
+    while view.scheduled:
+        view.scheduled.pop(0)()
+
+
+def test_export_decks_runs_on_a_worker_thread(presenter, mock_view, mock_deck_service):
+    """Test a successful export of the user's decks."""
+    # Arrange
+    presenter.archive_service = Mock()
+    presenter.archive_service.export_to_file.return_value = ArchiveSummary(decks=2, flashcards=10, review_logs=4)
+    mock_deck_service.list_decks_with_stats.return_value = []
+
+    # Act
+    presenter.export_decks("/tmp/talie.jsonl.gz")
+    finish_archive(presenter, mock_view)
+
+    # Assert
+    presenter.archive_service.export_to_file.assert_called_once_with("/tmp/talie.jsonl.gz", 1)
+    assert mock_view.show_archive_busy.call_args_list == [call(True), call(False)]
+    mock_view.show_toast.assert_called_once_with(
+        "Kopia zapasowa", "Wyeksportowano talii: 2, fiszek: 10, powtórek w historii: 4."
+    )
+    assert presenter._archive_thread is None
+
+
+def test_restore_decks_failure(presenter, mock_view, mock_deck_service):
+    """Test a restore of a file that is not a valid archive."""
+    # Arrange
+    presenter.archive_service = Mock()
+    presenter.archive_service.restore_from_file.side_effect = ValueError("Plik nie jest kopią talii 10xCards")
+    mock_deck_service.list_decks_with_stats.return_value = []
+
+    # Act
+    presenter.restore_decks("/tmp/talie.csv")
+    finish_archive(presenter, mock_view)
+
+    # Assert
+    presenter.archive_service.restore_from_file.assert_called_once_with("/tmp/talie.csv", 1)
+    mock_view.show_error.assert_called_once_with("Błąd podczas przywracania talii: Plik nie jest kopią talii 10xCards")
+    mock_view.show_archive_busy.assert_called_with(False)
+
+
+def test_export_decks_without_archive_service(presenter, mock_view):
+    """Test that backups are unavailable when no archive service was given."""
+    # Act
+    presenter.export_decks("/tmp/talie.csv")
+
+    # Assert
+    mock_view.show_error.assert_called_once_with("Kopia zapasowa talii jest niedostępna")
+    mock_view.show_archive_busy.assert_not_called()
@@ -1,9 +1,10 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from sqlite3 import IntegrityError
 
 from src.DeckManagement.application.deck_service import DeckService
 from src.DeckManagement.domain.models.Deck import Deck
+from src.DeckManagement.domain.models.DeckStats import DeckStats
 
 
 @pytest.fixture
@@ -186,6 +187,33 @@ class TestListDecks:
             deck_service.list_decks(user_id=user_id)
 
 
+class TestListDecksWithStats:
+    """Testy dla metody list_decks_with_stats."""
+
+    def test_list_decks_with_stats_counts_cards_due_by_end_of_day(
+        self, deck_service, deck_repository_mock, sample_deck
+    ):
+        # Arrange
+        decks = [(sample_deck, DeckStats(total=3, new=1, due_today=2))]
+        deck_repository_mock.list_all_with_stats.return_value = decks
+        warsaw = timezone(timedelta(hours=2))
+
+        # Act
+        result = deck_service.list_decks_with_stats(user_id=5, now=datetime(2026, 10, 17, 22, 30, tzinfo=warsaw))
+
+        # Assert
+        assert result == decks
+        deck_repository_mock.list_all_with_stats.assert_called_once_with(5, datetime(2026, 10, 18, 0, 0, tzinfo=warsaw))
+
+    def test_list_decks_with_stats_repository_error(self, deck_service, deck_repository_mock):
+        # Arrange
+        deck_repository_mock.list_all_with_stats.side_effect = Exception("Database error")
+
+        # Act & Assert
+        with pytest.raises(Exception):
+            deck_service.list_decks_with_stats(user_id=5)
+
+
 class TestDeleteDeck:
     """Testy dla metody delete_deck."""
 
@@ -0,0 +1,220 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from src.DeckManagement.infrastructure.persistence.sqlite.repositories.DeckArchiveRepositoryImpl import (
+    DeckArchiveRepositoryImpl,
+)
+
+MIGRATIONS = Path(__file__).parents[7] / "src/Shared/infrastructure/persistence/sqlite/migrations"
+
+
+class MockDbProvider:
+    """Test database provider that uses an in-memory SQLite database."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def get_connection(self) -> sqlite3.Connection:
+        return self.connection
+
+    @contextmanager
+    def transaction(self):
+        """Commits the enclosed writes, or joins the transaction already open, like SqliteConnectionProvider."""
+        if self.connection.in_transaction:
+            yield
+            return
+        self.connection.execute("BEGIN")
+        try:
+            yield
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+
+
+@pytest.fixture
+def db_connection():
+    conn = sqlite3.connect(":memory:")
+    for migration in sorted(MIGRATIONS.glob("*.sql")):
+        conn.executescript(migration.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO Users (id, username) VALUES (1, 'ala'), (2, 'ola')")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def repository(db_connection):
+    return DeckArchiveRepositoryImpl(MockDbProvider(db_connection))
+
+
+def fsrs_state(card_id, due="2026-10-20T08:00:00+00:00"):
+    return json.dumps(
+        {
+            "card_id": card_id,
+            "state": 2,
+            "step": None,
+            "stability": 3.5,
+            "difficulty": 5.1,
+            "due": due,
+            "last_review": "2026-10-10T08:00:00+00:00",
+        }
+    )
+
+
+def add_deck(conn, deck_id, user_id, name):
+    conn.execute(
+        "INSERT INTO Decks (id, user_id, name, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+        (deck_id, user_id, name, "2026-01-01 10:00:00", "2026-01-02 10:00:00"),
+    )
+
+
+def add_card(conn, card_id, deck_id, state=None):
+    conn.execute(
+        "INSERT INTO Flashcards (id, deck_id, front_text, back_text, fsrs_state, source, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, 'manual', '2026-01-03 10:00:00', '2026-01-04 10:00:00')",
+        (card_id, deck_id, f"przód {card_id}", f"tył {card_id}", state),
+    )
+
+
+def add_log(conn, user_id, card_id, rating):
+    conn.execute(
+        "INSERT INTO ReviewLogs (user_profile_id, flashcard_id, review_log_data, fsrs_rating, reviewed_at, "
+        "scheduler_params_at_review, created_at) VALUES (?, ?, ?, ?, '2026-10-10T08:00:00+00:00', '{}', "
+        "'2026-10-10 08:00:00')",
+        (user_id, card_id, json.dumps({"rating": rating}), rating),
+    )
+
+
+@pytest.fixture
+def collection(db_connection):
+    """Two decks of user 1 and one of user 2; review logs are inserted out of flashcard order."""
+    add_deck(db_connection, 1, 1, "Angielski")
+    add_deck(db_connection, 2, 1, "Chemia")
+    add_deck(db_connection, 3, 2, "Cudza")
+    add_card(db_connection, 10, 1, fsrs_state(10))
+    add_card(db_connection, 11, 2)
+    add_card(db_connection, 12, 1)
+    add_card(db_connection, 13, 3)
+    add_log(db_connection, 1, 12, 3)
+    add_log(db_connection, 1, 10, 1)
+    add_log(db_connection, 1, 10, 4)
+    add_log(db_connection, 2, 13, 2)
+    db_connection.commit()
+
+
+def summary(records):
+    return [(r["type"], r.get("id", r.get("flashcard_id")), r.get("fsrs_rating")) for r in records]
+
+
+def test_iter_records_yields_decks_then_flashcards_followed_by_their_logs(repository, collection):
+    records = list(repository.iter_records(1))
+
+    assert summary(records) == [
+        ("deck", 1, None),
+        ("deck", 2, None),
+        ("flashcard", 10, None),
+        ("review_log", 10, 1),
+        ("review_log", 10, 4),
+        ("flashcard", 11, None),
+        ("flashcard", 12, None),
+        ("review_log", 12, 3),
+    ]
+    assert records[0] == {
+        "type": "deck",
+        "id": 1,
+        "name": "Angielski",
+        "created_at": "2026-01-01 10:00:00",
+        "updated_at": "2026-01-02 10:00:00",
+    }
+    assert records[2]["fsrs_state"] == fsrs_state(10)
+    assert records[3]["review_log_data"] == json.dumps({"rating": 1})
+
+
+def test_iter_records_of_one_deck(repository, collection):
+    records = list(repository.iter_records(1, deck_id=2))
+
+    assert summary(records) == [("deck", 2, None), ("flashcard", 11, None)]
+
+
+def test_iter_records_does_not_export_decks_of_other_users(repository, collection):
+    assert list(repository.iter_records(1, deck_id=3)) == []
+
+
+def test_iter_records_ends_its_read_transaction(repository, collection, db_connection):
+    records = repository.iter_records(1)
+    next(records)
+    assert db_connection.in_transaction
+
+    records.close()
+
+    assert not db_connection.in_transaction
+
+
+def test_add_flashcards_keeps_state_and_derives_fsrs_columns(repository, db_connection, monkeypatch):
+    monkeypatch.setattr(DeckArchiveRepositoryImpl, "ADD_FLASHCARDS_CHUNK_SIZE", 2)
+    add_deck(db_connection, 5, 1, "Nowa")
+    template = {
+        "type": "flashcard",
+        "deck_id": 5,
+        "back_text": "tył",
+        "source": "ai-generated",
+        "ai_model_name": "model",
+        "created_at": "2025-05-05 05:05:05",
+        "updated_at": "2025-06-06 06:06:06",
+    }
+    records = [
+        {**template, "id": 100 + i, "front_text": f"przód {i}", "fsrs_state": fsrs_state(100 + i) if i else None}
+        for i in range(3)
+    ]
+
+    new_ids = repository.add_flashcards(records)
+
+    rows = db_connection.execute(
+        "SELECT id, front_text, fsrs_state, source, ai_model_name, created_at, updated_at, due, state, stability "
+        "FROM Flashcards ORDER BY id"
+    ).fetchall()
+    assert [row[0] for row in rows] == new_ids
+    assert [row[1] for row in rows] == ["przód 0", "przód 1", "przód 2"]
+    assert rows[1][2:7] == (fsrs_state(101), "ai-generated", "model", "2025-05-05 05:05:05", "2025-06-06 06:06:06")
+    assert rows[1][7:] == ("2026-10-20T08:00:00.000", 2, 3.5)
+    # A card without FSRS state is due from its creation
+    assert rows[0][7:] == ("2025-05-05T05:05:05.000", None, None)
+
+
+def test_add_deck_and_review_logs(repository, db_connection):
+    deck_id = repository.add_deck(
+        2, {"type": "deck", "id": 9, "name": "Kopia", "created_at": "2025-01-01 00:00:00", "updated_at": "2025-02-01"}
+    )
+    add_card(db_connection, 50, deck_id)
+    log = {
+        "type": "review_log",
+        "flashcard_id": 50,
+        "review_log_data": '{"rating": 3}',
+        "fsrs_rating": 3,
+        "reviewed_at": "2026-10-10T08:00:00+00:00",
+        "scheduler_params_at_review": '{"w": [1]}',
+        "created_at": None,
+    }
+
+    repository.add_review_logs(2, [log])
+
+    assert repository.list_deck_names(2) == {"Kopia"}
+    assert db_connection.execute("SELECT created_at FROM Decks WHERE id = ?", (deck_id,)).fetchone()[0] == (
+        "2025-01-01 00:00:00"
+    )
+    assert db_connection.execute(
+        "SELECT user_profile_id, flashcard_id, review_log_data, fsrs_rating, scheduler_params_at_review "
+        "FROM ReviewLogs"
+    ).fetchall() == [(2, 50, '{"rating": 3}', 3, '{"w": [1]}')]
+
+
+def test_add_deck_duplicate_name(repository, collection):
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.add_deck(
+            1, {"name": "Angielski", "created_at": "2025-01-01 00:00:00", "updated_at": "2025-01-01 00:00:00"}
+        )
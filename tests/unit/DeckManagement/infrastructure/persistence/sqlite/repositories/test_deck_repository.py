@@ -1,11 +1,18 @@
 import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pytest
 
 from src.DeckManagement.domain.models.Deck import Deck
+from src.DeckManagement.domain.models.DeckStats import DUE_TODAY_CAP
 from src.DeckManagement.infrastructure.persistence.sqlite.repositories.DeckRepositoryImpl import (
     DeckRepositoryImpl,
 )
 
+MIGRATIONS = Path(__file__).parents[7] / "src/Shared/infrastructure/persistence/sqlite/migrations"
+
 
 class MockDbProvider:
     """Test database provider that uses an in-memory SQLite database."""
@@ -16,6 +23,20 @@ class MockDbProvider:
     def get_connection(self) -> sqlite3.Connection:
         return self.connection
 
+    @contextmanager
+    def transaction(self):
+        """Commits the enclosed writes, or joins the transaction already open, like SqliteConnectionProvider."""
+        if self.connection.in_transaction:
+            yield
+            return
+        self.connection.execute("BEGIN")
+        try:
+            yield
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+
 
 @pytest.fixture
 def db_connection():
@@ -137,3 +158,144 @@ def test_isolation_between_users(repository):
     deck2 = repository.add(Deck(id=None, user_id=2, name="B", created_at=None, updated_at=None))
     assert repository.get_by_id(deck1.id, 2) is None
     assert repository.get_by_id(deck2.id, 1) is None
+
+
+@pytest.fixture
+def migrated_connection():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA foreign_keys = ON;")
+    for migration in sorted(MIGRATIONS.glob("*.sql")):
+        conn.executescript(migration.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO Users (id, username) VALUES (1, 'ala')")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def stats_repository(migrated_connection):
+    return DeckRepositoryImpl(MockDbProvider(migrated_connection))
+
+
+def add_card(conn, deck_id, due="2026-10-17T08:00:00.000", state=None, last_review=None):
+    return conn.execute(
+        "INSERT INTO Flashcards (deck_id, front_text, back_text, source, due, state, last_review) "
+        "VALUES (?, 'przód', 'tył', 'manual', ?, ?, ?)",
+        (deck_id, due, state, last_review),
+    ).lastrowid
+
+
+def stats_of(repository, deck_id, due_before=datetime(2026, 10, 18, tzinfo=timezone.utc)):
+    stats = {deck.id: stats for deck, stats in repository.list_all_with_stats(1, due_before)}[deck_id]
+    return stats.total, stats.new, stats.learning, stats.review, stats.due_today
+
+
+def recounted_stats(conn):
+    """DeckStats as computed from scratch, for checking the triggers against."""
+    return conn.execute(
+        "SELECT d.id, COUNT(f.id), COALESCE(SUM(f.id IS NOT NULL AND f.last_review IS NULL), 0), "
+        "COALESCE(SUM(f.last_review IS NOT NULL AND f.state IS NOT 2), 0), "
+        "COALESCE(SUM(f.last_review IS NOT NULL AND f.state IS 2), 0) "
+        "FROM Decks d LEFT JOIN Flashcards f ON f.deck_id = d.id GROUP BY d.id ORDER BY d.id"
+    ).fetchall()
+
+
+def test_list_all_with_stats_of_new_decks(stats_repository):
+    stats_repository.add(Deck(id=None, user_id=1, name="B", created_at=None, updated_at=None))
+    stats_repository.add(Deck(id=None, user_id=1, name="A", created_at=None, updated_at=None))
+
+    result = stats_repository.list_all_with_stats(1, datetime(2026, 10, 18, tzinfo=timezone.utc))
+
+    assert [deck.name for deck, _ in result] == ["A", "B"]
+    assert [(stats.total, stats.due_today, stats.last_studied_at) for _, stats in result] == [(0, 0, None)] * 2
+
+
+def test_stats_follow_flashcard_writes(stats_repository, migrated_connection):
+    conn = migrated_connection
+    deck = stats_repository.add(Deck(id=None, user_id=1, name="A", created_at=None, updated_at=None))
+    other = stats_repository.add(Deck(id=None, user_id=1, name="B", created_at=None, updated_at=None))
+    first = add_card(conn, deck.id)
+    second = add_card(conn, deck.id, due="2026-10-25T08:00:00.000", state=2, last_review="2026-10-10T08:00:00.000")
+    add_card(conn, deck.id, state=1, last_review="2026-10-16T08:00:00.000")
+    assert stats_of(stats_repository, deck.id) == (3, 1, 1, 1, 2)
+
+    conn.execute("UPDATE Flashcards SET state = 3, last_review = '2026-10-17T08:00:00.000' WHERE id = ?", (first,))
+    assert stats_of(stats_repository, deck.id) == (3, 0, 2, 1, 2)
+
+    conn.execute("UPDATE Flashcards SET deck_id = ? WHERE id = ?", (other.id, second))
+    conn.execute("DELETE FROM Flashcards WHERE id = ?", (first,))
+    assert stats_of(stats_repository, deck.id) == (1, 0, 1, 0, 1)
+    assert stats_of(stats_repository, other.id) == (1, 0, 0, 1, 0)
+    assert conn.execute("SELECT total, new_count, learning_count, review_count FROM DeckStats").fetchall() == [
+        (1, 0, 1, 0),
+        (1, 0, 0, 1),
+    ]
+
+
+def test_text_edits_do_not_change_stats(stats_repository, migrated_connection):
+    deck = stats_repository.add(Deck(id=None, user_id=1, name="A", created_at=None, updated_at=None))
+    card = add_card(migrated_connection, deck.id, state=2, last_review="2026-10-10T08:00:00.000")
+
+    migrated_connection.execute("UPDATE Flashcards SET front_text = 'nowy', due = NULL WHERE id = ?", (card,))
+
+    assert recounted_stats(migrated_connection) == [(deck.id, 1, 0, 0, 1)]
+    assert stats_of(stats_repository, deck.id) == (1, 0, 0, 1, 0)
+
+
+def test_due_today_stops_counting_past_the_cap(stats_repository, migrated_connection):
+    deck = stats_repository.add(Deck(id=None, user_id=1, name="A", created_at=None, updated_at=None))
+    migrated_connection.executemany(
+        "INSERT INTO Flashcards (deck_id, front_text, back_text, source, due) "
+        "VALUES (?, 'przód', 'tył', 'manual', '2026-10-17T08:00:00.000')",
+        [(deck.id,)] * (DUE_TODAY_CAP + 5),
+    )
+
+    assert stats_of(stats_repository, deck.id) == (DUE_TODAY_CAP + 5, DUE_TODAY_CAP + 5, 0, 0, DUE_TODAY_CAP + 1)
+
+
+def test_last_studied_at_is_the_latest_review(stats_repository, migrated_connection):
+    deck = stats_repository.add(Deck(id=None, user_id=1, name="A", created_at=None, updated_at=None))
+    card = add_card(migrated_connection, deck.id)
+    for reviewed_at in ("2026-10-12T08:00:00+00:00", "2026-10-10T08:00:00+00:00"):
+        migrated_connection.execute(
+            "INSERT INTO ReviewLogs (user_profile_id, flashcard_id, review_log_data, fsrs_rating, reviewed_at, "
+            "scheduler_params_at_review) VALUES (1, ?, '{}', 3, ?, '{}')",
+            (card, reviewed_at),
+        )
+
+    [(_, stats)] = stats_repository.list_all_with_stats(1, datetime(2026, 10, 18, tzinfo=timezone.utc))
+
+    assert stats.last_studied_at == datetime(2026, 10, 12, 8, tzinfo=timezone.utc)
+
+
+def test_migration_backfills_stats_of_existing_decks():
+    conn = sqlite3.connect(":memory:")
+    migrations = sorted(MIGRATIONS.glob("*.sql"))
+    deck_stats_migration = next(m for m in migrations if m.name.endswith("_create_deck_stats_table.sql"))
+    for migration in migrations[: migrations.index(deck_stats_migration)]:
+        conn.executescript(migration.read_text(encoding="utf-8"))
+    conn.execute("INSERT INTO Users (id, username) VALUES (1, 'ala')")
+    conn.execute("INSERT INTO Decks (id, user_id, name) VALUES (1, 1, 'A'), (2, 1, 'B')")
+    add_card(conn, 1)
+    card = add_card(conn, 1, state=2, last_review="2026-10-10T08:00:00.000")
+    add_card(conn, 1, state=3, last_review="2026-10-11T08:00:00.000")
+    conn.execute(
+        "INSERT INTO ReviewLogs (user_profile_id, flashcard_id, review_log_data, fsrs_rating, reviewed_at, "
+        "scheduler_params_at_review) VALUES (1, ?, '{}', 3, '2026-10-10T08:00:00+00:00', '{}')",
+        (card,),
+    )
+
+    conn.executescript(deck_stats_migration.read_text(encoding="utf-8"))
+
+    assert conn.execute("SELECT * FROM DeckStats ORDER BY deck_id").fetchall() == [
+        (1, 3, 1, 1, 1, "2026-10-10T08:00:00+00:00"),
+        (2, 0, 0, 0, 0, None),
+    ]
+    conn.close()
+
+
+def test_due_count_uses_the_deck_due_index(migrated_connection):
+    plan = migrated_connection.execute(
+        "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM Flashcards f WHERE f.deck_id = ? AND f.due <= ?", (1, "x")
+    ).fetchall()
+
+    assert any("idx_flashcards_deck_due" in row[-1] for row in plan)
@@ -222,3 +222,45 @@ class TestRefreshCurrentUser:
 
         # Assert - user data should remain unchanged
         assert session_service.get_current_user() == original_user
+
+
+class TestSessionSecrets:
+    """Testy dla sekretów sesji."""
+
+    def test_secret_cached_for_logged_in_user(self, session_service):
+        # Arrange
+        session_service.login("testuser")
+
+        # Act
+        session_service.set_secret("api_key", "sk-or-key")
+
+        # Assert
+        assert session_service.get_secret("api_key") == "sk-or-key"
+        assert session_service.get_secret("other") is None
+
+    def test_secret_not_cached_without_user(self, session_service):
+        # Act
+        session_service.set_secret("api_key", "sk-or-key")
+
+        # Assert
+        assert session_service.get_secret("api_key") is None
+
+    @pytest.mark.parametrize(
+        "action",
+        [
+            lambda service: service.logout(),
+            lambda service: service.refresh_current_user(),
+            lambda service: service.login("testuser"),
+        ],
+        ids=["logout", "refresh", "login"],
+    )
+    def test_secrets_cleared(self, session_service, action):
+        # Arrange
+        session_service.login("testuser")
+        session_service.set_secret("api_key", "sk-or-key")
+
+        # Act
+        action(session_service)
+
+        # Assert
+        assert session_service.get_secret("api_key") is None
@@ -0,0 +1,159 @@
+"""Unit tests for the SqliteConnectionProvider class."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.Shared.infrastructure.persistence.sqlite.connection import SqliteConnectionProvider
+
+
+@pytest.fixture
+def fresh_provider():
+    """Reset the singleton before and after each test and close the connection."""
+    SqliteConnectionProvider._instance = None
+    yield
+    if SqliteConnectionProvider._instance is not None:
+        SqliteConnectionProvider._instance._cleanup()
+    SqliteConnectionProvider._instance = None
+
+
+def _pragma(provider, name):
+    return provider.get_connection().execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_fast_profile_applies_wal_and_normal_sync(fresh_provider, tmp_path):
+    provider = SqliteConnectionProvider(str(tmp_path / "test.db"), profile="fast")
+
+    assert provider.profile == "fast"
+    assert _pragma(provider, "journal_mode") == "wal"
+    assert _pragma(provider, "synchronous") == 1  # NORMAL
+    assert _pragma(provider, "temp_store") == 2  # MEMORY
+    assert _pragma(provider, "busy_timeout") == 5000
+    assert _pragma(provider, "foreign_keys") == 1
+
+
+def test_durable_profile_uses_full_sync(fresh_provider, tmp_path):
+    provider = SqliteConnectionProvider(str(tmp_path / "test.db"), profile="durable")
+
+    assert _pragma(provider, "journal_mode") == "wal"
+    assert _pragma(provider, "synchronous") == 2  # FULL
+
+
+def test_unknown_profile_is_rejected(fresh_provider, tmp_path):
+    with pytest.raises(ValueError):
+        SqliteConnectionProvider(str(tmp_path / "test.db"), profile="reckless")
+    assert SqliteConnectionProvider._instance is None
+
+
+@pytest.fixture
+def provider_with_table(fresh_provider, tmp_path):
+    provider = SqliteConnectionProvider(str(tmp_path / "test.db"))
+    with provider.transaction():
+        provider.get_connection().execute("CREATE TABLE Items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    return provider
+
+
+def _insert(provider, name):
+    """Mimics a repository write: an insert inside the provider's transaction()."""
+    with provider.transaction():
+        provider.get_connection().execute("INSERT INTO Items (name) VALUES (?)", (name,))
+
+
+def _names(provider):
+    return [row[0] for row in provider.get_connection().execute("SELECT name FROM Items ORDER BY id")]
+
+
+def test_repository_writes_join_the_open_transaction(provider_with_table):
+    with provider_with_table.transaction():
+        _insert(provider_with_table, "first")
+        connection = provider_with_table.get_connection()
+        assert isinstance(connection, sqlite3.Connection)
+        assert connection.in_transaction
+        _insert(provider_with_table, "second")
+        assert connection.in_transaction
+
+    assert not provider_with_table.get_connection().in_transaction
+    assert _names(provider_with_table) == ["first", "second"]
+
+
+def test_repository_write_outside_a_transaction_is_committed(provider_with_table):
+    _insert(provider_with_table, "first")
+
+    assert not provider_with_table.get_connection().in_transaction
+    assert _in_thread(lambda: _names(provider_with_table)) == ["first"]
+
+
+def test_transaction_rolls_back_all_writes_on_error(provider_with_table):
+    with pytest.raises(RuntimeError):
+        with provider_with_table.transaction():
+            _insert(provider_with_table, "first")
+            with provider_with_table.transaction():
+                _insert(provider_with_table, "nested")
+            raise RuntimeError("boom")
+
+    assert _names(provider_with_table) == []
+
+
+def test_write_outside_a_transaction_is_refused(provider_with_table):
+    connection = provider_with_table.get_connection()
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        connection.execute("INSERT INTO Items (name) VALUES ('bypass')")
+
+    # The refused write does not leak into the next transaction
+    _insert(provider_with_table, "first")
+    assert _names(provider_with_table) == ["first"]
+
+
+def _in_thread(func):
+    """Run func on a new thread and return its result."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault("value", func()))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+def test_each_thread_gets_its_own_connection(provider_with_table):
+    main_connection = provider_with_table.get_connection()
+
+    worker_connection = _in_thread(provider_with_table.get_connection)
+
+    assert worker_connection is not main_connection
+    assert provider_with_table.get_connection() is main_connection
+
+
+def test_worker_thread_reads_while_main_thread_writes(provider_with_table):
+    _insert(provider_with_table, "committed")
+
+    with provider_with_table.transaction():
+        _insert(provider_with_table, "pending")
+        # WAL: readers on other connections see the last committed state without blocking
+        assert _in_thread(lambda: _names(provider_with_table)) == ["committed"]
+
+    assert _in_thread(lambda: _names(provider_with_table)) == ["committed", "pending"]
+
+
+def test_connections_of_finished_threads_are_closed(provider_with_table):
+    worker_connection = _in_thread(provider_with_table.get_connection)
+
+    # Opening a connection for another thread prunes the finished one
+    _in_thread(provider_with_table.get_connection)
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_connection.execute("SELECT 1")
+
+
+def test_writes_from_many_threads_are_serialized(provider_with_table):
+    def write_many(prefix):
+        for index in range(50):
+            _insert(provider_with_table, f"{prefix}-{index}")
+
+    threads = [threading.Thread(target=write_many, args=(f"t{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(_names(provider_with_table)) == 200
@@ -45,16 +45,53 @@ def crypto_manager_with_mock_fernet(mock_fernet, patch_basic_dependencies, mocke
 class TestCryptoManager:
     """Tests for the CryptoManager class."""
 
-    def test_init_calls_setup_fernet(self, patch_basic_dependencies, mocker):
-        """Test that __init__ calls _setup_fernet."""
+    def test_init_does_not_derive_key(self, patch_basic_dependencies, mocker):
+        """Test that __init__ defers the key derivation."""
         mock_setup = mocker.patch.object(CryptoManager, "_setup_fernet")
-        mock_setup.return_value = mocker.Mock()
 
         manager = CryptoManager()
 
+        mock_setup.assert_not_called()
+        assert not manager.is_ready
+
+    def test_key_derived_once_on_first_use(self, patch_basic_dependencies, mocker):
+        """Test that the Fernet instance is derived on first use and then reused."""
+        mock_setup = mocker.patch.object(CryptoManager, "_setup_fernet")
+        mock_setup.return_value.encrypt.return_value = b"encrypted_data"
+        manager = CryptoManager()
+
+        manager.encrypt_api_key("first")
+        manager.encrypt_api_key("second")
+
         mock_setup.assert_called_once()
+        assert manager.is_ready
         assert manager._fernet == mock_setup.return_value
 
+    def test_warm_up_in_background_derives_key(self, patch_basic_dependencies, mocker):
+        """Test that warm_up_in_background derives the key on another thread."""
+        mock_setup = mocker.patch.object(CryptoManager, "_setup_fernet")
+        manager = CryptoManager()
+
+        thread = manager.warm_up_in_background()
+        thread.join(timeout=5)
+
+        mock_setup.assert_called_once()
+        assert manager.is_ready
+        assert manager.warm_up_in_background() is None
+
+    def test_warm_up_in_background_failure_is_retried_on_use(self, patch_basic_dependencies, mocker):
+        """Test that a failed background derivation is retried by the next encrypt."""
+        mock_fernet = mocker.Mock(spec=Fernet)
+        mock_fernet.encrypt.return_value = b"encrypted_data"
+        mock_setup = mocker.patch.object(CryptoManager, "_setup_fernet", side_effect=[Exception("no key"), mock_fernet])
+        manager = CryptoManager()
+
+        manager.warm_up_in_background().join(timeout=5)
+
+        assert not manager.is_ready
+        assert manager.encrypt_api_key("test_api_key") == b"encrypted_data"
+        assert mock_setup.call_count == 2
+
     def test_setup_fernet_creates_fernet_instance(self, patch_basic_dependencies, mocker):
         """Test that _setup_fernet creates a Fernet instance with the correct key."""
         mock_fernet = mocker.patch("src.Shared.infrastructure.security.crypto.Fernet")
@@ -65,8 +102,8 @@ class TestCryptoManager:
         mock_pbkdf2.return_value = mock_pbkdf2_instance
         mock_pbkdf2_instance.derive.return_value = b"derived_key"
 
-        # Create the manager
-        CryptoManager()
+        # Create the manager and derive the key
+        CryptoManager().warm_up()
 
         # Verify PBKDF2HMAC was called with correct parameters
         mock_pbkdf2.assert_called_once()
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from src.Shared.infrastructure.async_loop import AsyncLoopThread
+
+
+@pytest.fixture
+def event_loop_thread():
+    loop_thread = AsyncLoopThread(name="TestLoop")
+    loop_thread.start()
+    yield loop_thread
+    loop_thread.stop()
+
+
+def test_submit_runs_coroutines_concurrently_on_one_thread(event_loop_thread):
+    threads = set()
+    both_started = asyncio.Event()
+    started = []
+
+    async def job(value):
+        threads.add(threading.current_thread().name)
+        started.append(value)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=2)
+        return value * 2
+
+    futures = [event_loop_thread.submit(job(value)) for value in (1, 2)]
+
+    assert [future.result(timeout=2) for future in futures] == [2, 4]
+    assert threads == {"TestLoop"}
+
+
+def test_cancelling_future_cancels_the_coroutine(event_loop_thread):
+    entered = threading.Event()
+    cancelled = threading.Event()
+
+    async def job():
+        entered.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    future = event_loop_thread.submit(job())
+    assert entered.wait(2)
+
+    future.cancel()
+
+    assert cancelled.wait(2)
+    with pytest.raises(CancelledError):
+        future.result(timeout=2)
+
+
+def test_stop_cancels_pending_coroutines_and_rejects_new_ones():
+    loop_thread = AsyncLoopThread()
+    loop_thread.start()
+    entered = threading.Event()
+    cleaned_up = threading.Event()
+
+    async def job():
+        entered.set()
+        try:
+            await asyncio.sleep(60)
+        finally:
+            cleaned_up.set()
+
+    loop_thread.submit(job())
+    assert entered.wait(2)
+
+    loop_thread.stop()
+
+    assert cleaned_up.is_set()
+    assert not loop_thread.is_running
+    coro = job()
+    with pytest.raises(RuntimeError):
+        loop_thread.submit(coro)
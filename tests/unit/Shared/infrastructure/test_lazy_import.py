@@ -0,0 +1,75 @@
+"""Unit tests for deferred imports."""
+
+import sys
+
+import pytest
+
+from src.Shared.infrastructure.lazy_import import LazyModule, warm_up_in_background
+
+
+@pytest.fixture
+def module_name(tmp_path, monkeypatch):
+    """Name of a fresh importable module."""
+    name = "lazy_import_test_module"
+    (tmp_path / f"{name}.py").write_text("value = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    yield name
+    sys.modules.pop(name, None)
+
+
+class TestLazyModule:
+    def test_not_imported_until_attribute_access(self, module_name):
+        lazy = LazyModule(module_name)
+
+        assert not lazy.is_loaded
+        assert module_name not in sys.modules
+
+        assert lazy.value == 42
+        assert lazy.is_loaded
+        assert module_name in sys.modules
+
+    def test_on_import_called_once(self, module_name, mocker):
+        on_import = mocker.Mock()
+        lazy = LazyModule(module_name, on_import=on_import)
+
+        lazy.value
+        lazy.value
+
+        on_import.assert_called_once_with(sys.modules[module_name])
+
+    def test_setattr_and_delattr_reach_the_module(self, module_name):
+        lazy = LazyModule(module_name)
+
+        lazy.value = 7
+        assert sys.modules[module_name].value == 7
+
+        del lazy.value
+        assert not hasattr(sys.modules[module_name], "value")
+
+    def test_can_be_patched(self, module_name, mocker):
+        lazy = LazyModule(module_name)
+        mocker.patch.object(lazy, "value", 99)
+
+        assert sys.modules[module_name].value == 99
+
+    def test_failed_import_is_retried(self, mocker):
+        import_module = mocker.patch(
+            "src.Shared.infrastructure.lazy_import.importlib.import_module",
+            side_effect=[ImportError("boom"), sys],
+        )
+        lazy = LazyModule("sys")
+
+        with pytest.raises(ImportError):
+            lazy.version
+        assert lazy.version == sys.version
+        assert import_module.call_count == 2
+
+
+def test_warm_up_in_background_imports_modules(module_name):
+    lazy = LazyModule(module_name)
+
+    warm_up_in_background([lazy]).join(timeout=5)
+
+    assert lazy.is_loaded
+    assert module_name in sys.modules
@@ -0,0 +1,80 @@
+"""Unit tests for startup phase timing."""
+
+import json
+
+import pytest
+
+from src.Shared.infrastructure.startup_timing import StartupTimer
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def timer(clock):
+    return StartupTimer(origin=99.0, clock=clock)
+
+
+class TestStartupTimer:
+    def test_phase_records_start_and_duration(self, timer, clock):
+        with timer.phase("migrations"):
+            clock.now += 0.25
+
+        assert timer.to_dict()["phases"] == [{"name": "migrations", "start_ms": 1000.0, "duration_ms": 250.0}]
+
+    def test_phase_recorded_when_block_raises(self, timer, clock):
+        with pytest.raises(RuntimeError):
+            with timer.phase("failing"):
+                clock.now += 0.1
+                raise RuntimeError("boom")
+
+        assert [phase["name"] for phase in timer.to_dict()["phases"]] == ["failing"]
+
+    def test_checkpoints_are_consecutive(self, timer, clock):
+        timer.checkpoint("imports")
+        clock.now += 0.5
+        timer.checkpoint("window")
+
+        assert timer.to_dict()["phases"] == [
+            {"name": "imports", "start_ms": 0.0, "duration_ms": 1000.0},
+            {"name": "window", "start_ms": 1000.0, "duration_ms": 500.0},
+        ]
+
+    def test_checkpoint_starts_after_phase(self, timer, clock):
+        with timer.phase("migrations"):
+            clock.now += 0.2
+        clock.now += 0.3
+        timer.checkpoint("services")
+
+        assert timer.to_dict()["phases"][1] == {"name": "services", "start_ms": 1200.0, "duration_ms": 300.0}
+
+    def test_mark(self, timer, clock):
+        clock.now += 1.0
+
+        assert timer.mark("first_idle") == pytest.approx(2000.0)
+        assert timer.to_dict()["marks"] == {"first_idle": 2000.0}
+        assert timer.to_dict()["origin_monotonic"] == 99.0
+
+    def test_write_json(self, timer, tmp_path):
+        timer.checkpoint("imports")
+        path = tmp_path / "nested" / "timings.json"
+
+        timer.write_json(path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == timer.to_dict()
+
+    def test_summary(self, timer, clock):
+        timer.checkpoint("imports")
+        timer.mark("first_idle")
+
+        assert timer.summary() == "Startup timings: imports=1000ms, first_idle@1000ms"
@@ -0,0 +1,261 @@
+"""Unit tests for the virtual mode of GenericTableWidget, run without a display."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import ttkbootstrap as ttk
+
+from src.Shared.ui.widgets.generic_table_widget import GenericTableWidget
+
+ROW_HEIGHT = 20
+
+
+class FakeTreeview:
+    """The part of ttk.Treeview used by GenericTableWidget, keeping rows and selection in memory."""
+
+    def __init__(self, master=None, *, height=10, **kwargs):
+        self.height = height
+        self.rows = []
+        self.values = {}
+        self.selected = ()
+        self.bindings = {}
+
+    def get_children(self, item=""):
+        return tuple(self.rows)
+
+    def insert(self, parent, index, iid=None, values=()):
+        self.rows.append(iid)
+        self.values[iid] = list(values)
+        return iid
+
+    def delete(self, *items):
+        for item in items:
+            self.rows.remove(item)
+            self.values.pop(item)
+        self.selected = tuple(item for item in self.selected if item not in items)
+
+    def item(self, item, values=None):
+        if values is None:
+            return {"values": self.values[item]}
+        self.values[item] = list(values)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, item):
+        self.selected = (item,)
+
+    def selection_remove(self, items):
+        self.selected = ()
+
+    def identify_row(self, y):
+        index = y // ROW_HEIGHT
+        return self.rows[index] if index < len(self.rows) else ""
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def cget(self, option):
+        return self.height
+
+    def winfo_ismapped(self):
+        return False
+
+    def focus(self, item=None):
+        pass
+
+    def bbox(self, item):
+        return ()
+
+    def configure(self, **kwargs):
+        pass
+
+    def heading(self, column, **kwargs):
+        pass
+
+    def column(self, column, **kwargs):
+        pass
+
+    def grid(self, **kwargs):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def yview_moveto(self, fraction):
+        pass
+
+
+@pytest.fixture
+def callbacks():
+    return SimpleNamespace(on_select=MagicMock(), on_double_click=MagicMock(), on_delete_key=MagicMock())
+
+
+@pytest.fixture
+def table(mocker, callbacks):
+    # Build the widget without a Tk root: the frame is a no-op, the Treeview is kept in memory
+    mocker.patch.object(ttk.Frame, "__init__", return_value=None)
+    mocker.patch.object(GenericTableWidget, "columnconfigure")
+    mocker.patch.object(GenericTableWidget, "rowconfigure")
+    mocker.patch.object(ttk, "Treeview", FakeTreeview)
+    mocker.patch.object(ttk, "Scrollbar", return_value=MagicMock())
+    widget = GenericTableWidget(
+        MagicMock(),
+        [("front", "Przód"), ("back", "Tył")],
+        height=10,
+        on_select=callbacks.on_select,
+        on_double_click=callbacks.on_double_click,
+        on_delete_key=callbacks.on_delete_key,
+    )
+    widget.fetches = []
+
+    def fetch_range(start, stop):
+        widget.fetches.append((start, stop))
+        return [(f"card-{i}", [f"Pytanie {i}", f"Odpowiedź {i}"]) for i in range(start, stop)]
+
+    widget.set_data_source(lambda: 1000, fetch_range)
+    return widget
+
+
+def shown(table):
+    """Fronts of the rendered rows, top to bottom."""
+    return [table.tree.values[slot][0] for slot in table.tree.get_children()]
+
+
+def select_slot(table, index):
+    """Click the rendered row at 'index'."""
+    table.tree.selection_set(table.tree.get_children()[index])
+    table._handle_select(SimpleNamespace())
+
+
+def press(table, keysym):
+    return table._handle_navigation_key(SimpleNamespace(keysym=keysym))
+
+
+def test_only_the_viewport_is_rendered(table):
+    assert len(table.tree.get_children()) == 10
+    assert shown(table) == [f"Pytanie {i}" for i in range(10)]
+    assert table.fetches == [(0, 60)]
+    table.scrollbar.set.assert_called_with(0.0, 0.01)
+
+
+def test_scrollbar_moves_the_window(table):
+    table._handle_scrollbar("moveto", "0.5")
+
+    assert table._first == 500
+    assert shown(table) == [f"Pytanie {i}" for i in range(500, 510)]
+    assert table.tree.get_children() == tuple(f"row{i}" for i in range(10))
+    table.scrollbar.set.assert_called_with(0.5, 0.51)
+
+    table._handle_scrollbar("scroll", "1", "pages")
+    assert table._first == 510
+    table._handle_scrollbar("scroll", "-1", "units")
+    assert table._first == 509
+    assert len(table.tree.get_children()) == 10
+
+
+def test_scrolling_is_clamped_to_the_last_screen(table):
+    table._handle_scrollbar("moveto", "1.0")
+
+    assert table._first == 990
+    assert shown(table)[-1] == "Pytanie 999"
+
+    table._handle_scrollbar("scroll", "1", "pages")
+    assert table._first == 990
+
+
+def test_scrolling_within_the_buffer_does_not_fetch(table):
+    table._handle_scrollbar("scroll", "3", "units")
+    table._handle_scrollbar("moveto", "0.5")
+
+    assert table.fetches == [(0, 60), (450, 560)]
+
+
+def test_selection_is_kept_when_the_window_moves(table, callbacks):
+    select_slot(table, 2)
+    callbacks.on_select.assert_called_once_with("card-2")
+
+    table._handle_scrollbar("moveto", "0.5")
+    assert table.get_selected_id() == "card-2"
+    assert table.tree.selection() == ()
+
+    table._handle_scrollbar("moveto", "0.0")
+    assert table.tree.selection() == ("row2",)
+    callbacks.on_select.assert_called_once()
+
+
+def test_down_at_the_bottom_edge_scrolls_by_one_row(table, callbacks):
+    select_slot(table, 9)
+
+    assert press(table, "Down") == "break"
+
+    assert table._first == 1
+    assert table.get_selected_id() == "card-10"
+    assert table.tree.selection() == ("row9",)
+    callbacks.on_select.assert_called_with("card-10")
+
+
+def test_up_at_the_top_edge_scrolls_by_one_row(table):
+    table._handle_scrollbar("moveto", "0.005")
+    select_slot(table, 0)
+
+    press(table, "Up")
+
+    assert table._first == 4
+    assert table.get_selected_id() == "card-4"
+    assert table.tree.selection() == ("row0",)
+
+
+def test_page_down_moves_by_a_screen(table):
+    select_slot(table, 3)
+
+    press(table, "Next")
+
+    assert table.get_selected_id() == "card-13"
+    assert table._first == 4
+    assert table.tree.selection() == ("row9",)
+
+
+def test_keys_stop_at_the_first_and_last_row(table):
+    press(table, "Up")
+    assert table.get_selected_id() == "card-0"
+    assert table._first == 0
+
+    press(table, "End")
+    press(table, "Down")
+    assert table.get_selected_id() == "card-999"
+    assert table._first == 990
+
+    press(table, "Next")
+    assert table.get_selected_id() == "card-999"
+
+
+def test_delete_acts_on_the_data_source_row(table, callbacks):
+    table._handle_scrollbar("moveto", "0.5")
+    select_slot(table, 3)
+
+    table._handle_delete_key(SimpleNamespace())
+
+    callbacks.on_delete_key.assert_called_once_with("card-503")
+
+
+def test_double_click_acts_on_the_row_under_the_pointer(table, callbacks):
+    table._handle_scrollbar("moveto", "0.5")
+    select_slot(table, 3)
+
+    table._handle_double_click(SimpleNamespace(y=7 * ROW_HEIGHT + 5))
+
+    callbacks.on_double_click.assert_called_once_with("card-507")
+
+
+def test_delete_item_refreshes_from_the_data_source(table):
+    ids = [f"card-{i}" for i in range(5)]
+    table.set_data_source(lambda: len(ids), lambda start, stop: [(i, [i]) for i in ids[start:stop]])
+    select_slot(table, 1)
+
+    ids.remove("card-1")
+    table.delete_item("card-1")
+
+    assert table.get_selected_id() is None
+    assert shown(table) == ["card-0", "card-2", "card-3", "card-4"]
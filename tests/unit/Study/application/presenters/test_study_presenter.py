@@ -256,6 +256,18 @@ class TestHandleEndSession:
         mock_study_service.end_session.assert_called_once()
         mock_navigation.navigate.assert_called_once_with("/decks/10/cards")
 
+    def test_handle_end_session_save_error(self, study_presenter, mock_study_service, mock_navigation, mock_view):
+        # Arrange
+        mock_study_service.end_session.side_effect = Exception("disk full")
+
+        # Act
+        study_presenter.handle_end_session()
+
+        # Assert
+        mock_view.show_error_message.assert_called_once()
+        assert "Failed to save study session" in mock_view.show_error_message.call_args[0][0]
+        mock_navigation.navigate.assert_called_once_with("/decks/10/cards")
+
 
 class TestHelperMethods:
     """Testy dla metod pomocniczych."""
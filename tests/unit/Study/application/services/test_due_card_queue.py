@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from src.Study.application.services.due_card_queue import DueCardQueue
+from src.CardManagement.domain.models.Flashcard import Flashcard
+from src.CardManagement.domain.models.FlashcardPage import FlashcardPage
+
+
+def _flashcard(card_id: int) -> Flashcard:
+    now = datetime.now(timezone.utc)
+    return Flashcard(
+        id=card_id,
+        deck_id=1,
+        front_text=f"Front {card_id}",
+        back_text=f"Back {card_id}",
+        fsrs_state=None,
+        source="manual",
+        ai_model_name=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _prepare(flashcards):
+    return [(f, MagicMock()) for f in flashcards]
+
+
+@pytest.fixture
+def repository():
+    """Repository serving three due cards in pages of two."""
+    repo = MagicMock()
+    pages = {
+        None: FlashcardPage(items=[_flashcard(1), _flashcard(2)], next_cursor="c2"),
+        "c2": FlashcardPage(items=[_flashcard(3)], next_cursor=None),
+    }
+    repo.count_due_by_deck_id.return_value = 3
+    repo.list_due_page.side_effect = lambda deck_id, now, limit, after_cursor=None: pages[after_cursor]
+    return repo
+
+
+def test_queue_fetches_pages_on_demand(repository):
+    queue = DueCardQueue(repository, 1, datetime.now(timezone.utc), 2, _prepare)
+
+    assert len(queue) == 3
+    assert repository.list_due_page.call_count == 1
+    assert [queue[i][0].id for i in range(3)] == [1, 2, 3]
+    assert repository.list_due_page.call_count == 2
+
+
+def test_queue_does_not_fetch_when_nothing_is_due():
+    repo = MagicMock()
+    repo.count_due_by_deck_id.return_value = 0
+
+    queue = DueCardQueue(repo, 1, datetime.now(timezone.utc), 2, _prepare)
+
+    assert len(queue) == 0
+    assert not queue
+    repo.list_due_page.assert_not_called()
+
+
+def test_queue_setitem_replaces_card_in_current_page(repository):
+    queue = DueCardQueue(repository, 1, datetime.now(timezone.utc), 2, _prepare)
+    replacement = (_flashcard(1), MagicMock())
+
+    queue[0] = replacement
+
+    assert queue[0] is replacement
+
+
+def test_queue_rejects_discarded_pages(repository):
+    queue = DueCardQueue(repository, 1, datetime.now(timezone.utc), 2, _prepare)
+    queue[2]
+
+    with pytest.raises(IndexError):
+        queue[0]
+
+
+def test_queue_shrinks_when_cards_disappear(repository):
+    repository.count_due_by_deck_id.return_value = 4
+    queue = DueCardQueue(repository, 1, datetime.now(timezone.utc), 2, _prepare)
+
+    with pytest.raises(IndexError):
+        queue[3]
+    assert len(queue) == 3
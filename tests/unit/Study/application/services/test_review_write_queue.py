@@ -0,0 +1,88 @@
+import time
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from src.Study.application.services.review_write_queue import ReviewEvent, ReviewWriteError, ReviewWriteQueue
+
+
+def _event(flashcard_id: int) -> ReviewEvent:
+    return ReviewEvent(
+        user_id=1,
+        flashcard_id=flashcard_id,
+        fsrs_state=f'{{"card_id": {flashcard_id}}}',
+        review_log_data={"rating": 3},
+        rating=3,
+        reviewed_at=datetime.now(timezone.utc),
+        scheduler_params_json="[]",
+    )
+
+
+@pytest.fixture
+def flashcard_repository():
+    return MagicMock()
+
+
+@pytest.fixture
+def review_log_repository():
+    return MagicMock()
+
+
+@pytest.fixture
+def make_queue(flashcard_repository, review_log_repository):
+    queues = []
+
+    def factory(**kwargs):
+        write_queue = ReviewWriteQueue(flashcard_repository, review_log_repository, MagicMock(), **kwargs)
+        queues.append(write_queue)
+        return write_queue
+
+    yield factory
+    for write_queue in queues:
+        write_queue.close()
+
+
+def test_flush_commits_all_events_in_batches(make_queue, flashcard_repository, review_log_repository):
+    write_queue = make_queue(batch_size=2, flush_interval_ms=10_000)
+
+    for flashcard_id in (1, 2, 3):
+        write_queue.submit(_event(flashcard_id))
+    write_queue.flush(timeout=5)
+
+    batches = [[fid for fid, _ in call.args[0]] for call in flashcard_repository.bulk_set_fsrs_state.call_args_list]
+    assert batches == [[1, 2], [3]]
+    assert [call.kwargs["flashcard_id"] for call in review_log_repository.add.call_args_list] == [1, 2, 3]
+
+
+def test_events_are_committed_after_flush_interval(make_queue, flashcard_repository):
+    write_queue = make_queue(batch_size=100, flush_interval_ms=10)
+
+    write_queue.submit(_event(1))
+
+    deadline = time.monotonic() + 5
+    while not flashcard_repository.bulk_set_fsrs_state.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    flashcard_repository.bulk_set_fsrs_state.assert_called_once()
+
+
+def test_failed_batch_is_reported_once(make_queue, review_log_repository):
+    write_queue = make_queue(batch_size=1, flush_interval_ms=10)
+    review_log_repository.add.side_effect = [Exception("disk I/O error"), None]
+
+    write_queue.submit(_event(1))
+    with pytest.raises(ReviewWriteError):
+        write_queue.flush(timeout=5)
+
+    write_queue.submit(_event(2))
+    write_queue.flush(timeout=5)
+
+
+def test_close_saves_pending_events(make_queue, flashcard_repository):
+    write_queue = make_queue(batch_size=100, flush_interval_ms=10_000)
+
+    write_queue.submit(_event(1))
+    write_queue.close()
+
+    flashcard_repository.bulk_set_fsrs_state.assert_called_once()
+    with pytest.raises(RuntimeError):
+        write_queue.submit(_event(2))
@@ -3,8 +3,11 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch, MagicMock
 
+from fsrs import Card as FSRSCard
+
 from src.Study.application.services.study_service import StudyService
 from src.CardManagement.domain.models.Flashcard import Flashcard
+from src.CardManagement.domain.models.FlashcardPage import FlashcardPage
 from src.UserProfile.domain.models.user import User
 
 
@@ -111,17 +114,13 @@ def sample_flashcards():
 def test_start_session_loads_due_cards(service, mock_flashcard_repository, sample_flashcards):
     # Arrange
     deck_id = 1
-    mock_flashcard_repository.list_by_deck_id.return_value = sample_flashcards
-
-    # Mockujemy tylko metody prywatne, pozostawiając normalne wywołanie list_by_deck_id
     service._initialize_scheduler = MagicMock()
-    service._load_and_prepare_fsrs_cards = MagicMock()
-    service._filter_and_sort_due_cards = MagicMock()
 
     # Symulujemy, że tylko pierwsza fiszka jest due
     mock_fsrs_card = MagicMock()
-    service._load_and_prepare_fsrs_cards.return_value = [(sample_flashcards[0], mock_fsrs_card)]
-    service._filter_and_sort_due_cards.return_value = [(sample_flashcards[0], mock_fsrs_card)]
+    mock_flashcard_repository.count_due_by_deck_id.return_value = 1
+    mock_flashcard_repository.list_due_page.return_value = FlashcardPage(items=[sample_flashcards[0]], next_cursor=None)
+    service._prepare_fsrs_cards = MagicMock(return_value=[(sample_flashcards[0], mock_fsrs_card)])
 
     # Act
     result = service.start_session(deck_id)
@@ -136,22 +135,20 @@ def test_start_session_loads_due_cards(service, mock_flashcard_repository, sampl
 
     # Verify method calls
     service._initialize_scheduler.assert_called_once()
-    # Ponieważ mockujemy _load_and_prepare_fsrs_cards, to list_by_deck_id nie jest wywoływane bezpośrednio
+    args = mock_flashcard_repository.list_due_page.call_args[0]
+    assert args[0] == deck_id
+    assert args[1].tzinfo is not None
+    assert args[2] == 50
+    mock_flashcard_repository.list_by_deck_id.assert_not_called()
 
 
-def test_start_session_handles_no_due_cards(service, mock_flashcard_repository, sample_flashcards):
+def test_start_session_handles_no_due_cards(service, mock_flashcard_repository):
     # Arrange
     deck_id = 1
-    mock_flashcard_repository.list_by_deck_id.return_value = sample_flashcards
-
-    # Mockujemy metody prywatne
     service._initialize_scheduler = MagicMock()
-    service._load_and_prepare_fsrs_cards = MagicMock()
-    service._filter_and_sort_due_cards = MagicMock()
 
     # Symulujemy, że żadna fiszka nie jest due
-    service._load_and_prepare_fsrs_cards.return_value = [(f, MagicMock()) for f in sample_flashcards]
-    service._filter_and_sort_due_cards.return_value = []  # Brak fiszek due
+    mock_flashcard_repository.count_due_by_deck_id.return_value = 0
 
     # Act
     result = service.start_session(deck_id)
@@ -161,6 +158,7 @@ def test_start_session_handles_no_due_cards(service, mock_flashcard_repository,
     assert service.current_deck_id == deck_id
     assert service.current_card_index == -1
     assert len(service.current_study_session_queue) == 0
+    mock_flashcard_repository.list_due_page.assert_not_called()
 
 
 def test_start_session_requires_authenticated_user(service, mock_session_service):
@@ -221,6 +219,93 @@ def test_record_review_updates_flashcard_and_saves_log(
     assert service.current_study_session_queue[0][1] == mock_updated_fsrs_card
 
 
+def test_record_review_writes_card_and_log_in_one_transaction(
+    service, mock_flashcard_repository, mock_review_log_repository, sample_flashcards
+):
+    # Arrange
+    events = []
+    unit_of_work = MagicMock()
+    unit_of_work.transaction.return_value.__enter__.side_effect = lambda: events.append("begin")
+    unit_of_work.transaction.return_value.__exit__.side_effect = lambda *exc: events.append("end")
+    mock_flashcard_repository.update.side_effect = lambda card: events.append("update")
+    mock_review_log_repository.add.side_effect = lambda **kwargs: events.append("log")
+    service.unit_of_work = unit_of_work
+
+    mock_updated_fsrs_card = MagicMock()
+    mock_updated_fsrs_card.to_dict.return_value = {"state": "updated"}
+    mock_review_log = MagicMock()
+    mock_review_log.review_datetime = datetime.now(timezone.utc)
+    service.scheduler.review_card.return_value = (mock_updated_fsrs_card, mock_review_log)
+    service.scheduler.parameters = (0.4, 0.6)
+    service.current_study_session_queue = [(sample_flashcards[0], MagicMock())]
+    service.current_card_index = 0
+
+    # Act
+    service.record_review(1, 3)
+
+    # Assert
+    assert events == ["begin", "update", "log", "end"]
+
+
+def test_record_review_restores_state_when_saving_fails(service, mock_review_log_repository, sample_flashcards):
+    # Arrange
+    original_state = sample_flashcards[0].fsrs_state
+    mock_updated_fsrs_card = MagicMock()
+    mock_updated_fsrs_card.to_dict.return_value = {"state": "updated"}
+    service.scheduler.review_card.return_value = (mock_updated_fsrs_card, MagicMock())
+    service.scheduler.parameters = (0.4, 0.6)
+    service.current_study_session_queue = [(sample_flashcards[0], MagicMock())]
+    service.current_card_index = 0
+    mock_review_log_repository.add.side_effect = Exception("disk I/O error")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        service.record_review(1, 3)
+    assert sample_flashcards[0].fsrs_state == original_state
+
+
+def test_record_review_queues_review_when_writer_is_set(
+    service, mock_flashcard_repository, mock_review_log_repository, sample_flashcards
+):
+    # Arrange
+    service.review_writer = MagicMock()
+    mock_updated_fsrs_card = MagicMock()
+    mock_updated_fsrs_card.to_dict.return_value = {"state": "updated"}
+    mock_review_log = MagicMock()
+    mock_review_log.review_datetime = datetime.now(timezone.utc)
+    mock_review_log.to_dict.return_value = {"review": "data"}
+    service.scheduler.review_card.return_value = (mock_updated_fsrs_card, mock_review_log)
+    service.scheduler.parameters = (0.4, 0.6)
+    service.current_study_session_queue = [(sample_flashcards[0], MagicMock())]
+    service.current_card_index = 0
+
+    # Act
+    service.record_review(1, 3)
+
+    # Assert
+    event = service.review_writer.submit.call_args[0][0]
+    assert event.flashcard_id == 1
+    assert json.loads(event.fsrs_state) == {"state": "updated"}
+    assert event.review_log_data == {"review": "data"}
+    mock_flashcard_repository.update.assert_not_called()
+    mock_review_log_repository.add.assert_not_called()
+
+
+def test_end_session_flushes_writer_and_clears_state_on_error(service, sample_flashcards):
+    # Arrange
+    service.review_writer = MagicMock()
+    service.review_writer.flush.side_effect = Exception("disk full")
+    service.current_study_session_queue = [(sample_flashcards[0], MagicMock())]
+    service.current_card_index = 0
+
+    # Act & Assert
+    with pytest.raises(Exception):
+        service.end_session()
+    service.review_writer.flush.assert_called_once()
+    assert service.current_study_session_queue == []
+    assert service.current_card_index == -1
+
+
 def test_record_review_validates_rating(service):
     # Arrange
     flashcard_id = 1
@@ -387,3 +472,40 @@ def test_get_current_card_returns_card_when_session_active(service, sample_flash
 
     # Assert
     assert result == (sample_flashcards[0], mock_fsrs_card)
+
+
+def test_prepare_fsrs_cards_initializes_new_cards(service, mock_flashcard_repository, sample_flashcards):
+    # Arrange
+    new_card = sample_flashcards[2]
+
+    # Act
+    result = service._prepare_fsrs_cards([new_card])
+
+    # Assert
+    assert [flashcard.id for flashcard, _ in result] == [3]
+    assert new_card.fsrs_state is not None
+    mock_flashcard_repository.bulk_set_fsrs_state.assert_called_once_with([(3, new_card.fsrs_state)])
+    mock_flashcard_repository.update.assert_not_called()
+
+
+def test_prepare_fsrs_cards_skips_write_when_all_cards_have_state(service, mock_flashcard_repository):
+    # Arrange
+    now = datetime.now(timezone.utc)
+    scheduled = Flashcard(
+        id=4,
+        deck_id=1,
+        front_text="Front 4",
+        back_text="Back 4",
+        fsrs_state=json.dumps(FSRSCard().to_dict()),
+        source="manual",
+        ai_model_name=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+    # Act
+    result = service._prepare_fsrs_cards([scheduled])
+
+    # Assert
+    assert [flashcard.id for flashcard, _ in result] == [4]
+    mock_flashcard_repository.bulk_set_fsrs_state.assert_not_called()
@@ -9,7 +9,8 @@ from src.Study.infrastructure.persistence.sqlite.repositories.ReviewLogRepositor
 
 @pytest.fixture
 def mock_db_provider(mocker):
-    mock_provider = mocker.Mock()
+    # MagicMock, so that transaction() can be used as a context manager
+    mock_provider = mocker.MagicMock()
     mock_connection = mocker.Mock()
     mock_cursor = mocker.Mock()
 
@@ -74,8 +75,9 @@ def test_add_inserts_review_log(repository, mock_db_provider):
     )
 
     # Assert
-    # Sprawdzamy tylko czy wywołano commit, co oznacza że operacja została zakończona pomyślnie
-    mock_connection.commit.assert_called_once()
+    # Zapis odbywa się w transakcji dostawcy; repozytorium samo nie zatwierdza zmian
+    mock_db_provider.transaction.assert_called_once()
+    mock_connection.commit.assert_not_called()
 
 
 def test_get_review_logs_for_flashcard(repository, mock_db_provider):
@@ -257,7 +259,8 @@ def test_delete_review_logs_for_flashcard(repository, mock_db_provider):
 
     # Assert
     assert result == 3
-    mock_connection.commit.assert_called_once()
+    mock_db_provider.transaction.assert_called_once()
+    mock_connection.commit.assert_not_called()
 
 
 def test_delete_review_logs_for_user(repository, mock_db_provider):
@@ -275,4 +278,26 @@ def test_delete_review_logs_for_user(repository, mock_db_provider):
 
     # Assert
     assert result == 10
-    mock_connection.commit.assert_called_once()
+    mock_db_provider.transaction.assert_called_once()
+    mock_connection.commit.assert_not_called()
+
+
+def test_execute_query_leaves_connection_settings_untouched(mocker):
+    # Arrange
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE ReviewLogs (id INTEGER PRIMARY KEY, user_profile_id INTEGER, review_log_data TEXT, reviewed_at TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO ReviewLogs (user_profile_id, review_log_data, reviewed_at) VALUES (1, '{\"rating\": 3}', '2025-01-01')"
+    )
+    provider = mocker.Mock()
+    provider.get_connection.return_value = conn
+    repo = ReviewLogRepositoryImpl(provider)
+
+    # Act
+    logs = repo.get_review_logs_for_user(1)
+
+    # Assert
+    assert logs[0]["review_log_data"] == {"rating": 3}
+    assert conn.row_factory is None
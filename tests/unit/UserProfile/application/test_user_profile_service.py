@@ -1,6 +1,7 @@
 import pytest
 import bcrypt
 
+from src.Shared.application.session_service import SessionService
 from src.UserProfile.application.user_profile_service import UserProfileService, UserProfileSummaryViewModel
 from src.UserProfile.domain.models.user import User
 from src.UserProfile.domain.repositories.exceptions import (
@@ -190,3 +191,89 @@ def test_authenticate_user_propagates_repository_error(service, mock_user_reposi
     # Act & Assert
     with pytest.raises(RepositoryError, match="DB Error"):
         service.authenticate_user(1, "anypassword")
+
+
+@pytest.fixture
+def session_user():
+    return User(id=1, username="user1", hashed_password=None, encrypted_api_key=b"cipher1")
+
+
+@pytest.fixture
+def session(mocker, session_user):
+    profile_service = mocker.Mock()
+    profile_service.get_profile_by_username.return_value = session_user
+    session = SessionService(profile_service)
+    session.login("user1")
+    return session
+
+
+@pytest.fixture
+def mock_crypto(mocker):
+    return mocker.patch("src.UserProfile.application.user_profile_service.crypto_manager")
+
+
+def test_get_api_key_is_decrypted_once_per_session(mock_user_repository, session, session_user, mock_crypto):
+    # Arrange
+    service = UserProfileService(mock_user_repository, session)
+    mock_user_repository.get_by_id.return_value = session_user
+    mock_crypto.decrypt_api_key.side_effect = ["sk-or-first", "sk-or-second"]
+
+    # Act
+    first = service.get_api_key(1)
+    second = service.get_api_key(1)
+
+    # Assert
+    assert (first, second) == ("sk-or-first", "sk-or-first")
+    assert session.get_secret(SessionService.API_KEY_SECRET) == "sk-or-first"
+    assert mock_crypto.decrypt_api_key.call_count == 1
+
+
+def test_get_api_key_is_gone_after_logout(mock_user_repository, session, session_user, mock_crypto):
+    # Arrange
+    service = UserProfileService(mock_user_repository, session)
+    mock_user_repository.get_by_id.return_value = session_user
+    mock_crypto.decrypt_api_key.return_value = "sk-or-key"
+    service.get_api_key(1)
+
+    # Act
+    session.logout()
+
+    # Assert
+    assert session.get_secret(SessionService.API_KEY_SECRET) is None
+    assert "sk-or-key" not in vars(service).values()
+    service.get_api_key(1)
+    assert mock_crypto.decrypt_api_key.call_count == 2
+
+
+def test_get_api_key_decrypts_a_changed_key_again(mock_user_repository, session, mock_crypto):
+    # Arrange
+    service = UserProfileService(mock_user_repository, session)
+    mock_user_repository.get_by_id.return_value = User(
+        id=1, username="user1", hashed_password=None, encrypted_api_key=b"cipher2"
+    )
+    session.set_secret(SessionService.API_KEY_SECRET, "sk-or-first")
+    mock_crypto.decrypt_api_key.return_value = "sk-or-second"
+
+    # Act
+    result = service.get_api_key(1)
+
+    # Assert
+    assert result == "sk-or-second"
+    assert session.get_secret(SessionService.API_KEY_SECRET) == "sk-or-first"
+
+
+def test_get_api_key_of_other_user_is_not_cached(mock_user_repository, session, mock_crypto):
+    # Arrange
+    service = UserProfileService(mock_user_repository, session)
+    mock_user_repository.get_by_id.return_value = User(
+        id=2, username="user2", hashed_password=None, encrypted_api_key=b"cipher1"
+    )
+    mock_crypto.decrypt_api_key.return_value = "sk-or-other"
+
+    # Act
+    service.get_api_key(2)
+    service.get_api_key(2)
+
+    # Assert
+    assert session.get_secret(SessionService.API_KEY_SECRET) is None
+    assert mock_crypto.decrypt_api_key.call_count == 2
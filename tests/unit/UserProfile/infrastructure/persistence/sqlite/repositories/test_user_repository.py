@@ -12,7 +12,7 @@ from src.UserProfile.infrastructure.persistence.sqlite.repositories.UserReposito
 
 @pytest.fixture
 def mock_db_provider(mocker: MockerFixture):
-    provider = mocker.Mock(spec=DbConnectionProvider)
+    provider = mocker.MagicMock(spec=DbConnectionProvider)
     provider.get_connection = mocker.Mock(return_value=mocker.Mock(spec=sqlite3.Connection))
     return provider
 
@@ -79,6 +79,8 @@ def test_add_user_success(mocker: MockerFixture, repository, mock_db_provider, s
             sample_user.app_theme,
         ),
     )
+    mock_db_provider.transaction.assert_called_once()
+    mock_db_provider.get_connection.return_value.commit.assert_not_called()
 
 
 def test_add_user_duplicate_username(mocker: MockerFixture, repository, mock_db_provider, sample_user):
@@ -185,6 +187,7 @@ def test_update_user_success(mocker: MockerFixture, repository, mock_db_provider
             user_to_update.id,
         ],
     )
+    mock_db_provider.transaction.assert_called_once()
 
 
 def test_update_user_not_found(mocker: MockerFixture, repository, mock_db_provider):
@@ -248,6 +251,7 @@ def test_delete_user_success(mocker: MockerFixture, repository, mock_db_provider
 
     # Verify SQL query was executed with correct parameters
     mock_db_provider.get_connection.return_value.execute.assert_any_call(mocker.ANY, (1,))
+    mock_db_provider.transaction.assert_called_once()
 
 
 def test_delete_user_not_found(mocker: MockerFixture, repository, mock_db_provider):